@@ -17,6 +17,7 @@ from src.tasks.model import StellarObjectIdentifier  # noqa: F401
 from src.core.security.models import User, UserRole, UserRoleEnum  # noqa: F401
 from src.export.types import ExportOption  # noqa: F401
 from src.export.model import ExportFile  # noqa: F401
+from src.tasks.partitions import PARTITIONED_TABLES
 
 
 # this is the Alembic Config object, which provides
@@ -34,6 +35,14 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = DbEntity.metadata
 
+
+def include_name(name, type_, parent_names) -> bool:
+    # partitions of the task result tables are managed by src.tasks.partitions, not by the migrations
+    if type_ == "table" and name not in target_metadata.tables:
+        return not name.startswith(tuple(f"{table}_" for table in PARTITIONED_TABLES))
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -56,6 +65,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_name=include_name,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -65,7 +75,11 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_name=include_name,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -0,0 +1,72 @@
+"""Add period search task type and periodogram peaks
+
+Revision ID: 7b898cb01816
+Revises: 4f8a9c1d2e6b
+Create Date: 2026-10-17 15:30:36.734873
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7b898cb01816"
+down_revision: Union[str, None] = "4f8a9c1d2e6b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("ALTER TYPE task_type ADD VALUE IF NOT EXISTS 'period_search'")
+
+    op.create_table(
+        "ac_periodogram_peak",
+        sa.Column("task_id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "method",
+            sa.Enum("lomb_scargle", "box_least_squares", name="period_search_method"),
+            nullable=False,
+        ),
+        sa.Column("light_filter", sa.String(), nullable=True),
+        sa.Column("rank", sa.Integer(), nullable=False),
+        sa.Column("period", sa.Double(), nullable=False),
+        sa.Column("power", sa.Double(), nullable=False),
+        sa.Column("false_alarm_probability", sa.Double(), nullable=True),
+        sa.Column("duration", sa.Double(), nullable=True),
+        sa.Column("depth", sa.Double(), nullable=True),
+        sa.Column("transit_time", sa.Double(), nullable=True),
+        sa.Column(
+            "id", sa.Uuid(), server_default=sa.text("gen_random_uuid()"), nullable=False
+        ),
+        sa.ForeignKeyConstraint(["task_id"], ["ac_task.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_ac_periodogram_peak_task_id",
+        "ac_periodogram_peak",
+        ["task_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_ac_periodogram_peak_task_id", table_name="ac_periodogram_peak")
+    op.drop_table("ac_periodogram_peak")
+    sa.Enum(name="period_search_method").drop(op.get_bind(), checkfirst=True)
+
+    # PostgreSQL cannot drop an enum value, the type is recreated without it
+    op.execute("DELETE FROM ac_task WHERE task_type = 'period_search'")
+    op.execute("ALTER TYPE task_type RENAME TO task_type_old")
+    sa.Enum("object_search", "photometric_data", name="task_type").create(
+        op.get_bind()
+    )
+    op.execute(
+        "ALTER TABLE ac_task ALTER COLUMN task_type TYPE task_type "
+        "USING task_type::text::task_type"
+    )
+    op.execute("DROP TYPE task_type_old")
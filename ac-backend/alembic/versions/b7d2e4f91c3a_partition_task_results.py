@@ -0,0 +1,160 @@
+"""Partition task results by creation time
+
+Revision ID: b7d2e4f91c3a
+Revises: 0e57d03bc767
+Create Date: 2026-10-17 10:12:41.503219
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d2e4f91c3a"
+down_revision: Union[str, None] = "0e57d03bc767"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _photometric_data_columns() -> list[sa.Column]:
+    return [
+        sa.Column("task_id", sa.Uuid(), nullable=False),
+        sa.Column("julian_date", sa.Double(), nullable=False),
+        sa.Column("magnitude", sa.Double(), nullable=False),
+        sa.Column(
+            "id", sa.Uuid(), server_default=sa.text("gen_random_uuid()"), nullable=False
+        ),
+        sa.Column("plugin_id", sa.Uuid(), nullable=False),
+        sa.Column("magnitude_error", sa.Double(), nullable=False),
+        sa.Column("light_filter", sa.String(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["task_id"],
+            ["ac_task.id"],
+            name="ac_photometric_data_task_id_fkey",
+            ondelete="CASCADE",
+        ),
+    ]
+
+
+def _stellar_object_identifier_columns() -> list[sa.Column]:
+    return [
+        sa.Column("task_id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "identifier", postgresql.JSONB(astext_type=sa.Text()), nullable=False
+        ),
+        sa.Column(
+            "id", sa.Uuid(), server_default=sa.text("gen_random_uuid()"), nullable=False
+        ),
+        sa.ForeignKeyConstraint(
+            ["task_id"],
+            ["ac_task.id"],
+            name="ac_stellar_object_identifier_task_id_fkey",
+            ondelete="CASCADE",
+        ),
+    ]
+
+
+def _rename_to_old(table: str) -> None:
+    op.rename_table(table, f"{table}_old")
+    # the name of the primary key index would collide with the new table
+    op.execute(f"ALTER INDEX {table}_pkey RENAME TO {table}_old_pkey")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _rename_to_old("ac_photometric_data")
+    _rename_to_old("ac_stellar_object_identifier")
+
+    # the partition key has to be a part of the primary key
+    op.create_table(
+        "ac_photometric_data",
+        *_photometric_data_columns(),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("id", "created_at"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    op.create_index(
+        "ix_ac_photometric_data_task_id_julian_date",
+        "ac_photometric_data",
+        ["task_id", "julian_date"],
+    )
+    op.create_table(
+        "ac_stellar_object_identifier",
+        *_stellar_object_identifier_columns(),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("id", "created_at"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    op.create_index(
+        "ix_ac_stellar_object_identifier_task_id",
+        "ac_stellar_object_identifier",
+        ["task_id"],
+    )
+
+    # the window partitions are created ahead of time by the clear_task_data task,
+    # the default partition holds everything else
+    op.execute(
+        "CREATE TABLE ac_photometric_data_default PARTITION OF ac_photometric_data DEFAULT"
+    )
+    op.execute(
+        "CREATE TABLE ac_stellar_object_identifier_default "
+        "PARTITION OF ac_stellar_object_identifier DEFAULT"
+    )
+
+    # existing results are kept with the creation time of their task
+    op.execute(
+        "INSERT INTO ac_photometric_data "
+        "(id, task_id, plugin_id, julian_date, magnitude, magnitude_error, light_filter, created_at) "
+        "SELECT data.id, data.task_id, data.plugin_id, data.julian_date, data.magnitude, "
+        "data.magnitude_error, data.light_filter, task.created_at "
+        "FROM ac_photometric_data_old data JOIN ac_task task ON task.id = data.task_id"
+    )
+    op.execute(
+        "INSERT INTO ac_stellar_object_identifier (id, task_id, identifier, created_at) "
+        "SELECT identifier.id, identifier.task_id, identifier.identifier, task.created_at "
+        "FROM ac_stellar_object_identifier_old identifier "
+        "JOIN ac_task task ON task.id = identifier.task_id"
+    )
+
+    op.drop_table("ac_photometric_data_old")
+    op.drop_table("ac_stellar_object_identifier_old")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _rename_to_old("ac_photometric_data")
+    _rename_to_old("ac_stellar_object_identifier")
+
+    op.create_table(
+        "ac_photometric_data",
+        *_photometric_data_columns(),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "ac_stellar_object_identifier",
+        *_stellar_object_identifier_columns(),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    op.execute(
+        "INSERT INTO ac_photometric_data "
+        "(id, task_id, plugin_id, julian_date, magnitude, magnitude_error, light_filter) "
+        "SELECT id, task_id, plugin_id, julian_date, magnitude, magnitude_error, light_filter "
+        "FROM ac_photometric_data_old"
+    )
+    op.execute(
+        "INSERT INTO ac_stellar_object_identifier (id, task_id, identifier) "
+        "SELECT id, task_id, identifier FROM ac_stellar_object_identifier_old"
+    )
+
+    # drops all partitions as well
+    op.drop_table("ac_photometric_data_old")
+    op.drop_table("ac_stellar_object_identifier_old")
@@ -0,0 +1,93 @@
+"""
+Benchmark of the photometric data ingestion paths of SyncTaskService.
+
+Compares rows per second of the executemany path (list of dicts inserted by bulk_insert) and the binary COPY path
+(insert_photometric_batch) for a synthetic light curve. Needs a migrated database configured by the usual
+environment variables. Run from the ac-backend directory:
+
+    python -m benchmarks.bulk_ingestion --rows 1000000
+"""
+
+import argparse
+import time
+import uuid
+from typing import Callable
+
+import numpy as np
+from sqlalchemy import create_engine, delete
+from sqlalchemy.orm import Session
+
+from src.core.config.config import settings
+from src.plugin.interface.photometric_batch import PhotometricBatch
+from src.tasks.model import PhotometricData, Task
+from src.tasks.service import SyncTaskService
+from src.tasks.types import TaskType
+
+
+def light_curve(rows: int, chunk_size: int) -> list[PhotometricBatch]:
+    rng = np.random.default_rng(0)
+    plugin_id = uuid.uuid4()
+
+    return [
+        PhotometricBatch.from_columns(
+            plugin_id,
+            2450000 + np.sort(rng.uniform(0, 9000, size)),
+            rng.normal(12, 0.5, size),
+            rng.uniform(0.001, 0.1, size),
+            light_filter=rng.choice(np.array(["B", "V", "R"], dtype=object), size),
+        )
+        for size in np.diff(np.append(np.arange(0, rows, chunk_size), rows))
+    ]
+
+
+def executemany(service: SyncTaskService, task_id: uuid.UUID, batch: PhotometricBatch):
+    # the ingestion path used before COPY: one dict per row, inserted with executemany
+    values = [{**dto.model_dump(), "task_id": task_id} for dto in batch.to_dtos()]
+    service.bulk_insert(values)
+
+
+def copy(service: SyncTaskService, task_id: uuid.UUID, batch: PhotometricBatch):
+    service.insert_photometric_batch(task_id, batch)
+
+
+def run(
+    session: Session,
+    batches: list[PhotometricBatch],
+    insert: Callable[[SyncTaskService, uuid.UUID, PhotometricBatch], None],
+) -> float:
+    task = Task(task_type=TaskType.photometric_data)
+    session.add(task)
+    session.commit()
+
+    service = SyncTaskService(session, PhotometricData)
+    try:
+        start = time.perf_counter()
+        for batch in batches:
+            insert(service, task.id, batch)
+        return time.perf_counter() - start
+    finally:
+        session.execute(delete(Task).where(Task.id == task.id))
+        session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--chunk-size", type=int, default=20_000)
+    args = parser.parse_args()
+
+    batches = light_curve(args.rows, args.chunk_size)
+    engine = create_engine(settings.SYNC_DATABASE_URL)
+
+    with Session(engine, expire_on_commit=False) as session:
+        for name, insert in (("executemany", executemany), ("COPY", copy)):
+            elapsed = run(session, batches, insert)
+            print(
+                f"{name:>12}: {args.rows} rows in {elapsed:.2f} s ({args.rows / elapsed:,.0f} rows/s)"
+            )
+
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
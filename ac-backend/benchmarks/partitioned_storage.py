@@ -0,0 +1,165 @@
+"""
+Benchmark of the partitioned task result storage.
+
+Compares the previous layout of ac_photometric_data (a single heap table without an index on task_id, cleaned up
+by deleting the rows of the expired tasks) with the partitioned layout (range partitions by created_at with an
+index on (task_id, julian_date), cleaned up by dropping the expired partitions). Both layouts are created in
+a scratch schema, which is dropped afterwards, and loaded with the same synthetic rows spread over tasks and
+time windows. Needs a database configured by the usual environment variables. Run from the ac-backend directory:
+
+    python -m benchmarks.partitioned_storage --rows 100000000 --tasks 2000 --windows 24
+"""
+
+import argparse
+import hashlib
+import statistics
+import time
+import uuid
+
+from sqlalchemy import Connection, create_engine, text
+
+from src.core.config.config import settings
+
+SCHEMA = "ac_benchmark"
+
+COLUMNS = (
+    "id uuid NOT NULL DEFAULT gen_random_uuid(), "
+    "task_id uuid NOT NULL, "
+    "plugin_id uuid NOT NULL, "
+    "julian_date double precision NOT NULL, "
+    "magnitude double precision NOT NULL, "
+    "magnitude_error double precision NOT NULL, "
+    "light_filter varchar, "
+    "created_at timestamp NOT NULL"
+)
+
+# the page query of Repository.find for the photometric data of a task
+RETRIEVE = (
+    "SELECT * FROM {table} WHERE task_id = :task_id ORDER BY julian_date LIMIT :count"
+)
+COUNT = "SELECT count(*) FROM {table} WHERE task_id = :task_id"
+
+
+def task_id(task: str) -> str:
+    # deterministic UUID of the n-th task, as SQL expression of the integer task
+    return f"CAST(md5(CAST(({task}) AS text)) AS uuid)"
+
+
+def create_layouts(connection: Connection, windows: int) -> None:
+    connection.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    connection.execute(
+        text(f"CREATE TABLE {SCHEMA}.heap ({COLUMNS}, PRIMARY KEY (id))")
+    )
+    connection.execute(
+        text(
+            f"CREATE TABLE {SCHEMA}.partitioned ({COLUMNS}, PRIMARY KEY (id, created_at)) "
+            "PARTITION BY RANGE (created_at)"
+        )
+    )
+    for window in range(windows):
+        connection.execute(
+            text(
+                f"CREATE TABLE {SCHEMA}.partitioned_w{window} PARTITION OF {SCHEMA}.partitioned "
+                f"FOR VALUES FROM ('2000-01-01'::timestamp + interval '{window} hours') "
+                f"TO ('2000-01-01'::timestamp + interval '{window + 1} hours')"
+            )
+        )
+
+
+def load(connection: Connection, table: str, rows: int, tasks: int, windows: int):
+    # the tasks are spread evenly over the windows, each row is inserted in the window of its task
+    connection.execute(
+        text(
+            f"INSERT INTO {SCHEMA}.{table} "
+            "(task_id, plugin_id, julian_date, magnitude, magnitude_error, light_filter, created_at) "
+            f"SELECT {task_id('i % :tasks')}, {task_id('-1')}, 2450000 + random() * 9000, "
+            "12 + random(), random() / 10, (ARRAY['B', 'V', 'R'])[1 + i % 3], "
+            "'2000-01-01'::timestamp + (i % :tasks) * :windows / :tasks * interval '1 hour' "
+            "FROM generate_series(0, :rows - 1) AS i"
+        ),
+        {"rows": rows, "tasks": tasks, "windows": windows},
+    )
+
+
+def retrieve_latency(
+    connection: Connection, table: str, tasks: int, samples: int
+) -> float:
+    latencies = []
+    for task in range(0, tasks, max(1, tasks // samples)):
+        params = {"task_id": python_task_id(task), "count": 5000}
+        start = time.perf_counter()
+        connection.execute(text(COUNT.format(table=f"{SCHEMA}.{table}")), params)
+        connection.execute(text(RETRIEVE.format(table=f"{SCHEMA}.{table}")), params)
+        latencies.append(time.perf_counter() - start)
+    return statistics.median(latencies)
+
+
+def python_task_id(task: int) -> uuid.UUID:
+    return uuid.UUID(hashlib.md5(str(task).encode()).hexdigest())
+
+
+def timed(connection: Connection, statement: str, **params) -> float:
+    start = time.perf_counter()
+    connection.execute(text(statement), params)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--tasks", type=int, default=2000)
+    parser.add_argument("--windows", type=int, default=24)
+    parser.add_argument("--samples", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_engine(settings.SYNC_DATABASE_URL, isolation_level="AUTOCOMMIT")
+
+    with engine.connect() as connection:
+        try:
+            create_layouts(connection, args.windows)
+            for table in ("heap", "partitioned"):
+                start = time.perf_counter()
+                load(connection, table, args.rows, args.tasks, args.windows)
+                if table == "partitioned":
+                    connection.execute(
+                        text(
+                            f"CREATE INDEX ON {SCHEMA}.partitioned (task_id, julian_date)"
+                        )
+                    )
+                connection.execute(text(f"ANALYZE {SCHEMA}.{table}"))
+                elapsed = time.perf_counter() - start
+                print(f"{table:>12}: loaded {args.rows} rows in {elapsed:.1f} s")
+
+            for table in ("heap", "partitioned"):
+                latency = retrieve_latency(connection, table, args.tasks, args.samples)
+                print(
+                    f"{table:>12}: retrieve first page of a task in {latency * 1000:.1f} ms (median)"
+                )
+
+            # cleanup of the oldest window, i.e. the tasks created in it. A single scan of the heap is a lower
+            # bound of the previous cleanup, whose cascading delete scanned the heap once per expired task
+            expired_tasks = sum(
+                1
+                for task in range(args.tasks)
+                if task * args.windows // args.tasks == 0
+            )
+            elapsed = timed(
+                connection,
+                f"DELETE FROM {SCHEMA}.heap WHERE created_at < "
+                "'2000-01-01'::timestamp + interval '1 hour'",
+            )
+            print(
+                f"{'heap':>12}: cleanup of {expired_tasks} tasks by DELETE in {elapsed:.2f} s"
+            )
+            elapsed = timed(connection, f"DROP TABLE {SCHEMA}.partitioned_w0")
+            print(
+                f"{'partitioned':>12}: cleanup of {expired_tasks} tasks by DROP TABLE in {elapsed:.2f} s"
+            )
+        finally:
+            connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import asyncio
+import os
+import threading
+from collections.abc import Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from src.core.config.config import settings
+
+R = TypeVar("R")
+
+
+class WorkerEventLoop:
+    """
+    Event loop of the worker process, which runs in a daemon thread. The Celery tasks of the process submit
+    their coroutines to the loop and wait for the results, so the coroutines of all concurrently executed tasks
+    share the loop, its async DB connections and async HTTP clients.
+
+    The loop is started by the first submitted coroutine. A forked process starts its own loop,
+    as the thread of the parent's loop does not exist in the child.
+    """
+
+    def __init__(self, max_threads: int) -> None:
+        """
+        Create new worker event loop.
+        :param max_threads: maximum number of threads of the default executor of the loop,
+            which runs the blocking code of the coroutines (asyncio.to_thread)
+        """
+        self._max_threads = max_threads
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._pid != os.getpid():
+                self._loop = asyncio.new_event_loop()
+                self._loop.set_default_executor(
+                    ThreadPoolExecutor(max_workers=self._max_threads)
+                )
+                self._pid = os.getpid()
+                threading.Thread(
+                    target=self._loop.run_forever, name="worker-event-loop", daemon=True
+                ).start()
+            return self._loop
+
+    def run(self, coroutine: Coroutine[Any, Any, R]) -> R:
+        """
+        Runs the coroutine on the loop and waits for its result. Must not be called from the loop itself.
+
+        :param coroutine: the coroutine to run.
+        :return: the result of the coroutine.
+        :raises BaseException: the exception raised by the coroutine.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+
+worker_event_loop = WorkerEventLoop(settings.WORKER_ASYNC_CONCURRENCY)
@@ -1,19 +1,40 @@
 import logging
 import os
+import threading
 from logging.handlers import TimedRotatingFileHandler
 
 from celery import Celery
-from celery.signals import worker_process_init, setup_logging
+from celery.signals import (
+    setup_logging,
+    worker_init,
+    worker_process_init,
+    worker_process_shutdown,
+    worker_shutdown,
+)
+from kombu import Queue
+from redis import RedisError
 from sqlalchemy import create_engine, event, exc
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session
 
 from src.core.config.config import settings
+from src.core.http_client.registry import http_clients
+from src.core.rate_limit.limiter import check_rate_limits
+from src.plugin.cache import plugin_cache, start_invalidation_listener
+from src.tasks.warm_up import warm_up_worker
+
+logger = logging.getLogger("celery_app")
 
 # Initialize Celery with Redis as broker and result backend
 celery_app = Celery(
     "ac_worker",
 )
 celery_app.conf.update(settings.CELERY_CONFIG)
+# the catalog tasks are routed to the queues of their plugins, the other tasks use the default queue
+celery_app.conf.task_queues = [
+    Queue(name, routing_key=name)
+    for name in [celery_app.conf.task_default_queue, *settings.CATALOG_TASK_QUEUES]
+]
 celery_app.autodiscover_tasks(["src.tasks"])
 
 
@@ -73,6 +94,16 @@ engine = create_engine(
     max_overflow=20,
 )
 
+# engine of the tasks running on the worker event loop in the asyncio execution mode,
+# its connections are created by the loop (psycopg in async mode)
+async_engine = create_async_engine(
+    settings.SYNC_DATABASE_URL,
+    pool_pre_ping=True,
+    pool_size=10,
+    max_overflow=20,
+)
+async_session_factory = async_sessionmaker(async_engine, expire_on_commit=False)
+
 
 @worker_process_init.connect
 def init_worker_process(*args, **kwargs):
@@ -82,9 +113,50 @@ def init_worker_process(*args, **kwargs):
     This signal handler runs in each forked child process.
 
     Ensure the parent proc's database connections are not touched
-    in the new connection pool
+    in the new connection pool, and subscribe to the invalidations
+    of the cached plugins of the process. If enabled, the process is warmed up,
+    so the first task does not pay for loading the plugins and astropy data.
     """
     engine.dispose(close=False)
+    start_invalidation_listener(plugin_cache)
+
+    if settings.WORKER_WARM_UP:
+        with Session(bind=engine, expire_on_commit=False) as session:
+            warm_up_worker(session)
+
+
+@worker_process_shutdown.connect
+def shutdown_worker_process(*args, **kwargs):
+    """
+    Reports the usage of the HTTP client pools of the worker process and closes them.
+    """
+    for stats in http_clients.stats():
+        logger.info(f"HTTP client pool usage: {stats.model_dump_json()}")
+    http_clients.close()
+
+
+@worker_init.connect
+def init_worker(*args, **kwargs):
+    """
+    Reports once per worker, if the rate limits of the catalogs cannot be applied.
+    In the asyncio execution mode, the tasks run in threads of the main worker process,
+    which is initialized like a worker process of the prefork pool.
+    """
+    try:
+        check_rate_limits()
+    except RedisError as e:
+        logger.error(
+            f"Rate limits and concurrency caps of the catalogs are not applied, Redis is not available: {e}"
+        )
+
+    if settings.WORKER_EXECUTION_MODE == "asyncio":
+        init_worker_process()
+
+
+@worker_shutdown.connect
+def shutdown_worker(*args, **kwargs):
+    if settings.WORKER_EXECUTION_MODE == "asyncio":
+        shutdown_worker_process()
 
 
 # tests for connections being shared across process boundaries, and invalidates them:
@@ -108,21 +180,32 @@ class TaskWithSession(celery_app.Task):
     """
     Task with ready to go session object
     https://celery.school/sqlalchemy-session-celery-tasks
+
+    The session is thread-local, as the task object is shared by the threads of the threads pool.
+    The sessions are stacked, as a task executed eagerly (in tests) can apply the same task again.
     """
 
     def __init__(self):
-        self._session: Session | None = None
+        self._local = threading.local()
+
+    def _sessions(self) -> list[Session]:
+        if not hasattr(self._local, "sessions"):
+            self._local.sessions = []
+        return self._local.sessions
 
     def before_start(self, task_id, args, kwargs):
-        self._session = Session(bind=engine, autocommit=False, expire_on_commit=False)
+        self._sessions().append(
+            Session(bind=engine, autocommit=False, expire_on_commit=False)
+        )
         super().before_start(task_id, args, kwargs)
 
     def after_return(self, status, retval, task_id, args, kwargs, einfo):
-        self._session.commit()
-        self._session.close()
-        self._session = None
+        session = self._sessions().pop()
+        session.commit()
+        session.close()
         super().after_return(status, retval, task_id, args, kwargs, einfo)
 
     @property
-    def session(self):
-        return self._session
+    def session(self) -> Session | None:
+        sessions = self._sessions()
+        return sessions[-1] if sessions else None
@@ -0,0 +1 @@
+"""Package provides the cache of the stellar objects found by the cone searches of the catalogs."""
@@ -0,0 +1,278 @@
+import json
+import logging
+import math
+from functools import cache
+from collections.abc import Awaitable
+from typing import Any, cast
+from uuid import UUID
+
+import numpy as np
+import redis
+from astropy.coordinates import SkyCoord
+from numpy.typing import ArrayLike, NDArray
+from redis.asyncio import Redis
+
+from src.core.config.config import settings
+from src.core.cone_search_cache.exceptions import (
+    ConeSearchCacheStatsUnavailableException,
+)
+from src.core.cone_search_cache.healpix import ang2pix_nest, order_for_size
+from src.core.cone_search_cache.schemas import ConeSearchCacheStatsDto
+from src.plugin.interface.schemas import StellarObjectIdentificatorDto
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "cone-search-cache"
+
+# tolerance of the containment of the cones, the positions are rounded by the JSON encoding
+_CONTAINMENT_TOLERANCE_ARCSEC = 1e-6
+
+
+@cache
+def _redis_client() -> redis.Redis:
+    # the connection pool of the client reconnects in forked processes
+    return redis.Redis(
+        host=settings.REDIS_DB_HOST,
+        port=settings.REDIS_DB_PORT,
+        socket_timeout=settings.CONE_SEARCH_CACHE_REDIS_TIMEOUT,
+        socket_connect_timeout=settings.CONE_SEARCH_CACHE_REDIS_TIMEOUT,
+    )
+
+
+def _stats_key(plugin_id: UUID | str) -> str:
+    return f"{KEY_PREFIX}:{plugin_id}:stats"
+
+
+def separation_arcsec(
+    ra_deg: ArrayLike, dec_deg: ArrayLike, center_ra_deg: float, center_dec_deg: float
+) -> NDArray[np.float64]:
+    """
+    Returns the angular distances of the positions from the center by the haversine formula.
+
+    :param ra_deg: right ascensions of the positions in degrees.
+    :param dec_deg: declinations of the positions in degrees.
+    :param center_ra_deg: right ascension of the center in degrees.
+    :param center_dec_deg: declination of the center in degrees.
+    :return: the distances in arcseconds, of the shape of the positions.
+    """
+    ra = np.radians(np.asarray(ra_deg, dtype=np.float64))
+    dec = np.radians(np.asarray(dec_deg, dtype=np.float64))
+    center_ra = math.radians(center_ra_deg)
+    center_dec = math.radians(center_dec_deg)
+    haversine = (
+        np.sin((dec - center_dec) / 2) ** 2
+        + np.cos(dec) * math.cos(center_dec) * np.sin((ra - center_ra) / 2) ** 2
+    )
+    distances: NDArray[np.float64] = (
+        np.degrees(2 * np.arcsin(np.sqrt(np.clip(haversine, 0, 1)))) * 3600
+    )
+    return distances
+
+
+class ConeSearchCache:
+    """
+    Cache of the stellar objects found by the cone searches of the catalog of a plugin, shared by all workers in Redis.
+
+    The searched cones are stored under the HEALPix pixel of their center and the bucket of their radius.
+    The radii of the buckets grow by powers of two from CONE_SEARCH_CACHE_MIN_RADIUS, and the pixels of a bucket
+    have about the size of its radius. A search is answered from the cache, if its cone is contained in a cone cached
+    under its pixel in its own or any larger bucket. The cached objects are filtered by their distance from
+    the center of the search, which replaces their distance from the cached search.
+
+    The entries expire after the TTL of the plugin. The hits, misses and stores are counted in Redis
+    and all failures of Redis are only logged, the catalog is searched instead.
+
+    The plugins, which limit the number of the objects found by a search, should disable the cache,
+    as the objects of a smaller cone filtered from a truncated larger one may be incomplete.
+    """
+
+    def __init__(
+        self, plugin_id: UUID, ttl: float, redis_client: redis.Redis | None = None
+    ) -> None:
+        """
+        Create new cone search cache.
+        :param plugin_id: ID of the plugin, whose cone searches are cached
+        :param ttl: seconds, for which the cone searches are cached, the cache is disabled if not positive
+        :param redis_client: Redis client storing the cone searches, the client of the process by default
+        """
+        self._plugin_id = plugin_id
+        self._ttl = ttl
+        self._redis_client = redis_client
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    @property
+    def _redis(self) -> redis.Redis:
+        return self._redis_client or _redis_client()
+
+    def accepts(self, radius_arcsec: float) -> bool:
+        """
+        Checks whether the cone searches of the radius are cached.
+
+        :param radius_arcsec: radius of the search in arcseconds.
+        :return: whether the search can be loaded from and stored in the cache.
+        """
+        return (
+            self.enabled and 0 < radius_arcsec <= settings.CONE_SEARCH_CACHE_MAX_RADIUS
+        )
+
+    @staticmethod
+    def _bucket(radius_arcsec: float) -> int:
+        return max(
+            math.ceil(math.log2(radius_arcsec / settings.CONE_SEARCH_CACHE_MIN_RADIUS)),
+            0,
+        )
+
+    def _key(self, bucket: int, coords: SkyCoord) -> str:
+        bucket_radius = settings.CONE_SEARCH_CACHE_MIN_RADIUS * 2**bucket
+        order = order_for_size(bucket_radius)
+        pixel = int(ang2pix_nest(order, coords.ra.deg, coords.dec.deg))
+        return f"{KEY_PREFIX}:{self._plugin_id}:{bucket}:{pixel}"
+
+    def _record(self, counts: dict[str, int]) -> None:
+        try:
+            with self._redis.pipeline(transaction=False) as pipeline:
+                for counter, count in counts.items():
+                    pipeline.hincrby(_stats_key(self._plugin_id), counter, count)
+                pipeline.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Cone search cache statistics were not recorded: {e}")
+
+    def load(
+        self, coords: SkyCoord, radius_arcsec: float
+    ) -> list[StellarObjectIdentificatorDto] | None:
+        """
+        Returns the cached stellar objects within the cone, if it is contained in a cached cone.
+
+        :param coords: center of the cone.
+        :param radius_arcsec: radius of the cone in arcseconds.
+        :return: the stellar objects with their distances from the center, None if the cone is not cached.
+        """
+        if not self.accepts(radius_arcsec):
+            return None
+
+        max_bucket = self._bucket(settings.CONE_SEARCH_CACHE_MAX_RADIUS)
+        # the smaller cones first, they contain fewer objects to filter
+        keys = [
+            self._key(bucket, coords)
+            for bucket in range(self._bucket(radius_arcsec), max_bucket + 1)
+        ]
+        try:
+            # the client is synchronous, its commands are typed for both clients
+            entries = cast(list[bytes | None], self._redis.mget(keys))
+        except redis.RedisError as e:
+            logger.warning(f"Cone search cache was not read: {e}")
+            return None
+
+        ra_deg, dec_deg = float(coords.ra.deg), float(coords.dec.deg)
+        for entry in entries:
+            if entry is None:
+                continue
+            cached = json.loads(entry)
+            center_distance = separation_arcsec(
+                cached["ra_deg"], cached["dec_deg"], ra_deg, dec_deg
+            )
+            if (
+                center_distance + radius_arcsec
+                <= cached["radius_arcsec"] + _CONTAINMENT_TOLERANCE_ARCSEC
+            ):
+                identificators = self._filter(cached, ra_deg, dec_deg, radius_arcsec)
+                self._record({"hits": 1, "served_identifiers": len(identificators)})
+                return identificators
+
+        self._record({"misses": 1})
+        return None
+
+    @staticmethod
+    def _filter(
+        cached: dict[str, Any], ra_deg: float, dec_deg: float, radius_arcsec: float
+    ) -> list[StellarObjectIdentificatorDto]:
+        distances = separation_arcsec(cached["ra"], cached["dec"], ra_deg, dec_deg)
+        identificators = cached["identificators"]
+        return [
+            StellarObjectIdentificatorDto.model_validate(
+                {**identificators[index], "dist_arcsec": float(distances[index])}
+            )
+            for index in np.flatnonzero(distances <= radius_arcsec)
+        ]
+
+    def store(
+        self,
+        coords: SkyCoord,
+        radius_arcsec: float,
+        identificators: list[StellarObjectIdentificatorDto],
+    ) -> None:
+        """
+        Stores the stellar objects found by the cone search of the catalog.
+
+        :param coords: center of the cone.
+        :param radius_arcsec: radius of the cone in arcseconds.
+        :param identificators: all stellar objects found within the cone.
+        """
+        if not self.accepts(radius_arcsec):
+            return
+        if len(identificators) > settings.CONE_SEARCH_CACHE_MAX_IDENTIFIERS:
+            self._record({"skips": 1})
+            return
+
+        entry = json.dumps(
+            {
+                "ra_deg": float(coords.ra.deg),
+                "dec_deg": float(coords.dec.deg),
+                "radius_arcsec": radius_arcsec,
+                # the positions are filtered without parsing the identificators
+                "ra": [identificator.ra_deg for identificator in identificators],
+                "dec": [identificator.dec_deg for identificator in identificators],
+                "identificators": [
+                    identificator.model_dump(mode="json")
+                    for identificator in identificators
+                ],
+            },
+            separators=(",", ":"),
+        )
+        try:
+            self._redis.set(
+                self._key(self._bucket(radius_arcsec), coords),
+                entry,
+                px=math.ceil(self._ttl * 1000),
+            )
+        except redis.RedisError as e:
+            logger.warning(f"Cone search was not cached: {e}")
+            return
+
+        self._record({"stores": 1, "stored_identifiers": len(identificators)})
+
+
+async def get_cone_search_cache_stats(
+    redis_client: Redis, plugin_id: UUID
+) -> ConeSearchCacheStatsDto:
+    """
+    Returns the usage of the cone search cache of the plugin.
+
+    :param redis_client: Redis client of the API.
+    :param plugin_id: ID of the plugin.
+    :return: statistics of the cone search cache.
+    :raises ConeSearchCacheStatsUnavailableException: if Redis is not available.
+    """
+    try:
+        raw_stats = await cast(
+            Awaitable[dict[bytes | str, bytes | str]],
+            redis_client.hgetall(_stats_key(plugin_id)),
+        )
+    except redis.RedisError as e:
+        raise ConeSearchCacheStatsUnavailableException() from e
+
+    stats = {
+        (key.decode() if isinstance(key, bytes) else key): int(value)
+        for key, value in raw_stats.items()
+    }
+    return ConeSearchCacheStatsDto(
+        hits=stats.get("hits", 0),
+        misses=stats.get("misses", 0),
+        stores=stats.get("stores", 0),
+        skips=stats.get("skips", 0),
+        served_identifiers=stats.get("served_identifiers", 0),
+        stored_identifiers=stats.get("stored_identifiers", 0),
+    )
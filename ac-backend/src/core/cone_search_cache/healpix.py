@@ -0,0 +1,87 @@
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+# pixels of the nested scheme fit into int64 up to this order
+MAX_ORDER = 29
+
+# mean size of the pixels of order 0, sqrt(4 pi / 12) radians, in arcseconds
+_ORDER_0_PIXEL_SIZE_ARCSEC = float(np.degrees(np.sqrt(np.pi / 3)) * 3600)
+
+
+def pixel_size_arcsec(order: int) -> float:
+    """
+    Returns the mean size of the HEALPix pixels of the order, the square root of their area.
+
+    :param order: HEALPix order, the number of pixels is 12 * 4**order.
+    :return: the pixel size in arcseconds.
+    """
+    return _ORDER_0_PIXEL_SIZE_ARCSEC / float(2**order)
+
+
+def order_for_size(size_arcsec: float) -> int:
+    """
+    Returns the HEALPix order, whose pixel size is the closest to the given size.
+
+    :param size_arcsec: the requested pixel size in arcseconds.
+    :return: the order between 0 and MAX_ORDER.
+    """
+    order = round(np.log2(_ORDER_0_PIXEL_SIZE_ARCSEC / size_arcsec))
+    return int(min(max(order, 0), MAX_ORDER))
+
+
+def _spread_bits(values: NDArray[np.int64]) -> NDArray[np.int64]:
+    # interleaves the bits with zeros, so the bits of x and y alternate in the nested index
+    values = (values | (values << 16)) & 0x0000FFFF0000FFFF
+    values = (values | (values << 8)) & 0x00FF00FF00FF00FF
+    values = (values | (values << 4)) & 0x0F0F0F0F0F0F0F0F
+    values = (values | (values << 2)) & 0x3333333333333333
+    return (values | (values << 1)) & 0x5555555555555555
+
+
+def ang2pix_nest(
+    order: int, ra_deg: ArrayLike, dec_deg: ArrayLike
+) -> NDArray[np.int64]:
+    """
+    Returns the indices of the HEALPix pixels in the nested scheme, which contain the positions
+    (Gorski et al. 2005, the algorithm of the HEALPix library).
+
+    :param order: HEALPix order, the number of pixels is 12 * 4**order.
+    :param ra_deg: right ascensions of the positions in degrees.
+    :param dec_deg: declinations of the positions in degrees.
+    :return: the pixel indices, of the shape of the positions.
+    """
+    nside = np.int64(1) << order
+    z = np.sin(np.radians(np.asarray(dec_deg, dtype=np.float64)))
+    za = np.abs(z)
+    # the longitude in the units of the base pixel quarters, in [0, 4)
+    tt = np.mod(np.asarray(ra_deg, dtype=np.float64), 360.0) / 90.0
+    tt, z, za = np.broadcast_arrays(tt, z, za)
+
+    # equatorial region
+    temp1 = nside * (0.5 + tt)
+    temp2 = nside * z * 0.75
+    # indices of the ascending and the descending edge lines
+    jp = (temp1 - temp2).astype(np.int64)
+    jm = (temp1 + temp2).astype(np.int64)
+    ifp = jp >> order
+    ifm = jm >> order
+    equatorial_face = np.where(ifp == ifm, ifp | 4, np.where(ifp < ifm, ifp, ifm + 8))
+    equatorial_x = jm & (nside - 1)
+    equatorial_y = nside - (jp & (nside - 1)) - 1
+
+    # polar caps
+    ntt = np.minimum(tt.astype(np.int64), 3)
+    tp = tt - ntt
+    tmp = nside * np.sqrt(3 * (1 - za))
+    polar_jp = np.minimum((tp * tmp).astype(np.int64), nside - 1)
+    polar_jm = np.minimum(((1 - tp) * tmp).astype(np.int64), nside - 1)
+    north = z >= 0
+    polar_face = np.where(north, ntt, ntt + 8)
+    polar_x = np.where(north, nside - polar_jm - 1, polar_jp)
+    polar_y = np.where(north, nside - polar_jp - 1, polar_jm)
+
+    equatorial = za <= 2 / 3
+    face = np.where(equatorial, equatorial_face, polar_face)
+    x = np.where(equatorial, equatorial_x, polar_x)
+    y = np.where(equatorial, equatorial_y, polar_y)
+    return (face << (2 * order)) + _spread_bits(x) + (_spread_bits(y) << 1)
@@ -0,0 +1,18 @@
+from src.core.repository.schemas import BaseDto
+
+
+class ConeSearchCacheStatsDto(BaseDto):
+    """Usage of the cone search cache of a plugin, summed over all workers."""
+
+    hits: int
+    """Number of cone searches answered from the cache."""
+    misses: int
+    """Number of cone searches, which were not contained in any cached cone."""
+    stores: int
+    """Number of cone searches stored in the cache."""
+    skips: int
+    """Number of cone searches not stored, as they found more than CONE_SEARCH_CACHE_MAX_IDENTIFIERS objects."""
+    served_identifiers: int
+    """Total number of stellar objects returned from the cache."""
+    stored_identifiers: int
+    """Total number of stellar objects stored in the cache."""
@@ -41,7 +41,7 @@ class Settings(BaseSettings):
     @computed_field  # type: ignore[prop-decorator]
     @property
     def CELERY_CONFIG(self) -> dict[str, Any]:
-        return {
+        config = {
             "broker_url": f"redis://{self.REDIS_BROKER_HOST}:{self.REDIS_BROKER_PORT}/0",
             "task_ignore_result": True,
             "result_expires": self.TASK_DATA_DELETE_INTERVAL
@@ -50,6 +50,8 @@ class Settings(BaseSettings):
             "task_acks_late": True,  # Acknowledge tasks after execution, not before
             "worker_prefetch_multiplier": 1,  # Each worker grabs only 1 task at a time
             "worker_hijack_root_logger": False,  # Keep previously configured handlers on the root logger
+            # the warm-up runs before the worker process reports it is up
+            "worker_proc_alive_timeout": self.WORKER_WARM_UP_TIMEOUT,
             "beat_schedule": {
                 "database-cleanup": {
                     "task": "src.tasks.tasks.clear_task_data",
@@ -57,6 +59,11 @@ class Settings(BaseSettings):
                 },
             },
         }
+        if self.WORKER_EXECUTION_MODE == "asyncio":
+            # the tasks wait for their coroutines in threads of a single process
+            config["worker_pool"] = "threads"
+            config["worker_concurrency"] = self.WORKER_ASYNC_CONCURRENCY
+        return config
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -68,6 +75,12 @@ class Settings(BaseSettings):
     def TEMP_DIR(self) -> Path:
         return Path.joinpath(self.ROOT_DIR, "temp").resolve()
 
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def RAW_DATA_CACHE_DIR(self) -> Path:
+        # in the temp directory, which is shared by all workers
+        return Path.joinpath(self.TEMP_DIR, "raw-data-cache").resolve()
+
     @computed_field  # type: ignore[prop-decorator]
     @property
     def RESOURCES_DIR(self) -> Path:
@@ -81,8 +94,95 @@ class Settings(BaseSettings):
         return Path.joinpath(self.ROOT_DIR, "logs").resolve()
 
     TASK_DATA_DELETE_INTERVAL: int = 2  # in hours
+    TASK_DATA_PARTITION_INTERVAL: int = 1  # in hours
+    """Length of the time windows, by which the task results are partitioned. Should divide 24."""
     MAX_PAGINATION_BATCH_COUNT: int = 5000
     """Maximum number of objects (records) returned in a single pagination request."""
+    PHOTOMETRIC_DATA_STREAM_BATCH_SIZE: int = 50_000
+    """Number of photometric data rows fetched from the DB cursor and encoded at once by the streaming endpoint."""
+    LIGHT_CURVE_DEFAULT_POINTS: int = 2000
+    """Default number of points of each downsampled light curve series."""
+    LIGHT_CURVE_MAX_POINTS: int = 20_000
+    """Maximum number of points of each downsampled light curve series, which can be requested."""
+    PHASE_CURVE_MAX_BINS: int = 1000
+    """Maximum number of phase bins of a binned phase curve, which can be requested."""
+    PERIOD_SEARCH_OVERSAMPLING: int = 5
+    """Number of frequencies per width of a periodogram peak in the period search."""
+    PERIOD_SEARCH_MAX_FREQUENCIES: int = 200_000
+    """Maximum number of frequencies of the Lomb-Scargle periodogram, the grid is made coarser above it."""
+    PERIOD_SEARCH_MAX_BLS_PERIODS: int = 20_000
+    """Maximum number of periods of the Box Least Squares periodogram."""
+    HTTP_CLIENT_TIMEOUT: float = 10.0
+    """Default timeout of the requests of the pooled HTTP clients in seconds."""
+    HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST: int = 10
+    """Maximum number of connections of a process to a single host."""
+    HTTP_CLIENT_HOST_MAX_CONNECTIONS: dict[str, int] = {}
+    """Maximum numbers of connections of a process to the listed hosts, overriding HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST."""
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 100
+    """Maximum number of connections of the general HTTP client of a process, which is not bound to a host."""
+    HTTP_CLIENT_HTTP2: bool = True
+    """Whether the pooled HTTP clients negotiate HTTP/2 with the hosts supporting it."""
+    PLUGIN_CACHE_SIZE: int = 32
+    """Maximum number of plugin instances cached by each worker process. Set to 0 to disable the cache."""
+    WORKER_EXECUTION_MODE: Literal["prefork", "asyncio"] = "prefork"
+    """Execution mode of the catalog tasks. In the prefork mode, each worker process executes one task at a time.
+    In the asyncio mode, a single process executes many tasks concurrently on an event loop."""
+    WORKER_ASYNC_CONCURRENCY: int = 64
+    """Maximum number of tasks executed concurrently by a worker in the asyncio mode."""
+    WORKER_WARM_UP: bool = True
+    """Whether each worker process preloads the plugins and astropy data before accepting tasks."""
+    WORKER_WARM_UP_TIMEOUT: float = 120.0
+    """Seconds, for which Celery waits for an initializing worker process, including its warm-up."""
+    PLUGIN_CACHE_INVALIDATION_CHANNEL: str = "plugin-cache-invalidation"
+    """Redis pub/sub channel, by which the API notifies the workers about replaced and deleted plugins."""
+    CATALOG_TASK_QUEUES: list[str] = ["catalog-fast", "catalog-slow"]
+    """Celery queues of the catalog tasks. Each plugin is assigned to one of them, so the slow catalogs do not starve
+    the fast ones. A worker consumes the default queue and all catalog queues, unless it is started with -Q."""
+    DEFAULT_CATALOG_TASK_QUEUE: str = "catalog-fast"
+    """Queue of the catalog tasks of the plugins, which are not assigned to a queue."""
+    SLOW_CATALOG_TASK_QUEUE: str = "catalog-slow"
+    """Queue, to which the default plugins of slow catalogs (e.g. catalogs queueing the requests) are assigned."""
+    RATE_LIMIT_SLOT_LEASE: float = 60 * 60
+    """Seconds after which a concurrency slot of a catalog is released, if the task holding it did not release it (e.g. it crashed)."""
+    RATE_LIMIT_SLOT_POLL_INTERVAL: float = 0.5
+    """Interval in seconds, in which a task waiting for a concurrency slot of a catalog checks for a free slot."""
+    RATE_LIMIT_SLOT_MAX_WAIT: float = 10.0
+    """Seconds a task waits for a concurrency slot of a catalog in the worker. If no slot is free by then,
+    the task is re-scheduled after the same time, so it does not hold the worker while the catalog is saturated."""
+    RATE_LIMIT_REDIS_TIMEOUT: float = 1.0
+    """Timeout of the Redis commands of the rate limits in seconds. The requests are not limited, if Redis does not respond."""
+    PHOTOMETRIC_DATA_MAX_PENDING_BATCHES: int = 4
+    """Maximum number of photometric data batches fetched by a plugin, which wait for insertion into the DB."""
+    PHOTOMETRIC_DATA_BATCH_LIMIT: int = 100
+    """Maximum number of stellar objects, whose photometric data are retrieved by a single batch task."""
+    BULK_TASK_SUBMISSION_LIMIT: int = 500
+    """Maximum number of tasks submitted by a single bulk request."""
+    PHOTOMETRIC_DATA_REUSE_WINDOW: float = 60 * 60
+    """Seconds, for which the photometric data of a completed task are copied to the new tasks of the same stellar object
+    and plugin, instead of retrieving them from the catalog again. Should be shorter than TASK_DATA_DELETE_INTERVAL.
+    Set to 0 to disable the reuse."""
+    PHOTOMETRIC_DATA_JOB_TIMEOUT: float = 6 * 60 * 60
+    """Maximum time in seconds, for which a photometric data task waits for the job preparing the data on the catalog server."""
+    LIGHT_TRAVEL_TIME_CACHE_ACCURACY: float = 1e-6
+    """Maximum interpolation error of cached light travel time corrections in seconds. Set to 0 to disable the cache."""
+    LIGHT_TRAVEL_TIME_CACHE_MAX_BYTES: int = 1024**3
+    """Disk budget of the light travel time cache. The least recently used tables are evicted above it by clear_task_data."""
+    RAW_DATA_CACHE_TTL: float = 24 * 60 * 60
+    """Seconds, for which the raw responses of the catalogs are cached, unless the plugin sets its own TTL. Set to 0 to disable the cache."""
+    RAW_DATA_CACHE_MAX_BYTES: int = 10 * 1024**3
+    """Disk budget of the raw data cache shared by all plugins. The least recently used responses are evicted above it."""
+    RAW_DATA_CACHE_REDIS_TIMEOUT: float = 1.0
+    """Timeout of the Redis commands counting the hits and misses of the raw data cache in seconds."""
+    CONE_SEARCH_CACHE_TTL: float = 24 * 60 * 60
+    """Seconds, for which the stellar objects found by the cone searches are cached, unless the plugin sets its own TTL. Set to 0 to disable the cache."""
+    CONE_SEARCH_CACHE_MIN_RADIUS: float = 1.0
+    """Radius of the smallest bucket of the cone search cache in arcseconds, the radii of the buckets grow by powers of two."""
+    CONE_SEARCH_CACHE_MAX_RADIUS: float = 2 * 60 * 60
+    """Radius in arcseconds, above which the cone searches are not cached."""
+    CONE_SEARCH_CACHE_MAX_IDENTIFIERS: int = 50_000
+    """Maximum number of stellar objects of a cached cone search, the larger searches are not cached."""
+    CONE_SEARCH_CACHE_REDIS_TIMEOUT: float = 1.0
+    """Timeout of the Redis commands of the cone search cache in seconds."""
 
     @computed_field  # type: ignore[prop-decorator]
     @property
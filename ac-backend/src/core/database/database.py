@@ -1,6 +1,13 @@
 import contextlib
 import logging
-from typing import Any, AsyncIterator, Optional, AsyncGenerator
+from typing import (
+    Any,
+    AsyncIterator,
+    Optional,
+    AsyncGenerator,
+    Callable,
+    AsyncContextManager,
+)
 from uuid import UUID
 
 from sqlalchemy import func
@@ -90,3 +97,12 @@ async def get_async_db_session() -> AsyncGenerator[AsyncSession, Any]:
     """Function to provide a FastAPI dependency for a request-scoped AsyncSession."""
     async with async_sessionmanager.session() as session:
         yield session
+
+
+def get_async_db_session_factory() -> Callable[[], AsyncContextManager[AsyncSession]]:
+    """
+    Function to provide a FastAPI dependency for creating sessions, which outlive the request.
+    The request-scoped session is closed before a streaming response is sent, so the response
+    has to open its own session.
+    """
+    return async_sessionmanager.session
@@ -1,8 +1,15 @@
-from typing import Annotated
+from typing import Annotated, AsyncContextManager, Callable
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.database.database import get_async_db_session
+from src.core.database.database import (
+    get_async_db_session,
+    get_async_db_session_factory,
+)
 
 DBSessionDep = Annotated[AsyncSession, Depends(get_async_db_session)]
+DBSessionFactoryDep = Annotated[
+    Callable[[], AsyncContextManager[AsyncSession]],
+    Depends(get_async_db_session_factory),
+]
@@ -0,0 +1 @@
+"""Package provides the pooled HTTP clients shared by the plugins and the API."""
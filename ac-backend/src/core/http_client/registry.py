@@ -0,0 +1,206 @@
+import logging
+import os
+import threading
+from dataclasses import dataclass
+
+import httpx
+
+from src.core.config.config import settings
+from src.core.http_client.schemas import HttpClientStatsDto
+from src.core.rate_limit.limiter import (
+    acquire_current_token,
+    async_acquire_current_token,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _RequestCounter:
+    count: int = 0
+
+
+@dataclass
+class _PooledClient:
+    client: httpx.Client | httpx.AsyncClient
+    origin: str | None
+    timeout: float
+    max_connections: int
+    requests: _RequestCounter
+
+
+def _origin(url: str) -> str:
+    parsed = httpx.URL(url)
+    if not parsed.scheme or not parsed.host:
+        raise ValueError(f"URL {url} has no scheme or host")
+    return f"{parsed.scheme}://{parsed.host}:{parsed.port or (443 if parsed.scheme == 'https' else 80)}"
+
+
+class HttpClientRegistry:
+    """
+    Process-wide registry of pooled HTTP clients. The clients are shared by all plugin instances and tasks
+    of the process, so the connections (including their TLS sessions) are kept alive between the tasks.
+
+    A client is created for each origin (scheme, host and port) and timeout, so the connection limit
+    of its pool is a limit per host. The limit is HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST, unless it is overridden
+    for the host by HTTP_CLIENT_HOST_MAX_CONNECTIONS. HTTP/2 is negotiated with the HTTPS hosts supporting it,
+    the others use HTTP/1.1. The general client, which is not bound to an origin, is limited by
+    HTTP_CLIENT_MAX_CONNECTIONS in total.
+
+    The clients are closed by the registry, not by their users. The registry of a forked process
+    drops the clients of the parent, as their connections belong to the parent.
+    """
+
+    def __init__(self) -> None:
+        self._clients: dict[tuple[bool, str | None, float], _PooledClient] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def client(
+        self, url: str | None = None, timeout: float | None = None
+    ) -> httpx.Client:
+        """
+        Returns the pooled client for the origin of the URL.
+
+        :param url: any URL of the host the client is used for, None for the general client.
+        :param timeout: timeout of the requests in seconds, HTTP_CLIENT_TIMEOUT by default.
+        :return: the shared client, which must not be closed by the caller.
+        """
+        return self._get(False, url, timeout)  # type: ignore[return-value]
+
+    def async_client(
+        self, url: str | None = None, timeout: float | None = None
+    ) -> httpx.AsyncClient:
+        """
+        Async counterpart of client.
+
+        :param url: any URL of the host the client is used for, None for the general client.
+        :param timeout: timeout of the requests in seconds, HTTP_CLIENT_TIMEOUT by default.
+        :return: the shared client, which must not be closed by the caller.
+        """
+        return self._get(True, url, timeout)  # type: ignore[return-value]
+
+    def _get(
+        self, asynchronous: bool, url: str | None, timeout: float | None
+    ) -> httpx.Client | httpx.AsyncClient:
+        origin = None if url is None else _origin(url)
+        timeout = settings.HTTP_CLIENT_TIMEOUT if timeout is None else timeout
+        key = (asynchronous, origin, timeout)
+
+        with self._lock:
+            if self._pid != os.getpid():
+                self._clients = {}
+                self._pid = os.getpid()
+
+            if key not in self._clients:
+                self._clients[key] = self._create(asynchronous, origin, timeout)
+            return self._clients[key].client
+
+    def _create(
+        self, asynchronous: bool, origin: str | None, timeout: float
+    ) -> _PooledClient:
+        if origin is None:
+            max_connections = settings.HTTP_CLIENT_MAX_CONNECTIONS
+        else:
+            max_connections = settings.HTTP_CLIENT_HOST_MAX_CONNECTIONS.get(
+                httpx.URL(origin).host, settings.HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST
+            )
+        requests = _RequestCounter()
+
+        # the requests of a task holding a rate limit slot wait for the tokens of the limit
+        def on_request(_: httpx.Request) -> None:
+            acquire_current_token()
+            requests.count += 1
+
+        async def on_async_request(_: httpx.Request) -> None:
+            await async_acquire_current_token()
+            requests.count += 1
+
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+        client: httpx.Client | httpx.AsyncClient
+        if asynchronous:
+            client = httpx.AsyncClient(
+                timeout=timeout,
+                limits=limits,
+                http2=settings.HTTP_CLIENT_HTTP2,
+                event_hooks={"request": [on_async_request]},
+            )
+        else:
+            client = httpx.Client(
+                timeout=timeout,
+                limits=limits,
+                http2=settings.HTTP_CLIENT_HTTP2,
+                event_hooks={"request": [on_request]},
+            )
+
+        logger.info(
+            f"Created HTTP client for {origin or 'general use'} "
+            f"(timeout {timeout} s, {max_connections} connections)"
+        )
+        return _PooledClient(
+            client=client,
+            origin=origin,
+            timeout=timeout,
+            max_connections=max_connections,
+            requests=requests,
+        )
+
+    def stats(self) -> list[HttpClientStatsDto]:
+        """
+        Returns the pool usage of the clients of the process.
+
+        :return: statistics of each client.
+        """
+        with self._lock:
+            pooled_clients = list(self._clients.values())
+
+        stats = []
+        for pooled in pooled_clients:
+            # the pools are not part of the public httpx API
+            pool = getattr(pooled.client._transport, "_pool", None)
+            connections = list(getattr(pool, "connections", []))
+            requests = list(getattr(pool, "_requests", []))
+            stats.append(
+                HttpClientStatsDto(
+                    origin=pooled.origin,
+                    asynchronous=isinstance(pooled.client, httpx.AsyncClient),
+                    timeout=pooled.timeout,
+                    http2=settings.HTTP_CLIENT_HTTP2,
+                    max_connections=pooled.max_connections,
+                    requests=pooled.requests.count,
+                    open_connections=len(connections),
+                    idle_connections=sum(
+                        connection.is_idle() for connection in connections
+                    ),
+                    queued_requests=sum(
+                        request.connection is None for request in requests
+                    ),
+                )
+            )
+        return stats
+
+    def close(self) -> None:
+        """Closes the sync clients. The async clients are closed by aclose."""
+        with self._lock:
+            for key, pooled in list(self._clients.items()):
+                if isinstance(pooled.client, httpx.Client):
+                    pooled.client.close()
+                    del self._clients[key]
+
+    async def aclose(self) -> None:
+        """Closes all clients."""
+        with self._lock:
+            pooled_clients = list(self._clients.values())
+            self._clients = {}
+
+        for pooled in pooled_clients:
+            if isinstance(pooled.client, httpx.AsyncClient):
+                await pooled.client.aclose()
+            else:
+                pooled.client.close()
+
+
+http_clients = HttpClientRegistry()
@@ -0,0 +1,23 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+
+from src.core.http_client.registry import http_clients
+from src.core.http_client.schemas import HttpClientStatsDto
+from src.core.security.auth import required_roles
+from src.core.security.models import User
+from src.core.security.schemas import UserRoleEnum
+
+router = APIRouter(
+    prefix="/api/http-clients",
+    tags=["http-clients"],
+    responses={404: {"description": "Not found"}},
+)
+
+
+@router.get("/stats")
+async def get_stats(
+    _: Annotated[User, Depends(required_roles(UserRoleEnum.super_admin))],
+) -> list[HttpClientStatsDto]:
+    """Pool usage of the HTTP clients of the API process"""
+    return http_clients.stats()
@@ -0,0 +1,18 @@
+from src.core.repository.schemas import BaseDto
+
+
+class HttpClientStatsDto(BaseDto):
+    """Usage of the connection pool of a pooled HTTP client."""
+
+    origin: str | None
+    """Origin (scheme, host and port) the client is used for, None for the general client."""
+    asynchronous: bool
+    timeout: float
+    http2: bool
+    max_connections: int
+    requests: int
+    """Number of requests sent by the client."""
+    open_connections: int
+    idle_connections: int
+    queued_requests: int
+    """Number of requests waiting for a connection of the pool."""
@@ -0,0 +1 @@
+"""Package provides the distributed rate limits of the requests to the catalogs."""
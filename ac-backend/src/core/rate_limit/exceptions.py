@@ -0,0 +1,27 @@
+from http import HTTPStatus
+
+from src.core.exception.exceptions import ACException
+
+
+class RateLimitStatsUnavailableException(ACException):
+    """Exception for the statistics of the rate limits, which cannot be read from Redis"""
+
+    CODE = "RATE_LIMIT_STATS_UNAVAILABLE_ERROR"
+    HTTP_STATUS = HTTPStatus.SERVICE_UNAVAILABLE
+
+    def __init__(self) -> None:
+        super().__init__(
+            "Statistics of the rate limits are not available",
+            self.CODE,
+            self.HTTP_STATUS,
+        )
+
+
+class ConcurrencySlotUnavailableException(Exception):
+    """Exception for a task, which did not acquire a concurrency slot of a catalog within RATE_LIMIT_SLOT_MAX_WAIT"""
+
+    def __init__(self, name: str, countdown: float) -> None:
+        super().__init__(
+            f"No concurrency slot of rate limit {name} was free within {countdown} s"
+        )
+        self.countdown = countdown
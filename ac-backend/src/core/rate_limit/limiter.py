@@ -0,0 +1,289 @@
+import asyncio
+import logging
+import time
+import uuid
+from uuid import UUID
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from functools import cache
+
+import redis
+from redis.asyncio import Redis
+
+from src.core.config.config import settings
+from src.core.rate_limit.exceptions import (
+    ConcurrencySlotUnavailableException,
+    RateLimitStatsUnavailableException,
+)
+from src.core.rate_limit.schemas import RateLimitStatsDto
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "rate-limit"
+
+# Token bucket refilled by `rate` tokens per second up to `burst` tokens. Every call reserves a token,
+# the bucket may go into debt, so the concurrent callers are served in the order of their calls.
+# Returns the time in seconds, after which the reserved token is available.
+_RESERVE_TOKEN_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(bucket[1]) or burst
+local updated = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated) * rate) - 1
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil((burst - tokens) / rate) + 1)
+return tostring(math.max(0, -tokens) / rate)
+"""
+
+# Semaphore stored as a sorted set of the holders scored by the expiration of their leases,
+# so the slots of crashed workers are released after the lease. Returns 1 if the slot was acquired.
+_ACQUIRE_SLOT_SCRIPT = """
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local lease = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+if redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[1]) then
+    redis.call('ZADD', KEYS[1], now + lease, ARGV[2])
+    redis.call('EXPIRE', KEYS[1], math.ceil(lease))
+    return 1
+end
+return 0
+"""
+
+_current_limiter: ContextVar["RateLimiter | None"] = ContextVar(
+    "current_rate_limiter", default=None
+)
+
+
+@cache
+def _redis_client() -> redis.Redis:
+    # the connection pool of the client reconnects in forked processes
+    return redis.Redis(
+        host=settings.REDIS_DB_HOST,
+        port=settings.REDIS_DB_PORT,
+        socket_timeout=settings.RATE_LIMIT_REDIS_TIMEOUT,
+        socket_connect_timeout=settings.RATE_LIMIT_REDIS_TIMEOUT,
+    )
+
+
+def plugin_limit_name(plugin_id: UUID) -> str:
+    """Returns the name of the rate limit of the catalog of the plugin."""
+    return f"plugin:{plugin_id}"
+
+
+class RateLimiter:
+    """
+    Distributed rate limit of the requests to a catalog, shared by all workers through Redis.
+    The limit consists of a token bucket, which limits the rate of the requests, and a semaphore,
+    which limits the number of tasks using the catalog concurrently. The limits, which are None, are not applied.
+
+    A task acquires a slot of the semaphore by the slot context manager for the time it uses the catalog.
+    Within the slot, each request of the pooled HTTP clients takes a token of the bucket, so the plugins
+    are limited without any changes. Requests made by other means can take a token by acquire_token.
+
+    The limits are best effort: if Redis is not available, the requests are not limited.
+    A task, which does not get a slot within RATE_LIMIT_SLOT_MAX_WAIT, gets ConcurrencySlotUnavailableException,
+    so it can be re-scheduled instead of waiting in the worker.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: float | None = None,
+        burst: int | None = None,
+        max_concurrency: int | None = None,
+        redis_client: redis.Redis | None = None,
+    ) -> None:
+        """
+        Create new rate limiter.
+        :param name: name of the limited resource (e.g. the plugin ID), the limiters of the same name share the limits
+        :param rate: maximum number of requests per second
+        :param burst: maximum number of requests sent at once after a period of inactivity, 1 by default
+        :param max_concurrency: maximum number of concurrent slots
+        :param redis_client: Redis client, the client of the process by default
+        """
+        self._name = name
+        self._rate = rate
+        self._burst = max(1, burst or 1)
+        self._max_concurrency = max_concurrency
+        self._redis_client = redis_client
+
+    @property
+    def _redis(self) -> redis.Redis:
+        return self._redis_client or _redis_client()
+
+    def _key(self, kind: str) -> str:
+        return f"{KEY_PREFIX}:{self._name}:{kind}"
+
+    def _record_wait(self, counter: str, wait: float) -> None:
+        if wait > 1:
+            logger.info(
+                f"Waited {wait:.2f} s for a {counter} of rate limit {self._name}"
+            )
+        try:
+            with self._redis.pipeline(transaction=False) as pipeline:
+                pipeline.hincrby(self._key("stats"), f"{counter}s", 1)
+                pipeline.hincrbyfloat(
+                    self._key("stats"), f"{counter}_wait_seconds", wait
+                )
+                pipeline.execute()
+        except redis.RedisError as e:
+            logger.warning(
+                f"Wait time of rate limit {self._name} was not recorded: {e}"
+            )
+
+    def acquire_token(self) -> float:
+        """
+        Waits for a token of the bucket.
+
+        :return: the time waited in seconds.
+        """
+        if self._rate is None:
+            return 0.0
+
+        try:
+            wait = float(
+                self._redis.register_script(_RESERVE_TOKEN_SCRIPT)(
+                    keys=[self._key("bucket")], args=[self._rate, self._burst]
+                )
+            )
+            time.sleep(wait)
+            self._record_wait("request", wait)
+            return wait
+        except redis.RedisError as e:
+            logger.warning(f"Rate limit {self._name} is not applied: {e}")
+            return 0.0
+
+    def _acquire_slot(self, holder: str, max_concurrency: int) -> float:
+        start = time.monotonic()
+        deadline = start + settings.RATE_LIMIT_SLOT_MAX_WAIT
+        script = self._redis.register_script(_ACQUIRE_SLOT_SCRIPT)
+        args: list[str | int | float] = [
+            max_concurrency,
+            holder,
+            settings.RATE_LIMIT_SLOT_LEASE,
+        ]
+        while not script(keys=[self._key("slots")], args=args):
+            if time.monotonic() >= deadline:
+                raise ConcurrencySlotUnavailableException(
+                    self._name, settings.RATE_LIMIT_SLOT_MAX_WAIT
+                )
+            time.sleep(settings.RATE_LIMIT_SLOT_POLL_INTERVAL)
+
+        wait = time.monotonic() - start
+        self._record_wait("slot", wait)
+        return wait
+
+    def _release_slot(self, holder: str) -> None:
+        try:
+            self._redis.zrem(self._key("slots"), holder)
+        except redis.RedisError as e:
+            # the slot is released after its lease
+            logger.warning(f"Slot of rate limit {self._name} was not released: {e}")
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """
+        Waits for a slot of the semaphore and holds it within the context. The requests of the pooled HTTP clients
+        made within the context take the tokens of the bucket.
+
+        :raises ConcurrencySlotUnavailableException: if no slot is free within RATE_LIMIT_SLOT_MAX_WAIT.
+        """
+        holder = None
+        if self._max_concurrency is not None:
+            try:
+                holder = str(uuid.uuid4())
+                self._acquire_slot(holder, self._max_concurrency)
+            except redis.RedisError as e:
+                logger.warning(f"Concurrency limit {self._name} is not applied: {e}")
+                holder = None
+
+        token = _current_limiter.set(self)
+        try:
+            yield
+        finally:
+            _current_limiter.reset(token)
+            if holder is not None:
+                self._release_slot(holder)
+
+    @asynccontextmanager
+    async def async_slot(self) -> AsyncIterator[None]:
+        """
+        Async counterpart of slot. Redis is called in threads, so the event loop is not blocked by the waiting.
+        """
+        holder = None
+        if self._max_concurrency is not None:
+            try:
+                holder = str(uuid.uuid4())
+                await asyncio.to_thread(
+                    self._acquire_slot, holder, self._max_concurrency
+                )
+            except redis.RedisError as e:
+                logger.warning(f"Concurrency limit {self._name} is not applied: {e}")
+                holder = None
+
+        token = _current_limiter.set(self)
+        try:
+            yield
+        finally:
+            _current_limiter.reset(token)
+            if holder is not None:
+                await asyncio.to_thread(self._release_slot, holder)
+
+
+def check_rate_limits() -> None:
+    """
+    Checks that the rate limits can be applied, so a worker, which cannot reach Redis, reports it at its start
+    instead of silently sending unlimited requests.
+
+    :raises redis.RedisError: if Redis is not available.
+    """
+    _redis_client().ping()
+
+
+def acquire_current_token() -> None:
+    """Waits for a token of the rate limiter, whose slot is held by the current context, if any."""
+    limiter = _current_limiter.get()
+    if limiter is not None:
+        limiter.acquire_token()
+
+
+async def async_acquire_current_token() -> None:
+    """Async counterpart of acquire_current_token."""
+    limiter = _current_limiter.get()
+    if limiter is not None:
+        await asyncio.to_thread(limiter.acquire_token)
+
+
+async def get_rate_limit_stats(redis_client: Redis, name: str) -> RateLimitStatsDto:
+    """
+    Returns the usage of the rate limit of the given name.
+
+    :param redis_client: Redis client of the API.
+    :param name: name of the limited resource.
+    :return: statistics of the rate limit.
+    :raises RateLimitStatsUnavailableException: if Redis is not available.
+    """
+    try:
+        async with redis_client.pipeline(transaction=False) as pipeline:
+            pipeline.hgetall(f"{KEY_PREFIX}:{name}:stats")
+            pipeline.zcount(f"{KEY_PREFIX}:{name}:slots", time.time(), "+inf")
+            stats, active_slots = await pipeline.execute()
+    except redis.RedisError as e:
+        raise RateLimitStatsUnavailableException() from e
+
+    stats = {
+        (key.decode() if isinstance(key, bytes) else key): float(value)
+        for key, value in stats.items()
+    }
+    return RateLimitStatsDto(
+        requests=int(stats.get("requests", 0)),
+        request_wait_seconds=stats.get("request_wait_seconds", 0.0),
+        slots=int(stats.get("slots", 0)),
+        slot_wait_seconds=stats.get("slot_wait_seconds", 0.0),
+        active_slots=active_slots,
+    )
@@ -0,0 +1,16 @@
+from src.core.repository.schemas import BaseDto
+
+
+class RateLimitStatsDto(BaseDto):
+    """Usage of a distributed rate limit, summed over all workers."""
+
+    requests: int
+    """Number of requests, which acquired a token of the bucket."""
+    request_wait_seconds: float
+    """Total time the requests waited for the tokens."""
+    slots: int
+    """Number of tasks, which acquired a concurrency slot."""
+    slot_wait_seconds: float
+    """Total time the tasks waited for the slots."""
+    active_slots: int
+    """Number of currently held slots."""
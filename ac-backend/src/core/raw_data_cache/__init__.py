@@ -0,0 +1 @@
+"""Package provides the persistent cache of the raw responses of the catalogs."""
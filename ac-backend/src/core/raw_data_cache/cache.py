@@ -0,0 +1,327 @@
+import asyncio
+import logging
+import os
+import shutil
+import time
+import uuid
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cache
+from pathlib import Path
+from uuid import UUID
+
+import redis
+from redis.asyncio import Redis
+
+from src.core.config.config import settings
+from src.core.raw_data_cache.exceptions import RawDataCacheStatsUnavailableException
+from src.core.raw_data_cache.schemas import RawDataCacheStatsDto
+from src.plugin.interface.schemas import StellarObjectIdentificatorDto
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "raw-data-cache"
+
+# the files being written are hidden by the prefix, until they are complete and renamed to their entry
+TEMP_FILE_PREFIX = "."
+# seconds, after which the temporary files of crashed writers are removed
+STALE_TEMP_FILE_AGE = 60 * 60
+
+_current_cache: ContextVar["RawDataCache | None"] = ContextVar(
+    "current_raw_data_cache", default=None
+)
+
+
+@cache
+def _redis_client() -> redis.Redis:
+    # the connection pool of the client reconnects in forked processes
+    return redis.Redis(
+        host=settings.REDIS_DB_HOST,
+        port=settings.REDIS_DB_PORT,
+        socket_timeout=settings.RAW_DATA_CACHE_REDIS_TIMEOUT,
+        socket_connect_timeout=settings.RAW_DATA_CACHE_REDIS_TIMEOUT,
+    )
+
+
+def _stats_key(plugin_id: UUID | str) -> str:
+    return f"{KEY_PREFIX}:{plugin_id}:stats"
+
+
+def _record(
+    redis_client: redis.Redis, counts: dict[UUID | str, dict[str, int]]
+) -> None:
+    try:
+        with redis_client.pipeline(transaction=False) as pipeline:
+            for plugin_id, plugin_counts in counts.items():
+                for counter, count in plugin_counts.items():
+                    pipeline.hincrby(_stats_key(plugin_id), counter, count)
+            pipeline.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Raw data cache statistics were not recorded: {e}")
+
+
+def link_or_copy(source: Path, target: Path) -> None:
+    """
+    Replaces the target file by a hard link of the source file, or by its copy, if they are on different filesystems.
+    The files must not be modified afterwards, as they may share the data.
+
+    :param source: the existing file.
+    :param target: the linked or copied file.
+    """
+    target.unlink(missing_ok=True)
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+
+
+class RawDataCache:
+    """
+    Persistent cache of the raw responses of the catalog of a plugin, shared by all workers through the temp directory.
+    Each response is stored as a file named by the plugin ID and the content hash of the identificator
+    (see StellarObjectIdentificatorDto.content_hash), so the raw data of a stellar object are fetched from the catalog
+    at most once per TTL of the plugin.
+
+    The entries of all plugins share a disk budget. When it is exceeded, the least recently used entries are evicted
+    by evict_raw_data_cache. The modification time of an entry is the time it was stored, its access time is set
+    by the cache on each hit.
+
+    A task sets the cache of its plugin by the scope context manager, the plugins use it by the helpers
+    of the plugin base classes. The hits, misses, stores and evictions are counted in Redis on a best effort basis.
+    """
+
+    def __init__(
+        self,
+        plugin_id: UUID,
+        ttl: float,
+        max_bytes: int | None = None,
+        directory: Path | None = None,
+        redis_client: redis.Redis | None = None,
+    ) -> None:
+        """
+        Create new raw data cache.
+        :param plugin_id: ID of the plugin, whose responses are cached
+        :param ttl: seconds, for which the responses are cached, the cache is disabled if not positive
+        :param max_bytes: disk budget of all plugins, RAW_DATA_CACHE_MAX_BYTES by default
+        :param directory: root directory of the cache, RAW_DATA_CACHE_DIR by default
+        :param redis_client: Redis client counting the statistics, the client of the process by default
+        """
+        self._plugin_id = plugin_id
+        self._ttl = ttl
+        self._max_bytes = (
+            settings.RAW_DATA_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        )
+        self._directory = directory or settings.RAW_DATA_CACHE_DIR
+        self._redis_client = redis_client
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0 and self._max_bytes > 0
+
+    @property
+    def _redis(self) -> redis.Redis:
+        return self._redis_client or _redis_client()
+
+    def _path(self, identificator: StellarObjectIdentificatorDto) -> Path:
+        return self._directory / str(self._plugin_id) / identificator.content_hash()
+
+    def _fresh_entry(self, path: Path) -> os.stat_result | None:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        if time.time() - stat.st_mtime > self._ttl:
+            return None
+        return stat
+
+    def _record(self, counts: dict[str, int]) -> None:
+        _record(self._redis, {self._plugin_id: counts})
+
+    def contains(self, identificator: StellarObjectIdentificatorDto) -> bool:
+        """
+        Checks whether the raw data of the stellar object are cached and not expired, without using them.
+
+        :param identificator: the stellar object of the raw data.
+        :return: whether the raw data can be loaded.
+        """
+        return self.enabled and self._fresh_entry(self._path(identificator)) is not None
+
+    def load(self, identificator: StellarObjectIdentificatorDto, target: Path) -> bool:
+        """
+        Writes the cached raw data of the stellar object to the target file, if they are cached and not expired.
+
+        :param identificator: the stellar object of the raw data.
+        :param target: path of the file, to which the raw data are written.
+        :return: whether the raw data were written.
+        """
+        if not self.enabled:
+            return False
+
+        path = self._path(identificator)
+        stat = self._fresh_entry(path)
+        if stat is not None:
+            try:
+                link_or_copy(path, target)
+                # marks the entry as recently used for the eviction
+                os.utime(path, (time.time(), stat.st_mtime))
+            except FileNotFoundError:
+                # evicted by other worker meanwhile
+                stat = None
+
+        if stat is None:
+            self._record({"misses": 1})
+            return False
+
+        self._record({"hits": 1, "hit_bytes": stat.st_size})
+        return True
+
+    def store(self, identificator: StellarObjectIdentificatorDto, source: Path) -> None:
+        """
+        Stores the raw data of the stellar object in the cache. The cache is kept within the disk budget
+        by the periodic task data cleanup, see evict_raw_data_cache. The failures are only logged,
+        as the raw data were already retrieved.
+
+        :param identificator: the stellar object of the raw data.
+        :param source: path of the file with the raw data, it must not be modified afterwards.
+        """
+        if not self.enabled:
+            return
+
+        path = self._path(identificator)
+        temp_path = path.with_name(f"{TEMP_FILE_PREFIX}{path.name}.{uuid.uuid4().hex}")
+        try:
+            size = source.stat().st_size
+            if size > self._max_bytes:
+                return
+            path.parent.mkdir(parents=True, exist_ok=True)
+            link_or_copy(source, temp_path)
+            # readers see either the previous or the complete entry
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Raw data of {identificator} were not cached: {e}")
+            temp_path.unlink(missing_ok=True)
+            return
+
+        self._record({"stores": 1, "stored_bytes": size})
+
+    @contextmanager
+    def scope(self) -> Iterator[None]:
+        """
+        Makes the cache available to the plugin helpers within the context, if it is enabled.
+        """
+        token = _current_cache.set(self if self.enabled else None)
+        try:
+            yield
+        finally:
+            _current_cache.reset(token)
+
+
+def current_raw_data_cache() -> RawDataCache | None:
+    """Returns the raw data cache set by the scope of the current context, None if there is none."""
+    return _current_cache.get()
+
+
+def evict_raw_data_cache(
+    max_bytes: int | None = None,
+    directory: Path | None = None,
+    redis_client: redis.Redis | None = None,
+) -> int:
+    """
+    Removes the least recently used entries of all plugins, until the raw data cache fits into its disk budget,
+    and the temporary files of crashed writers. The whole cache directory is scanned, so the eviction runs
+    with the periodic task data cleanup instead of on every store.
+
+    :param max_bytes: disk budget of all plugins, RAW_DATA_CACHE_MAX_BYTES by default.
+    :param directory: root directory of the cache, RAW_DATA_CACHE_DIR by default.
+    :param redis_client: Redis client counting the statistics, the client of the process by default.
+    :return: number of the evicted entries.
+    """
+    max_bytes = settings.RAW_DATA_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    directory = directory or settings.RAW_DATA_CACHE_DIR
+
+    entries = []
+    now = time.time()
+    for path in directory.glob("*/*"):
+        try:
+            stat = path.stat()
+            if path.name.startswith(TEMP_FILE_PREFIX):
+                if now - stat.st_mtime > STALE_TEMP_FILE_AGE:
+                    path.unlink()
+                continue
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_atime, stat.st_size, path))
+
+    total_bytes = sum(size for _, size, _ in entries)
+    if total_bytes <= max_bytes:
+        return 0
+
+    evictions: Counter[str] = Counter()
+    for _, size, path in sorted(entries):
+        if total_bytes <= max_bytes:
+            break
+        try:
+            path.unlink()
+            evictions[path.parent.name] += 1
+        except FileNotFoundError:
+            # evicted by other worker meanwhile
+            pass
+        total_bytes -= size
+
+    _record(
+        redis_client or _redis_client(),
+        {plugin_id: {"evictions": count} for plugin_id, count in evictions.items()},
+    )
+    return evictions.total()
+
+
+def _disk_usage(directory: Path) -> tuple[int, int]:
+    entries = 0
+    size_bytes = 0
+    for path in directory.glob("*"):
+        if path.name.startswith(TEMP_FILE_PREFIX):
+            continue
+        try:
+            size_bytes += path.stat().st_size
+        except FileNotFoundError:
+            continue
+        entries += 1
+    return entries, size_bytes
+
+
+async def get_raw_data_cache_stats(
+    redis_client: Redis, plugin_id: UUID, directory: Path | None = None
+) -> RawDataCacheStatsDto:
+    """
+    Returns the usage of the raw data cache of the plugin.
+
+    :param redis_client: Redis client of the API.
+    :param plugin_id: ID of the plugin.
+    :param directory: root directory of the cache, RAW_DATA_CACHE_DIR by default.
+    :return: statistics of the raw data cache.
+    :raises RawDataCacheStatsUnavailableException: if Redis is not available.
+    """
+    try:
+        stats = await redis_client.hgetall(_stats_key(plugin_id))
+    except redis.RedisError as e:
+        raise RawDataCacheStatsUnavailableException() from e
+
+    stats = {
+        (key.decode() if isinstance(key, bytes) else key): int(value)
+        for key, value in stats.items()
+    }
+    entries, size_bytes = await asyncio.to_thread(
+        _disk_usage, (directory or settings.RAW_DATA_CACHE_DIR) / str(plugin_id)
+    )
+    return RawDataCacheStatsDto(
+        hits=stats.get("hits", 0),
+        misses=stats.get("misses", 0),
+        stores=stats.get("stores", 0),
+        evictions=stats.get("evictions", 0),
+        hit_bytes=stats.get("hit_bytes", 0),
+        stored_bytes=stats.get("stored_bytes", 0),
+        entries=entries,
+        size_bytes=size_bytes,
+    )
@@ -0,0 +1,17 @@
+from http import HTTPStatus
+
+from src.core.exception.exceptions import ACException
+
+
+class RawDataCacheStatsUnavailableException(ACException):
+    """Exception for the statistics of the raw data cache, which cannot be read from Redis"""
+
+    CODE = "RAW_DATA_CACHE_STATS_UNAVAILABLE_ERROR"
+    HTTP_STATUS = HTTPStatus.SERVICE_UNAVAILABLE
+
+    def __init__(self) -> None:
+        super().__init__(
+            "Statistics of the raw data cache are not available",
+            self.CODE,
+            self.HTTP_STATUS,
+        )
@@ -0,0 +1,22 @@
+from src.core.repository.schemas import BaseDto
+
+
+class RawDataCacheStatsDto(BaseDto):
+    """Usage of the raw data cache of a plugin, summed over all workers."""
+
+    hits: int
+    """Number of raw responses loaded from the cache."""
+    misses: int
+    """Number of raw responses, which were not cached or expired."""
+    stores: int
+    """Number of raw responses stored in the cache."""
+    evictions: int
+    """Number of raw responses evicted to keep the cache within its disk budget."""
+    hit_bytes: int
+    """Total size of the raw responses loaded from the cache."""
+    stored_bytes: int
+    """Total size of the raw responses stored in the cache."""
+    entries: int
+    """Number of currently cached raw responses."""
+    size_bytes: int
+    """Total size of the currently cached raw responses."""
@@ -1,8 +1,25 @@
+import base64
+import binascii
+import json
+import uuid
 from typing import TypeVar, Generic, Any, Optional, Literal
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Sequence
 from uuid import UUID
 
-from sqlalchemy import select, func, and_, or_, desc, asc
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import to_jsonable_python
+from sqlalchemy import (
+    Row,
+    Select,
+    select,
+    insert,
+    func,
+    and_,
+    or_,
+    desc,
+    asc,
+    tuple_,
+)
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -46,6 +63,43 @@ class Filters(BaseDto):
     distinct: Distinct | None = None
 
 
+def encode_cursor(fields: list[str], values: list[Any]) -> str:
+    """
+    Encodes the sort key of the last entity of a page into an opaque cursor.
+
+    :param fields: names of the sort key columns.
+    :param values: values of the sort key columns.
+    :return: URL-safe cursor.
+    """
+    payload = json.dumps({"fields": fields, "values": to_jsonable_python(values)})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str, fields: list[str]) -> list[Any]:
+    """
+    Decodes the sort key values from a cursor created by encode_cursor.
+
+    :param cursor: the cursor.
+    :param fields: names of the expected sort key columns.
+    :return: JSON values of the sort key columns.
+    :raises RepositoryException: if the cursor is malformed or was created for other sort key.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise RepositoryException("Invalid cursor")
+
+    if (
+        not isinstance(payload, dict)
+        or payload.get("fields") != fields
+        or not isinstance(payload.get("values"), list)
+        or len(payload["values"]) != len(fields)
+    ):
+        raise RepositoryException("Invalid cursor")
+
+    return payload["values"]
+
+
 class Repository(Generic[Entity]):
     def __init__(self, model: type[Entity], session: AsyncSession):
         self._session = session
@@ -110,12 +164,29 @@ class Repository(Generic[Entity]):
 
         return and_(True, *expressions)
 
+    async def _count(self, stmt: Select[Any]) -> int:
+        count_stmt = select(func.count()).select_from(stmt.subquery())
+        result = await self._session.execute(count_stmt)
+        return result.scalar_one()
+
+    async def count(self, filters: dict[str, Any] | None = None) -> int:
+        """
+        Counts the entities matching the filters.
+
+        :param filters: Filters in the format of Filters.filters.
+        :return: number of the matching entities.
+        """
+        orm_filters = self._build_filter(**(filters or {}))
+        return await self._count(
+            select(self._model).select_from(self._model).where(orm_filters)
+        )
+
     async def find_first(
         self,
         filters: Filters | None = None,
     ) -> Optional[Entity]:
-        total_count, entities = await self.find(filters=filters)
-        if total_count == 0:
+        _, entities = await self.find(count=1, filters=filters, with_total=False)
+        if not entities:
             return None
         return entities[0]
 
@@ -133,7 +204,8 @@ class Repository(Generic[Entity]):
         offset: int = 0,
         count: int = settings.MAX_PAGINATION_BATCH_COUNT,
         filters: Filters | None = None,
-    ) -> tuple[int, list[Entity]]:
+        with_total: bool = True,
+    ) -> tuple[int | None, list[Entity]]:
         """
         Fetches a subset of entities from the repository based on the given filters
         and constraints. This method supports features such as filtering, sorting,
@@ -149,10 +221,13 @@ class Repository(Generic[Entity]):
         :param filters: Optional set of filters to apply while querying the repository.
             This includes filtering options, ordering, and distinct field constraints.
         :type filters: Filters | None
+        :param with_total: Whether to count all entities matching the filters. The count is
+            an extra query, which scans all the matching rows.
+        :type with_total: bool
         :return: A tuple where the first element is the total count of entities that
-            match the filters, and the second element is the list of entities retrieved
-            within the range defined by `offset` and `count`.
-        :rtype: tuple[int, list[Entity]]
+            match the filters (None if not requested), and the second element is the list
+            of entities retrieved within the range defined by `offset` and `count`.
+        :rtype: tuple[int | None, list[Entity]]
         """
         count = (
             count
@@ -185,9 +260,7 @@ class Repository(Generic[Entity]):
             base_stmt = base_stmt.distinct(*cols)
 
         # count of all rows
-        count_stmt = select(func.count()).select_from(base_stmt.subquery())
-        entity_count_result = await self._session.execute(count_stmt)
-        entity_count = entity_count_result.scalar()
+        entity_count = await self._count(base_stmt) if with_total else None
 
         # get all rows
         entity_stmt = base_stmt.offset(offset).limit(count)
@@ -195,6 +268,156 @@ class Repository(Generic[Entity]):
 
         return entity_count, list(result.scalars().all())
 
+    async def find_by_cursor(
+        self,
+        cursor: str | None = None,
+        count: int = settings.MAX_PAGINATION_BATCH_COUNT,
+        filters: Filters | None = None,
+        offset: int = 0,
+        key: str = "id",
+        with_total: bool = True,
+    ) -> tuple[int | None, list[Entity], str | None]:
+        """
+        Fetches a page of entities using keyset pagination. The entities are sorted by the order_by field
+        of the filters, or by the key field, with the entity ID as a tie-breaker. Instead of skipping
+        the previous rows as with offset, the page starts right after the sort key encoded in the cursor,
+        so every page is fetched in the same time.
+
+        :param cursor: Cursor returned with the previous page, or None for the first page.
+        :type cursor: str | None
+        :param count: Maximum number of entities to retrieve, capped at `settings.MAX_PAGINATION_BATCH_COUNT`.
+        :type count: int
+        :param filters: Optional set of filters and ordering. The sort field must not be nullable.
+            Distinct is not supported.
+        :type filters: Filters | None
+        :param offset: Number of entities skipped after the cursor. Allows offset pagination with
+            a deterministic order.
+        :type offset: int
+        :param key: Field sorted by, if the filters do not specify the order.
+        :type key: str
+        :param with_total: Whether to count all entities matching the filters.
+        :type with_total: bool
+        :return: A tuple of the total count of entities that match the filters (None if not requested),
+            the entities of the page and the cursor of the next page, which is None if there are no more entities.
+        :rtype: tuple[int | None, list[Entity], str | None]
+        """
+        count = min(count, settings.MAX_PAGINATION_BATCH_COUNT)
+
+        if filters is not None and filters.distinct is not None:
+            raise RepositoryException(
+                "Distinct is not supported with cursor pagination"
+            )
+
+        order_by = (
+            filters.order_by
+            if filters is not None and filters.order_by is not None
+            else OrderBy(field=key)
+        )
+        fields = [order_by.field] if order_by.field == "id" else [order_by.field, "id"]
+        try:
+            columns = [getattr(self._model, field) for field in fields]
+        except AttributeError as e:
+            raise RepositoryException(f"Unknown field: {e}")
+
+        orm_filters = self._build_filter(**(filters.filters if filters else {}))
+        base_stmt = select(self._model).select_from(self._model).where(orm_filters)
+
+        # count of all rows
+        entity_count = await self._count(base_stmt) if with_total else None
+
+        entity_stmt = base_stmt
+        if cursor is not None:
+            try:
+                values = [
+                    TypeAdapter(column.type.python_type).validate_python(value)
+                    for column, value in zip(columns, decode_cursor(cursor, fields))
+                ]
+            except ValidationError:
+                raise RepositoryException("Invalid cursor")
+            # row comparison, i.e. lexicographic order of the sort key
+            entity_stmt = entity_stmt.where(
+                tuple_(*columns) < tuple_(*values)
+                if order_by.value == "desc"
+                else tuple_(*columns) > tuple_(*values)
+            )
+
+        entity_stmt = (
+            entity_stmt.order_by(
+                *(
+                    desc(column) if order_by.value == "desc" else asc(column)
+                    for column in columns
+                )
+            )
+            .offset(offset)
+            .limit(count)
+        )
+        result = await self._session.execute(entity_stmt)
+        entities = list(result.scalars().all())
+
+        next_cursor = None
+        if entities and len(entities) == count:
+            next_cursor = encode_cursor(
+                fields, [getattr(entities[-1], field) for field in fields]
+            )
+
+        return entity_count, entities, next_cursor
+
+    async def stream(
+        self,
+        fields: list[str],
+        filters: Filters | None = None,
+        batch_size: int = settings.MAX_PAGINATION_BATCH_COUNT,
+        key: list[str] | None = None,
+    ) -> AsyncIterator[Sequence[Row[Any]]]:
+        """
+        Streams the values of the given fields of all entities matching the filters, in batches of rows.
+        The rows are fetched from a server-side cursor, so only one batch is held in memory at a time,
+        and no entity objects are created.
+
+        :param fields: Names of the selected columns.
+        :type fields: list[str]
+        :param filters: Optional set of filters and ordering. Distinct is not supported.
+        :type filters: Filters | None
+        :param batch_size: Number of rows fetched from the cursor at once.
+        :type batch_size: int
+        :param key: Fields sorted by in ascending order, if the filters do not specify the order.
+        :type key: list[str] | None
+        :return: Asynchronous iterator of the batches of rows. The query is executed before it is returned,
+            so invalid filters raise immediately.
+        :rtype: AsyncIterator[Sequence[Row[Any]]]
+        """
+        if filters is not None and filters.distinct is not None:
+            raise RepositoryException("Distinct is not supported with streaming")
+
+        try:
+            columns = [getattr(self._model, field) for field in fields]
+        except AttributeError as e:
+            raise RepositoryException(f"Unknown field: {e}")
+
+        orm_filters = self._build_filter(**(filters.filters if filters else {}))
+        stmt = select(*columns).select_from(self._model).where(orm_filters)
+
+        if filters is not None and filters.order_by is not None:
+            order_by = [filters.order_by]
+        else:
+            order_by = [OrderBy(field=field) for field in key or []]
+        try:
+            stmt = stmt.order_by(
+                *(
+                    desc(getattr(self._model, order.field))
+                    if order.value == "desc"
+                    else asc(getattr(self._model, order.field))
+                    for order in order_by
+                )
+            )
+        except AttributeError as e:
+            raise RepositoryException(f"Unknown field: {e}")
+
+        result = await self._session.stream(
+            stmt.execution_options(yield_per=batch_size)
+        )
+        return result.partitions()
+
     async def distinct_entity_attribute_values(
         self,
         attribute: str,
@@ -274,6 +497,38 @@ class Repository(Generic[Entity]):
             await self._session.rollback()
             raise RepositoryException("Failed to insert bulk data") from e
 
+    async def insert_returning(self, data: list[dict[str, Any]]) -> list[Entity]:
+        """
+        Inserts the entities given by their column values by a single INSERT ... RETURNING statement
+        and commits them, so any number of entities is created in one round trip to the database.
+
+        The IDs are generated by the application, as the rows of a multi-row insert are not returned
+        in the order of the values otherwise.
+
+        :param data: Column values of the inserted entities.
+        :type data: list[dict[str, Any]]
+        :return: The inserted entities, in the order of the given values.
+        :rtype: list[Entity]
+        """
+        if not data:
+            return []
+
+        values = [{"id": uuid.uuid4(), **row} for row in data]
+        try:
+            result = await self._session.scalars(
+                insert(self._model).returning(self._model), values
+            )
+            entities = {entity.id: entity for entity in result.all()}
+            await self._session.commit()
+        except IntegrityError as e:
+            await self._session.rollback()
+            raise IntegrityException("Failed to insert bulk data") from e
+        except SQLAlchemyError as e:
+            await self._session.rollback()
+            raise RepositoryException("Failed to insert bulk data") from e
+
+        return [entities[row["id"]] for row in values]
+
 
 def get_repository(
     entity_type: type[Entity],
@@ -4,4 +4,7 @@ from src.core.repository.schemas import BaseDto
 class PaginationResponseDto[DataT](BaseDto):
     data: list[DataT]
     count: int
-    total_items: int
+    total_items: int | None
+    """Number of all items, None if the total was not requested."""
+    next_cursor: str | None = None
+    """Opaque cursor of the next page, None if there are no more items or the endpoint does not support it."""
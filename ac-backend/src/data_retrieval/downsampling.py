@@ -0,0 +1,148 @@
+import itertools
+from operator import attrgetter
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    CompoundSelect,
+    Double,
+    and_,
+    func,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.data_retrieval.schemas import LightCurveRequestDto, LightCurveSeriesDto
+from src.tasks.model import PhotometricData
+
+
+def downsample_statement(request: LightCurveRequestDto) -> CompoundSelect[Any]:
+    """
+    Builds the query of the downsampled light curves. The photometric data in the julian date window
+    are split into series by plugin and light filter. Each series with more points than requested is split into
+    points / 2 buckets of equal julian date width, and only the brightest and the faintest point of each bucket
+    is selected, so the extremes of the light curve are kept. Smaller series are selected as they are.
+
+    The extremes are found by hash aggregation of (magnitude, julian date, magnitude error) arrays,
+    which avoids sorting all points of the series.
+
+    :param request: tasks, julian date window and number of points of each series.
+    :return: select of the series, its total number of points, and the brightest and the faintest point
+        as (magnitude, julian date, magnitude error) arrays, ordered by the series.
+    """
+    conditions: list[ColumnElement[bool]] = [
+        PhotometricData.task_id.in_(request.task_ids)
+    ]
+    if request.julian_date_from is not None:
+        conditions.append(PhotometricData.julian_date >= request.julian_date_from)
+    if request.julian_date_to is not None:
+        conditions.append(PhotometricData.julian_date <= request.julian_date_to)
+
+    series = (
+        select(
+            PhotometricData.plugin_id,
+            PhotometricData.light_filter,
+            func.count().label("total_points"),
+            func.min(PhotometricData.julian_date).label("first_julian_date"),
+            func.max(PhotometricData.julian_date).label("last_julian_date"),
+        )
+        .where(*conditions)
+        .group_by(PhotometricData.plugin_id, PhotometricData.light_filter)
+        .cte("series")
+    )
+    of_series = and_(
+        PhotometricData.plugin_id == series.c.plugin_id,
+        PhotometricData.light_filter.is_not_distinct_from(series.c.light_filter),
+    )
+    point = array(
+        [
+            PhotometricData.magnitude,
+            PhotometricData.julian_date,
+            PhotometricData.magnitude_error,
+        ]
+    )
+
+    small_series = (
+        select(
+            series.c.plugin_id,
+            series.c.light_filter,
+            series.c.total_points,
+            point.label("brightest"),
+            point.label("faintest"),
+        )
+        .join_from(series, PhotometricData, of_series)
+        .where(*conditions, series.c.total_points <= request.points)
+    )
+
+    # the last point belongs to the last bucket, a series of a single julian date has only the first bucket
+    buckets = request.points // 2
+    span = func.nullif(
+        series.c.last_julian_date - series.c.first_julian_date, 0, type_=Double
+    )
+    bucket = func.least(
+        func.coalesce(
+            func.floor(
+                (PhotometricData.julian_date - series.c.first_julian_date)
+                * buckets
+                / span
+            ),
+            0,
+        ),
+        buckets - 1,
+    )
+    large_series = (
+        select(
+            PhotometricData.plugin_id,
+            PhotometricData.light_filter,
+            func.min(series.c.total_points).label("total_points"),
+            func.min(point).label("brightest"),
+            func.max(point).label("faintest"),
+        )
+        .join_from(series, PhotometricData, of_series)
+        .where(*conditions, series.c.total_points > request.points)
+        .group_by(PhotometricData.plugin_id, PhotometricData.light_filter, bucket)
+    )
+
+    return union_all(small_series, large_series).order_by("plugin_id", "light_filter")
+
+
+async def downsample_light_curves(
+    session: AsyncSession, request: LightCurveRequestDto
+) -> list[LightCurveSeriesDto]:
+    """
+    Downsamples the photometric data of the tasks for plotting, see downsample_statement.
+    The downsampling is done by the DB, so only the selected points are transferred.
+
+    :param session: DB session.
+    :param request: tasks, julian date window and number of points of each series.
+    :return: downsampled series, one per plugin and light filter, with points ordered by the julian date.
+    """
+    rows = (await session.execute(downsample_statement(request))).all()
+
+    result = []
+    for (plugin_id, light_filter), group in itertools.groupby(
+        rows, key=attrgetter("plugin_id", "light_filter")
+    ):
+        buckets = list(group)
+        points = []
+        for bucket in buckets:
+            points.append(bucket.brightest)
+            # a single point is both the brightest and the faintest
+            if bucket.faintest != bucket.brightest:
+                points.append(bucket.faintest)
+        points.sort(key=lambda p: p[1])
+        magnitude, julian_date, magnitude_error = zip(*points)
+        result.append(
+            LightCurveSeriesDto(
+                plugin_id=plugin_id,
+                light_filter=light_filter,
+                total_points=buckets[0].total_points,
+                julian_date=julian_date,
+                magnitude=magnitude,
+                magnitude_error=magnitude_error,
+            )
+        )
+
+    return result
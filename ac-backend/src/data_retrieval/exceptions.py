@@ -0,0 +1,17 @@
+from http import HTTPStatus
+
+from src.core.exception.exceptions import ACException
+
+
+class NotAcceptableException(ACException):
+    """Exception for requests accepting none of the media types of the response"""
+
+    CODE = "NOT_ACCEPTABLE_ERROR"
+    HTTP_STATUS = HTTPStatus.NOT_ACCEPTABLE
+
+    def __init__(self, supported: list[str]) -> None:
+        super().__init__(
+            f"Supported media types: {', '.join(supported)}",
+            self.CODE,
+            self.HTTP_STATUS,
+        )
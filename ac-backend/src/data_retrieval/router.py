@@ -1,15 +1,28 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import Depends, APIRouter
+from fastapi import Depends, APIRouter, Header
+from fastapi.responses import StreamingResponse
 
 from src.core.config.config import settings
+from src.core.database.dependencies import DBSessionDep, DBSessionFactoryDep
 from src.core.exception.exceptions import APIException
 from src.plugin.interface.schemas import PhotometricDataDto
 from src.core.repository.repository import Filters
 from src.core.service.schemas import PaginationResponseDto
-from src.data_retrieval.schemas import StellarObjectIdentifierDto
+from src.data_retrieval.downsampling import downsample_light_curves
+from src.data_retrieval.schemas import (
+    LightCurveRequestDto,
+    LightCurveSeriesDto,
+    PeriodogramPeakDto,
+    StellarObjectIdentifierDto,
+)
 from src.data_retrieval.service import DataService, PhotometricDataRepositoryDep
+from src.data_retrieval.streaming import (
+    STREAM_MEDIA_TYPES,
+    negotiate_media_type,
+    stream_photometric_data,
+)
 
 DataServiceDep = Annotated[DataService, Depends(DataService)]
 
@@ -26,14 +39,34 @@ async def retrieve_objects_identifiers(
     filters: Filters | None = None,
     offset: int = 0,
     count: int = settings.MAX_PAGINATION_BATCH_COUNT,
+    cursor: str | None = None,
+    with_total: bool = True,
 ) -> PaginationResponseDto[StellarObjectIdentifierDto]:
-    """List identifiers from the database"""
+    """
+    List identifiers from the database. Pass next_cursor of the previous page as the cursor to get the next page,
+    offset is kept for backward compatibility. Set with_total to false to skip counting of the identifiers.
+    """
     if filters is None or (
         "task_id__eq" not in filters.filters and "task_id__in" not in filters.filters
     ):
         raise APIException("task_id__eq or task_id__in required in filters")
 
-    return await service.list_soi(offset, count, filters)
+    return await service.list_soi(offset, count, filters, cursor, with_total)
+
+
+@router.get("/multi-catalog-search/{task_id}/object-identifiers")
+async def retrieve_multi_catalog_identifiers(
+    service: DataServiceDep,
+    task_id: UUID,
+    count: int = settings.MAX_PAGINATION_BATCH_COUNT,
+    cursor: str | None = None,
+    with_total: bool = True,
+) -> PaginationResponseDto[StellarObjectIdentifierDto]:
+    """
+    List identifiers found in all catalogs of a multi-catalog search task, ordered by the distance
+    from the searched position. Pass next_cursor of the previous page as the cursor to get the next page.
+    """
+    return await service.list_multi_catalog_soi(task_id, count, cursor, with_total)
 
 
 @router.post("/photometric-data")
@@ -42,9 +75,13 @@ async def retrieve_data(
     filters: Filters | None = None,
     offset: int = 0,
     count: int = settings.MAX_PAGINATION_BATCH_COUNT,
+    cursor: str | None = None,
+    with_total: bool = True,
 ) -> PaginationResponseDto[PhotometricDataDto]:
     """
-    Retrieve photometric data from the database.
+    Retrieve photometric data from the database. Pass next_cursor of the previous page as the cursor to get
+    the next page, offset is kept for backward compatibility. Set with_total to false to skip counting
+    of the data.
     """
     if filters is None or (
         "task_id__eq" not in filters.filters and "task_id__in" not in filters.filters
@@ -52,10 +89,84 @@ async def retrieve_data(
         raise APIException("task_id__eq or task_id__in required in filters")
 
     return await service.list_photometric_data(
-        offset=offset, count=count, filters=filters
+        offset=offset,
+        count=count,
+        filters=filters,
+        cursor=cursor,
+        with_total=with_total,
     )
 
 
+@router.post("/periodogram-peaks")
+async def retrieve_periodogram_peaks(
+    service: DataServiceDep,
+    filters: Filters | None = None,
+    count: int = settings.MAX_PAGINATION_BATCH_COUNT,
+    cursor: str | None = None,
+    with_total: bool = True,
+) -> PaginationResponseDto[PeriodogramPeakDto]:
+    """
+    Retrieve periodogram peaks found by period search tasks. Pass next_cursor of the previous page as the cursor
+    to get the next page. Set with_total to false to skip counting of the peaks.
+    """
+    if filters is None or (
+        "task_id__eq" not in filters.filters and "task_id__in" not in filters.filters
+    ):
+        raise APIException("task_id__eq or task_id__in required in filters")
+
+    return await service.list_periodogram_peaks(
+        count=count, filters=filters, cursor=cursor, with_total=with_total
+    )
+
+
+@router.post(
+    "/photometric-data/stream",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {media_type: {} for media_type in STREAM_MEDIA_TYPES}},
+        406: {"description": "None of the accepted media types is supported"},
+    },
+)
+async def stream_data(
+    session_factory: DBSessionFactoryDep,
+    filters: Filters | None = None,
+    accept: Annotated[str | None, Header()] = None,
+) -> StreamingResponse:
+    """
+    Stream all photometric data of the tasks in a single response, ordered by the task and the julian date
+    unless the filters specify the order. The data are sent as Arrow IPC stream or as newline delimited JSON,
+    based on the Accept header, Arrow is the default.
+    """
+    if filters is None or (
+        "task_id__eq" not in filters.filters and "task_id__in" not in filters.filters
+    ):
+        raise APIException("task_id__eq or task_id__in required in filters")
+
+    media_type = negotiate_media_type(accept)
+
+    return StreamingResponse(
+        await stream_photometric_data(
+            session_factory,
+            filters,
+            media_type,
+            settings.PHOTOMETRIC_DATA_STREAM_BATCH_SIZE,
+        ),
+        media_type=media_type,
+    )
+
+
+@router.post("/light-curves")
+async def retrieve_light_curves(
+    session: DBSessionDep, request: LightCurveRequestDto
+) -> list[LightCurveSeriesDto]:
+    """
+    Retrieve light curves of the tasks downsampled for plotting, one series per plugin and light filter.
+    Each series has at most the requested number of points, the brightest and the faintest point
+    of each julian date bucket are kept. Restrict the julian date window to get the detail of a zoomed part.
+    """
+    return await downsample_light_curves(session, request)
+
+
 @router.get("/unique-light-filters/{task_id}")
 async def retrieve_light_filters_by_task_id(
     pdr: PhotometricDataRepositoryDep, task_id: UUID
@@ -1,9 +1,47 @@
 from typing import Any
 from uuid import UUID
 
-from src.core.repository.schemas import BaseIdDto
+from pydantic import Field
+
+from src.core.config.config import settings
+from src.core.repository.schemas import BaseDto, BaseIdDto
+from src.tasks.types import PeriodSearchMethod
 
 
 class StellarObjectIdentifierDto(BaseIdDto):
     task_id: UUID
     identifier: dict[str, Any]
+
+
+class PeriodogramPeakDto(BaseIdDto):
+    task_id: UUID
+    method: PeriodSearchMethod
+    light_filter: str | None
+    rank: int
+    period: float
+    power: float
+    false_alarm_probability: float | None
+    duration: float | None
+    depth: float | None
+    transit_time: float | None
+
+
+class LightCurveRequestDto(BaseDto):
+    task_ids: list[UUID] = Field(min_length=1)
+    julian_date_from: float | None = None
+    julian_date_to: float | None = None
+    points: int = Field(
+        default=settings.LIGHT_CURVE_DEFAULT_POINTS,
+        ge=2,
+        le=settings.LIGHT_CURVE_MAX_POINTS,
+    )
+
+
+class LightCurveSeriesDto(BaseDto):
+    plugin_id: UUID
+    light_filter: str | None
+    total_points: int
+    """Number of points of the series in the julian date window before downsampling."""
+    julian_date: list[float]
+    magnitude: list[float]
+    magnitude_error: list[float]
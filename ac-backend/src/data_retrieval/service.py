@@ -1,13 +1,25 @@
-from typing import Annotated
+from typing import Annotated, Any
+from uuid import UUID
 
 from fastapi import Depends
 
 from src.core.config.config import settings
 from src.plugin.interface.schemas import PhotometricDataDto
-from src.core.repository.repository import Repository, get_repository, Filters
+from src.core.repository.repository import (
+    Filters,
+    OrderBy,
+    Repository,
+    get_repository,
+)
 from src.core.service.schemas import PaginationResponseDto
-from src.data_retrieval.schemas import StellarObjectIdentifierDto
-from src.tasks.model import StellarObjectIdentifier, PhotometricData
+from src.data_retrieval.schemas import PeriodogramPeakDto, StellarObjectIdentifierDto
+from src.tasks.model import (
+    PeriodogramPeak,
+    StellarObjectIdentifier,
+    PhotometricData,
+    Task,
+)
+from src.tasks.types import TaskType
 
 StellarObjectIdentifierRepositoryDep = Annotated[
     Repository[StellarObjectIdentifier],
@@ -16,6 +28,10 @@ StellarObjectIdentifierRepositoryDep = Annotated[
 PhotometricDataRepositoryDep = Annotated[
     Repository[PhotometricData], Depends(get_repository(PhotometricData))
 ]
+TaskRepositoryDep = Annotated[Repository[Task], Depends(get_repository(Task))]
+PeriodogramPeakRepositoryDep = Annotated[
+    Repository[PeriodogramPeak], Depends(get_repository(PeriodogramPeak))
+]
 
 
 class DataService:
@@ -27,22 +43,125 @@ class DataService:
         self,
         soi_repository: StellarObjectIdentifierRepositoryDep,
         photometric_data_repository: PhotometricDataRepositoryDep,
+        task_repository: TaskRepositoryDep,
+        periodogram_peak_repository: PeriodogramPeakRepositoryDep,
     ):
         self._soi_repository = soi_repository
         self._photometric_data_repository = photometric_data_repository
+        self._task_repository = task_repository
+        self._periodogram_peak_repository = periodogram_peak_repository
+
+    @staticmethod
+    def _filtered_task_ids(filters: Filters | None) -> list[UUID] | None:
+        # IDs of the tasks, if the filters select all results of some tasks and nothing else
+        if filters is None or filters.distinct is not None:
+            return None
+
+        if filters.filters.keys() == {"task_id__eq"}:
+            task_ids = [filters.filters["task_id__eq"]]
+        elif filters.filters.keys() == {"task_id__in"}:
+            task_ids = filters.filters["task_id__in"]
+        else:
+            return None
+
+        try:
+            return [UUID(str(task_id)) for task_id in task_ids]
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _is_distinct(filters: Filters | None, cursor: str | None) -> bool:
+        """
+        Returns whether the page is selected by distinct filters without a cursor. The keyset pagination
+        does not support distinct, so such pages are fetched by the offset.
+        """
+        return filters is not None and filters.distinct is not None and cursor is None
+
+    async def _total_count(
+        self,
+        repository: Repository[Any],
+        task_type: TaskType,
+        filters: Filters | None,
+    ) -> int:
+        """
+        Counts the results matching the filters. If the filters select whole completed tasks,
+        the result counts stored at their completion are summed instead of counting the rows.
+        """
+        task_ids = self._filtered_task_ids(filters)
+        if task_ids is not None:
+            _, tasks = await self._task_repository.find(
+                filters=Filters(filters={"id__in": task_ids}), with_total=False
+            )
+            result_counts = [
+                task.result_count
+                for task in tasks
+                if task.task_type == task_type and task.result_count is not None
+            ]
+            if len(result_counts) == len(set(task_ids)):
+                return sum(result_counts)
+
+        return await repository.count(filters.filters if filters else None)
 
     async def list_soi(
         self,
         offset: int = 0,
         count: int = settings.MAX_PAGINATION_BATCH_COUNT,
         filters: Filters | None = None,
+        cursor: str | None = None,
+        with_total: bool = True,
     ) -> PaginationResponseDto[StellarObjectIdentifierDto]:
-        total_count, soi_list = await self._soi_repository.find(
-            offset=offset, count=count, filters=filters
-        )
+        """
+        List stellar object identifiers, ordered by ID unless the filters specify the order.
+        The page starts after the cursor, if given, and then skips offset identifiers.
+        The total count is None, unless with_total is set. The distinct identifiers are paginated
+        by the offset only, without the cursor of the next page.
+        """
+        if self._is_distinct(filters, cursor):
+            total_count, soi_list = await self._soi_repository.find(
+                offset=offset, count=count, filters=filters, with_total=with_total
+            )
+            next_cursor = None
+        else:
+            _, soi_list, next_cursor = await self._soi_repository.find_by_cursor(
+                cursor=cursor,
+                count=count,
+                filters=filters,
+                offset=offset,
+                with_total=False,
+            )
+            total_count = (
+                await self._total_count(
+                    self._soi_repository, TaskType.object_search, filters
+                )
+                if with_total
+                else None
+            )
         data = list(map(StellarObjectIdentifierDto.model_validate, soi_list))
         return PaginationResponseDto[StellarObjectIdentifierDto](
-            data=data, count=len(data), total_items=total_count
+            data=data, count=len(data), total_items=total_count, next_cursor=next_cursor
+        )
+
+    async def list_multi_catalog_soi(
+        self,
+        task_id: UUID,
+        count: int = settings.MAX_PAGINATION_BATCH_COUNT,
+        cursor: str | None = None,
+        with_total: bool = True,
+    ) -> PaginationResponseDto[StellarObjectIdentifierDto]:
+        """
+        List stellar object identifiers found by the child tasks of a multi-catalog search task,
+        ordered by the distance from the searched position.
+        """
+        await self._task_repository.get(task_id)  # check if exists
+        _, children = await self._task_repository.find(
+            filters=Filters(filters={"parent_id__eq": task_id}), with_total=False
+        )
+        filters = Filters(
+            filters={"task_id__in": [child.id for child in children]},
+            order_by=OrderBy(field="dist_arcsec"),
+        )
+        return await self.list_soi(
+            count=count, filters=filters, cursor=cursor, with_total=with_total
         )
 
     async def list_photometric_data(
@@ -50,12 +169,75 @@ class DataService:
         offset: int = 0,
         count: int = settings.MAX_PAGINATION_BATCH_COUNT,
         filters: Filters | None = None,
+        cursor: str | None = None,
+        with_total: bool = True,
     ) -> PaginationResponseDto[PhotometricDataDto]:
-        total_count, pd_list = await self._photometric_data_repository.find(
-            offset=offset, count=count, filters=filters
-        )
+        """
+        List photometric data, ordered by julian date unless the filters specify the order.
+        The page starts after the cursor, if given, and then skips offset measurements.
+        The total count is None, unless with_total is set. The distinct measurements are paginated
+        by the offset only, without the cursor of the next page.
+        """
+        if self._is_distinct(filters, cursor):
+            total_count, pd_list = await self._photometric_data_repository.find(
+                offset=offset, count=count, filters=filters, with_total=with_total
+            )
+            next_cursor = None
+        else:
+            (
+                _,
+                pd_list,
+                next_cursor,
+            ) = await self._photometric_data_repository.find_by_cursor(
+                cursor=cursor,
+                count=count,
+                filters=filters,
+                offset=offset,
+                key="julian_date",
+                with_total=False,
+            )
+            total_count = (
+                await self._total_count(
+                    self._photometric_data_repository,
+                    TaskType.photometric_data,
+                    filters,
+                )
+                if with_total
+                else None
+            )
 
         data = list(map(PhotometricDataDto.model_validate, pd_list))
         return PaginationResponseDto[PhotometricDataDto](
-            data=data, count=len(data), total_items=total_count
+            data=data, count=len(data), total_items=total_count, next_cursor=next_cursor
+        )
+
+    async def list_periodogram_peaks(
+        self,
+        count: int = settings.MAX_PAGINATION_BATCH_COUNT,
+        filters: Filters | None = None,
+        cursor: str | None = None,
+        with_total: bool = True,
+    ) -> PaginationResponseDto[PeriodogramPeakDto]:
+        """
+        List periodogram peaks found by period search tasks, ordered by rank unless the filters specify the order.
+        The page starts after the cursor, if given. The total count is None, unless with_total is set.
+        """
+        (
+            _,
+            peak_list,
+            next_cursor,
+        ) = await self._periodogram_peak_repository.find_by_cursor(
+            cursor=cursor, count=count, filters=filters, key="rank", with_total=False
+        )
+        total_count = (
+            await self._total_count(
+                self._periodogram_peak_repository, TaskType.period_search, filters
+            )
+            if with_total
+            else None
+        )
+
+        data = list(map(PeriodogramPeakDto.model_validate, peak_list))
+        return PaginationResponseDto[PeriodogramPeakDto](
+            data=data, count=len(data), total_items=total_count, next_cursor=next_cursor
         )
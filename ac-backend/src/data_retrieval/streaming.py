@@ -0,0 +1,174 @@
+import contextlib
+import io
+import json
+from collections.abc import AsyncIterator, Sequence
+from typing import Any, AsyncContextManager, Callable
+
+import pyarrow as pa
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.repository.repository import Filters, Repository
+from src.data_retrieval.exceptions import NotAcceptableException
+from src.tasks.model import PhotometricData
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+STREAM_MEDIA_TYPES = [ARROW_STREAM_MEDIA_TYPE, NDJSON_MEDIA_TYPE]
+"""Media types of the photometric data stream, the first one is the default."""
+
+PHOTOMETRIC_DATA_SCHEMA = pa.schema(
+    [
+        ("task_id", pa.uuid()),
+        ("plugin_id", pa.uuid()),
+        ("julian_date", pa.float64()),
+        ("magnitude", pa.float64()),
+        ("magnitude_error", pa.float64()),
+        ("light_filter", pa.string()),
+    ]
+)
+
+
+def negotiate_media_type(accept: str | None) -> str:
+    """
+    Selects the media type of the photometric data stream based on the Accept header.
+
+    :param accept: value of the Accept header, None if the header is missing.
+    :return: the most preferred supported media type.
+    :raises NotAcceptableException: if no supported media type is accepted.
+    """
+    if accept is None:
+        return STREAM_MEDIA_TYPES[0]
+
+    ranges = []
+    for position, media_range in enumerate(accept.split(",")):
+        media_type, *params = (part.strip() for part in media_range.split(";"))
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        # the most preferred first, ties keep the order of the header
+        ranges.append((-quality, position, media_type.lower()))
+
+    for negative_quality, _, media_type in sorted(ranges):
+        if negative_quality == 0:
+            break
+        if media_type in ("*/*", "application/*"):
+            return STREAM_MEDIA_TYPES[0]
+        if media_type in STREAM_MEDIA_TYPES:
+            return media_type
+
+    raise NotAcceptableException(STREAM_MEDIA_TYPES)
+
+
+def _to_record_batch(rows: Sequence[Row[Any]]) -> pa.RecordBatch:
+    task_id, plugin_id, julian_date, magnitude, magnitude_error, light_filter = zip(
+        *rows
+    )
+
+    return pa.record_batch(
+        [
+            pa.array([uuid.bytes for uuid in task_id], pa.binary(16)).cast(pa.uuid()),
+            pa.array([uuid.bytes for uuid in plugin_id], pa.binary(16)).cast(pa.uuid()),
+            pa.array(julian_date, pa.float64()),
+            pa.array(magnitude, pa.float64()),
+            pa.array(magnitude_error, pa.float64()),
+            pa.array(light_filter, pa.string()),
+        ],
+        schema=PHOTOMETRIC_DATA_SCHEMA,
+    )
+
+
+async def encode_arrow_stream(
+    partitions: AsyncIterator[Sequence[Row[Any]]],
+) -> AsyncIterator[bytes]:
+    """
+    Encodes batches of photometric data rows as Arrow IPC stream. Each batch of rows becomes one record batch,
+    which is yielded as soon as it is encoded.
+
+    :param partitions: batches of rows with the columns of PHOTOMETRIC_DATA_SCHEMA.
+    :return: chunks of the Arrow IPC stream, including the schema and the end-of-stream marker.
+    """
+    sink = io.BytesIO()
+
+    def flush() -> bytes:
+        chunk = sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+        return chunk
+
+    with pa.ipc.new_stream(sink, PHOTOMETRIC_DATA_SCHEMA) as writer:
+        yield flush()
+
+        async for rows in partitions:
+            writer.write_batch(_to_record_batch(rows))
+            yield flush()
+
+    yield flush()
+
+
+async def encode_ndjson(
+    partitions: AsyncIterator[Sequence[Row[Any]]],
+) -> AsyncIterator[bytes]:
+    """
+    Encodes batches of photometric data rows as newline delimited JSON, one object per row.
+
+    :param partitions: batches of rows with the columns of PHOTOMETRIC_DATA_SCHEMA.
+    :return: chunks of NDJSON, one chunk per batch.
+    """
+    names = PHOTOMETRIC_DATA_SCHEMA.names
+
+    async for rows in partitions:
+        lines = []
+        for task_id, plugin_id, *values in rows:
+            record = dict(zip(names, (str(task_id), str(plugin_id), *values)))
+            lines.append(json.dumps(record))
+        lines.append("")
+        yield "\n".join(lines).encode()
+
+
+async def stream_photometric_data(
+    session_factory: Callable[[], AsyncContextManager[AsyncSession]],
+    filters: Filters,
+    media_type: str,
+    batch_size: int,
+) -> AsyncIterator[bytes]:
+    """
+    Streams all photometric data matching the filters in the given media type. The data are read
+    from a server-side cursor in its own session, so the memory does not grow with the number of rows.
+    Unless the filters specify the order, the data are ordered by the task and the julian date.
+
+    The query is executed before returning, so its errors can still be reported as an error response.
+    The session is closed when the stream is exhausted or closed.
+
+    :param session_factory: creates the session of the stream.
+    :param filters: filters of the photometric data.
+    :param media_type: one of STREAM_MEDIA_TYPES.
+    :param batch_size: number of rows fetched from the cursor and encoded at once.
+    :return: chunks of the response body.
+    """
+    encode = (
+        encode_arrow_stream if media_type == ARROW_STREAM_MEDIA_TYPE else encode_ndjson
+    )
+
+    async with contextlib.AsyncExitStack() as stack:
+        session = await stack.enter_async_context(session_factory())
+        partitions = await Repository(PhotometricData, session).stream(
+            PHOTOMETRIC_DATA_SCHEMA.names,
+            filters=filters,
+            batch_size=batch_size,
+            key=["task_id", "julian_date"],
+        )
+        # the stream takes over the session
+        session_stack = stack.pop_all()
+
+    async def chunks() -> AsyncIterator[bytes]:
+        async with session_stack:
+            async for chunk in encode(partitions):
+                yield chunk
+
+    return chunks()
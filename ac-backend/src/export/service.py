@@ -73,7 +73,7 @@ class ExportService:
         :rtype: None
         """
         count = settings.MAX_PAGINATION_BATCH_COUNT
-        offset = 0
+        cursor = None
 
         async with aiofiles.open(csv_file, "w") as out_file:
             # write header
@@ -83,9 +83,8 @@ class ExportService:
 
             while True:
                 page = await self._data_service.list_photometric_data(
-                    offset=offset, count=count, filters=filters
+                    count=count, filters=filters, cursor=cursor, with_total=False
                 )
-                offset += page.count
 
                 for record in page.data:
                     source_name = plugin_dict[record.plugin_id]
@@ -93,8 +92,9 @@ class ExportService:
                         f"{record.julian_date}{delimiter}{record.magnitude}{delimiter}{record.magnitude_error}{delimiter}{record.light_filter if record.light_filter is not None else ''}{delimiter}{source_name}\n"
                     )
 
-                if offset >= page.total_items:
+                if page.next_cursor is None:
                     break
+                cursor = page.next_cursor
 
     async def _export_to_single_file(
         self,
@@ -147,9 +147,11 @@ class ExportService:
         # split tasks by sources
         for task_id in task_ids:
             page = await self._data_service.list_photometric_data(
-                count=1, filters=Filters(filters={"task_id__eq": task_id})
+                count=1,
+                filters=Filters(filters={"task_id__eq": task_id}),
+                with_total=False,
             )
-            if page.total_items == 0:
+            if not page.data:
                 continue
             plugin_id = page.data[0].plugin_id
 
@@ -302,9 +304,11 @@ class ExportService:
 
         for task_id in task_ids:
             page = await self._data_service.list_photometric_data(
-                count=1, filters=Filters(filters={"task_id__eq": task_id})
+                count=1,
+                filters=Filters(filters={"task_id__eq": task_id}),
+                with_total=False,
             )
-            if page.total_items == 0:
+            if not page.data:
                 continue
             plugin_id = page.data[0].plugin_id
             source_name = plugin_dict[plugin_id]
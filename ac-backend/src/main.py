@@ -7,7 +7,6 @@ from pathlib import Path
 from astropy.coordinates.name_resolve import NameResolveError
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from httpx import AsyncClient, Client
 from redis.asyncio import Redis
 from starlette import status
 from starlette.responses import JSONResponse
@@ -15,6 +14,8 @@ from starlette.responses import JSONResponse
 from src.core.config.config import settings
 from src.core.database.db_init import init_db
 from src.core.exception.exceptions import ACException
+from src.core.http_client import router as http_client_router
+from src.core.http_client.registry import http_clients
 from src.core.security import router as security_router
 from src.data_retrieval import router as data_router
 from src.export import router as export_router
@@ -59,16 +60,13 @@ async def lifespan(app: FastAPI):
         decode_responses=True,
     )
 
-    sync_http_client = Client()
-    async with AsyncClient() as http_client:
-        yield {
-            "async_http_client": http_client,
-            "sync_http_client": Client(),
-            "redis_client": redis_client,
-        }
-        # The AsyncClient closes on shutdown
+    yield {
+        "async_http_client": http_clients.async_client(),
+        "sync_http_client": http_clients.client(),
+        "redis_client": redis_client,
+    }
 
-    sync_http_client.close()
+    await http_clients.aclose()
     await redis_client.close()
 
 
@@ -146,3 +144,4 @@ app.include_router(name_resolving_router.router)
 app.include_router(phase_diagram_router.router)
 app.include_router(export_router.router)
 app.include_router(security_router.router)
+app.include_router(http_client_router.router)
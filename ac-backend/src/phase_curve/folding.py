@@ -0,0 +1,170 @@
+from collections import defaultdict
+
+import numpy as np
+import numpy.typing as npt
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config.config import settings
+from src.core.repository.repository import Filters, Repository
+from src.phase_curve.schemas import (
+    FoldedSeriesDto,
+    PhaseBinsDto,
+    PhaseCurveDto,
+    PhaseFoldRequestDto,
+)
+from src.tasks.model import PhotometricData
+from src.tasks.series import SeriesKey, split_series
+
+# scales the median absolute deviation to the standard deviation of normal distribution
+MAD_TO_SIGMA = 1.4826
+
+_FIELDS = ["plugin_id", "light_filter", "julian_date", "magnitude", "magnitude_error"]
+
+
+def fold(
+    julian_date: npt.NDArray[np.float64], period: float, epoch: float
+) -> npt.NDArray[np.float64]:
+    """
+    Folds the julian dates by the period.
+
+    :param julian_date: julian dates of the points.
+    :param period: period in days.
+    :param epoch: julian date of the phase 0.
+    :return: phases in [0, 1).
+    """
+    phase = np.mod((julian_date - epoch) / period, 1.0)
+    # the modulo of tiny negative values rounds up to 1
+    phase[phase >= 1.0] = 0.0
+    return phase
+
+
+def _segment_medians(
+    values: npt.NDArray[np.float64],
+    starts: npt.NDArray[np.intp],
+    counts: npt.NDArray[np.intp],
+) -> npt.NDArray[np.float64]:
+    # medians of consecutive non-empty segments of sorted values
+    lower = values[starts + (counts - 1) // 2]
+    upper = values[starts + counts // 2]
+    medians: npt.NDArray[np.float64] = (lower + upper) / 2
+    return medians
+
+
+def bin_phases(
+    phase: npt.NDArray[np.float64], magnitude: npt.NDArray[np.float64], bins: int
+) -> tuple[
+    npt.NDArray[np.float64],
+    npt.NDArray[np.float64],
+    npt.NDArray[np.float64],
+    npt.NDArray[np.intp],
+]:
+    """
+    Bins the phase curve into equal-width phase bins. The medians of all bins are computed at once
+    by sorting the magnitudes by the bin and the magnitude.
+
+    :param phase: phases in [0, 1).
+    :param magnitude: magnitudes of the points.
+    :param bins: number of bins.
+    :return: centers, median magnitudes, scatters (scaled median absolute deviations) and counts
+        of the non-empty bins.
+    """
+    bin_index = np.minimum((phase * bins).astype(np.intp), bins - 1)
+    counts = np.bincount(bin_index, minlength=bins)
+    non_empty = counts > 0
+    starts = (np.cumsum(counts) - counts)[non_empty]
+    counts = counts[non_empty]
+
+    order = np.lexsort((magnitude, bin_index))
+    median = _segment_medians(magnitude[order], starts, counts)
+
+    sorted_bin_index = bin_index[order]
+    median_of_point = np.zeros(bins)
+    median_of_point[non_empty] = median
+    deviation = np.abs(magnitude[order] - median_of_point[sorted_bin_index])
+    deviation_order = np.lexsort((deviation, sorted_bin_index))
+    scatter = MAD_TO_SIGMA * _segment_medians(
+        deviation[deviation_order], starts, counts
+    )
+
+    centers = (np.flatnonzero(non_empty) + 0.5) / bins
+    return centers, median, scatter, counts
+
+
+async def fold_photometric_data(
+    session: AsyncSession, request: PhaseFoldRequestDto
+) -> PhaseCurveDto:
+    """
+    Folds the photometric data of the tasks by the period. The data are streamed from the DB and collected
+    as NumPy arrays per plugin and light filter, the folding and binning is done on whole arrays.
+
+    :param session: DB session.
+    :param request: tasks, period, epoch and binning of the phase curve.
+    :return: folded series per plugin and light filter, if the points are requested, and binned phase curves
+        per light filter, if the bins are requested.
+    """
+    partitions = await Repository(PhotometricData, session).stream(
+        _FIELDS,
+        filters=Filters(filters={"task_id__in": request.task_ids}),
+        batch_size=settings.PHOTOMETRIC_DATA_STREAM_BATCH_SIZE,
+    )
+
+    columns: dict[SeriesKey, list[npt.NDArray[np.float64]]] = defaultdict(list)
+    async for rows in partitions:
+        # columns julian date, magnitude and magnitude error
+        for series, chunk in split_series(rows).items():
+            columns[series].append(chunk)
+
+    data = {
+        series: np.concatenate(chunks)
+        for series, chunks in sorted(
+            columns.items(), key=lambda item: (str(item[0][0]), item[0][1] or "")
+        )
+    }
+    phases = {
+        series: fold(values[:, 0], request.period, request.epoch)
+        for series, values in data.items()
+    }
+
+    folded_series = None
+    if request.include_points:
+        folded_series = []
+        for (plugin_id, light_filter), values in data.items():
+            order = np.argsort(phases[(plugin_id, light_filter)], kind="stable")
+            folded_series.append(
+                FoldedSeriesDto(
+                    plugin_id=plugin_id,
+                    light_filter=light_filter,
+                    phase=phases[(plugin_id, light_filter)][order].tolist(),
+                    julian_date=values[order, 0].tolist(),
+                    magnitude=values[order, 1].tolist(),
+                    magnitude_error=values[order, 2].tolist(),
+                )
+            )
+
+    phase_bins = None
+    if request.bins is not None:
+        # the bins combine all catalogs
+        by_light_filter: dict[
+            str | None, list[tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]]
+        ] = defaultdict(list)
+        for series, values in data.items():
+            by_light_filter[series[1]].append((phases[series], values[:, 1]))
+
+        phase_bins = []
+        for light_filter, chunks in by_light_filter.items():
+            centers, median, scatter, counts = bin_phases(
+                np.concatenate([phase for phase, _ in chunks]),
+                np.concatenate([magnitude for _, magnitude in chunks]),
+                request.bins,
+            )
+            phase_bins.append(
+                PhaseBinsDto(
+                    light_filter=light_filter,
+                    phase=centers.tolist(),
+                    median_magnitude=median.tolist(),
+                    scatter=scatter.tolist(),
+                    count=counts.tolist(),
+                )
+            )
+
+    return PhaseCurveDto(series=folded_series, bins=phase_bins)
@@ -2,10 +2,16 @@ from astropy.coordinates import SkyCoord
 from fastapi import APIRouter, Depends
 from httpx import AsyncClient
 
+from src.core.database.dependencies import DBSessionDep
 from src.core.exception.exceptions import APIException
 
 from src.deps import get_async_http_client
-from src.phase_curve.schemas import PhaseCurveDataDto
+from src.phase_curve.folding import fold_photometric_data
+from src.phase_curve.schemas import (
+    PhaseCurveDataDto,
+    PhaseCurveDto,
+    PhaseFoldRequestDto,
+)
 
 
 router = APIRouter(
@@ -113,3 +119,18 @@ async def phase_curve_data(
     return PhaseCurveDataDto(
         ra_deg=None, dec_deg=None, epoch=None, period=None, vsx_object_name=None
     )
+
+
+@router.post("/fold")
+async def fold_phase_curve(
+    session: DBSessionDep, request: PhaseFoldRequestDto
+) -> PhaseCurveDto:
+    """
+    Fold the photometric data of the tasks by the period. Returns the folded points per catalog and light filter
+    ordered by the phase, and if bins are given, the median magnitude and its scatter in each phase bin
+    per light filter. Set include_points to false to get only the bins.
+    :param session: DB session.
+    :param request: The tasks, period in days, epoch as julian date of the phase 0, and number of bins.
+    :return: PhaseCurveDto
+    """
+    return await fold_photometric_data(session, request)
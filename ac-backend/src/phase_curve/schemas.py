@@ -1,3 +1,8 @@
+from uuid import UUID
+
+from pydantic import Field
+
+from src.core.config.config import settings
 from src.core.repository.schemas import BaseDto
 
 
@@ -7,3 +12,37 @@ class PhaseCurveDataDto(BaseDto):
     ra_deg: float | None
     dec_deg: float | None
     vsx_object_name: str | None
+
+
+class PhaseFoldRequestDto(BaseDto):
+    task_ids: list[UUID] = Field(min_length=1)
+    period: float = Field(gt=0)
+    epoch: float
+    bins: int | None = Field(default=None, ge=1, le=settings.PHASE_CURVE_MAX_BINS)
+    """Number of phase bins, no binning if None."""
+    include_points: bool = True
+    """Whether to return the folded points, set to False to get only the bins."""
+
+
+class FoldedSeriesDto(BaseDto):
+    plugin_id: UUID
+    light_filter: str | None
+    phase: list[float]
+    julian_date: list[float]
+    magnitude: list[float]
+    magnitude_error: list[float]
+
+
+class PhaseBinsDto(BaseDto):
+    light_filter: str | None
+    phase: list[float]
+    """Centers of the non-empty bins."""
+    median_magnitude: list[float]
+    scatter: list[float]
+    """Median absolute deviation of the magnitudes scaled to the standard deviation of normal distribution."""
+    count: list[int]
+
+
+class PhaseCurveDto(BaseDto):
+    series: list[FoldedSeriesDto] | None
+    bins: list[PhaseBinsDto] | None
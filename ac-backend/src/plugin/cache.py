@@ -0,0 +1,168 @@
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, cast
+from uuid import UUID
+
+import redis
+from redis.asyncio import Redis
+from redis.client import PubSub
+
+from src.core.config.config import settings
+from src.plugin.interface.async_catalog_plugin import AsyncCatalogPlugin
+from src.plugin.interface.catalog_plugin import CatalogPlugin
+from src.plugin.interface.schemas import StellarObjectIdentificatorDto
+
+logger = logging.getLogger(__name__)
+
+Plugin = (
+    CatalogPlugin[StellarObjectIdentificatorDto]
+    | AsyncCatalogPlugin[StellarObjectIdentificatorDto]
+)
+
+# seconds, for which the listener waits for a message, and after a failure of the connection
+LISTENER_POLL_TIMEOUT = 1.0
+LISTENER_RETRY_DELAY = 5.0
+
+
+class PluginCache:
+    """
+    Per-process LRU cache of the loaded plugin instances. The plugins are keyed by their ID and file name,
+    so the instance of a replaced plugin file is never returned, and the plugin module is executed only once
+    per process, instead of once per task. Each cached plugin module is registered in sys.modules
+    under its file name, the entry is removed together with the plugin.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._plugins: OrderedDict[tuple[UUID, str], Plugin] = OrderedDict()
+        # the invalidation listener runs in its own thread
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._plugins)
+
+    def get(
+        self, plugin_id: UUID, file_name: str, load: Callable[[], Plugin | None]
+    ) -> Plugin | None:
+        """
+        Returns the cached plugin instance, or loads and caches it. Other versions of the plugin are evicted.
+
+        :param plugin_id: ID of the plugin.
+        :param file_name: name of the current plugin file, which is also the module name.
+        :param load: loads the plugin module and returns the plugin instance, None if it has no plugin class.
+        :return: the plugin instance, None if the module has no plugin class.
+        """
+        key = (plugin_id, file_name)
+        with self._lock:
+            if key in self._plugins:
+                self._plugins.move_to_end(key)
+                return self._plugins[key]
+
+        plugin = load()
+
+        with self._lock:
+            self._evict(lambda cached: cached[0] == plugin_id and cached != key)
+            if plugin is None or self._max_size <= 0:
+                sys.modules.pop(file_name, None)
+                return plugin
+
+            self._plugins[key] = plugin
+            while len(self._plugins) > self._max_size:
+                (_, evicted_file_name), _ = self._plugins.popitem(last=False)
+                sys.modules.pop(evicted_file_name, None)
+        return plugin
+
+    def invalidate(self, plugin_id: UUID) -> None:
+        """
+        Removes all versions of the plugin from the cache.
+
+        :param plugin_id: ID of the plugin.
+        """
+        with self._lock:
+            self._evict(lambda key: key[0] == plugin_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._evict(lambda _: True)
+
+    def _evict(self, predicate: Callable[[tuple[UUID, str]], bool]) -> None:
+        for key in [key for key in self._plugins if predicate(key)]:
+            del self._plugins[key]
+            sys.modules.pop(key[1], None)
+
+
+plugin_cache = PluginCache(settings.PLUGIN_CACHE_SIZE)
+
+
+async def publish_plugin_invalidation(redis_client: Redis, plugin_id: UUID) -> None:
+    """
+    Notifies the workers, that the plugin was replaced or deleted. The cache keys contain the file name,
+    so a worker, which misses the message, never uses a replaced plugin file; the message only frees the memory
+    of the stale plugin. Hence, a failure of Redis is only logged.
+
+    :param redis_client: Redis client of the API.
+    :param plugin_id: ID of the changed plugin.
+    """
+    try:
+        await redis_client.publish(
+            settings.PLUGIN_CACHE_INVALIDATION_CHANNEL, str(plugin_id)
+        )
+    except redis.RedisError:
+        logger.warning(
+            f"Could not publish the invalidation of plugin {plugin_id}", exc_info=True
+        )
+
+
+def _on_listener_error(
+    error: BaseException, pubsub: redis.client.PubSub, thread: threading.Thread
+) -> None:
+    # the pub/sub connection is re-established and re-subscribed by the next read
+    logger.warning(f"Plugin cache invalidation listener failed: {error}")
+    time.sleep(LISTENER_RETRY_DELAY)
+
+
+def start_invalidation_listener(cache: PluginCache) -> threading.Thread | None:
+    """
+    Subscribes to the plugin invalidation messages and invalidates the cache in a daemon thread.
+
+    :param cache: plugin cache of the process.
+    :return: the listener thread, None if Redis is not available.
+    """
+
+    def on_message(message: dict[str, Any]) -> None:
+        try:
+            cache.invalidate(UUID(message["data"]))
+        except ValueError:
+            logger.warning(f"Invalid plugin invalidation message: {message['data']}")
+
+    client = redis.Redis(
+        host=settings.REDIS_DB_HOST,
+        port=settings.REDIS_DB_PORT,
+        decode_responses=True,
+    )
+    pubsub = PubSub(client.connection_pool, ignore_subscribe_messages=True)
+    try:
+        pubsub.subscribe(  # type: ignore[no-untyped-call]
+            **{settings.PLUGIN_CACHE_INVALIDATION_CHANNEL: on_message}
+        )
+    except redis.RedisError:
+        logger.warning(
+            "Could not subscribe to the plugin invalidations, stale plugins are evicted by LRU only",
+            exc_info=True,
+        )
+        pubsub.close()
+        return None
+
+    # the untyped PubSubWorkerThread of redis-py
+    return cast(
+        threading.Thread,
+        pubsub.run_in_thread(
+            sleep_time=LISTENER_POLL_TIMEOUT,
+            daemon=True,
+            exception_handler=_on_listener_error,
+        ),
+    )
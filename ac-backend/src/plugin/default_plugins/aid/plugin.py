@@ -6,11 +6,10 @@ from astropy.coordinates import SkyCoord
 import pandas as pd
 
 from src.plugin.interface.catalog_plugin import DefaultCatalogPlugin
+from src.plugin.interface.photometric_batch import PhotometricBatch
 from src.plugin.interface.schemas import (
-    PhotometricDataDto,
     StellarObjectIdentificatorDto,
 )
-import httpx
 
 
 class AidIdentificatorDto(StellarObjectIdentificatorDto):
@@ -29,7 +28,7 @@ class AidPlugin(DefaultCatalogPlugin[AidIdentificatorDto]):
             "https://www.aavso.org/aavso-international-database",
             True,
         )
-        self._http_client = httpx.Client()
+        self._http_client = self._get_http_client("https://vsx.aavso.org")
 
     def __list_url(self, ra: float, dec: float, radius: float) -> str:
         return f"https://vsx.aavso.org/index.php?view=api.list&ra={ra}&dec={dec}&radius={radius}&format=json"
@@ -80,12 +79,16 @@ class AidPlugin(DefaultCatalogPlugin[AidIdentificatorDto]):
 
     def get_photometric_data(
         self, identificator: AidIdentificatorDto, csv_path: Path, resources_dir: Path
-    ) -> Iterator[list[PhotometricDataDto]]:
-        self.__write_to_csv(self.__data_url(identificator.auid), csv_path)
+    ) -> Iterator[PhotometricBatch]:
+        self._cached_download(
+            identificator,
+            csv_path,
+            lambda path: self.__write_to_csv(self.__data_url(identificator.auid), path),
+        )
 
         # release data in chunks
         for chunk in self.__get_chunk(csv_path, identificator):
-            if chunk == []:
+            if len(chunk) == 0:
                 continue
 
             yield chunk
@@ -99,7 +102,7 @@ class AidPlugin(DefaultCatalogPlugin[AidIdentificatorDto]):
 
     def __get_chunk(
         self, path: Path, identificator: AidIdentificatorDto
-    ) -> Iterator[list[PhotometricDataDto]]:
+    ) -> Iterator[PhotometricBatch]:
         for chunk in pd.read_csv(
             path,
             chunksize=50_000,
@@ -115,26 +118,21 @@ class AidPlugin(DefaultCatalogPlugin[AidIdentificatorDto]):
             na_values=(""),
             on_bad_lines="skip",
         ):
-            batch: list[PhotometricDataDto] = []
             chunk = chunk.dropna(subset=["JD", "mag", "uncert", "band"])
-            for jd, mag, uncert, band in chunk.itertuples(index=False, name=None):
-                # convert JD_UTC to BJD_TDB
-                bjd = self._to_bjd_tdb(
-                    jd,
-                    time_format="jd",
-                    time_scale="utc",
-                    reference_frame="geocentric",
-                    ra_deg=identificator.ra_deg,
-                    dec_deg=identificator.dec_deg,
-                )
+            # convert JD_UTC to BJD_TDB
+            bjds = self._to_bjd_tdb_batch(
+                chunk["JD"].to_numpy(),
+                time_format="jd",
+                time_scale="utc",
+                reference_frame="geocentric",
+                ra_deg=identificator.ra_deg,
+                dec_deg=identificator.dec_deg,
+            )
 
-                batch.append(
-                    PhotometricDataDto(
-                        plugin_id=identificator.plugin_id,
-                        julian_date=bjd,
-                        magnitude=mag,
-                        magnitude_error=uncert,
-                        light_filter=band,
-                    )
-                )
-            yield batch
+            yield PhotometricBatch.from_columns(
+                identificator.plugin_id,
+                bjds,
+                chunk["mag"].to_numpy(),
+                chunk["uncert"].to_numpy(),
+                light_filter=chunk["band"].to_numpy(),
+            )
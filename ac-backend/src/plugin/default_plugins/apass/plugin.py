@@ -2,12 +2,11 @@ from pathlib import Path
 from typing import Iterator
 from uuid import UUID
 
-import httpx
 from astropy.coordinates import SkyCoord
 
 from src.plugin.interface.catalog_plugin import DefaultCatalogPlugin
+from src.plugin.interface.photometric_batch import PhotometricBatch
 from src.plugin.interface.schemas import (
-    PhotometricDataDto,
     StellarObjectIdentificatorDto,
 )
 from bs4 import BeautifulSoup
@@ -27,7 +26,7 @@ class ApassPlugin(DefaultCatalogPlugin[ApassIdentificatorDto]):
             False,
         )
         self._url = "https://tombstone.physics.mcmaster.ca/APASS/conesearch_offset.php"
-        self._http_client = httpx.Client(timeout=10.0)
+        self._http_client = self._get_http_client(self._url, timeout=10.0)
 
     def list_objects(
         self,
@@ -64,7 +63,7 @@ class ApassPlugin(DefaultCatalogPlugin[ApassIdentificatorDto]):
 
     def get_photometric_data(
         self, identificator: ApassIdentificatorDto, csv_path: Path, resources_dir: Path
-    ) -> Iterator[list[PhotometricDataDto]]:
+    ) -> Iterator[PhotometricBatch]:
         query_params = {
             "radeg": f"{identificator.ra_deg}",
             "decdeg": f"{identificator.dec_deg}",
@@ -73,8 +72,6 @@ class ApassPlugin(DefaultCatalogPlugin[ApassIdentificatorDto]):
         query_resp = self._http_client.get(self._url, params=query_params)
         html = query_resp.text
 
-        chunk: list[PhotometricDataDto] = []
-
         soup = BeautifulSoup(html, "html.parser")
         root = soup.find("font", attrs={"face": "courier"})
         records = root.get_text(strip=True, separator="\n").splitlines()
@@ -82,13 +79,20 @@ class ApassPlugin(DefaultCatalogPlugin[ApassIdentificatorDto]):
         if records[0] == "No rows were returned by query.":
             return
 
+        hjds: list[float] = []
+        mags: list[float] = []
+        mag_errs: list[float] = []
+        light_filters: list[str] = []
+
         with open(csv_path, mode="w") as csv_file:
             csv_file.write(records[1] + "\n")
 
             for i in range(2, len(records)):
-                if len(chunk) >= self.batch_limit():
-                    yield chunk
-                    chunk = []
+                if len(hjds) >= self.batch_limit():
+                    yield self.__to_chunk(
+                        identificator, hjds, mags, mag_errs, light_filters
+                    )
+                    hjds, mags, mag_errs, light_filters = [], [], [], []
 
                 record = records[i]
 
@@ -97,26 +101,36 @@ class ApassPlugin(DefaultCatalogPlugin[ApassIdentificatorDto]):
                 # hjd-24e5, mag, errmag, filter
                 values = record.split(",")
 
-                # convert HJD_UTC to BJD_TDB
                 hjd = float(values[0]) + 2400000
-                bjd = self._to_bjd_tdb(
-                    hjd,
-                    time_format="jd",
-                    time_scale="utc",
-                    reference_frame="heliocentric",
-                    ra_deg=identificator.ra_deg,
-                    dec_deg=identificator.dec_deg,
-                )
+                mag = float(values[1])
+                mag_err = float(values[2])
 
-                chunk.append(
-                    PhotometricDataDto(
-                        julian_date=bjd,
-                        magnitude=float(values[1]),
-                        magnitude_error=float(values[2]),
-                        plugin_id=identificator.plugin_id,
-                        light_filter=values[3].strip("'"),
-                    )
-                )
+                hjds.append(hjd)
+                mags.append(mag)
+                mag_errs.append(mag_err)
+                light_filters.append(values[3].strip("'"))
 
-        if chunk != []:
-            yield chunk
+        if hjds != []:
+            yield self.__to_chunk(identificator, hjds, mags, mag_errs, light_filters)
+
+    def __to_chunk(
+        self,
+        identificator: ApassIdentificatorDto,
+        hjds: list[float],
+        mags: list[float],
+        mag_errs: list[float],
+        light_filters: list[str],
+    ) -> PhotometricBatch:
+        # convert HJD_UTC to BJD_TDB
+        bjds = self._to_bjd_tdb_batch(
+            hjds,
+            time_format="jd",
+            time_scale="utc",
+            reference_frame="heliocentric",
+            ra_deg=identificator.ra_deg,
+            dec_deg=identificator.dec_deg,
+        )
+
+        return PhotometricBatch.from_columns(
+            identificator.plugin_id, bjds, mags, mag_errs, light_filter=light_filters
+        )
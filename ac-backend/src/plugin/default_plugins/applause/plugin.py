@@ -2,6 +2,7 @@ from pathlib import Path
 from typing import Iterator
 from uuid import UUID
 
+import numpy as np
 from astropy.coordinates import SkyCoord
 from astropy.table import Table
 
@@ -9,8 +10,8 @@ from pyvo.dal import AsyncTAPJob
 
 from src.core.config.config import settings
 from src.plugin.interface.catalog_plugin import DefaultCatalogPlugin
+from src.plugin.interface.photometric_batch import PhotometricBatch
 from src.plugin.interface.schemas import (
-    PhotometricDataDto,
     StellarObjectIdentificatorDto,
 )
 
@@ -31,6 +32,7 @@ class ApplausePlugin(DefaultCatalogPlugin[ApplauseIdentificatorDto]):
             "German astronomical observatories own considerable collection of photographic plates. While these observations lead to significant discoveries in the past, they are also of interest for scientists today and in the future. In particular, for the study of long-term variability of many types of stars, these measurements are of immense scientific value.",
             "https://www.plate-archive.org/cms/home/",
             True,
+            slow=True,
         )
         self.__service = vo.dal.TAPService(
             APPLAUSE_TAP_URL, session=self.__tap_session()
@@ -127,50 +129,37 @@ class ApplausePlugin(DefaultCatalogPlugin[ApplauseIdentificatorDto]):
         identificator: ApplauseIdentificatorDto,
         csv_path: Path,
         resources_dir: Path,
-    ) -> Iterator[list[PhotometricDataDto]]:
+    ) -> Iterator[PhotometricBatch]:
         lc_query = f"""SELECT ucac4_id, jd_mid, bmag, bmagerr, vmag, vmagerr FROM applause_dr3.lightcurve
         WHERE ucac4_id='{identificator.ucac4_id}' ORDER BY jd_mid"""
 
         result_table = self.__tap_query(lc_query, "PostgreSQL")
         result_table.write(csv_path)
 
-        chunk: list[PhotometricDataDto] = []
-        for jd_mid, bmag, bmagerr, vmag, vmagerr in result_table.iterrows(
-            "jd_mid ", "bmag", "bmagerr", "vmag", "vmagerr"
-        ):
-            if len(chunk) >= self.batch_limit():
-                yield chunk
-                chunk = []
-
-            # convert JD_UTC to BJD_TDB
-            bjd = self._to_bjd_tdb(
-                jd_mid,
-                time_format="jd",
-                time_scale="utc",
-                reference_frame="geocentric",
-                ra_deg=identificator.ra_deg,
-                dec_deg=identificator.dec_deg,
-            )
-
-            chunk.append(
-                PhotometricDataDto(
-                    plugin_id=identificator.plugin_id,
-                    julian_date=bjd,
-                    magnitude=bmag,
-                    magnitude_error=bmagerr,
-                    light_filter="B",
-                )
-            )
+        # convert JD_UTC to BJD_TDB
+        bjds = self._to_bjd_tdb_batch(
+            result_table["jd_mid"],
+            time_format="jd",
+            time_scale="utc",
+            reference_frame="geocentric",
+            ra_deg=identificator.ra_deg,
+            dec_deg=identificator.dec_deg,
+        )
 
-            chunk.append(
-                PhotometricDataDto(
-                    plugin_id=identificator.plugin_id,
-                    julian_date=bjd,
-                    magnitude=vmag,
-                    magnitude_error=vmagerr,
-                    light_filter="V",
-                )
+        bmag = np.asarray(result_table["bmag"], dtype=np.float64)
+        bmagerr = np.asarray(result_table["bmagerr"], dtype=np.float64)
+        vmag = np.asarray(result_table["vmag"], dtype=np.float64)
+        vmagerr = np.asarray(result_table["vmagerr"], dtype=np.float64)
+
+        # each row contains both B and V measurement
+        rows_per_chunk = self.batch_limit() // 2
+        for start in range(0, len(bjds), rows_per_chunk):
+            end = start + rows_per_chunk
+            yield PhotometricBatch(
+                identificator.plugin_id,
+                np.repeat(bjds[start:end], 2),
+                np.column_stack((bmag[start:end], vmag[start:end])).ravel(),
+                np.column_stack((bmagerr[start:end], vmagerr[start:end])).ravel(),
+                np.tile([0, 1], len(bjds[start:end])),
+                ["B", "V"],
             )
-
-        if chunk != []:
-            yield chunk
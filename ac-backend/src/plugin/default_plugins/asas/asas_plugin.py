@@ -2,13 +2,12 @@ from pathlib import Path
 from typing import Iterator
 from uuid import UUID
 
-import httpx
 from astropy.coordinates import SkyCoord
 from astropy import units as u
 
 from src.plugin.interface.catalog_plugin import DefaultCatalogPlugin
+from src.plugin.interface.photometric_batch import PhotometricBatch
 from src.plugin.interface.schemas import (
-    PhotometricDataDto,
     StellarObjectIdentificatorDto,
 )
 from bs4 import BeautifulSoup
@@ -26,8 +25,8 @@ class AsasPlugin(DefaultCatalogPlugin[AsasIdentificatorDto]):
             "https://www.astrouw.edu.pl/asas/?page=main",
             True,
         )
-        self._http_client = httpx.Client(timeout=10.0)
         self._search_url = "https://www.astrouw.edu.pl/cgi-asas/asas_cat_input"
+        self._http_client = self._get_http_client(self._search_url, timeout=10.0)
 
     def _data_url(self, asas_id: str) -> str:
         return f"https://www.astrouw.edu.pl/cgi-asas/asas_cgi_get_data?{asas_id},asas3"
@@ -93,14 +92,13 @@ class AsasPlugin(DefaultCatalogPlugin[AsasIdentificatorDto]):
 
     def get_photometric_data(
         self, identificator: AsasIdentificatorDto, csv_path: Path, resources_dir: Path
-    ) -> Iterator[list[PhotometricDataDto]]:
+    ) -> Iterator[PhotometricBatch]:
         resp = self._http_client.get(self._data_url(identificator.asas_id))
         resp.raise_for_status()
         html = resp.text
 
         lines = html.split("\n")
 
-        chunk: list[PhotometricDataDto] = []
         # Each data row consists of the following fields:
         # -  HJD-2450000
         # -  magnitudes (one for each aperture)
@@ -148,10 +146,14 @@ class AsasPlugin(DefaultCatalogPlugin[AsasIdentificatorDto]):
                 "HJD MAG_0,MAG_1,MAG_2,MAG_3,MAG_4,MER_0,MER_1,MER_2,MER_3,MER_4,GRADE,FRAME\n"
             )
 
+            hjds: list[float] = []
+            mags: list[float] = []
+            mag_errs: list[float] = []
+
             for line in lines:
-                if len(chunk) >= self.batch_limit():
-                    yield chunk
-                    chunk = []
+                if len(hjds) >= self.batch_limit():
+                    yield self.__to_chunk(identificator, hjds, mags, mag_errs)
+                    hjds, mags, mag_errs = [], [], []
 
                 if line.startswith("#") or line == "":
                     continue
@@ -169,27 +171,33 @@ class AsasPlugin(DefaultCatalogPlugin[AsasIdentificatorDto]):
                 )
                 hjd = float(tokens[0]) + 2450000
 
-                bjd = self._to_bjd_tdb(
-                    hjd,
-                    time_format="jd",
-                    time_scale="utc",
-                    reference_frame="heliocentric",
-                    ra_deg=identificator.ra_deg,
-                    dec_deg=identificator.dec_deg,
-                )
+                hjds.append(hjd)
+                mags.append(mag)
+                mag_errs.append(mag_err)
 
-                chunk.append(
-                    PhotometricDataDto(
-                        julian_date=bjd,
-                        magnitude=mag,
-                        magnitude_error=mag_err,
-                        plugin_id=identificator.plugin_id,
-                        light_filter="V",
-                    )
-                )
+        if hjds != []:
+            yield self.__to_chunk(identificator, hjds, mags, mag_errs)
 
-        if chunk != []:
-            yield chunk
+    def __to_chunk(
+        self,
+        identificator: AsasIdentificatorDto,
+        hjds: list[float],
+        mags: list[float],
+        mag_errs: list[float],
+    ) -> PhotometricBatch:
+        # convert HJD_UTC to BJD_TDB
+        bjds = self._to_bjd_tdb_batch(
+            hjds,
+            time_format="jd",
+            time_scale="utc",
+            reference_frame="heliocentric",
+            ra_deg=identificator.ra_deg,
+            dec_deg=identificator.dec_deg,
+        )
+
+        return PhotometricBatch.from_columns(
+            identificator.plugin_id, bjds, mags, mag_errs, light_filter="V"
+        )
 
     # ASAS-ID - ASAS identification (coded from the star's RA_2000 and DEC_2000 in the format: hhmmss+ddmm.m)
     # (see https://www.astrouw.edu.pl/asas/?page=catalogues)
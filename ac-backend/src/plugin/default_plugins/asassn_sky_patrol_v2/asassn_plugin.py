@@ -2,13 +2,12 @@ from pathlib import Path
 from typing import Iterator
 from uuid import UUID
 
-import httpx
 from astropy.coordinates import SkyCoord
 from astropy import units as u
 
 from src.plugin.interface.catalog_plugin import DefaultCatalogPlugin
+from src.plugin.interface.photometric_batch import PhotometricBatch
 from src.plugin.interface.schemas import (
-    PhotometricDataDto,
     StellarObjectIdentificatorDto,
 )
 
@@ -27,7 +26,9 @@ class AsassnPlugin(DefaultCatalogPlugin[AsassnIdentificatorDto]):
             "https://www.astronomy.ohio-state.edu/asassn/index.shtml",
             True,
         )
-        self._http_client = httpx.Client(timeout=10.0)
+        self._http_client = self._get_http_client(
+            "http://asassn-lb01.ifa.hawaii.edu:9006", timeout=10.0
+        )
 
     def _search_url(self, coords: SkyCoord, radius_arcsec: float) -> str:
         return f"http://asassn-lb01.ifa.hawaii.edu:9006/lookup_cone/radius{radius_arcsec / 3600}_ra{coords.ra.deg}_dec{coords.dec.deg}"
@@ -85,12 +86,14 @@ class AsassnPlugin(DefaultCatalogPlugin[AsassnIdentificatorDto]):
 
     def get_photometric_data(
         self, identificator: AsassnIdentificatorDto, csv_path: Path, resources_dir: Path
-    ) -> Iterator[list[PhotometricDataDto]]:
+    ) -> Iterator[PhotometricBatch]:
         response = self._http_client.get(self._data_url(identificator.asas_sn_id))
         response.raise_for_status()
         data_json = response.json()
 
-        chunk: list[PhotometricDataDto] = []
+        hjds: list[float] = []
+        mags: list[float] = []
+        mag_errs: list[float] = []
 
         with open(csv_path, mode="w") as csv_file:
             csv_file.write(
@@ -102,32 +105,33 @@ class AsassnPlugin(DefaultCatalogPlugin[AsassnIdentificatorDto]):
                     f"{record[0]},{record[1]},{record[2]},{record[3]},{record[4]},{record[5]},{record[6]},{record[7]},{record[8]}\n"
                 )
 
-                if len(chunk) >= self.batch_limit():
-                    yield chunk
-                    chunk = []
-
-                hjd = record[0]
-                mag = record[3]
-                mag_err = record[4]
-
-                bjd = self._to_bjd_tdb(
-                    hjd,
-                    time_format="jd",
-                    time_scale="utc",
-                    reference_frame="heliocentric",
-                    ra_deg=identificator.ra_deg,
-                    dec_deg=identificator.dec_deg,
-                )
+                if len(hjds) >= self.batch_limit():
+                    yield self.__to_chunk(identificator, hjds, mags, mag_errs)
+                    hjds, mags, mag_errs = [], [], []
 
-                chunk.append(
-                    PhotometricDataDto(
-                        julian_date=bjd,
-                        magnitude=mag,
-                        magnitude_error=mag_err,
-                        plugin_id=identificator.plugin_id,
-                        light_filter="V",
-                    )
-                )
+                hjds.append(record[0])
+                mags.append(record[3])
+                mag_errs.append(record[4])
 
-        if chunk != []:
-            yield chunk
+        if hjds != []:
+            yield self.__to_chunk(identificator, hjds, mags, mag_errs)
+
+    def __to_chunk(
+        self,
+        identificator: AsassnIdentificatorDto,
+        hjds: list[float],
+        mags: list[float],
+        mag_errs: list[float],
+    ) -> PhotometricBatch:
+        bjds = self._to_bjd_tdb_batch(
+            hjds,
+            time_format="jd",
+            time_scale="utc",
+            reference_frame="heliocentric",
+            ra_deg=identificator.ra_deg,
+            dec_deg=identificator.dec_deg,
+        )
+
+        return PhotometricBatch.from_columns(
+            identificator.plugin_id, bjds, mags, mag_errs, light_filter="V"
+        )
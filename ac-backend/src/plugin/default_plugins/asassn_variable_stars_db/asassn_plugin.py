@@ -2,12 +2,11 @@ from pathlib import Path
 from typing import Iterator
 from uuid import UUID
 
-import httpx
 from astropy.coordinates import SkyCoord
 
 from src.plugin.interface.catalog_plugin import DefaultCatalogPlugin
+from src.plugin.interface.photometric_batch import PhotometricBatch
 from src.plugin.interface.schemas import (
-    PhotometricDataDto,
     StellarObjectIdentificatorDto,
 )
 from bs4 import BeautifulSoup
@@ -27,8 +26,8 @@ class AsassnPlugin(DefaultCatalogPlugin[AsassnIdentificatorDto]):
             "https://www.astronomy.ohio-state.edu/asassn/index.shtml",
             True,
         )
-        self._http_client = httpx.Client(timeout=10.0)
         self._base_url = "https://asas-sn.osu.edu"
+        self._http_client = self._get_http_client(self._base_url, timeout=10.0)
 
     def _search_url(self, coords: SkyCoord, radius_arcsec: float) -> str:
         return f"https://asas-sn.osu.edu/variables?ra={coords.ra.deg}&dec={coords.dec.deg}&radius={radius_arcsec / 60}&vmag_min=&vmag_max=&amplitude_min=&amplitude_max=&period_min=&period_max=&lksl_min=&lksl_max=&class_prob_min=&class_prob_max=&parallax_over_err_min=&parallax_over_err_max=&name=&references[]=I&references[]=II&references[]=III&references[]=IV&references[]=V&references[]=IX&sort_by=raj2000&sort_order=asc&show_non_periodic=true&show_without_class=true&asassn_discov_only=false&"
@@ -90,14 +89,17 @@ class AsassnPlugin(DefaultCatalogPlugin[AsassnIdentificatorDto]):
 
     def get_photometric_data(
         self, identificator: AsassnIdentificatorDto, csv_path: Path, resources_dir: Path
-    ) -> Iterator[list[PhotometricDataDto]]:
+    ) -> Iterator[PhotometricBatch]:
         data_url = f"{self._base_url}/variables/{identificator.asasn_uuid}.json"
 
         resp = self._http_client.get(data_url)
         resp.raise_for_status()
         data = resp.json()
 
-        chunk: list[PhotometricDataDto] = []
+        hjds: list[float] = []
+        mags: list[float] = []
+        mag_errs: list[float] = []
+
         with open(csv_path, mode="w") as csv_file:
             csv_file.write("hjd,camera,mag,mag_err,flux,flux_err\n")
 
@@ -105,31 +107,37 @@ class AsassnPlugin(DefaultCatalogPlugin[AsassnIdentificatorDto]):
                 csv_file.write(
                     f"{result['hjd']},{result['camera']},{result['mag']},{result['mag_err']},{result['flux']},{result['flux_err']}\n"
                 )
-                if len(chunk) >= self.batch_limit():
-                    yield chunk
-                    chunk = []
+                if len(hjds) >= self.batch_limit():
+                    yield self.__to_chunk(identificator, hjds, mags, mag_errs)
+                    hjds, mags, mag_errs = [], [], []
 
                 hjd = float(result["hjd"])
                 mag = float(result["mag"])
                 mag_err = float(result["mag_err"])
-                bjd = self._to_bjd_tdb(
-                    hjd,
-                    time_format="jd",
-                    time_scale="utc",
-                    reference_frame="heliocentric",
-                    ra_deg=identificator.ra_deg,
-                    dec_deg=identificator.dec_deg,
-                )
 
-                chunk.append(
-                    PhotometricDataDto(
-                        julian_date=bjd,
-                        magnitude=mag,
-                        magnitude_error=mag_err,
-                        plugin_id=identificator.plugin_id,
-                        light_filter="V",
-                    )
-                )
+                hjds.append(hjd)
+                mags.append(mag)
+                mag_errs.append(mag_err)
 
-        if chunk != []:
-            yield chunk
+        if hjds != []:
+            yield self.__to_chunk(identificator, hjds, mags, mag_errs)
+
+    def __to_chunk(
+        self,
+        identificator: AsassnIdentificatorDto,
+        hjds: list[float],
+        mags: list[float],
+        mag_errs: list[float],
+    ) -> PhotometricBatch:
+        bjds = self._to_bjd_tdb_batch(
+            hjds,
+            time_format="jd",
+            time_scale="utc",
+            reference_frame="heliocentric",
+            ra_deg=identificator.ra_deg,
+            dec_deg=identificator.dec_deg,
+        )
+
+        return PhotometricBatch.from_columns(
+            identificator.plugin_id, bjds, mags, mag_errs, light_filter="V"
+        )
@@ -10,9 +10,10 @@ from astropy.coordinates import SkyCoord
 
 from src.core.config.config import settings
 from src.plugin.interface.catalog_plugin import DefaultCatalogPlugin
+from src.plugin.interface.photometric_batch import PhotometricBatch
 from src.plugin.interface.schemas import (
+    PhotometricDataJobDto,
     StellarObjectIdentificatorDto,
-    PhotometricDataDto,
 )
 
 
@@ -21,15 +22,19 @@ class AtlasIdentificatorDto(StellarObjectIdentificatorDto):
 
 
 class AtlasPlugin(DefaultCatalogPlugin[AtlasIdentificatorDto]):
+    # interval of polling a queued forced photometry job
+    _POLL_INTERVAL_SECONDS = 5.0
+
     def __init__(self) -> None:
         super().__init__(
             "ATLAS",
             "Asteroid Terrestrial-impact Last Alert System is an asteroid impact early warning system developed by the University of Hawaii and funded by NASA. It consists of four telescopes (Hawaii ×2, Chile, South Africa), which automatically scan the whole sky several times every night looking for moving objects.",
             "https://fallingstar-data.com/forcedphot/",
             False,
+            slow=True,
         )
-        self._http_client = httpx.Client(timeout=10.0)
         self._base_url = "https://fallingstar-data.com/forcedphot"
+        self._http_client = self._get_http_client(self._base_url, timeout=10.0)
 
     def list_objects(
         self,
@@ -48,53 +53,197 @@ class AtlasPlugin(DefaultCatalogPlugin[AtlasIdentificatorDto]):
             )
         ]
 
-    def get_photometric_data(
-        self, identificator: AtlasIdentificatorDto, csv_path: Path, resources_dir: Path
-    ) -> Iterator[list[PhotometricDataDto]]:
-        headers = {
+    def _headers(self) -> dict[str, str]:
+        return {
             "Authorization": f"Token {settings.ATLAS_TOKEN}",
             "Accept": "application/json",
         }
 
-        task_url = None
-        while not task_url:
-            resp = self._http_client.post(
-                f"{self._base_url}/queue/",
-                headers=headers,
-                data={
-                    "radeclist": f"{identificator.ra_deg} {identificator.dec_deg}",
-                    "mjd_max": None,
-                    "mjd_min": None,
-                },
+    def poll_photometric_data(
+        self,
+        identificator: AtlasIdentificatorDto,
+        job: PhotometricDataJobDto | None,
+    ) -> PhotometricDataJobDto | None:
+        """
+        Queues the forced photometry job, or checks whether the queued job has finished.
+        If the queue is throttled, the job is submitted again after the time advised by the server.
+        No job is queued, if the raw data of the identificator are cached.
+        """
+        cache = self._raw_data_cache()
+        if job is None and cache is not None and cache.contains(identificator):
+            return None
+        return self._poll_job(identificator, job)
+
+    def poll_photometric_data_batch(
+        self,
+        identificators: list[AtlasIdentificatorDto],
+        jobs: list[PhotometricDataJobDto | None],
+    ) -> list[PhotometricDataJobDto | None]:
+        """
+        Queues the forced photometry jobs of all identificators without a queued job by a single request,
+        and checks whether the queued jobs have finished. No job is queued for the cached identificators.
+        """
+        cache = self._raw_data_cache()
+        polled: list[PhotometricDataJobDto | None] = []
+        unqueued = []
+        for index, (identificator, job) in enumerate(
+            zip(identificators, jobs, strict=True)
+        ):
+            if job is None and cache is not None and cache.contains(identificator):
+                polled.append(None)
+            elif job is None or "task_url" not in job.state:
+                polled.append(job)
+                unqueued.append(index)
+            elif job.ready:
+                polled.append(job)
+            else:
+                polled.append(self._poll_job(identificator, job))
+
+        if unqueued:
+            queued = self._queue_jobs([identificators[index] for index in unqueued])
+            for index, job in zip(unqueued, queued, strict=True):
+                polled[index] = job
+        return polled
+
+    def _poll_job(
+        self,
+        identificator: AtlasIdentificatorDto,
+        job: PhotometricDataJobDto | None,
+    ) -> PhotometricDataJobDto:
+        if job is None or "task_url" not in job.state:
+            return self._queue_jobs([identificator])[0]
+
+        resp = self._http_client.get(job.state["task_url"], headers=self._headers())
+        resp.raise_for_status()
+        json_resp = resp.json()
+
+        if json_resp["finishtimestamp"]:
+            return PhotometricDataJobDto(
+                state={**job.state, "result_url": json_resp["result_url"]},
+                ready=True,
             )
-            resp_json = resp.json()[0]
-            if resp.status_code == 201:  # successfully queued
-                task_url = resp_json["url"]
-            elif resp.status_code == 429:  # throttled
-                message = resp_json["detail"]
-                t_sec = re.findall(r"available in (\d+) seconds", message)
-                t_min = re.findall(r"available in (\d+) minutes", message)
-                if t_sec:
-                    waittime = int(t_sec[0])
-                elif t_min:
-                    waittime = int(t_min[0]) * 60
-                else:
-                    waittime = 10
-                time.sleep(waittime)
+        return PhotometricDataJobDto(
+            state=job.state, countdown=self._POLL_INTERVAL_SECONDS
+        )
+
+    def _queue_jobs(
+        self, identificators: list[AtlasIdentificatorDto]
+    ) -> list[PhotometricDataJobDto]:
+        """
+        Queues a forced photometry job per identificator by a single request. If the queue is throttled,
+        the returned jobs have no task URL and the countdown advised by the server.
+        """
+        resp = self._http_client.post(
+            f"{self._base_url}/queue/",
+            headers=self._headers(),
+            data={
+                "radeclist": "\n".join(
+                    f"{identificator.ra_deg} {identificator.dec_deg}"
+                    for identificator in identificators
+                ),
+                "mjd_max": None,
+                "mjd_min": None,
+            },
+        )
+        if resp.status_code == 201:  # successfully queued, a task per coordinates
+            tasks = resp.json()
+            if len(tasks) != len(identificators):
+                # the tasks are assigned to the coordinates by their order
+                raise ValueError(
+                    f"The ATLAS queue returned {len(tasks)} jobs for {len(identificators)} coordinates"
+                )
+            return [
+                PhotometricDataJobDto(
+                    state={"task_url": task["url"]},
+                    countdown=self._POLL_INTERVAL_SECONDS,
+                )
+                for task in tasks
+            ]
+        if resp.status_code == 429:  # throttled
+            message = resp.json()[0]["detail"]
+            t_sec = re.findall(r"available in (\d+) seconds", message)
+            t_min = re.findall(r"available in (\d+) minutes", message)
+            if t_sec:
+                waittime = int(t_sec[0])
+            elif t_min:
+                waittime = int(t_min[0]) * 60
             else:
-                resp.raise_for_status()
+                waittime = 10
+            return [PhotometricDataJobDto(countdown=waittime) for _ in identificators]
 
-        result_url = None
-        while not result_url:
-            resp = self._http_client.get(task_url, headers=headers)
-            resp.raise_for_status()
-            json_resp = resp.json()
+        resp.raise_for_status()
+        raise httpx.HTTPStatusError(
+            f"Unexpected response {resp.status_code} of the ATLAS queue",
+            request=resp.request,
+            response=resp,
+        )
+
+    def get_photometric_data(
+        self,
+        identificator: AtlasIdentificatorDto,
+        csv_path: Path,
+        resources_dir: Path,
+        job: PhotometricDataJobDto | None = None,
+    ) -> Iterator[PhotometricBatch]:
+        self._cached_download(
+            identificator,
+            csv_path,
+            lambda path: self._download_result(
+                self._wait_for_job(identificator, job), path
+            ),
+        )
+        yield from self._read_result(identificator, csv_path)
+
+    def _wait_for_job(
+        self,
+        identificator: AtlasIdentificatorDto,
+        job: PhotometricDataJobDto | None,
+    ) -> PhotometricDataJobDto:
+        # the task passes the finished job, other callers wait for it here
+        while job is None or not job.ready:
+            job = self._poll_job(identificator, job)
+            if not job.ready:
+                time.sleep(job.countdown)
+        return job
+
+    def get_photometric_data_batch(
+        self,
+        identificators: list[AtlasIdentificatorDto],
+        csv_paths: list[Path],
+        resources_dir: Path,
+        jobs: list[PhotometricDataJobDto | None] | None = None,
+    ) -> Iterator[tuple[int, PhotometricBatch]]:
+        """
+        Downloads the results of the ready jobs, the cached identificators have no job. The batch task passes
+        the jobs polled by poll_photometric_data_batch, other callers wait for the jobs here.
+        """
+        if jobs is None:
+            jobs = self._wait_for_jobs(identificators)
+        for index, (identificator, csv_path, job) in enumerate(
+            zip(identificators, csv_paths, jobs, strict=True)
+        ):
+            for batch in self.get_photometric_data(
+                identificator, csv_path, resources_dir, job
+            ):
+                yield index, batch
+
+    def _wait_for_jobs(
+        self, identificators: list[AtlasIdentificatorDto]
+    ) -> list[PhotometricDataJobDto | None]:
+        jobs: list[PhotometricDataJobDto | None] = [None] * len(identificators)
+        while True:
+            jobs = self.poll_photometric_data_batch(identificators, jobs)
+            countdowns = [
+                job.countdown for job in jobs if job is not None and not job.ready
+            ]
+            if not countdowns:
+                return jobs
+            time.sleep(min(countdowns))
 
-            if resp.status_code == 200:  # HTTP OK
-                if json_resp["finishtimestamp"]:
-                    result_url = json_resp["result_url"]
-                    break
-                time.sleep(5)
+    def _download_result(self, job: PhotometricDataJobDto, csv_path: Path) -> None:
+        headers = self._headers()
+        task_url = job.state["task_url"]
+        result_url = job.state["result_url"]
 
         with self._http_client.stream("GET", result_url, headers=headers) as resp:
             resp.raise_for_status()
@@ -106,6 +255,11 @@ class AtlasPlugin(DefaultCatalogPlugin[AtlasIdentificatorDto]):
         # cluttered (and reduce server storage usage) by sending a delete operation
         self._http_client.delete(task_url, headers=headers)
 
+    def _read_result(
+        self,
+        identificator: AtlasIdentificatorDto,
+        csv_path: Path,
+    ) -> Iterator[PhotometricBatch]:
         for chunk in pd.read_csv(
             csv_path,
             chunksize=50_000,
@@ -129,31 +283,20 @@ class AtlasPlugin(DefaultCatalogPlugin[AtlasIdentificatorDto]):
             )
             filtered_chunk = chunk[mask]
 
-            batch: list[PhotometricDataDto] = []
-            for mjd, mag, mag_err, photometric_filter in zip(
-                filtered_chunk["MJD"],
-                filtered_chunk["m"],
-                filtered_chunk["dm"],
-                filtered_chunk["F"],
-            ):
-                # convert MJD_UTC to BJD_TDB
-                bjd = self._to_bjd_tdb(
-                    mjd,
-                    time_format="mjd",
-                    time_scale="utc",
-                    reference_frame="geocentric",
-                    ra_deg=identificator.ra_deg,
-                    dec_deg=identificator.dec_deg,
-                )
-
-                batch.append(
-                    PhotometricDataDto(
-                        plugin_id=identificator.plugin_id,
-                        julian_date=bjd,
-                        magnitude=mag,
-                        magnitude_error=mag_err,
-                        light_filter=photometric_filter,
-                    )
-                )
+            # convert MJD_UTC to BJD_TDB
+            bjds = self._to_bjd_tdb_batch(
+                filtered_chunk["MJD"].to_numpy(),
+                time_format="mjd",
+                time_scale="utc",
+                reference_frame="geocentric",
+                ra_deg=identificator.ra_deg,
+                dec_deg=identificator.dec_deg,
+            )
 
-            yield batch
+            yield PhotometricBatch.from_columns(
+                identificator.plugin_id,
+                bjds,
+                filtered_chunk["m"].to_numpy(),
+                filtered_chunk["dm"].to_numpy(),
+                light_filter=filtered_chunk["F"].to_numpy(),
+            )
@@ -2,13 +2,12 @@ from pathlib import Path
 from typing import Iterator
 from uuid import UUID
 
-import httpx
 import pandas as pd
 from astropy.coordinates import SkyCoord
 
 from src.plugin.interface.catalog_plugin import DefaultCatalogPlugin
+from src.plugin.interface.photometric_batch import PhotometricBatch
 from src.plugin.interface.schemas import (
-    PhotometricDataDto,
     StellarObjectIdentificatorDto,
 )
 from bs4 import BeautifulSoup
@@ -26,8 +25,8 @@ class CatalinaPlugin(DefaultCatalogPlugin[CatalinaIdentificatorDto]):
             "http://nesssi.cacr.caltech.edu/DataRelease/",
             False,
         )
-        self._http_client = httpx.Client(timeout=10.0)
         self._url = "http://nunuku.caltech.edu/cgi-bin/getcssconedb_release_img.cgi"
+        self._http_client = self._get_http_client(self._url, timeout=10.0)
 
     def list_objects(
         self,
@@ -77,19 +76,23 @@ class CatalinaPlugin(DefaultCatalogPlugin[CatalinaIdentificatorDto]):
         identificator: CatalinaIdentificatorDto,
         csv_path: Path,
         resources_dir: Path,
-    ) -> Iterator[list[PhotometricDataDto]]:
-        self.__write_to_csv(identificator.csv_link, csv_path)
+    ) -> Iterator[PhotometricBatch]:
+        self._cached_download(
+            identificator,
+            csv_path,
+            lambda path: self.__write_to_csv(identificator.csv_link, path),
+        )
 
         # release data in chunks
         for chunk in self.__get_chunk(csv_path, identificator):
-            if chunk == []:
+            if len(chunk) == 0:
                 continue
 
             yield chunk
 
     def __get_chunk(
         self, path: Path, identificator: CatalinaIdentificatorDto
-    ) -> Iterator[list[PhotometricDataDto]]:
+    ) -> Iterator[PhotometricBatch]:
         for chunk in pd.read_csv(
             path,
             chunksize=50_000,
@@ -104,29 +107,24 @@ class CatalinaPlugin(DefaultCatalogPlugin[CatalinaIdentificatorDto]):
             na_values=(""),
             on_bad_lines="skip",
         ):
-            batch: list[PhotometricDataDto] = []
             chunk = chunk.dropna(subset=["MJD", "Mag", "Magerr"])
-            for mjd, mag, magerr in chunk.itertuples(index=False, name=None):
-                # convert MJD_UTC to BJD_TDB
-                bjd = self._to_bjd_tdb(
-                    mjd,
-                    time_format="mjd",
-                    time_scale="utc",
-                    reference_frame="geocentric",
-                    ra_deg=identificator.ra_deg,
-                    dec_deg=identificator.dec_deg,
-                )
-
-                batch.append(
-                    PhotometricDataDto(
-                        plugin_id=identificator.plugin_id,
-                        julian_date=bjd,
-                        magnitude=mag,
-                        magnitude_error=magerr,
-                        light_filter="V",
-                    )
-                )
-            yield batch
+            # convert MJD_UTC to BJD_TDB
+            bjds = self._to_bjd_tdb_batch(
+                chunk["MJD"].to_numpy(),
+                time_format="mjd",
+                time_scale="utc",
+                reference_frame="geocentric",
+                ra_deg=identificator.ra_deg,
+                dec_deg=identificator.dec_deg,
+            )
+
+            yield PhotometricBatch.from_columns(
+                identificator.plugin_id,
+                bjds,
+                chunk["Mag"].to_numpy(),
+                chunk["Magerr"].to_numpy(),
+                light_filter="V",
+            )
 
     def __write_to_csv(self, url: str, path: Path) -> None:
         with self._http_client.stream("GET", url) as resp:
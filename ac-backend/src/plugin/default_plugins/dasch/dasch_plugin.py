@@ -3,12 +3,11 @@ from pathlib import Path
 from typing import Iterator
 from uuid import UUID
 
-import httpx
 from astropy.coordinates import SkyCoord
 
 from src.plugin.interface.catalog_plugin import DefaultCatalogPlugin
+from src.plugin.interface.photometric_batch import PhotometricBatch
 from src.plugin.interface.schemas import (
-    PhotometricDataDto,
     StellarObjectIdentificatorDto,
 )
 
@@ -32,7 +31,7 @@ class DaschPlugin(DefaultCatalogPlugin[DaschIdentificatorDto]):
         self.base_url = "https://api.starglass.cfa.harvard.edu/public"
         self.querycat_endpoint = f"{self.base_url}/dasch/dr7/querycat"
         self.lightcurve_endpoint = f"{self.base_url}/dasch/dr7/lightcurve"
-        self._http_client = httpx.Client()
+        self._http_client = self._get_http_client(self.base_url)
 
     def list_objects(
         self,
@@ -99,22 +98,12 @@ class DaschPlugin(DefaultCatalogPlugin[DaschIdentificatorDto]):
 
     def get_photometric_data(
         self, identificator: DaschIdentificatorDto, csv_path: Path, resources_dir: Path
-    ) -> Iterator[list[PhotometricDataDto]]:
-        lc_body = {
-            "gsc_bin_index": identificator.gsc_bin_index,
-            "ref_number": identificator.ref_number,
-            "refcat": REFCAT_APASS,
-        }
-
-        with self._http_client.stream(
-            "POST", self.lightcurve_endpoint, data=lc_body
-        ) as resp:
-            resp.raise_for_status()
-
-            # write to CSV in chunks
-            with open(csv_path, "wb") as f:
-                for chunk in resp.iter_bytes(1024 * 1024):
-                    f.write(chunk)
+    ) -> Iterator[PhotometricBatch]:
+        self._cached_download(
+            identificator,
+            csv_path,
+            lambda path: self.__write_to_csv(identificator, path),
+        )
 
         with open(csv_path, "r") as lc_data:
             reader = csv.reader(lc_data)
@@ -124,12 +113,14 @@ class DaschPlugin(DefaultCatalogPlugin[DaschIdentificatorDto]):
             mag_idx = header.index("magcal_magdep")
             err_idx = header.index("magcal_magdep_rms")
 
-            chunk: list[PhotometricDataDto] = []
+            jds: list[float] = []
+            mags: list[float] = []
+            errs: list[float] = []
 
             for row in reader:
-                if len(chunk) >= self.batch_limit():
-                    yield chunk
-                    chunk = []
+                if len(jds) >= self.batch_limit():
+                    yield self.__to_chunk(identificator, jds, mags, errs)
+                    jds, mags, errs = [], [], []
 
                 jd_str = row[jd_idx]
                 mag_str = row[mag_idx]
@@ -137,30 +128,53 @@ class DaschPlugin(DefaultCatalogPlugin[DaschIdentificatorDto]):
                 if jd_str == "" or mag_str == "" or err_str == "":
                     continue
 
-                # convert HJD_UTC to BJD_TDB
-                # see DASCH time format - Time column:
-                # https://dasch.cfa.harvard.edu/dr7/lightcurve-columns/
-                bjd = self._to_bjd_tdb(
-                    float(row[jd_idx]),
-                    time_format="jd",
-                    time_scale="utc",
-                    reference_frame="heliocentric",
-                    ra_deg=identificator.ra_deg,
-                    dec_deg=identificator.dec_deg,
-                )
+                jd = float(jd_str)
+                mag = float(mag_str)
+                err = float(err_str)
 
-                mag = float(row[mag_idx])
-                err = float(row[err_idx])
-
-                chunk.append(
-                    PhotometricDataDto(
-                        julian_date=bjd,
-                        magnitude=mag,
-                        magnitude_error=err,
-                        plugin_id=identificator.plugin_id,
-                        light_filter=None,
-                    )
-                )
+                jds.append(jd)
+                mags.append(mag)
+                errs.append(err)
 
-        if chunk != []:
-            yield chunk
+        if jds != []:
+            yield self.__to_chunk(identificator, jds, mags, errs)
+
+    def __to_chunk(
+        self,
+        identificator: DaschIdentificatorDto,
+        jds: list[float],
+        mags: list[float],
+        errs: list[float],
+    ) -> PhotometricBatch:
+        # convert HJD_UTC to BJD_TDB
+        # see DASCH time format - Time column:
+        # https://dasch.cfa.harvard.edu/dr7/lightcurve-columns/
+        bjds = self._to_bjd_tdb_batch(
+            jds,
+            time_format="jd",
+            time_scale="utc",
+            reference_frame="heliocentric",
+            ra_deg=identificator.ra_deg,
+            dec_deg=identificator.dec_deg,
+        )
+
+        return PhotometricBatch.from_columns(
+            identificator.plugin_id, bjds, mags, errs, light_filter=None
+        )
+
+    def __write_to_csv(self, identificator: DaschIdentificatorDto, path: Path) -> None:
+        lc_body = {
+            "gsc_bin_index": identificator.gsc_bin_index,
+            "ref_number": identificator.ref_number,
+            "refcat": REFCAT_APASS,
+        }
+
+        with self._http_client.stream(
+            "POST", self.lightcurve_endpoint, data=lc_body
+        ) as resp:
+            resp.raise_for_status()
+
+            # write to CSV in chunks
+            with open(path, "wb") as f:
+                for chunk in resp.iter_bytes(1024 * 1024):
+                    f.write(chunk)
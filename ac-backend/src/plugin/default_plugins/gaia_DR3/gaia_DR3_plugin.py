@@ -3,11 +3,14 @@ from pathlib import Path
 from typing import Iterator
 from uuid import UUID
 
+import numpy as np
 from astropy.coordinates import SkyCoord
+from astropy.table import Table
 
 from src.plugin.interface.catalog_plugin import DefaultCatalogPlugin
+from src.plugin.interface.photometric_batch import PhotometricBatch
 from src.plugin.interface.schemas import (
-    PhotometricDataDto,
+    PhotometricDataJobDto,
     StellarObjectIdentificatorDto,
 )
 
@@ -68,28 +71,28 @@ class GaiaDR3Plugin(DefaultCatalogPlugin[GaiaDR3IdentificatorDto]):
         if chunk != []:
             yield chunk
 
-    def get_photometric_data(
-        self,
-        identificator: GaiaDR3IdentificatorDto,
-        csv_path: Path,
-        resources_dir: Path,
-    ) -> Iterator[list[PhotometricDataDto]]:
-        # for DB columns, see:
-        # https://gea.esac.esa.int/archive/documentation/GDR3/Gaia_archive/chap_datamodel/sec_dm_photometry/ssec_dm_epoch_photometry.html
-
+    def _load_epoch_photometry(self, source_ids: list[str]) -> dict:
         # data retrieval tutorial:
         # https://www.cosmos.esa.int/web/gaia-users/archive/datalink-products#Tutorial:--Retrieve-(all)-the-DataLink-products-associated-to-a-sample
 
         retrieval_type = "EPOCH_PHOTOMETRY"  # Options are: 'EPOCH_PHOTOMETRY', 'MCMC_GSPPHOT', 'MCMC_MSC', 'XP_SAMPLED', 'XP_CONTINUOUS', 'RVS', 'ALL'
         data_structure = "INDIVIDUAL"  # Options are: 'INDIVIDUAL' and 'RAW'
         data_release = "Gaia DR3"  # Options are: 'Gaia DR3' (default), 'Gaia DR2'
-        datalink = Gaia.load_data(
-            ids=[identificator.source_id],
+        return Gaia.load_data(
+            ids=source_ids,
             data_release=data_release,
             retrieval_type=retrieval_type,
             data_structure=data_structure,
             verbose=False,
         )
+
+    def get_photometric_data(
+        self,
+        identificator: GaiaDR3IdentificatorDto,
+        csv_path: Path,
+        resources_dir: Path,
+    ) -> Iterator[PhotometricBatch]:
+        datalink = self._load_epoch_photometry([identificator.source_id])
         key_list = list(datalink.keys())
         # no records found in the table.
         # the key_list should contain only 1 record, as we are selecting only 1 source id
@@ -100,47 +103,76 @@ class GaiaDR3Plugin(DefaultCatalogPlugin[GaiaDR3IdentificatorDto]):
         key = key_list[0]
 
         votable = datalink[key][0]  # Select the first (and only) element of the list
-        result_table = votable.to_table()
+        yield from self._read_epoch_photometry(
+            identificator, votable.to_table(), csv_path
+        )
 
+    def get_photometric_data_batch(
+        self,
+        identificators: list[GaiaDR3IdentificatorDto],
+        csv_paths: list[Path],
+        resources_dir: Path,
+        jobs: list[PhotometricDataJobDto | None] | None = None,
+    ) -> Iterator[tuple[int, PhotometricBatch]]:
+        """
+        Loads the epoch photometry of all sources by a single DataLink request.
+        """
+        indices: dict[str, list[int]] = {}
+        for index, identificator in enumerate(identificators):
+            indices.setdefault(str(identificator.source_id), []).append(index)
+
+        datalink = self._load_epoch_photometry(list(indices.keys()))
+        # a table per source, the sources without any records are missing
+        for votables in datalink.values():
+            result_table = votables[0].to_table()
+            if len(result_table) == 0:
+                continue
+
+            for index in indices.get(str(result_table["source_id"][0]), []):
+                for batch in self._read_epoch_photometry(
+                    identificators[index], result_table, csv_paths[index]
+                ):
+                    yield index, batch
+
+    def _read_epoch_photometry(
+        self,
+        identificator: GaiaDR3IdentificatorDto,
+        result_table: Table,
+        csv_path: Path,
+    ) -> Iterator[PhotometricBatch]:
+        # for DB columns, see:
+        # https://gea.esac.esa.int/archive/documentation/GDR3/Gaia_archive/chap_datamodel/sec_dm_photometry/ssec_dm_epoch_photometry.html
         result_table.write(csv_path, format="ascii.csv", overwrite=True)
 
         mask = result_table["rejected_by_photometry"] == False  # noqa: E712
         table = result_table[mask]
-        chunk: list[PhotometricDataDto] = []
-        for i in range(len(table)):
-            if len(chunk) >= self.batch_limit():
-                yield chunk
-                chunk = []
-
-            # Values are BJD_TCB timestamps
-            # The reference epoch for time are (BJD) 2010-01-01T00:00:00.
-            # 2010-01-01T00:00:00 (UTC) == 2455197.5 (JD)
-            bjd_tcb = table["g_transit_time"][i] + 2455197.5
-            g_mag = table["g_transit_mag"][i]
-            # TODO convert to magnitude error?
-            g_mag_err = (2.5 / math.log(10)) * (
-                table["g_transit_flux_error"][i] / table["g_transit_flux"][i]
-            )
+        # Values are BJD_TCB timestamps
+        # The reference epoch for time are (BJD) 2010-01-01T00:00:00.
+        # 2010-01-01T00:00:00 (UTC) == 2455197.5 (JD)
+        bjd_tcb = np.asarray(table["g_transit_time"], dtype=np.float64) + 2455197.5
+        g_mag = np.asarray(table["g_transit_mag"], dtype=np.float64)
+        # TODO convert to magnitude error?
+        g_mag_err = (2.5 / math.log(10)) * (
+            np.asarray(table["g_transit_flux_error"], dtype=np.float64)
+            / np.asarray(table["g_transit_flux"], dtype=np.float64)
+        )
 
-            # convert BJD_TCB to BJD_TDB
-            bjd = self._to_bjd_tdb(
-                bjd_tcb,
-                time_format="jd",
-                time_scale="tcb",
-                reference_frame="barycentric",
-                ra_deg=identificator.ra_deg,
-                dec_deg=identificator.dec_deg,
-            )
+        # convert BJD_TCB to BJD_TDB
+        bjd = self._to_bjd_tdb_batch(
+            bjd_tcb,
+            time_format="jd",
+            time_scale="tcb",
+            reference_frame="barycentric",
+            ra_deg=identificator.ra_deg,
+            dec_deg=identificator.dec_deg,
+        )
 
-            chunk.append(
-                PhotometricDataDto(
-                    plugin_id=identificator.plugin_id,
-                    julian_date=bjd,
-                    magnitude=g_mag,
-                    magnitude_error=g_mag_err,
-                    light_filter="G",
-                )
+        for start in range(0, len(table), self.batch_limit()):
+            end = start + self.batch_limit()
+            yield PhotometricBatch.from_columns(
+                identificator.plugin_id,
+                bjd[start:end],
+                g_mag[start:end],
+                g_mag_err[start:end],
+                light_filter="G",
             )
-
-        if chunk != []:
-            yield chunk
@@ -2,14 +2,13 @@ from pathlib import Path
 from typing import Iterator
 from uuid import UUID
 
-import httpx
 from astropy.coordinates import SkyCoord
 from astropy import units as u
 from astroquery.vizier import Vizier
 
 from src.plugin.interface.catalog_plugin import DefaultCatalogPlugin
+from src.plugin.interface.photometric_batch import PhotometricBatch
 from src.plugin.interface.schemas import (
-    PhotometricDataDto,
     StellarObjectIdentificatorDto,
 )
 
@@ -28,7 +27,9 @@ class MachoPlugin(DefaultCatalogPlugin[MachoIdentificatorDto]):
             "https://wwwmacho.anu.edu.au/",
             True,
         )
-        self._http_client = httpx.Client(timeout=10.0)
+        self._http_client = self._get_http_client(
+            "https://cdsarc.cds.unistra.fr", timeout=10.0
+        )
         self._vizier = Vizier()
 
     def _data_url(self, ident: MachoIdentificatorDto) -> str:
@@ -79,14 +80,16 @@ class MachoPlugin(DefaultCatalogPlugin[MachoIdentificatorDto]):
 
     def get_photometric_data(
         self, identificator: MachoIdentificatorDto, csv_path: Path, resources_dir: Path
-    ) -> Iterator[list[PhotometricDataDto]]:
+    ) -> Iterator[PhotometricBatch]:
         # data format:
         # JD-2400000	[mag]	(error)
 
         resp = self._http_client.get(self._data_url(identificator))
         resp.raise_for_status()
 
-        batch: list[PhotometricDataDto] = []
+        jds: list[float] = []
+        mags: list[float] = []
+        mag_errs: list[float] = []
 
         with open(csv_path, "w") as csv_file:
             csv_file.write("# JD-2400000, mag, mag_err\n")
@@ -94,9 +97,9 @@ class MachoPlugin(DefaultCatalogPlugin[MachoIdentificatorDto]):
 
             for line in resp.iter_lines():
                 if not line.startswith("#"):
-                    if len(batch) > self.batch_limit():
-                        yield batch
-                        batch = []
+                    if len(jds) > self.batch_limit():
+                        yield self.__to_batch(identificator, jds, mags, mag_errs)
+                        jds, mags, mag_errs = [], [], []
 
                     row = line.split()
 
@@ -106,25 +109,30 @@ class MachoPlugin(DefaultCatalogPlugin[MachoIdentificatorDto]):
 
                     csv_file.write(f"{jd},{mag},{mag_err}\n")
 
-                    # convert JD_UTC to BJD_TDB
-                    bjd = self._to_bjd_tdb(
-                        jd,
-                        time_format="jd",
-                        time_scale="utc",
-                        reference_frame="geocentric",
-                        ra_deg=identificator.ra_deg,
-                        dec_deg=identificator.dec_deg,
-                    )
-
-                    batch.append(
-                        PhotometricDataDto(
-                            plugin_id=identificator.plugin_id,
-                            julian_date=bjd,
-                            magnitude=mag,
-                            magnitude_error=mag_err,
-                            light_filter=None,
-                        )
-                    )
-
-        if batch != []:
-            yield batch
+                    jds.append(jd)
+                    mags.append(mag)
+                    mag_errs.append(mag_err)
+
+        if jds != []:
+            yield self.__to_batch(identificator, jds, mags, mag_errs)
+
+    def __to_batch(
+        self,
+        identificator: MachoIdentificatorDto,
+        jds: list[float],
+        mags: list[float],
+        mag_errs: list[float],
+    ) -> PhotometricBatch:
+        # convert JD_UTC to BJD_TDB
+        bjds = self._to_bjd_tdb_batch(
+            jds,
+            time_format="jd",
+            time_scale="utc",
+            reference_frame="geocentric",
+            ra_deg=identificator.ra_deg,
+            dec_deg=identificator.dec_deg,
+        )
+
+        return PhotometricBatch.from_columns(
+            identificator.plugin_id, bjds, mags, mag_errs, light_filter=None
+        )
@@ -3,12 +3,11 @@ from pathlib import Path
 from typing import Iterator
 from uuid import UUID
 
-import httpx
 from astropy.coordinates import SkyCoord
 
 from src.plugin.interface.catalog_plugin import DefaultCatalogPlugin
+from src.plugin.interface.photometric_batch import PhotometricBatch
 from src.plugin.interface.schemas import (
-    PhotometricDataDto,
     StellarObjectIdentificatorDto,
 )
 
@@ -27,7 +26,7 @@ class Mmt9Plugin(DefaultCatalogPlugin[Mmt9IdentificatorDto]):
             False,
         )
         self._url = "http://survey.favor2.info/favor2/photometry/json"
-        self._http_client = httpx.Client(timeout=30.0)
+        self._http_client = self._get_http_client(self._url, timeout=30.0)
 
     def list_objects(
         self,
@@ -66,7 +65,7 @@ class Mmt9Plugin(DefaultCatalogPlugin[Mmt9IdentificatorDto]):
 
     def get_photometric_data(
         self, identificator: Mmt9IdentificatorDto, csv_path: Path, resources_dir: Path
-    ) -> Iterator[list[PhotometricDataDto]]:
+    ) -> Iterator[PhotometricBatch]:
         query_params = {
             "coords": f"{identificator.ra_deg} {identificator.dec_deg} ",
             "sr": f"{identificator.radius_arcsec / 3600}",
@@ -79,7 +78,10 @@ class Mmt9Plugin(DefaultCatalogPlugin[Mmt9IdentificatorDto]):
         query_resp = self._http_client.get(self._url, params=query_params)
         query_data = query_resp.json()
 
-        chunk: list[PhotometricDataDto] = []
+        mjds: list[float] = []
+        mags: list[float] = []
+        mag_errs: list[float] = []
+        light_filters: list[str] = []
 
         with open(csv_path, mode="w") as csv_file:
             csv_writer = csv.writer(csv_file, delimiter=",")
@@ -125,29 +127,38 @@ class Mmt9Plugin(DefaultCatalogPlugin[Mmt9IdentificatorDto]):
                         ]
                     )
 
-                    if len(chunk) >= self.batch_limit():
-                        yield chunk
-                        chunk = []
-
-                    # convert MJD_UTC to BJD_TDB
-                    bjd = self._to_bjd_tdb(
-                        float(record["mjds"][i]),
-                        time_format="mjd",
-                        time_scale="utc",
-                        reference_frame="geocentric",
-                        ra_deg=identificator.ra_deg,
-                        dec_deg=identificator.dec_deg,
-                    )
-
-                    chunk.append(
-                        PhotometricDataDto(
-                            julian_date=bjd,
-                            magnitude=record["mags"][i],
-                            magnitude_error=record["magerrs"][i],
-                            plugin_id=identificator.plugin_id,
-                            light_filter=record["filter"],
+                    if len(mjds) >= self.batch_limit():
+                        yield self.__to_chunk(
+                            identificator, mjds, mags, mag_errs, light_filters
                         )
-                    )
+                        mjds, mags, mag_errs, light_filters = [], [], [], []
+
+                    mjds.append(float(record["mjds"][i]))
+                    mags.append(record["mags"][i])
+                    mag_errs.append(record["magerrs"][i])
+                    light_filters.append(record["filter"])
+
+        if mjds != []:
+            yield self.__to_chunk(identificator, mjds, mags, mag_errs, light_filters)
 
-        if chunk != []:
-            yield chunk
+    def __to_chunk(
+        self,
+        identificator: Mmt9IdentificatorDto,
+        mjds: list[float],
+        mags: list[float],
+        mag_errs: list[float],
+        light_filters: list[str],
+    ) -> PhotometricBatch:
+        # convert MJD_UTC to BJD_TDB
+        bjds = self._to_bjd_tdb_batch(
+            mjds,
+            time_format="mjd",
+            time_scale="utc",
+            reference_frame="geocentric",
+            ra_deg=identificator.ra_deg,
+            dec_deg=identificator.dec_deg,
+        )
+
+        return PhotometricBatch.from_columns(
+            identificator.plugin_id, bjds, mags, mag_errs, light_filter=light_filters
+        )
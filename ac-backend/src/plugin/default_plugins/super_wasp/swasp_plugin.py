@@ -2,14 +2,13 @@ from pathlib import Path
 from typing import Iterator
 from uuid import UUID
 
-import httpx
 import pandas as pd
 from astropy.coordinates import SkyCoord
 from astropy import units as u
 
 from src.plugin.interface.catalog_plugin import DefaultCatalogPlugin
+from src.plugin.interface.photometric_batch import PhotometricBatch
 from src.plugin.interface.schemas import (
-    PhotometricDataDto,
     StellarObjectIdentificatorDto,
 )
 from bs4 import BeautifulSoup
@@ -27,9 +26,9 @@ class SwaspPlugin(DefaultCatalogPlugin[SwaspIdentificatorDto]):
             "https://wasp.cerit-sc.cz/",
             True,
         )
-        self._http_client = httpx.Client(timeout=10.0)
         self._search_url = "https://wasp.cerit-sc.cz/search"
         self._data_url = "https://wasp.cerit-sc.cz/csv"
+        self._http_client = self._get_http_client(self._search_url, timeout=10.0)
 
     def list_objects(
         self,
@@ -81,12 +80,18 @@ class SwaspPlugin(DefaultCatalogPlugin[SwaspIdentificatorDto]):
 
     def get_photometric_data(
         self, identificator: SwaspIdentificatorDto, csv_path: Path, resources_dir: Path
-    ) -> Iterator[list[PhotometricDataDto]]:
-        self.__write_to_csv(self._data_url, identificator.swasp_id, csv_path)
+    ) -> Iterator[PhotometricBatch]:
+        self._cached_download(
+            identificator,
+            csv_path,
+            lambda path: self.__write_to_csv(
+                self._data_url, identificator.swasp_id, path
+            ),
+        )
 
         # release data in chunks
         for chunk in self.__get_chunk(csv_path, identificator):
-            if chunk == []:
+            if len(chunk) == 0:
                 continue
 
             yield chunk
@@ -100,7 +105,7 @@ class SwaspPlugin(DefaultCatalogPlugin[SwaspIdentificatorDto]):
 
     def __get_chunk(
         self, path: Path, identificator: SwaspIdentificatorDto
-    ) -> Iterator[list[PhotometricDataDto]]:
+    ) -> Iterator[PhotometricBatch]:
         for chunk in pd.read_csv(
             path,
             chunksize=50_000,
@@ -115,26 +120,21 @@ class SwaspPlugin(DefaultCatalogPlugin[SwaspIdentificatorDto]):
             na_values=(""),
             on_bad_lines="skip",
         ):
-            batch: list[PhotometricDataDto] = []
             chunk = chunk.dropna(subset=["HJD", "magnitude", "magnitude error"])
-            for hjd, mag, mag_err in chunk.itertuples(index=False, name=None):
-                # convert HJD_UTC to BJD_TDB
-                bjd = self._to_bjd_tdb(
-                    hjd,
-                    time_format="jd",
-                    time_scale="utc",
-                    reference_frame="heliocentric",
-                    ra_deg=identificator.ra_deg,
-                    dec_deg=identificator.dec_deg,
-                )
+            # convert HJD_UTC to BJD_TDB
+            bjds = self._to_bjd_tdb_batch(
+                chunk["HJD"].to_numpy(),
+                time_format="jd",
+                time_scale="utc",
+                reference_frame="heliocentric",
+                ra_deg=identificator.ra_deg,
+                dec_deg=identificator.dec_deg,
+            )
 
-                batch.append(
-                    PhotometricDataDto(
-                        plugin_id=identificator.plugin_id,
-                        julian_date=bjd,
-                        magnitude=mag,
-                        magnitude_error=mag_err,
-                        light_filter=None,
-                    )
-                )
-            yield batch
+            yield PhotometricBatch.from_columns(
+                identificator.plugin_id,
+                bjds,
+                chunk["magnitude"].to_numpy(),
+                chunk["magnitude error"].to_numpy(),
+                light_filter=None,
+            )
@@ -0,0 +1,95 @@
+from abc import abstractmethod
+from pathlib import Path
+from typing import AsyncIterator, List
+from uuid import UUID
+
+import httpx
+from astropy.coordinates import SkyCoord
+
+from src.core.http_client.registry import http_clients
+from src.plugin.interface.catalog_plugin import BaseCatalogPlugin, T
+from src.plugin.interface.photometric_batch import PhotometricBatch
+from src.plugin.interface.schemas import PhotometricDataDto, PhotometricDataJobDto
+
+
+class AsyncCatalogPlugin(BaseCatalogPlugin[T]):
+    """
+    Base class for the catalog plugins, which fetch the data by asyncio. The methods have the same contract as
+    the ones of CatalogPlugin, but they are async generators. The plugin must not block the event loop,
+    as the loop is shared by all tasks of the worker process; the CPU-bound parsing of large responses
+    can be moved to a thread by asyncio.to_thread.
+    """
+
+    def _get_async_http_client(
+        self, url: str, timeout: float | None = None
+    ) -> httpx.AsyncClient:
+        """
+        Returns the async HTTP client for the catalog host, shared by all plugin instances and tasks of the worker process.
+        Please use it instead of creating own clients, and do not close it.
+
+        :param url: any URL of the catalog host.
+        :param timeout: timeout of the requests in seconds, the default of the application if None.
+        :return: the pooled async HTTP client of the host.
+        """
+        return http_clients.async_client(url, timeout)
+
+    @abstractmethod
+    def list_objects(
+        self,
+        coords: SkyCoord,
+        radius_arcsec: float,
+        plugin_id: UUID,
+        resources_dir: Path,
+    ) -> AsyncIterator[List[T]]:
+        """
+        Async generator method that yields found stellar objects, see CatalogPlugin.list_objects.
+        :param coords: the coordinates which to search for objects around
+        :param radius_arcsec: search radius around the given coordinates in arcseconds
+        :param plugin_id: the plugin id of the used plugin database entity. Used to identify the plugin in the database.
+        :param resources_dir: resource directory of the plugin
+        :return: list of stellar object identificators.
+        """
+        pass
+
+    @abstractmethod
+    def get_photometric_data(
+        self, identificator: T, csv_path: Path, resources_dir: Path
+    ) -> AsyncIterator[PhotometricBatch | list[PhotometricDataDto]]:
+        """
+        Async generator method that yields photometric data for a given stellar object,
+        see CatalogPlugin.get_photometric_data.
+
+        :param resources_dir: resource directory of the plugin
+        :param csv_path: path to store the original data
+        :param identificator: the stellar object to get photometric data for
+        :return: photometric data for the given stellar object.
+        """
+        pass
+
+    async def get_photometric_data_batch(
+        self,
+        identificators: list[T],
+        csv_paths: list[Path],
+        resources_dir: Path,
+        jobs: list[PhotometricDataJobDto | None] | None = None,
+    ) -> AsyncIterator[tuple[int, PhotometricBatch | list[PhotometricDataDto]]]:
+        """
+        Async generator method that yields photometric data for multiple stellar objects,
+        see CatalogPlugin.get_photometric_data_batch. By default, get_photometric_data is called
+        for each identificator in turn.
+
+        :param identificators: the stellar objects to get photometric data for
+        :param csv_paths: paths to store the original data, one per identificator
+        :param resources_dir: resource directory of the plugin
+        :param jobs: the ready jobs of poll_photometric_data_batch, passed only if the plugin prepares the data by jobs
+        :return: pairs of the index of the identificator and the photometric data of the stellar object.
+        """
+        for index, (identificator, csv_path) in enumerate(
+            zip(identificators, csv_paths, strict=True)
+        ):
+            job = None if jobs is None else jobs[index]
+            job_kwargs = {} if job is None else {"job": job}
+            async for data in self.get_photometric_data(
+                identificator, csv_path, resources_dir, **job_kwargs
+            ):
+                yield index, data
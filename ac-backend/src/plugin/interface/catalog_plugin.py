@@ -1,23 +1,35 @@
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from pathlib import Path
 from typing import TypeVar, List, Generic, Iterator, Literal
 from uuid import UUID
 
+import httpx
+import numpy as np
+import numpy.typing as npt
 from astropy import units
 from astropy.coordinates import SkyCoord, EarthLocation
 from astropy.time import Time
 
+from src.core.http_client.registry import http_clients
+from src.core.raw_data_cache.cache import RawDataCache, current_raw_data_cache
+from src.plugin.interface.light_travel_time_cache import (
+    get_light_travel_time_cache,
+    light_travel_time_correction,
+)
+from src.plugin.interface.photometric_batch import PhotometricBatch
 from src.plugin.interface.schemas import (
     StellarObjectIdentificatorDto,
     PhotometricDataDto,
+    PhotometricDataJobDto,
 )
 
 T = TypeVar("T", bound=StellarObjectIdentificatorDto)
 
 
-class CatalogPlugin(Generic[T], ABC):
+class BaseCatalogPlugin(Generic[T], ABC):
     """
-    Base class for all catalog plugins.
+    Base class of the sync and async catalog plugins with the helpers shared by both.
     """
 
     def __init__(
@@ -31,45 +43,92 @@ class CatalogPlugin(Generic[T], ABC):
     def batch_limit(self):
         return self.__batch_limit
 
-    @abstractmethod
-    def list_objects(
-        self,
-        coords: SkyCoord,
-        radius_arcsec: float,
-        plugin_id: UUID,
-        resources_dir: Path,
-    ) -> Iterator[List[T]]:
+    def _get_http_client(self, url: str, timeout: float | None = None) -> httpx.Client:
         """
-        Generator method that yields found stellar objects. Returns plugins corresponding stellar object identificators
-        found in the radius around the given coordinates. If the catalog is locally stored, it is stored in the resources directory.
-        :param coords: the coordinates which to search for objects around
-        :param radius_arcsec: search radius around the given coordinates in arcseconds
-        :param plugin_id: the plugin id of the used plugin database entity. Used to identify the plugin in the database.
-        :param resources_dir: resource directory of the plugin
-        :return: list of stellar object identificators.
+        Returns the HTTP client for the catalog host, shared by all plugin instances and tasks of the worker process.
+        The connections to the host are kept alive between the tasks and limited per host.
+        Please use it instead of creating own clients, and do not close it.
+
+        :param url: any URL of the catalog host.
+        :param timeout: timeout of the requests in seconds, the default of the application if None.
+        :return: the pooled HTTP client of the host.
         """
-        pass
+        return http_clients.client(url, timeout)
 
-    @abstractmethod
-    def get_photometric_data(
-        self, identificator: T, csv_path: Path, resources_dir: Path
-    ) -> Iterator[list[PhotometricDataDto]]:
+    def _raw_data_cache(self) -> RawDataCache | None:
         """
-        Generator method that yields photometric data for a given stellar object. Writes the original fetched data to the provided csv file.
+        Returns the cache of the raw responses of the catalog, set by the task for the plugin.
+        Please prefer _cached_download, unless the raw data are not downloaded by a single call.
 
-        The data has to be converted into a unified format in this method. Please see PhotometricDataDto for format details. For timestamp unification, please use the _to_bjd_tdb helper method.
+        :return: the raw data cache, None if the caching is disabled or the plugin is not run by a task.
+        """
+        return current_raw_data_cache()
 
-        If the remote source returns large amounts of data, please split the data into chunks and yield each chunk. This is because the data is saved to the database,
-        so that we avoid inserting too much at once. The recommended chunk size is defined in batch_limit.
+    def _cached_download(
+        self, identificator: T, csv_path: Path, download: Callable[[Path], None]
+    ) -> bool:
+        """
+        Writes the raw data of the stellar object to the CSV file. If the raw data were downloaded within the TTL
+        of the plugin, they are taken from the raw data cache, otherwise they are downloaded by the given function
+        and cached. Please use it in get_photometric_data to download the raw response of the catalog before it is
+        converted, so a popular stellar object is fetched from the catalog at most once per TTL.
 
-        If the catalog is locally stored, it is stored in the resources directory.
+        The CSV file may share the data with the cache, so it must not be modified after it is written.
+
+        :param identificator: the stellar object of the raw data
+        :param csv_path: path to store the raw data
+        :param download: function downloading the raw data to the given path
+        :return: whether the raw data were taken from the cache.
+        """
+        cache = self._raw_data_cache()
+        if cache is not None and cache.load(identificator, csv_path):
+            return True
+
+        download(csv_path)
+        if cache is not None:
+            cache.store(identificator, csv_path)
+        return False
+
+    def poll_photometric_data(
+        self, identificator: T, job: PhotometricDataJobDto | None
+    ) -> PhotometricDataJobDto | None:
+        """
+        Submits or polls a job, which prepares the photometric data on the catalog server. Catalogs, which queue
+        the requests for the data (e.g. forced photometry), should implement this method instead of waiting
+        for the job in get_photometric_data, as the waiting would occupy the worker.
+
+        The photometric data task calls the method with the job returned by the previous call (None at first).
+        While the returned job is not ready, the job is stored on the task and the task is re-scheduled
+        after the countdown of the job. When the job is ready, it is passed to get_photometric_data
+        as the job keyword argument, so a plugin implementing this method must accept it.
+
+        The method should not block for longer than a single request. By default, there is no job to wait for.
 
-        :param resources_dir: resource directory of the plugin
-        :param csv_path: path to store the original data
         :param identificator: the stellar object to get photometric data for
-        :return: list of photometric data for the given stellar object.
+        :param job: the job returned by the previous call, None if the job was not submitted yet
+        :return: the submitted or polled job, None if the data can be retrieved directly.
         """
-        pass
+        return None
+
+    def poll_photometric_data_batch(
+        self, identificators: list[T], jobs: list[PhotometricDataJobDto | None]
+    ) -> list[PhotometricDataJobDto | None]:
+        """
+        Submits or polls the jobs of multiple stellar objects, see poll_photometric_data. The batch task calls
+        the method with the jobs returned by the previous call and re-schedules itself, until all jobs are ready.
+        Then the ready jobs are passed to get_photometric_data_batch as the jobs keyword argument.
+        Catalogs, which queue the jobs of many targets by one request, should override this method.
+
+        By default, poll_photometric_data is called for each identificator in turn.
+
+        :param identificators: the stellar objects to get photometric data for
+        :param jobs: the jobs returned by the previous call, one per identificator, None if not submitted yet
+        :return: the submitted or polled jobs, one per identificator.
+        """
+        return [
+            self.poll_photometric_data(identificator, job)
+            for identificator, job in zip(identificators, jobs, strict=True)
+        ]
 
     def _to_bjd_tdb(
         self,
@@ -106,26 +165,69 @@ class CatalogPlugin(Generic[T], ABC):
         time = Time(time_value, format=time_format, scale=time_scale)
         target = SkyCoord(ra_deg, dec_deg, unit="deg")
 
+        return float(self._bjd_tdb_jd(time, target, reference_frame))
+
+    def _to_bjd_tdb_batch(
+        self,
+        time_values: npt.ArrayLike,
+        time_format: str,
+        time_scale: str,
+        reference_frame: Literal["geocentric", "heliocentric", "barycentric"],
+        ra_deg: float,
+        dec_deg: float,
+    ) -> npt.NDArray[np.float64]:
+        """
+        Vectorized counterpart of _to_bjd_tdb. Converts all time values of a single target to BJD_TDB timestamps
+        in one astropy call, which is considerably faster than converting the values one by one.
+
+        The results are identical to calling _to_bjd_tdb for each of the values.
+
+        :param time_values: The time values to convert (e.g. a list or a numpy array).
+        :param time_format: The format of the time values.
+        :param time_scale: The time standard of the time values.
+        :param reference_frame: The location reference frame of the time values.
+        :param ra_deg: Right ascension of the target in degrees.
+        :param dec_deg: Declination of the target in degrees.
+        :return: Numpy array of timestamps in BJD_TDB format, in the same order as the given time values.
+        """
+        values = np.asarray(time_values, dtype=np.float64)
+        if values.size == 0:
+            return np.empty(0, dtype=np.float64)
+
+        time = Time(values, format=time_format, scale=time_scale)
+        target = SkyCoord(ra_deg, dec_deg, unit="deg")
+
+        return np.asarray(
+            self._bjd_tdb_jd(time, target, reference_frame), dtype=np.float64
+        )
+
+    def _bjd_tdb_jd(
+        self,
+        time: Time,
+        target: SkyCoord,
+        reference_frame: Literal["geocentric", "heliocentric", "barycentric"],
+    ) -> npt.NDArray[np.float64] | float:
+        """
+        Shared implementation of _to_bjd_tdb and _to_bjd_tdb_batch. Works with both scalar and array Time objects.
+
+        :param time: The time (or times) to convert.
+        :param target: Coordinates of the target.
+        :param reference_frame: The location reference frame of the time.
+        :return: Julian date(s) in BJD_TDB.
+        """
         if reference_frame == "barycentric":
             # already in barycentric frame; just return it.
             return time.tdb.jd
 
-        if reference_frame == "heliocentric":
-            ltt_helio = time.light_travel_time(
-                target, kind="heliocentric", location=self._geocenter
-            )
-            ltt_bary = time.light_travel_time(
-                target, kind="barycentric", location=self._geocenter
-            )
-            corrected_time = time - ltt_helio + ltt_bary
-
-            return corrected_time.tdb.jd
-
-        if reference_frame == "geocentric":
-            ltt_bary = time.light_travel_time(
-                target, kind="barycentric", location=self._geocenter
-            )
-            corrected_time = time + ltt_bary
+        if reference_frame in ("heliocentric", "geocentric"):
+            cache = get_light_travel_time_cache()
+            if cache is not None:
+                correction = cache.corrections(time, target, reference_frame)
+            else:
+                correction = light_travel_time_correction(
+                    time, target, reference_frame, self._geocenter
+                )
+            corrected_time = time + correction * units.s
 
             return corrected_time.tdb.jd
 
@@ -134,9 +236,98 @@ class CatalogPlugin(Generic[T], ABC):
         )
 
 
+class CatalogPlugin(BaseCatalogPlugin[T]):
+    """
+    Base class for all catalog plugins.
+    """
+
+    @abstractmethod
+    def list_objects(
+        self,
+        coords: SkyCoord,
+        radius_arcsec: float,
+        plugin_id: UUID,
+        resources_dir: Path,
+    ) -> Iterator[List[T]]:
+        """
+        Generator method that yields found stellar objects. Returns plugins corresponding stellar object identificators
+        found in the radius around the given coordinates. If the catalog is locally stored, it is stored in the resources directory.
+        :param coords: the coordinates which to search for objects around
+        :param radius_arcsec: search radius around the given coordinates in arcseconds
+        :param plugin_id: the plugin id of the used plugin database entity. Used to identify the plugin in the database.
+        :param resources_dir: resource directory of the plugin
+        :return: list of stellar object identificators.
+        """
+        pass
+
+    @abstractmethod
+    def get_photometric_data(
+        self, identificator: T, csv_path: Path, resources_dir: Path
+    ) -> Iterator[PhotometricBatch | list[PhotometricDataDto]]:
+        """
+        Generator method that yields photometric data for a given stellar object. Writes the original fetched data to the provided csv file.
+
+        The data has to be converted into a unified format in this method. Please see PhotometricDataDto for format details. For timestamp unification, please use the _to_bjd_tdb_batch helper method
+        (or _to_bjd_tdb for single values).
+
+        Each chunk is preferably a PhotometricBatch, which stores the data in columns and avoids creating an object per measurement.
+        Lists of PhotometricDataDto are still supported.
+
+        If the remote source returns large amounts of data, please split the data into chunks and yield each chunk. This is because the data is saved to the database,
+        so that we avoid inserting too much at once. The recommended chunk size is defined in batch_limit.
+
+        If the catalog is locally stored, it is stored in the resources directory.
+
+        :param resources_dir: resource directory of the plugin
+        :param csv_path: path to store the original data
+        :param identificator: the stellar object to get photometric data for
+        :return: photometric data for the given stellar object.
+        """
+        pass
+
+    def get_photometric_data_batch(
+        self,
+        identificators: list[T],
+        csv_paths: list[Path],
+        resources_dir: Path,
+        jobs: list[PhotometricDataJobDto | None] | None = None,
+    ) -> Iterator[tuple[int, PhotometricBatch | list[PhotometricDataDto]]]:
+        """
+        Generator method that yields photometric data for multiple stellar objects. Catalogs, which serve many targets
+        in one request (e.g. by a list of IDs or a TAP query), should override this method, so the data of the objects
+        selected together are retrieved by as few requests as possible.
+
+        Each chunk is yielded together with the index of its identificator, the chunks of different identificators
+        may be interleaved. The original data of each identificator are written to the CSV file of the same index.
+        The chunks have the same format as the ones of get_photometric_data.
+
+        By default, get_photometric_data is called for each identificator in turn.
+
+        :param identificators: the stellar objects to get photometric data for
+        :param csv_paths: paths to store the original data, one per identificator
+        :param resources_dir: resource directory of the plugin
+        :param jobs: the ready jobs of poll_photometric_data_batch, passed only if the plugin prepares the data by jobs
+        :return: pairs of the index of the identificator and the photometric data of the stellar object.
+        """
+        for index, (identificator, csv_path) in enumerate(
+            zip(identificators, csv_paths, strict=True)
+        ):
+            job = None if jobs is None else jobs[index]
+            job_kwargs = {} if job is None else {"job": job}
+            for data in self.get_photometric_data(
+                identificator, csv_path, resources_dir, **job_kwargs
+            ):
+                yield index, data
+
+
 class DefaultCatalogPlugin(CatalogPlugin[T]):
     def __init__(
-        self, name: str, description: str, url: str, directly_identifies_objects: bool
+        self,
+        name: str,
+        description: str,
+        url: str,
+        directly_identifies_objects: bool,
+        slow: bool = False,
     ) -> None:
         """
         Create new default catalog plugin.
@@ -145,6 +336,8 @@ class DefaultCatalogPlugin(CatalogPlugin[T]):
         :param url: catalog website url
         :param directly_identifies_objects: whether the catalog directly identifies objects or not.
         That is, is each photometry record linked to an object with ID, or does the catalog just provide a list of measurements for given position?
+        :param slow: whether the tasks of the catalog take minutes (e.g. the catalog queues the requests),
+        so the plugin is registered to the queue of slow catalogs.
         """
         super().__init__()
         self.__batch_limit = 20000
@@ -155,6 +348,7 @@ class DefaultCatalogPlugin(CatalogPlugin[T]):
         self._description = description
         self._catalog_url = url
         self._catalog_name = name
+        self._slow = slow
 
     def batch_limit(self):
         return self.__batch_limit
@@ -174,3 +368,7 @@ class DefaultCatalogPlugin(CatalogPlugin[T]):
     @property
     def catalog_url(self) -> str:
         return self._catalog_url
+
+    @property
+    def slow(self) -> bool:
+        return self._slow
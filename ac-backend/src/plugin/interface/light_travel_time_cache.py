@@ -0,0 +1,270 @@
+import hashlib
+import os
+import tempfile
+import time as clock
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Literal
+
+import numpy as np
+import numpy.typing as npt
+from astropy import units
+from astropy.coordinates import SkyCoord, EarthLocation
+from astropy.time import Time
+
+from src.core.config.config import settings
+
+CorrectionKind = Literal["geocentric", "heliocentric"]
+
+
+def light_travel_time_correction(
+    time: Time, target: SkyCoord, kind: CorrectionKind, location: EarthLocation
+) -> npt.NDArray[np.float64]:
+    """
+    Evaluates the ephemeris and returns the correction (in seconds) which has to be added to the given times
+    in given reference frame to move them to the solar system barycentre.
+
+    :param time: The times to compute the correction for.
+    :param target: Coordinates of the target.
+    :param kind: The reference frame of the times.
+    :param location: The observer location (geocenter for all catalogs).
+    :return: Corrections in seconds, in the same shape as the given time.
+    """
+    ltt_bary = time.light_travel_time(target, kind="barycentric", location=location)
+
+    if kind == "heliocentric":
+        ltt_helio = time.light_travel_time(
+            target, kind="heliocentric", location=location
+        )
+        return (ltt_bary - ltt_helio).to_value(units.s)
+
+    return ltt_bary.to_value(units.s)
+
+
+class LightTravelTimeCache:
+    """
+    Cache of light travel time corrections. For each target and reference frame, the corrections are
+    evaluated on a coarse uniform grid of TT julian dates and interpolated by a cubic polynomial in between.
+    TT is used for the grid, as UTC leap seconds would break the smoothness of the corrections.
+    The grid is split into blocks of BLOCK_NODES nodes, each block is stored in a separate .npy file and
+    read back as a memory-mapped array, so that the worker processes share both the files and their pages.
+
+    The blocks of all targets share a disk budget. The blocks opened least recently by any process are removed
+    by evict, the processes, which still map them, keep their pages.
+    """
+
+    BLOCK_NODES = 256
+
+    # Upper bounds of the fourth time derivative of the corrections in s / day^4, used to pick the grid step.
+    # Geocentric corrections are dominated by the Earth's orbit (~500 s, 1 year) and the lunar wobble
+    # of the Earth (~0.016 s, 27.3 days). Heliocentric corrections only depend on the barycentric position of
+    # the Sun, which is dominated by the planets with periods of several months to years.
+    _FOURTH_DERIVATIVE_BOUND: dict[str, float] = {
+        "geocentric": 1e-4,
+        "heliocentric": 1e-9,
+    }
+    # max |(t + 1) t (t - 1) (t - 2)| / 4! for t in [0, 1], error constant of the cubic interpolation
+    _INTERPOLATION_ERROR_CONSTANT = 9 / 16 / 24
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        accuracy: float,
+        max_open_blocks: int = 1024,
+        max_bytes: int | None = None,
+    ) -> None:
+        """
+        Create new light travel time cache.
+        :param cache_dir: directory to store the correction tables in
+        :param accuracy: maximum interpolation error of the corrections in seconds
+        :param max_open_blocks: maximum number of memory-mapped tables kept open by the process
+        :param max_bytes: disk budget of the correction tables enforced by evict, None for no limit
+        """
+        if accuracy <= 0:
+            raise ValueError("Accuracy of the light travel time cache must be positive")
+
+        self.cache_dir = cache_dir
+        self.accuracy = accuracy
+        self.__max_open_blocks = max_open_blocks
+        self.__max_bytes = max_bytes
+        self.__blocks: OrderedDict[Path, np.ndarray] = OrderedDict()
+        self.__lock = Lock()
+        self.__location = EarthLocation.from_geocentric(
+            0 * units.m, 0 * units.m, 0 * units.m
+        )
+
+    def step(self, kind: CorrectionKind) -> float:
+        """
+        Grid step in days for given reference frame. The step is the largest power of two,
+        for which the interpolation error stays within the configured accuracy.
+
+        :param kind: The reference frame of the corrections.
+        :return: Grid step in days.
+        """
+        bound = self._INTERPOLATION_ERROR_CONSTANT * self._FOURTH_DERIVATIVE_BOUND[kind]
+        max_step = (self.accuracy / bound) ** 0.25
+
+        return float(2.0 ** np.floor(np.log2(max_step)))
+
+    def corrections(
+        self, time: Time, target: SkyCoord, kind: CorrectionKind
+    ) -> npt.NDArray[np.float64]:
+        """
+        Returns the interpolated corrections (in seconds) for the given times. Missing grid blocks are
+        evaluated and persisted first.
+
+        :param time: The times to compute the correction for.
+        :param target: Coordinates of the target.
+        :param kind: The reference frame of the times.
+        :return: Corrections in seconds, in the same shape as the given time.
+        """
+        step = self.step(kind)
+        position = np.atleast_1d(np.asarray(time.tt.jd, dtype=np.float64)) / step
+        nodes = np.floor(position).astype(np.int64)
+        fraction = position - nodes
+        blocks = nodes // self.BLOCK_NODES
+
+        key_dir = self.cache_dir / self.__key(target, kind, step)
+        neighbours = np.empty((4, nodes.size))
+        offsets = np.arange(-1, 3)[:, np.newaxis]
+
+        for block in np.unique(blocks):
+            table = self.__get_block(key_dir, int(block), target, kind)
+            in_block = blocks == block
+            # the first table value belongs to the node preceding the block
+            indices = nodes[in_block] - block * self.BLOCK_NODES + 1
+            neighbours[:, in_block] = table[indices + offsets]
+
+        # cubic Lagrange interpolation from nodes i - 1, i, i + 1 and i + 2
+        weights = np.stack(
+            [
+                -fraction * (fraction - 1) * (fraction - 2) / 6,
+                (fraction + 1) * (fraction - 1) * (fraction - 2) / 2,
+                -(fraction + 1) * fraction * (fraction - 2) / 2,
+                (fraction + 1) * fraction * (fraction - 1) / 6,
+            ]
+        )
+
+        return np.sum(weights * neighbours, axis=0).reshape(time.shape)
+
+    def __key(self, target: SkyCoord, kind: CorrectionKind, step: float) -> str:
+        key = f"{kind}:{target.ra.deg!r}:{target.dec.deg!r}:{step!r}"
+        return hashlib.sha1(key.encode()).hexdigest()
+
+    def __get_block(
+        self,
+        key_dir: Path,
+        block: int,
+        target: SkyCoord,
+        kind: CorrectionKind,
+    ) -> np.ndarray:
+        path = key_dir / f"{block}.npy"
+
+        with self.__lock:
+            if path in self.__blocks:
+                self.__blocks.move_to_end(path)
+                return self.__blocks[path]
+
+        try:
+            table = self.__open_block(path)
+        except FileNotFoundError:
+            # not evaluated yet, or evicted meanwhile
+            self.__write_block(path, block, target, kind)
+            table = self.__open_block(path)
+
+        with self.__lock:
+            self.__blocks[path] = table
+            if len(self.__blocks) > self.__max_open_blocks:
+                self.__blocks.popitem(last=False)
+
+        return table
+
+    @staticmethod
+    def __open_block(path: Path) -> np.ndarray:
+        table = np.load(path, mmap_mode="r")
+        # marks the block as recently used for the eviction, the process keeps it open afterwards
+        os.utime(path, (clock.time(), os.stat(path).st_mtime))
+        return table
+
+    def evict(self) -> int:
+        """
+        Removes the least recently opened correction tables of all targets, until they fit into the disk budget.
+
+        :return: number of the removed tables.
+        """
+        if self.__max_bytes is None:
+            return 0
+
+        blocks = []
+        for path in self.cache_dir.glob("*/*.npy"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            blocks.append((stat.st_atime, stat.st_size, path))
+
+        total_bytes = sum(size for _, size, _ in blocks)
+        evicted = 0
+        for _, size, path in sorted(blocks):
+            if total_bytes <= self.__max_bytes:
+                break
+            try:
+                path.unlink()
+                evicted += 1
+            except FileNotFoundError:
+                # evicted by other process meanwhile
+                pass
+            total_bytes -= size
+
+        with self.__lock:
+            for path in [path for path in self.__blocks if not path.exists()]:
+                del self.__blocks[path]
+        return evicted
+
+    def __write_block(
+        self,
+        path: Path,
+        block: int,
+        target: SkyCoord,
+        kind: CorrectionKind,
+    ) -> None:
+        # one extra node before and two after the block, so that every node in the block can be interpolated
+        first_node = block * self.BLOCK_NODES - 1
+        grid = np.arange(first_node, first_node + self.BLOCK_NODES + 3) * self.step(
+            kind
+        )
+        table = light_travel_time_correction(
+            Time(grid, format="jd", scale="tt"), target, kind, self.__location
+        )
+
+        # write to a temporary file and rename it, so that other processes never read a partial table
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, suffix=".tmp", delete=False
+        ) as tmp_file:
+            np.save(tmp_file, table.astype(np.float64))
+        os.replace(tmp_file.name, path)
+
+
+_caches: dict[tuple[Path, float], LightTravelTimeCache] = {}
+
+
+def get_light_travel_time_cache() -> LightTravelTimeCache | None:
+    """
+    Returns the light travel time cache of the current process.
+
+    :return: the cache, or None if the cache is disabled.
+    """
+    accuracy = settings.LIGHT_TRAVEL_TIME_CACHE_ACCURACY
+    if accuracy <= 0:
+        return None
+
+    cache_dir = settings.RESOURCES_DIR / "light_travel_time_cache"
+    key = (cache_dir, accuracy)
+    if key not in _caches:
+        _caches[key] = LightTravelTimeCache(
+            cache_dir, accuracy, max_bytes=settings.LIGHT_TRAVEL_TIME_CACHE_MAX_BYTES
+        )
+
+    return _caches[key]
@@ -0,0 +1,204 @@
+from uuid import UUID
+
+import numpy as np
+import numpy.typing as npt
+
+from src.plugin.interface.schemas import PhotometricDataDto
+
+
+class PhotometricBatch:
+    """
+    Columnar batch of photometric measurements of a single stellar object, in unified format.
+    It is the array-backed counterpart of a list of PhotometricDataDto: instead of one object per measurement,
+    the values are stored in numpy columns. Light filters are dictionary-encoded, i.e. light_filter_codes
+    contains indices into the light_filters list, or -1 if the measurement has no light filter.
+
+    :ivar plugin_id: ID of the plugin that created the batch.
+    :ivar julian_date: Julian dates of the observations, in BJD_TDB.
+    :ivar magnitude: Magnitudes of the observed object.
+    :ivar magnitude_error: Uncertainties associated with the magnitudes.
+    :ivar light_filter_codes: Indices of the light filters in light_filters, -1 for measurements without a filter.
+    :ivar light_filters: Distinct light filters used in the batch.
+    """
+
+    def __init__(
+        self,
+        plugin_id: UUID,
+        julian_date: npt.ArrayLike,
+        magnitude: npt.ArrayLike,
+        magnitude_error: npt.ArrayLike,
+        light_filter_codes: npt.ArrayLike,
+        light_filters: list[str],
+    ) -> None:
+        self.plugin_id = plugin_id
+        self.julian_date = np.asarray(julian_date, dtype=np.float64)
+        self.magnitude = np.asarray(magnitude, dtype=np.float64)
+        self.magnitude_error = np.asarray(magnitude_error, dtype=np.float64)
+        self.light_filter_codes = np.asarray(light_filter_codes, dtype=np.int32)
+        self.light_filters = light_filters
+
+        length = len(self.julian_date)
+        if any(
+            column.ndim != 1 or len(column) != length
+            for column in (
+                self.julian_date,
+                self.magnitude,
+                self.magnitude_error,
+                self.light_filter_codes,
+            )
+        ):
+            raise ValueError(
+                "All columns of a photometric batch must have equal length"
+            )
+
+        if length > 0 and (
+            self.light_filter_codes.min() < -1
+            or self.light_filter_codes.max() >= len(light_filters)
+        ):
+            raise ValueError("Light filter codes must index the light filters")
+
+    @classmethod
+    def from_columns(
+        cls,
+        plugin_id: UUID,
+        julian_date: npt.ArrayLike,
+        magnitude: npt.ArrayLike,
+        magnitude_error: npt.ArrayLike,
+        light_filter: str | None | npt.ArrayLike,
+    ) -> "PhotometricBatch":
+        """
+        Create a batch from plain columns, encoding the light filters.
+
+        :param plugin_id: ID of the plugin that created the batch.
+        :param julian_date: Julian dates of the observations, in BJD_TDB.
+        :param magnitude: Magnitudes of the observed object.
+        :param magnitude_error: Uncertainties associated with the magnitudes.
+        :param light_filter: Either a single light filter shared by all measurements, or a column of light filters.
+        :return: the photometric batch.
+        """
+        length = len(np.asarray(julian_date))
+
+        if light_filter is None:
+            return cls(
+                plugin_id,
+                julian_date,
+                magnitude,
+                magnitude_error,
+                np.full(length, -1),
+                [],
+            )
+
+        if isinstance(light_filter, str):
+            return cls(
+                plugin_id,
+                julian_date,
+                magnitude,
+                magnitude_error,
+                np.zeros(length),
+                [light_filter],
+            )
+
+        filters = np.asarray(light_filter, dtype=object)
+        # None or NaN (missing value in pandas)
+        missing = np.fromiter(
+            (
+                f is None or (isinstance(f, (float, np.floating)) and np.isnan(f))
+                for f in filters
+            ),
+            dtype=bool,
+            count=len(filters),
+        )
+        light_filters, inverse = np.unique(
+            filters[~missing].astype(str), return_inverse=True
+        )
+        codes = np.full(len(filters), -1)
+        codes[~missing] = inverse
+
+        return cls(
+            plugin_id,
+            julian_date,
+            magnitude,
+            magnitude_error,
+            codes,
+            light_filters.tolist(),
+        )
+
+    @classmethod
+    def from_dtos(cls, data: list[PhotometricDataDto]) -> "PhotometricBatch":
+        """
+        Create a batch from a list of photometric data records. Used to adapt plugins yielding lists.
+
+        :param data: the photometric data records. All records must be created by the same plugin.
+        :return: the photometric batch.
+        """
+        plugin_ids = {dto.plugin_id for dto in data}
+        if len(plugin_ids) > 1:
+            raise ValueError("Photometric data records of multiple plugins")
+
+        encoding: dict[str, int] = {}
+        codes = [
+            -1
+            if dto.light_filter is None
+            else encoding.setdefault(dto.light_filter, len(encoding))
+            for dto in data
+        ]
+
+        return cls(
+            plugin_ids.pop() if plugin_ids else UUID(int=0),
+            [dto.julian_date for dto in data],
+            [dto.magnitude for dto in data],
+            [dto.magnitude_error for dto in data],
+            codes,
+            list(encoding),
+        )
+
+    def __len__(self) -> int:
+        return len(self.julian_date)
+
+    def light_filter(self) -> npt.NDArray[np.object_]:
+        """
+        Decodes the light filter column.
+
+        :return: light filter of each measurement, None for measurements without a filter.
+        """
+        dictionary = np.array([*self.light_filters, None], dtype=object)
+
+        # code -1 selects the trailing None
+        return dictionary[self.light_filter_codes]
+
+    def to_dtos(self) -> list[PhotometricDataDto]:
+        """
+        Converts the batch to a list of photometric data records.
+
+        :return: list of photometric data records.
+        """
+        return [
+            PhotometricDataDto(
+                plugin_id=self.plugin_id,
+                julian_date=julian_date,
+                magnitude=magnitude,
+                magnitude_error=magnitude_error,
+                light_filter=light_filter,
+            )
+            for julian_date, magnitude, magnitude_error, light_filter in zip(
+                self.julian_date.tolist(),
+                self.magnitude.tolist(),
+                self.magnitude_error.tolist(),
+                self.light_filter(),
+            )
+        ]
+
+
+def as_photometric_batch(
+    data: PhotometricBatch | list[PhotometricDataDto],
+) -> PhotometricBatch:
+    """
+    Adapter for plugins yielding lists of PhotometricDataDto instead of photometric batches.
+
+    :param data: a chunk yielded by CatalogPlugin.get_photometric_data.
+    :return: the chunk as a photometric batch.
+    """
+    if isinstance(data, PhotometricBatch):
+        return data
+
+    return PhotometricBatch.from_dtos(data)
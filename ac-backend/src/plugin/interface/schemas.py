@@ -1,3 +1,6 @@
+import hashlib
+import json
+from typing import Any
 from uuid import UUID
 
 from pydantic import ConfigDict, field_serializer
@@ -30,6 +33,18 @@ class StellarObjectIdentificatorDto(BaseDto):
     def serialize_id(self, plugin_id: UUID, _info):
         return str(plugin_id)
 
+    def content_hash(self) -> str:
+        """
+        Returns the canonical hash of the identified stellar object. The hash does not depend on the order
+        of the attributes, on the plugin ID, nor on the distance, which depends on the search, by which the object
+        was found. Hence, the identificators of the same object of a plugin have the same hash.
+
+        :return: hex digest of the SHA-256 hash.
+        """
+        content = self.model_dump(mode="json", exclude={"plugin_id", "dist_arcsec"})
+        canonical = json.dumps(content, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
 
 class PhotometricDataDto(BaseDto):
     """
@@ -47,3 +62,18 @@ class PhotometricDataDto(BaseDto):
     magnitude: float
     magnitude_error: float
     light_filter: str | None
+
+
+class PhotometricDataJobDto(BaseDto):
+    """
+    State of a job, which prepares the photometric data on the catalog server (e.g. a forced photometry job).
+    The job is persisted on the task between its runs, so the task does not wait for the server in a worker.
+
+    :ivar state: JSON serializable state of the job defined by the plugin, e.g. the URL of the job.
+    :ivar ready: Whether the photometric data are ready to be retrieved by get_photometric_data.
+    :ivar countdown: Seconds after which the job is polled again, if it is not ready.
+    """
+
+    state: dict[str, Any] = {}
+    ready: bool = False
+    countdown: float = 0.0
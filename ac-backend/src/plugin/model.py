@@ -23,3 +23,15 @@ class Plugin(DbEntity):
     directly_identifies_objects: Mapped[bool] = mapped_column(
         nullable=False, default=False
     )
+    # limits of the requests to the catalog shared by all workers, see RateLimiter; None means unlimited
+    rate_limit: Mapped[float | None] = mapped_column(nullable=True)
+    rate_limit_burst: Mapped[int | None] = mapped_column(nullable=True)
+    max_concurrency: Mapped[int | None] = mapped_column(nullable=True)
+    # Celery queue of the catalog tasks of the plugin, None means DEFAULT_CATALOG_TASK_QUEUE
+    task_queue: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    # seconds, for which the raw responses of the catalog are cached, see RawDataCache;
+    # None means RAW_DATA_CACHE_TTL, 0 disables the cache
+    raw_data_cache_ttl: Mapped[float | None] = mapped_column(nullable=True)
+    # seconds, for which the found stellar objects are cached, see ConeSearchCache;
+    # None means CONE_SEARCH_CACHE_TTL, 0 disables the cache
+    cone_search_cache_ttl: Mapped[float | None] = mapped_column(nullable=True)
@@ -11,6 +11,9 @@ from starlette.responses import Response, FileResponse
 from datetime import datetime
 
 from src.core.config.config import settings
+from src.core.rate_limit.schemas import RateLimitStatsDto
+from src.core.cone_search_cache.schemas import ConeSearchCacheStatsDto
+from src.core.raw_data_cache.schemas import RawDataCacheStatsDto
 from src.core.repository.repository import Filters
 from src.core.service.schemas import PaginationResponseDto
 from src.core.security.auth import required_roles
@@ -79,6 +82,36 @@ async def get_plugin(
     return plugin
 
 
+@router.get("/{plugin_id}/rate-limit-stats")
+async def get_rate_limit_stats(
+    _: Annotated[User, Depends(required_roles(UserRoleEnum.super_admin))],
+    plugin_id: UUID,
+    service: PluginServiceDep,
+) -> RateLimitStatsDto:
+    """Usage of the rate limits of the plugin, including the time the requests waited for them"""
+    return await service.get_rate_limit_stats(plugin_id)
+
+
+@router.get("/{plugin_id}/raw-data-cache-stats")
+async def get_raw_data_cache_stats(
+    _: Annotated[User, Depends(required_roles(UserRoleEnum.super_admin))],
+    plugin_id: UUID,
+    service: PluginServiceDep,
+) -> RawDataCacheStatsDto:
+    """Usage of the cache of the raw responses of the catalog of the plugin, including its hits and misses"""
+    return await service.get_raw_data_cache_stats(plugin_id)
+
+
+@router.get("/{plugin_id}/cone-search-cache-stats")
+async def get_cone_search_cache_stats(
+    _: Annotated[User, Depends(required_roles(UserRoleEnum.super_admin))],
+    plugin_id: UUID,
+    service: PluginServiceDep,
+) -> ConeSearchCacheStatsDto:
+    """Usage of the cache of the stellar objects found by the cone searches of the plugin, including its hits and misses"""
+    return await service.get_cone_search_cache_stats(plugin_id)
+
+
 @router.post("", response_model=PluginDto)
 async def create_plugin(
     _: Annotated[User, Depends(required_roles(UserRoleEnum.super_admin))],
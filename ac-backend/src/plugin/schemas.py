@@ -1,5 +1,9 @@
 import datetime
+from typing import Annotated
 
+from pydantic import AfterValidator, Field
+
+from src.core.config.config import settings
 from src.core.repository.schemas import BaseIdDto, BaseDto
 
 
@@ -11,6 +15,23 @@ class PluginDto(BaseIdDto):
     description: str
     catalog_url: str
     file_name: str | None
+    rate_limit: float | None
+    rate_limit_burst: int | None
+    max_concurrency: int | None
+    task_queue: str | None
+    raw_data_cache_ttl: float | None
+    cone_search_cache_ttl: float | None
+
+
+def _validate_task_queue(task_queue: str) -> str:
+    if task_queue not in settings.CATALOG_TASK_QUEUES:
+        raise ValueError(
+            f"Unknown task queue {task_queue}, valid values are: {', '.join(settings.CATALOG_TASK_QUEUES)}"
+        )
+    return task_queue
+
+
+TaskQueue = Annotated[str, AfterValidator(_validate_task_queue)]
 
 
 class CreatePluginDto(BaseDto):
@@ -19,6 +40,18 @@ class CreatePluginDto(BaseDto):
     directly_identifies_objects: bool
     catalog_url: str
     description: str
+    rate_limit: float | None = Field(default=None, gt=0)
+    """Maximum number of requests per second sent to the catalog by all workers."""
+    rate_limit_burst: int | None = Field(default=None, ge=1)
+    """Maximum number of requests sent at once after a period of inactivity."""
+    max_concurrency: int | None = Field(default=None, ge=1)
+    """Maximum number of tasks using the catalog concurrently."""
+    task_queue: TaskQueue | None = None
+    """Celery queue of the catalog tasks, the default catalog queue if None."""
+    raw_data_cache_ttl: float | None = Field(default=None, ge=0)
+    """Seconds, for which the raw responses of the catalog are cached, RAW_DATA_CACHE_TTL if None, 0 disables the cache."""
+    cone_search_cache_ttl: float | None = Field(default=None, ge=0)
+    """Seconds, for which the objects found by the cone searches are cached, CONE_SEARCH_CACHE_TTL if None, 0 disables the cache."""
 
 
 class UpdatePluginDto(BaseIdDto):
@@ -26,6 +59,12 @@ class UpdatePluginDto(BaseIdDto):
     directly_identifies_objects: bool | None = None
     description: str | None = None
     catalog_url: str | None = None
+    rate_limit: float | None = Field(default=None, gt=0)
+    rate_limit_burst: int | None = Field(default=None, ge=1)
+    max_concurrency: int | None = Field(default=None, ge=1)
+    task_queue: TaskQueue | None = None
+    raw_data_cache_ttl: float | None = Field(default=None, ge=0)
+    cone_search_cache_ttl: float | None = Field(default=None, ge=0)
 
 
 class UpdatePluginFileDto(BaseIdDto):
@@ -17,12 +17,26 @@ from typing import Annotated
 from fastapi import Depends, UploadFile
 import aiofiles
 from fastapi.concurrency import run_in_threadpool
+from redis.asyncio import Redis
 
 from src.plugin import default_plugins
 from src.core.config.config import settings
 from src.plugin.interface.catalog_plugin import DefaultCatalogPlugin
+from src.core.rate_limit.exceptions import RateLimitStatsUnavailableException
+from src.core.rate_limit.limiter import get_rate_limit_stats, plugin_limit_name
+from src.core.rate_limit.schemas import RateLimitStatsDto
+from src.core.cone_search_cache.cache import get_cone_search_cache_stats
+from src.core.cone_search_cache.exceptions import (
+    ConeSearchCacheStatsUnavailableException,
+)
+from src.core.cone_search_cache.schemas import ConeSearchCacheStatsDto
+from src.core.raw_data_cache.cache import get_raw_data_cache_stats
+from src.core.raw_data_cache.exceptions import RawDataCacheStatsUnavailableException
+from src.core.raw_data_cache.schemas import RawDataCacheStatsDto
 from src.core.repository.repository import Repository, get_repository, Filters
 from src.core.service.schemas import PaginationResponseDto
+from src.deps import get_redis_client
+from src.plugin.cache import publish_plugin_invalidation
 
 from src.plugin.model import Plugin
 from src.plugin.schemas import (
@@ -33,6 +47,16 @@ from src.plugin.schemas import (
 )
 
 PluginRepositoryDep = Annotated[Repository[Plugin], Depends(get_repository(Plugin))]
+RedisClientDep = Annotated[Redis | None, Depends(get_redis_client)]
+
+_NULLABLE_FIELDS = {
+    "rate_limit",
+    "rate_limit_burst",
+    "max_concurrency",
+    "task_queue",
+    "raw_data_cache_ttl",
+    "cone_search_cache_ttl",
+}
 
 logger = logging.getLogger(__name__)
 
@@ -44,10 +68,18 @@ class PluginService:
     This class provides functionalities for creating, updating, retrieving, deleting,
     and listing plugins. Additionally, it supports uploading plugin files, managing
     plugin resources directories, and registering default plugins.
+
+    If the Redis client is given, the workers are notified about the replaced and deleted plugins,
+    so they evict them from their plugin caches.
     """
 
-    def __init__(self, repository: PluginRepositoryDep):
+    def __init__(
+        self,
+        repository: PluginRepositoryDep,
+        redis_client: RedisClientDep = None,
+    ):
         self._repository = repository
+        self._redis_client = redis_client
 
     async def get_plugin(self, plugin_id: UUID) -> PluginDto:
         plugin = await self._repository.get(plugin_id)
@@ -68,6 +100,10 @@ class PluginService:
         await self.get_plugin(update_dto.id)
 
         update_data = update_dto.model_dump(exclude_none=True)
+        # the limits, the queue and the TTL are reset by explicit null values
+        update_data |= update_dto.model_dump(
+            include=_NULLABLE_FIELDS, exclude_unset=True
+        )
         plugin = await self._repository.update(update_dto.id, update_data)
         return PluginDto.model_validate(plugin)
 
@@ -92,6 +128,7 @@ class PluginService:
 
         update_data = UpdatePluginFileDto(id=plugin_entity.id, file_name=new_file_name)
         plugin = await self._repository.update(plugin_id, update_data.model_dump())
+        await self._invalidate_plugin(plugin_id)
         return PluginDto.model_validate(plugin)
 
     async def delete_plugin(self, plugin_id: UUID) -> None:
@@ -106,6 +143,54 @@ class PluginService:
         await run_in_threadpool(shutil.rmtree, settings.RESOURCES_DIR / str(plugin.id))
 
         await self._repository.delete(plugin_id)
+        await self._invalidate_plugin(plugin_id)
+
+    async def get_rate_limit_stats(self, plugin_id: UUID) -> RateLimitStatsDto:
+        """
+        Returns the usage of the rate limits of the plugin by all workers.
+
+        :param plugin_id: ID of the plugin.
+        :return: statistics of the rate limits.
+        :raises RateLimitStatsUnavailableException: if Redis is not available.
+        """
+        await self._repository.get(plugin_id)  # check if exists
+        if self._redis_client is None:
+            raise RateLimitStatsUnavailableException()
+        return await get_rate_limit_stats(
+            self._redis_client, plugin_limit_name(plugin_id)
+        )
+
+    async def get_raw_data_cache_stats(self, plugin_id: UUID) -> RawDataCacheStatsDto:
+        """
+        Returns the usage of the raw data cache of the plugin by all workers.
+
+        :param plugin_id: ID of the plugin.
+        :return: statistics of the raw data cache.
+        :raises RawDataCacheStatsUnavailableException: if Redis is not available.
+        """
+        await self._repository.get(plugin_id)  # check if exists
+        if self._redis_client is None:
+            raise RawDataCacheStatsUnavailableException()
+        return await get_raw_data_cache_stats(self._redis_client, plugin_id)
+
+    async def get_cone_search_cache_stats(
+        self, plugin_id: UUID
+    ) -> ConeSearchCacheStatsDto:
+        """
+        Returns the usage of the cone search cache of the plugin by all workers.
+
+        :param plugin_id: ID of the plugin.
+        :return: statistics of the cone search cache.
+        :raises ConeSearchCacheStatsUnavailableException: if Redis is not available.
+        """
+        await self._repository.get(plugin_id)  # check if exists
+        if self._redis_client is None:
+            raise ConeSearchCacheStatsUnavailableException()
+        return await get_cone_search_cache_stats(self._redis_client, plugin_id)
+
+    async def _invalidate_plugin(self, plugin_id: UUID) -> None:
+        if self._redis_client is not None:
+            await publish_plugin_invalidation(self._redis_client, plugin_id)
 
     async def list_plugins(
         self,
@@ -194,6 +279,9 @@ class PluginService:
                         directly_identifies_objects=plugin_instance.directly_identifies_objects,
                         description=plugin_instance.description,
                         catalog_url=plugin_instance.catalog_url,
+                        task_queue=settings.SLOW_CATALOG_TASK_QUEUE
+                        if plugin_instance.slow
+                        else None,
                     )
                 )
 
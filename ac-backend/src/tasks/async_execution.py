@@ -0,0 +1,210 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from pathlib import Path
+from typing import List, TypeVar
+from uuid import UUID
+
+from astropy.coordinates import SkyCoord
+
+from src.core.celery.event_loop import WorkerEventLoop
+from src.core.celery.worker import async_session_factory
+from src.core.config.config import settings
+from src.core.rate_limit.limiter import RateLimiter
+from src.core.raw_data_cache.cache import RawDataCache
+from src.plugin.interface.async_catalog_plugin import AsyncCatalogPlugin
+from src.plugin.interface.catalog_plugin import BaseCatalogPlugin, CatalogPlugin, T
+from src.plugin.interface.photometric_batch import (
+    PhotometricBatch,
+    as_photometric_batch,
+)
+from src.plugin.interface.schemas import (
+    PhotometricDataDto,
+    PhotometricDataJobDto,
+    StellarObjectIdentificatorDto,
+)
+from src.tasks.model import PhotometricData, StellarObjectIdentifier
+from src.tasks.service import AsyncTaskService
+
+X = TypeVar("X")
+
+# marks the end of an iterator, which cannot be signalled by StopIteration across threads
+_END = object()
+
+
+async def iterate_in_thread(factory: Callable[[], Iterable[X]]) -> AsyncIterator[X]:
+    """
+    Iterates a blocking iterable in the threads of the default executor of the running loop,
+    so the loop can run other coroutines meanwhile.
+
+    :param factory: creates the iterable, it is called in a thread as well.
+    :return: async iterator over the items.
+    """
+    iterator = await asyncio.to_thread(lambda: iter(factory()))
+    while (item := await asyncio.to_thread(next, iterator, _END)) is not _END:
+        yield item  # type: ignore[misc]
+
+
+def iterate_in_loop(
+    iterator: AsyncIterator[X], event_loop: WorkerEventLoop
+) -> Iterator[X]:
+    """
+    Iterates an async iterator from sync code by running each step on the worker event loop.
+
+    :param iterator: the async iterator.
+    :param event_loop: the loop which runs the iterator.
+    :return: sync iterator over the items.
+    """
+
+    async def step() -> X | object:
+        return await anext(iterator, _END)
+
+    while (item := event_loop.run(step())) is not _END:
+        yield item  # type: ignore[misc]
+
+
+def iterate(
+    results: Iterable[X] | AsyncIterator[X], event_loop: WorkerEventLoop
+) -> Iterable[X]:
+    """
+    Returns the results of a plugin method as a sync iterable, the results of async plugins
+    are iterated on the worker event loop.
+
+    :param results: results of a method of a sync or async plugin.
+    :param event_loop: the loop which runs the async plugins.
+    :return: sync iterable over the results.
+    """
+    if isinstance(results, AsyncIterator):
+        return iterate_in_loop(results, event_loop)
+    return results
+
+
+class ThreadedPluginAdapter(AsyncCatalogPlugin[T]):
+    """
+    Adapts a sync plugin to the AsyncCatalogPlugin interface. The blocking generators of the plugin are run
+    in threads, so a sync plugin can be used by the tasks of the asyncio execution mode.
+    """
+
+    def __init__(self, plugin: CatalogPlugin[T]) -> None:
+        super().__init__()
+        self._plugin = plugin
+
+    def list_objects(
+        self,
+        coords: SkyCoord,
+        radius_arcsec: float,
+        plugin_id: UUID,
+        resources_dir: Path,
+    ) -> AsyncIterator[List[T]]:
+        return iterate_in_thread(
+            lambda: self._plugin.list_objects(
+                coords, radius_arcsec, plugin_id, resources_dir
+            )
+        )
+
+    def get_photometric_data(
+        self,
+        identificator: T,
+        csv_path: Path,
+        resources_dir: Path,
+        job: PhotometricDataJobDto | None = None,
+    ) -> AsyncIterator[PhotometricBatch | list[PhotometricDataDto]]:
+        job_kwargs = {} if job is None else {"job": job}
+        return iterate_in_thread(
+            lambda: self._plugin.get_photometric_data(
+                identificator, csv_path, resources_dir, **job_kwargs
+            )
+        )
+
+    def get_photometric_data_batch(
+        self,
+        identificators: list[T],
+        csv_paths: list[Path],
+        resources_dir: Path,
+        jobs: list[PhotometricDataJobDto | None] | None = None,
+    ) -> AsyncIterator[tuple[int, PhotometricBatch | list[PhotometricDataDto]]]:
+        jobs_kwargs = {} if jobs is None else {"jobs": jobs}
+        return iterate_in_thread(
+            lambda: self._plugin.get_photometric_data_batch(
+                identificators, csv_paths, resources_dir, **jobs_kwargs
+            )
+        )
+
+
+def as_async_plugin(
+    plugin: BaseCatalogPlugin[T],
+) -> AsyncCatalogPlugin[T]:
+    if isinstance(plugin, AsyncCatalogPlugin):
+        return plugin
+    return ThreadedPluginAdapter(plugin)  # type: ignore[arg-type]
+
+
+async def cone_search_async(
+    plugin_id: UUID,
+    coords: SkyCoord,
+    radius_arcsec: float,
+    task_id: UUID,
+    collect: bool = False,
+) -> list[StellarObjectIdentificatorDto]:
+    """
+    Asyncio counterpart of the cone search of the catalog tasks. The found stellar objects are stored
+    by an async DB session.
+
+    :param plugin_id: Unique identifier for the plugin instance.
+    :param coords: Sky coordinates for the center of the cone search.
+    :param radius_arcsec: Radius of the cone search in arcseconds.
+    :param task_id: Unique identifier for the task associated with the cone search.
+    :param collect: whether to return the found stellar objects, so they can be cached.
+    :return: all found stellar objects if collected, otherwise an empty list.
+    """
+    found: list[StellarObjectIdentificatorDto] = []
+    async with async_session_factory() as session:
+        task_service = AsyncTaskService(session, StellarObjectIdentifier)
+        plugin = as_async_plugin(await task_service.get_plugin_instance(plugin_id))
+        rate_limiter = await task_service.get_rate_limiter(plugin_id)
+        resources_dir = settings.RESOURCES_DIR / str(plugin_id)
+
+        async with rate_limiter.async_slot():
+            async for data in plugin.list_objects(
+                coords, radius_arcsec, plugin_id, resources_dir
+            ):
+                await task_service.insert_identifiers(task_id, data)
+                if collect:
+                    found.extend(data)
+    return found
+
+
+async def fetch_photometric_data_async(
+    task_id: UUID,
+    plugin: BaseCatalogPlugin[StellarObjectIdentificatorDto],
+    rate_limiter: RateLimiter,
+    raw_data_cache: RawDataCache,
+    identificator: StellarObjectIdentificatorDto,
+    csv_path: Path,
+    job: PhotometricDataJobDto | None = None,
+) -> None:
+    """
+    Asyncio counterpart of the photometric data task. The batches are inserted by an async DB session
+    as they are yielded by the plugin; while a batch is inserted, the loop runs the other tasks.
+
+    :param task_id: The unique identifier of the task being processed.
+    :param plugin: the plugin of the identificator, loaded by the task.
+    :param rate_limiter: rate limiter of the catalog of the plugin.
+    :param raw_data_cache: cache of the raw responses of the catalog of the plugin.
+    :param identificator: The stellar object identificator corresponding to the plugin.
+    :param csv_path: The path of the CSV file to which the data are saved.
+    :param job: the ready job of the plugin, which prepared the data on the catalog server, if any.
+    """
+    async_plugin = as_async_plugin(plugin)
+    resources_dir = settings.RESOURCES_DIR / str(identificator.plugin_id)
+    job_kwargs = {} if job is None else {"job": job}
+
+    async with async_session_factory() as session, rate_limiter.async_slot():
+        task_service = AsyncTaskService(session, PhotometricData)
+        # the plugin methods run in threads copy the context of the coroutine
+        with raw_data_cache.scope():
+            async for data in async_plugin.get_photometric_data(
+                identificator, csv_path, resources_dir, **job_kwargs
+            ):
+                await task_service.insert_photometric_batch(
+                    task_id, as_photometric_batch(data)
+                )
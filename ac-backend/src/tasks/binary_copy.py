@@ -0,0 +1,81 @@
+import struct
+from uuid import UUID
+
+import numpy as np
+
+from src.plugin.interface.photometric_batch import PhotometricBatch
+
+# https://www.postgresql.org/docs/current/sql-copy.html#id-1.9.3.55.9.4
+COPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+"""Signature, flags field and header extension length of the binary COPY format."""
+COPY_TRAILER = struct.pack("!h", -1)
+
+PHOTOMETRIC_DATA_COLUMNS = (
+    "task_id",
+    "plugin_id",
+    "julian_date",
+    "magnitude",
+    "magnitude_error",
+    "light_filter",
+)
+
+
+def encode_photometric_batch(task_id: UUID, batch: PhotometricBatch) -> bytes:
+    """
+    Encodes the photometric batch into the binary COPY format, with columns in order of PHOTOMETRIC_DATA_COLUMNS.
+
+    Tuples of the binary format consist of fixed-size fields, except of the light filter. Therefore, the rows are
+    grouped by the light filter and each group is encoded at once as a numpy structured array.
+    The order of the rows is not preserved.
+
+    :param task_id: ID of the task the data belongs to.
+    :param batch: the photometric data to encode.
+    :return: COPY data, including the header and the trailer.
+    """
+    chunks = [COPY_HEADER]
+
+    for code in np.unique(batch.light_filter_codes):
+        rows = batch.light_filter_codes == code
+        # NULL is encoded as a field with length -1 and no data
+        light_filter = None if code < 0 else batch.light_filters[code].encode()
+
+        fields = [
+            ("field_count", ">i2"),
+            ("task_id_length", ">i4"),
+            ("task_id", "V16"),
+            ("plugin_id_length", ">i4"),
+            ("plugin_id", "V16"),
+            ("julian_date_length", ">i4"),
+            ("julian_date", ">f8"),
+            ("magnitude_length", ">i4"),
+            ("magnitude", ">f8"),
+            ("magnitude_error_length", ">i4"),
+            ("magnitude_error", ">f8"),
+            ("light_filter_length", ">i4"),
+        ]
+        if light_filter:
+            fields.append(("light_filter", f"V{len(light_filter)}"))
+
+        tuples = np.empty(np.count_nonzero(rows), dtype=np.dtype(fields))
+        tuples["field_count"] = len(PHOTOMETRIC_DATA_COLUMNS)
+        tuples["task_id_length"] = 16
+        tuples["task_id"] = np.void(task_id.bytes)
+        tuples["plugin_id_length"] = 16
+        tuples["plugin_id"] = np.void(batch.plugin_id.bytes)
+        tuples["julian_date_length"] = 8
+        tuples["julian_date"] = batch.julian_date[rows]
+        tuples["magnitude_length"] = 8
+        tuples["magnitude"] = batch.magnitude[rows]
+        tuples["magnitude_error_length"] = 8
+        tuples["magnitude_error"] = batch.magnitude_error[rows]
+        tuples["light_filter_length"] = (
+            -1 if light_filter is None else len(light_filter)
+        )
+        if light_filter:
+            tuples["light_filter"] = np.void(light_filter)
+
+        chunks.append(tuples.tobytes())
+
+    chunks.append(COPY_TRAILER)
+
+    return b"".join(chunks)
@@ -1,18 +1,25 @@
 import datetime
+from typing import Any
 from uuid import UUID
 
 import sqlalchemy
-from sqlalchemy import Double, func, DateTime, String, ForeignKey
+from sqlalchemy import Computed, Double, func, DateTime, String, ForeignKey, Index
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.database.database import DbEntity
-from src.tasks.types import TaskStatus, TaskType
+from src.tasks.types import PeriodSearchMethod, TaskStatus, TaskType
 
 
 class Task(DbEntity):
     __tablename__ = "ac_task"
+    __table_args__ = (
+        Index("ix_ac_task_parent_id", "parent_id"),
+        Index(
+            "ix_ac_task_plugin_id_identificator_hash", "plugin_id", "identificator_hash"
+        ),
+    )
 
     status: Mapped[TaskStatus] = mapped_column(default=TaskStatus.in_progress)
     created_at: Mapped[datetime.datetime] = mapped_column(
@@ -21,6 +28,23 @@ class Task(DbEntity):
     task_type: Mapped[TaskType] = mapped_column(
         SAEnum(TaskType, name="task_type"), nullable=False
     )
+    # number of the results (identifiers or photometric data), stored when the task completes
+    result_count: Mapped[int | None] = mapped_column(nullable=True)
+    # job preparing the photometric data on the catalog server, stored while the task waits for it,
+    # see PhotometricDataJobDto
+    job: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
+    # task of a multi-catalog search, which fanned out this task to a single catalog. The status of the parent
+    # aggregates the statuses of its children.
+    parent_id: Mapped[UUID | None] = mapped_column(
+        ForeignKey("ac_task.id", ondelete="CASCADE"), nullable=True
+    )
+    # plugin and content hash of the identificator of a photometric data task, see
+    # StellarObjectIdentificatorDto.content_hash, so the tasks of the same stellar object can share their data
+    plugin_id: Mapped[UUID | None] = mapped_column(sqlalchemy.Uuid, nullable=True)
+    identificator_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    # completed task, whose photometric data were copied instead of retrieving them from the catalog.
+    # It is not a foreign key, as the source task may expire earlier.
+    source_task_id: Mapped[UUID | None] = mapped_column(sqlalchemy.Uuid, nullable=True)
 
     # By default, all related objects are lazy-loaded
     # https://docs.sqlalchemy.org/en/20/orm/queryguide/relationships.html#lazy-loading
@@ -34,12 +58,21 @@ class Task(DbEntity):
     identifiers: Mapped[list["StellarObjectIdentifier"]] = relationship(
         cascade="all, delete-orphan", passive_deletes=True
     )
+    periodogram_peaks: Mapped[list["PeriodogramPeak"]] = relationship(
+        cascade="all, delete-orphan", passive_deletes=True
+    )
 
 
 class PhotometricData(DbEntity):
-    """."""
+    """Photometric measurement downloaded by a task. The table is range partitioned by created_at,
+    see src.tasks.partitions. The primary key is (id, created_at), as the partition key
+    has to be a part of it."""
 
     __tablename__ = "ac_photometric_data"
+    __table_args__ = (
+        Index("ix_ac_photometric_data_task_id_julian_date", "task_id", "julian_date"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     task_id: Mapped[UUID] = mapped_column(
         ForeignKey("ac_task.id", ondelete="CASCADE"), nullable=False
@@ -50,15 +83,58 @@ class PhotometricData(DbEntity):
     magnitude: Mapped[float] = mapped_column(Double, nullable=False)
     magnitude_error: Mapped[float] = mapped_column(Double, nullable=False)
     light_filter: Mapped[str] = mapped_column(String, nullable=True)
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime, primary_key=True, server_default=func.now()
+    )
 
 
 class StellarObjectIdentifier(DbEntity):
     """Represents stellar object identifiers returned by a catalogue.
-    The identifier format can vary, thus we are using JSONB type to store them."""
+    The identifier format can vary, thus we are using JSONB type to store them.
+    The table is partitioned the same way as PhotometricData."""
 
     __tablename__ = "ac_stellar_object_identifier"
+    __table_args__ = (
+        Index("ix_ac_stellar_object_identifier_task_id", "task_id"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     task_id: Mapped[UUID] = mapped_column(
         ForeignKey("ac_task.id", ondelete="CASCADE"), nullable=False
     )
     identifier = mapped_column(JSONB, nullable=False)
+    # distance from the searched position, generated from the identifier, so the results of multiple catalogs
+    # can be sorted by it
+    dist_arcsec: Mapped[float | None] = mapped_column(
+        Double, Computed("(identifier ->> 'dist_arcsec')::double precision")
+    )
+    # the partition key is a part of the primary key
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime, primary_key=True, server_default=func.now()
+    )
+
+
+class PeriodogramPeak(DbEntity):
+    """Peak of a periodogram computed by a period search task over the photometric data of other tasks.
+    The peaks are ranked from 1 (the highest power) per method and light filter."""
+
+    __tablename__ = "ac_periodogram_peak"
+    __table_args__ = (Index("ix_ac_periodogram_peak_task_id", "task_id"),)
+
+    task_id: Mapped[UUID] = mapped_column(
+        ForeignKey("ac_task.id", ondelete="CASCADE"), nullable=False
+    )
+    method: Mapped[PeriodSearchMethod] = mapped_column(
+        SAEnum(PeriodSearchMethod, name="period_search_method"), nullable=False
+    )
+    light_filter: Mapped[str | None] = mapped_column(String, nullable=True)
+    rank: Mapped[int] = mapped_column(nullable=False)
+
+    period: Mapped[float] = mapped_column(Double, nullable=False)  # in days
+    power: Mapped[float] = mapped_column(Double, nullable=False)
+    # Lomb-Scargle only
+    false_alarm_probability: Mapped[float | None] = mapped_column(Double, nullable=True)
+    # Box Least Squares only, the duration in days, the depth in magnitudes and the mid-transit julian date
+    duration: Mapped[float | None] = mapped_column(Double, nullable=True)
+    depth: Mapped[float | None] = mapped_column(Double, nullable=True)
+    transit_time: Mapped[float | None] = mapped_column(Double, nullable=True)
@@ -0,0 +1,131 @@
+import re
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.tasks.model import PhotometricData, StellarObjectIdentifier
+
+# Task results are range partitioned by the time of insertion (created_at), in windows of
+# settings.TASK_DATA_PARTITION_INTERVAL hours. Rows are always inserted after their task has been created,
+# so a window that ended before the cleanup cutoff contains only results of expired tasks, and the whole
+# partition can be dropped instead of deleting the rows one by one.
+# Rows outside any window partition (e.g. before the partitions are created) end up in the default
+# partition, which is cleaned up by the cascading delete of the expired tasks.
+
+PARTITIONED_TABLES = (
+    PhotometricData.__tablename__,
+    StellarObjectIdentifier.__tablename__,
+)
+
+_PARTITION_BOUND = re.compile(r"FROM \('([^']+)'\) TO \('([^']+)'\)")
+
+
+def partition_name(table: str, start: datetime) -> str:
+    """
+    Name of the partition of the table starting at the given time.
+
+    :param table: name of the partitioned table.
+    :param start: start of the partition window.
+    :return: name of the partition.
+    """
+    return f"{table}_p{start.strftime('%Y%m%d%H')}"
+
+
+def window_start(timestamp: datetime, interval_hours: int) -> datetime:
+    """
+    Start of the partition window containing the timestamp. Windows are aligned to midnight.
+
+    :param timestamp: any time within the window.
+    :param interval_hours: length of the window in hours.
+    :return: start of the window.
+    """
+    start = timestamp.replace(minute=0, second=0, microsecond=0)
+    return start - timedelta(hours=start.hour % interval_hours)
+
+
+def _list_partitions(
+    session: Session, table: str
+) -> list[tuple[str, datetime, datetime]]:
+    # name, start and end of the window partitions of the table, the default partition is skipped
+    result = session.execute(
+        text(
+            "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) "
+            "FROM pg_inherits "
+            "JOIN pg_class parent ON pg_inherits.inhparent = parent.oid "
+            "JOIN pg_class child ON pg_inherits.inhrelid = child.oid "
+            "WHERE parent.relname = :table"
+        ),
+        {"table": table},
+    )
+
+    partitions = []
+    for name, bound in result.tuples():
+        match = _PARTITION_BOUND.search(bound)
+        if match is not None:
+            partitions.append(
+                (
+                    name,
+                    datetime.fromisoformat(match.group(1)),
+                    datetime.fromisoformat(match.group(2)),
+                )
+            )
+    return sorted(partitions, key=lambda partition: partition[1])
+
+
+def create_partitions(
+    session: Session, now: datetime, until: datetime, interval_hours: int
+) -> list[str]:
+    """
+    Creates the missing partitions of the task result tables for windows starting after now, up to until.
+    The window containing now is not created, as the default partition may already contain its rows.
+
+    :param session: session used to execute the DDL, the caller commits.
+    :param now: current time.
+    :param until: the partitions cover at least the time up to until.
+    :param interval_hours: length of the partition windows in hours.
+    :return: names of the created partitions.
+    """
+    created = []
+
+    for table in PARTITIONED_TABLES:
+        existing = _list_partitions(session, table)
+        start = window_start(now, interval_hours) + timedelta(hours=interval_hours)
+
+        while start < until:
+            end = start + timedelta(hours=interval_hours)
+            # windows of a different length may remain after changing the interval
+            if not any(
+                start < existing_end and existing_start < end
+                for _, existing_start, existing_end in existing
+            ):
+                name = partition_name(table, start)
+                session.execute(
+                    text(
+                        f'CREATE TABLE "{name}" PARTITION OF "{table}" '
+                        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+                    )
+                )
+                created.append(name)
+            start = end
+
+    return created
+
+
+def drop_expired_partitions(session: Session, cutoff: datetime) -> list[str]:
+    """
+    Drops the partitions of the task result tables, whose window ended before the cutoff.
+
+    :param session: session used to execute the DDL, the caller commits.
+    :param cutoff: tasks created before the cutoff are expired.
+    :return: names of the dropped partitions.
+    """
+    dropped = []
+
+    for table in PARTITIONED_TABLES:
+        for name, _, end in _list_partitions(session, table):
+            if end <= cutoff:
+                session.execute(text(f'DROP TABLE "{name}"'))
+                dropped.append(name)
+
+    return dropped
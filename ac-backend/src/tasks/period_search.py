@@ -0,0 +1,254 @@
+from collections import defaultdict
+from typing import Any
+from uuid import UUID
+
+import numpy as np
+import numpy.typing as npt
+from astropy.timeseries import BoxLeastSquares, LombScargle
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.core.config.config import settings
+from src.tasks.model import PhotometricData
+from src.tasks.schemas import PeriodSearchRequestDto
+from src.tasks.series import SeriesKey, split_series
+from src.tasks.types import PeriodSearchMethod
+
+# transit durations tried by Box Least Squares, in days
+BLS_DURATIONS = np.array([1.0, 2.0, 4.0, 8.0]) / 24
+
+# minimum number of points of a light curve, for which the periods are searched
+MIN_POINTS = 10
+
+LightCurve = tuple[
+    npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]
+]
+
+
+def load_light_curves(
+    session: Session, task_ids: list[UUID]
+) -> dict[str | None, LightCurve]:
+    """
+    Loads the photometric data of the tasks as one light curve per light filter. The catalogs differ in their
+    zero points, so the median magnitude of each catalog is subtracted before the catalogs are combined.
+
+    :param session: DB session.
+    :param task_ids: tasks with the photometric data.
+    :return: julian dates, relative magnitudes and magnitude errors per light filter.
+    """
+    stmt = select(
+        PhotometricData.plugin_id,
+        PhotometricData.light_filter,
+        PhotometricData.julian_date,
+        PhotometricData.magnitude,
+        PhotometricData.magnitude_error,
+    ).where(PhotometricData.task_id.in_(task_ids))
+
+    chunks: dict[SeriesKey, list[npt.NDArray[np.float64]]] = defaultdict(list)
+    result = session.execute(
+        stmt.execution_options(yield_per=settings.PHOTOMETRIC_DATA_STREAM_BATCH_SIZE)
+    )
+    for rows in result.partitions():
+        for series, chunk in split_series(rows).items():
+            chunks[series].append(chunk)
+
+    by_light_filter: dict[str | None, list[npt.NDArray[np.float64]]] = defaultdict(list)
+    for (_, light_filter), series_chunks in chunks.items():
+        catalog_values = np.concatenate(series_chunks)
+        catalog_values[:, 1] -= np.median(catalog_values[:, 1])
+        by_light_filter[light_filter].append(catalog_values)
+
+    light_curves: dict[str | None, LightCurve] = {}
+    for light_filter, catalog_series in by_light_filter.items():
+        filter_values = np.concatenate(catalog_series)
+        light_curves[light_filter] = (
+            filter_values[:, 0],
+            filter_values[:, 1],
+            filter_values[:, 2],
+        )
+    return light_curves
+
+
+def frequency_grid(
+    julian_date: npt.NDArray[np.float64],
+    min_period: float | None,
+    max_period: float | None,
+    max_frequencies: int,
+) -> npt.NDArray[np.float64]:
+    """
+    Builds a regular frequency grid for the light curve. The lowest frequency is given by the baseline,
+    the highest one by the median sampling interval (pseudo-Nyquist frequency), unless the periods are
+    limited by the request. The step oversamples the width of the periodogram peaks
+    by PERIOD_SEARCH_OVERSAMPLING, and is made coarser if the grid would be longer than max_frequencies.
+
+    :param julian_date: julian dates of the light curve.
+    :param min_period: the shortest period searched in days, None for the pseudo-Nyquist limit.
+    :param max_period: the longest period searched in days, None for the baseline.
+    :param max_frequencies: maximum length of the grid.
+    :return: frequencies in 1 / day, empty if the light curve does not allow any period in the range.
+    """
+    baseline = float(np.ptp(julian_date))
+    intervals = np.diff(np.unique(julian_date))
+    if baseline <= 0 or len(intervals) == 0:
+        return np.empty(0)
+
+    minimum_frequency = 1 / baseline
+    if max_period is not None:
+        minimum_frequency = max(minimum_frequency, 1 / max_period)
+    maximum_frequency = float(0.5 / np.median(intervals))
+    if min_period is not None:
+        maximum_frequency = 1 / min_period
+    if maximum_frequency <= minimum_frequency:
+        return np.empty(0)
+
+    step = 1 / (settings.PERIOD_SEARCH_OVERSAMPLING * baseline)
+    count = min(
+        int((maximum_frequency - minimum_frequency) / step) + 1, max_frequencies
+    )
+    return np.linspace(minimum_frequency, maximum_frequency, max(count, 2))
+
+
+def find_peaks(power: npt.NDArray[np.float64], count: int) -> npt.NDArray[np.intp]:
+    """
+    Finds the highest local maxima of the periodogram.
+
+    :param power: power of the periodogram.
+    :param count: maximum number of the peaks.
+    :return: indices of the peaks, ordered from the highest power.
+    """
+    padded = np.concatenate(([-np.inf], power, [-np.inf]))
+    is_peak = (padded[1:-1] > padded[:-2]) & (padded[1:-1] >= padded[2:])
+    peaks = np.flatnonzero(is_peak & np.isfinite(power))
+
+    if len(peaks) > count:
+        peaks = peaks[np.argpartition(power[peaks], -count)[-count:]]
+    return peaks[np.argsort(power[peaks])[::-1]]
+
+
+def _errors_or_none(
+    magnitude_error: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64] | None:
+    # the weights are undefined, if some catalog does not provide the errors
+    return magnitude_error if np.all(magnitude_error > 0) else None
+
+
+def lomb_scargle_peaks(
+    light_curve: LightCurve, frequency: npt.NDArray[np.float64], count: int
+) -> list[dict[str, Any]]:
+    """
+    Computes the Lomb-Scargle periodogram by the fast O(N log N) method of Press & Rybicki
+    and returns its highest peaks with the Baluev false alarm probability.
+
+    :param light_curve: julian dates, magnitudes and errors.
+    :param frequency: regular frequency grid.
+    :param count: maximum number of the peaks.
+    :return: peaks as PeriodogramPeak columns.
+    """
+    julian_date, magnitude, magnitude_error = light_curve
+    periodogram = LombScargle(julian_date, magnitude, _errors_or_none(magnitude_error))
+    power = periodogram.power(frequency, method="fast", assume_regular_frequency=True)
+
+    peaks = find_peaks(power, count)
+    false_alarm_probability = periodogram.false_alarm_probability(
+        power[peaks],
+        minimum_frequency=frequency[0],
+        maximum_frequency=frequency[-1],
+    )
+
+    return [
+        {
+            "method": PeriodSearchMethod.lomb_scargle,
+            "rank": rank,
+            "period": float(1 / frequency[peak]),
+            "power": float(power[peak]),
+            "false_alarm_probability": float(probability),
+        }
+        for rank, (peak, probability) in enumerate(
+            zip(peaks, np.atleast_1d(false_alarm_probability)), start=1
+        )
+    ]
+
+
+def box_least_squares_peaks(
+    light_curve: LightCurve, frequency: npt.NDArray[np.float64], count: int
+) -> list[dict[str, Any]]:
+    """
+    Computes the Box Least Squares periodogram for the transits or eclipses by the binned fast method
+    and returns its highest peaks. The magnitudes are negated, as BLS searches for dips of the flux.
+
+    BLS peaks are narrower than Lomb-Scargle ones, so the frequency range of the given grid is searched
+    with the step of the shortest duration / baseline^2, at most PERIOD_SEARCH_MAX_BLS_PERIODS periods,
+    as BLS is much more expensive than Lomb-Scargle.
+
+    :param light_curve: julian dates, magnitudes and errors.
+    :param frequency: Lomb-Scargle frequency grid, whose range is searched.
+    :param count: maximum number of the peaks.
+    :return: peaks as PeriodogramPeak columns.
+    """
+    julian_date, magnitude, magnitude_error = light_curve
+    min_period = 1 / frequency[-1]
+
+    durations = BLS_DURATIONS[BLS_DURATIONS < min_period]
+    if len(durations) == 0:
+        durations = np.array([min_period / 4])
+
+    step = durations[0] / np.ptp(julian_date) ** 2
+    count_periods = min(
+        int((frequency[-1] - frequency[0]) / step) + 1,
+        settings.PERIOD_SEARCH_MAX_BLS_PERIODS,
+    )
+    period = 1 / np.linspace(frequency[-1], frequency[0], max(count_periods, 2))
+
+    periodogram = BoxLeastSquares(
+        julian_date, -magnitude, _errors_or_none(magnitude_error)
+    )
+    result = periodogram.power(period, durations, method="fast")
+    power = np.asarray(result.power)
+
+    return [
+        {
+            "method": PeriodSearchMethod.box_least_squares,
+            "rank": rank,
+            "period": float(result.period[peak]),
+            "power": float(power[peak]),
+            "duration": float(result.duration[peak]),
+            "depth": float(result.depth[peak]),
+            "transit_time": float(result.transit_time[peak]),
+        }
+        for rank, peak in enumerate(find_peaks(power, count), start=1)
+    ]
+
+
+def search_periods(
+    light_curves: dict[str | None, LightCurve], query: PeriodSearchRequestDto
+) -> list[dict[str, Any]]:
+    """
+    Searches the periods of each light curve.
+
+    :param light_curves: light curves per light filter.
+    :param query: the searched period range, methods and number of peaks.
+    :return: peaks as PeriodogramPeak columns, without the task ID.
+    """
+    peaks = []
+    for light_filter, light_curve in light_curves.items():
+        if len(light_curve[0]) < MIN_POINTS:
+            continue
+
+        frequency = frequency_grid(
+            light_curve[0],
+            query.min_period,
+            query.max_period,
+            settings.PERIOD_SEARCH_MAX_FREQUENCIES,
+        )
+        if len(frequency) == 0:
+            continue
+
+        filter_peaks = lomb_scargle_peaks(light_curve, frequency, query.peaks)
+        if query.box_least_squares:
+            filter_peaks += box_least_squares_peaks(light_curve, frequency, query.peaks)
+
+        for peak in filter_peaks:
+            peak["light_filter"] = light_filter
+        peaks += filter_peaks
+
+    return peaks
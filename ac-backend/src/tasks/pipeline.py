@@ -0,0 +1,128 @@
+import queue
+import threading
+from types import TracebackType
+from typing import Callable
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from src.plugin.interface.photometric_batch import PhotometricBatch
+from src.tasks.model import PhotometricData
+from src.tasks.service import SyncTaskService
+
+
+class PhotometricDataWriter:
+    """
+    Writer stage of the photometric data task. The batches produced by the plugin are put into a bounded queue,
+    which is drained by a separate thread with its own session. This way, the plugin can download and parse
+    the next batch while the previous one is inserted.
+
+    If the queue is full, put blocks until the writer catches up (backpressure). An error in the writer is
+    re-raised in the producing thread on the next put or on close. If the producer fails, the writer is aborted.
+    A batch can be tagged with the ID of another task, so a single writer serves the tasks retrieved together.
+    Use the writer as a context manager::
+
+        with PhotometricDataWriter(task_id, session_factory, max_pending) as writer:
+            for batch in batches:
+                writer.put(batch)
+    """
+
+    __POLL_INTERVAL_SEC = 0.1
+
+    def __init__(
+        self,
+        task_id: UUID,
+        session_factory: Callable[[], Session],
+        max_pending: int,
+    ) -> None:
+        """
+        Create new photometric data writer.
+        :param task_id: ID of the task the data belongs to
+        :param session_factory: creates the session of the writer thread
+        :param max_pending: maximum number of batches waiting for insertion
+        """
+        self._task_id = task_id
+        self._session_factory = session_factory
+        self._queue: queue.Queue[tuple[UUID, PhotometricBatch] | None] = queue.Queue(
+            maxsize=max_pending
+        )
+        self._aborted = threading.Event()
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(
+            target=self._run, name=f"photometric-data-writer-{task_id}", daemon=True
+        )
+
+    def __enter__(self) -> "PhotometricDataWriter":
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def put(self, batch: PhotometricBatch, task_id: UUID | None = None) -> None:
+        """
+        Queues the batch for insertion. Blocks while the queue is full.
+
+        :param batch: the photometric data to insert.
+        :param task_id: ID of the task the data belongs to, the task of the writer if None.
+        :raises BaseException: the error of the writer thread, if it has failed.
+        """
+        self._put((self._task_id if task_id is None else task_id, batch))
+
+    def close(self) -> None:
+        """
+        Waits until all queued batches are inserted and stops the writer thread.
+
+        :raises BaseException: the error of the writer thread, if it has failed.
+        """
+        # None marks the end of the data
+        self._put(None)
+        self._thread.join()
+        self._raise_error()
+
+    def abort(self) -> None:
+        """
+        Stops the writer thread without inserting the remaining batches.
+        """
+        self._aborted.set()
+        self._thread.join()
+
+    def _put(self, item: tuple[UUID, PhotometricBatch] | None) -> None:
+        while True:
+            self._raise_error()
+            try:
+                self._queue.put(item, timeout=self.__POLL_INTERVAL_SEC)
+                return
+            except queue.Full:
+                continue
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        try:
+            with self._session_factory() as session:
+                task_service = SyncTaskService(session, PhotometricData)
+
+                while not self._aborted.is_set():
+                    try:
+                        item = self._queue.get(timeout=self.__POLL_INTERVAL_SEC)
+                    except queue.Empty:
+                        continue
+
+                    if item is None:
+                        return
+
+                    task_service.insert_photometric_batch(*item)
+        except BaseException as e:
+            # re-raised in the producing thread
+            self._error = e
@@ -4,23 +4,34 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends
 
+from src.core.celery.worker import celery_app
 from src.core.config.config import settings
 from src.plugin.interface.schemas import (
     StellarObjectIdentificatorDto,
 )
-from src.core.repository.repository import Repository, get_repository
+from src.core.repository.repository import Filters, Repository, get_repository
+from src.plugin.model import Plugin
 from src.tasks.model import Task
 from src.tasks.schemas import (
+    BulkPhotometricDataRequestDto,
     ConeSearchRequestDto,
     FindObjectRequestDto,
+    MultiCatalogSearchRequestDto,
+    MultiCatalogTaskIdDto,
+    PeriodSearchRequestDto,
+    PhotometricDataBatchRequestDto,
     TaskStatusDto,
     TaskIdDto,
 )
 
+from src.tasks.service import catalog_task_queue
 from src.tasks.tasks import (
     catalog_cone_search,
     find_stellar_object,
     get_photometric_data,
+    get_photometric_data_batch,
+    multi_catalog_search,
+    period_search,
 )
 from src.tasks.types import TaskType
 
@@ -28,6 +39,10 @@ TaskRepositoryDep = Annotated[
     Repository[Task],
     Depends(get_repository(Task)),
 ]
+PluginRepositoryDep = Annotated[
+    Repository[Plugin],
+    Depends(get_repository(Plugin)),
+]
 
 
 router = APIRouter(
@@ -40,21 +55,26 @@ router = APIRouter(
 @router.post("/submit-task/{plugin_id}/cone-search")
 async def cone_search(
     task_repository: TaskRepositoryDep,
+    plugin_repository: PluginRepositoryDep,
     search_query_dto: ConeSearchRequestDto,
     plugin_id: UUID,
 ) -> TaskIdDto:
     """
     Handles the submission of a cone search task. This endpoint also initiates
-    an asynchronous Celery task for the cone search operation.
+    an asynchronous Celery task for the cone search operation in the queue of the plugin.
 
     :param task_repository: Task repository dependency.
+    :param plugin_repository: Plugin repository dependency.
     :param search_query_dto: Data transfer object containing cone search query parameters.
     :param plugin_id: The identifier for the plugin associated with the task.
     :return: A DTO containing the generated ID of the created task.
     """
     search_query_dto.plugin_id = plugin_id
     task = await task_repository.save(Task(task_type=TaskType.object_search))
-    catalog_cone_search.delay(str(task.id), search_query_dto.model_dump())
+    catalog_cone_search.apply_async(
+        (str(task.id), search_query_dto.model_dump()),
+        queue=catalog_task_queue(await plugin_repository.get_optional(plugin_id)),
+    )
 
     return TaskIdDto(task_id=task.id)
 
@@ -62,14 +82,16 @@ async def cone_search(
 @router.post("/submit-task/{plugin_id}/find-object")
 async def find_object(
     task_repository: TaskRepositoryDep,
+    plugin_repository: PluginRepositoryDep,
     query_dto: FindObjectRequestDto,
     plugin_id: UUID,
 ) -> TaskIdDto:
     """
     Handles the endpoint to submit a task for finding a stallar object based on a given name in a star survey (catalog).
-    This endpoint also initiates an asynchronous Celery task for the find object search operation.
+    This endpoint also initiates an asynchronous Celery task for the find object search operation in the queue of the plugin.
 
     :param task_repository: Task repository dependency.
+    :param plugin_repository: Plugin repository dependency.
     :param query_dto: The name of the stellar object to be searched for.
     :param plugin_id: The identifier for the plugin associated with the task.
     :return: A DTO containing the generated ID of the created task.
@@ -78,23 +100,67 @@ async def find_object(
     query_dto.plugin_id = plugin_id
     task = await task_repository.save(Task(task_type=TaskType.object_search))
 
-    find_stellar_object.delay(str(task.id), query_dto.model_dump())
+    find_stellar_object.apply_async(
+        (str(task.id), query_dto.model_dump()),
+        queue=catalog_task_queue(await plugin_repository.get_optional(plugin_id)),
+    )
 
     return TaskIdDto(task_id=task.id)
 
 
+@router.post("/submit-task/multi-catalog-search")
+async def submit_multi_catalog_search(
+    task_repository: TaskRepositoryDep,
+    query_dto: MultiCatalogSearchRequestDto,
+) -> MultiCatalogTaskIdDto:
+    """
+    Handles the submission of a search in multiple catalogs around the given coordinates or the named object.
+    A child task is created per plugin under a parent task, whose status aggregates the statuses of the children:
+    it is completed when all children finished and at least one of them completed. The identifiers found by all
+    catalogs can be retrieved by the parent task sorted by distance.
+
+    :param task_repository: Task repository dependency.
+    :param query_dto: The searched plugins and the coordinates or the name of the stellar object.
+    :return: A DTO containing the ID of the parent task and the IDs of the child tasks by plugin.
+    """
+    parent = await task_repository.save(Task(task_type=TaskType.object_search))
+    plugin_ids = list(dict.fromkeys(query_dto.plugin_ids))
+    children = await task_repository.insert_returning(
+        [
+            {"task_type": TaskType.object_search, "parent_id": parent.id}
+            for _ in plugin_ids
+        ]
+    )
+    plugin_task_ids = {
+        plugin_id: child.id for plugin_id, child in zip(plugin_ids, children)
+    }
+
+    multi_catalog_search.delay(
+        str(parent.id),
+        query_dto.model_dump(),
+        {
+            str(plugin_id): str(task_id)
+            for plugin_id, task_id in plugin_task_ids.items()
+        },
+    )
+
+    return MultiCatalogTaskIdDto(task_id=parent.id, plugin_task_ids=plugin_task_ids)
+
+
 @router.post("/submit-task/{plugin_id}/photometric-data")
 async def submit_retrieve_data(
     task_repository: TaskRepositoryDep,
+    plugin_repository: PluginRepositoryDep,
     plugin_id: UUID,
     identificator_model: StellarObjectIdentificatorDto,
 ) -> TaskIdDto:
     """
     Endpoint to submit a task for retrieval of photometric data corresponding to a plugin.
-    Triggers an asynchronous Celery task to retrieve the photometric data and save it as a CSV file in
-    a temporary storage and in DB.
+    Triggers an asynchronous Celery task in the queue of the plugin to retrieve the photometric data and save it
+    as a CSV file in a temporary storage and in DB.
 
     :param task_repository: Task repository dependency.
+    :param plugin_repository: Plugin repository dependency.
     :param plugin_id: The identifier for the plugin associated with the task.
     :param identificator_model: Identificator containing the information about the stellar object
     :return: A DTO containing the generated ID of the created task.
@@ -106,15 +172,124 @@ async def submit_retrieve_data(
     filename = f"{task_id}.csv"
     csv_path = Path.joinpath(settings.TEMP_DIR, filename)
 
-    get_photometric_data.delay(
-        str(task_id), identificator_model.model_dump(), csv_path.resolve().as_posix()
+    get_photometric_data.apply_async(
+        (str(task_id), identificator_model.model_dump(), csv_path.resolve().as_posix()),
+        queue=catalog_task_queue(await plugin_repository.get_optional(plugin_id)),
     )
 
     return TaskIdDto(task_id=task_id)
 
 
+@router.post("/submit-task/{plugin_id}/photometric-data-batch")
+async def submit_retrieve_data_batch(
+    task_repository: TaskRepositoryDep,
+    plugin_repository: PluginRepositoryDep,
+    plugin_id: UUID,
+    query_dto: PhotometricDataBatchRequestDto,
+) -> list[TaskIdDto]:
+    """
+    Endpoint to submit the retrieval of photometric data of multiple stellar objects of a plugin. A task is created
+    for each stellar object, but the data are retrieved by a single Celery task in the queue of the plugin,
+    so the plugin can fetch the data of all objects by as few requests to the catalog as possible.
+
+    :param task_repository: Task repository dependency.
+    :param plugin_repository: Plugin repository dependency.
+    :param plugin_id: The identifier for the plugin associated with the tasks.
+    :param query_dto: Identificators containing the information about the stellar objects.
+    :return: DTOs containing the generated IDs of the created tasks, in the order of the identificators.
+    """
+    for identificator in query_dto.identificators:
+        identificator.plugin_id = plugin_id
+    tasks = await task_repository.insert_returning(
+        [{"task_type": TaskType.photometric_data} for _ in query_dto.identificators]
+    )
+    task_ids = [task.id for task in tasks]
+
+    get_photometric_data_batch.apply_async(
+        (
+            [str(task_id) for task_id in task_ids],
+            [identificator.model_dump() for identificator in query_dto.identificators],
+            [
+                Path.joinpath(settings.TEMP_DIR, f"{task_id}.csv").resolve().as_posix()
+                for task_id in task_ids
+            ],
+        ),
+        queue=catalog_task_queue(await plugin_repository.get_optional(plugin_id)),
+    )
+
+    return [TaskIdDto(task_id=task_id) for task_id in task_ids]
+
+
+@router.post("/submit-task/photometric-data/bulk")
+async def submit_retrieve_data_bulk(
+    task_repository: TaskRepositoryDep,
+    plugin_repository: PluginRepositoryDep,
+    query_dto: BulkPhotometricDataRequestDto,
+) -> list[TaskIdDto]:
+    """
+    Endpoint to submit the retrieval of photometric data of multiple stellar objects, possibly of different plugins.
+    Each stellar object gets its own task, as if submitted by the photometric-data endpoint, but all tasks
+    are created by a single insert and their Celery messages are published over a single broker connection.
+
+    :param task_repository: Task repository dependency.
+    :param plugin_repository: Plugin repository dependency.
+    :param query_dto: Stellar objects with the plugins to retrieve their photometric data from.
+    :return: DTOs containing the generated IDs of the created tasks, in the order of the items.
+    """
+    for item in query_dto.items:
+        item.identificator.plugin_id = item.plugin_id
+    tasks = await task_repository.insert_returning(
+        [{"task_type": TaskType.photometric_data} for _ in query_dto.items]
+    )
+
+    plugin_ids = list({item.plugin_id for item in query_dto.items})
+    _, plugins = await plugin_repository.find(
+        count=len(plugin_ids),
+        filters=Filters(filters={"id__in": plugin_ids}),
+        with_total=False,
+    )
+    queues = {plugin.id: catalog_task_queue(plugin) for plugin in plugins}
+
+    with celery_app.producer_or_acquire() as producer:
+        for task, item in zip(tasks, query_dto.items):
+            csv_path = Path.joinpath(settings.TEMP_DIR, f"{task.id}.csv")
+            get_photometric_data.apply_async(
+                (
+                    str(task.id),
+                    item.identificator.model_dump(),
+                    csv_path.resolve().as_posix(),
+                ),
+                queue=queues.get(item.plugin_id, catalog_task_queue(None)),
+                producer=producer,
+            )
+
+    return [TaskIdDto(task_id=task.id) for task in tasks]
+
+
+@router.post("/submit-task/period-search")
+async def submit_period_search(
+    task_repository: TaskRepositoryDep,
+    query_dto: PeriodSearchRequestDto,
+) -> TaskIdDto:
+    """
+    Endpoint to submit a task for the period search in the photometric data of the given tasks.
+    Triggers an asynchronous Celery task, which computes the periodograms and stores their peaks in DB.
+
+    :param task_repository: Task repository dependency.
+    :param query_dto: The photometric data tasks and parameters of the period search.
+    :return: A DTO containing the generated ID of the created task.
+    """
+    task = await task_repository.save(Task(task_type=TaskType.period_search))
+
+    period_search.delay(str(task.id), query_dto.model_dump())
+
+    return TaskIdDto(task_id=task.id)
+
+
 @router.get("/task_status/{task_id}")
 async def get_task_status(task_id: UUID, task_repository: TaskRepositoryDep):
     """Endpoint to check the status of a task."""
     task = await task_repository.get(task_id)
-    return TaskStatusDto(task_id=task_id, status=task.status.value)
+    return TaskStatusDto(
+        task_id=task_id, status=task.status.value, source_task_id=task.source_task_id
+    )
@@ -1,6 +1,11 @@
+from typing import Self
 from uuid import UUID
 
+from pydantic import Field, model_validator
+
+from src.core.config.config import settings
 from src.core.repository.schemas import BaseDto
+from src.plugin.interface.schemas import StellarObjectIdentificatorDto
 
 
 class ConeSearchRequestDto(BaseDto):
@@ -15,10 +20,73 @@ class FindObjectRequestDto(BaseDto):
     name: str
 
 
+class MultiCatalogSearchRequestDto(BaseDto):
+    plugin_ids: list[UUID] = Field(min_length=1)
+    """Plugins of the searched catalogs."""
+    name: str | None = None
+    """Name of the stellar object, resolved to its coordinates once for all catalogs."""
+    right_ascension_deg: float | None = None
+    declination_deg: float | None = None
+    radius_arcsec: float | None = Field(default=None, gt=0)
+    """Search radius, 30 arcseconds around the coordinates or OBJECT_SEARCH_RADIUS around the named object if None."""
+
+    @model_validator(mode="after")
+    def check_target(self) -> Self:
+        has_coordinates = (
+            self.right_ascension_deg is not None and self.declination_deg is not None
+        )
+        if (self.name is None) == (not has_coordinates):
+            raise ValueError("Either the name or both coordinates are required")
+        if self.radius_arcsec is None:
+            self.radius_arcsec = (
+                settings.OBJECT_SEARCH_RADIUS if self.name is not None else 30.0
+            )
+        return self
+
+
+class PhotometricDataBatchRequestDto(BaseDto):
+    identificators: list[StellarObjectIdentificatorDto] = Field(
+        min_length=1, max_length=settings.PHOTOMETRIC_DATA_BATCH_LIMIT
+    )
+    """Stellar objects of the plugin, a photometric data task is created for each of them."""
+
+
+class PhotometricDataTaskRequestDto(BaseDto):
+    plugin_id: UUID
+    identificator: StellarObjectIdentificatorDto
+
+
+class BulkPhotometricDataRequestDto(BaseDto):
+    items: list[PhotometricDataTaskRequestDto] = Field(
+        min_length=1, max_length=settings.BULK_TASK_SUBMISSION_LIMIT
+    )
+    """Stellar objects with their plugins, a photometric data task is created for each of them."""
+
+
 class TaskIdDto(BaseDto):
     task_id: UUID
 
 
+class MultiCatalogTaskIdDto(TaskIdDto):
+    plugin_task_ids: dict[UUID, UUID]
+    """Child task searching the catalog of each plugin, the parent task aggregates their statuses."""
+
+
 class TaskStatusDto(BaseDto):
     task_id: UUID
     status: str
+    source_task_id: UUID | None = None
+    """Photometric data task, whose recent data were copied instead of calling the plugin."""
+
+
+class PeriodSearchRequestDto(BaseDto):
+    task_ids: list[UUID] = Field(min_length=1)
+    """Photometric data tasks, whose data are searched."""
+    min_period: float | None = Field(default=None, gt=0)
+    """The shortest period in days, limited by the cadence of the data if None."""
+    max_period: float | None = Field(default=None, gt=0)
+    """The longest period in days, limited by the baseline of the data if None."""
+    box_least_squares: bool = False
+    """Whether to search for transits and eclipses by Box Least Squares besides Lomb-Scargle."""
+    peaks: int = Field(default=5, ge=1, le=50)
+    """Number of the highest peaks stored per method and light filter."""
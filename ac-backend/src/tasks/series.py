@@ -0,0 +1,38 @@
+from collections.abc import Sequence
+from typing import Any
+from uuid import UUID
+
+import numpy as np
+import numpy.typing as npt
+from sqlalchemy import Row
+
+# photometric data of a single plugin and light filter
+SeriesKey = tuple[UUID, str | None]
+
+
+def split_series(
+    rows: Sequence[Row[Any]],
+) -> dict[SeriesKey, npt.NDArray[np.float64]]:
+    """
+    Splits the rows of photometric data by their plugin and light filter. The rows are sorted by the series
+    at once and split at the first row of each series, instead of collecting the indices of each row.
+
+    :param rows: rows of the plugin ID, light filter, julian date, magnitude and magnitude error.
+    :return: columns julian date, magnitude and magnitude error per plugin and light filter,
+        in the order of the rows within each series.
+    """
+    if not rows:
+        return {}
+
+    # the filters are prefixed, so no filter has the same key as the missing one
+    keys = np.array(
+        [f"{row[0]}:{'' if row[1] is None else '+' + row[1]}" for row in rows]
+    )
+    order = np.argsort(keys, kind="stable")
+    _, starts = np.unique(keys[order], return_index=True)
+
+    values = np.array([row[2:] for row in rows], dtype=np.float64)[order]
+    return {
+        (rows[order[start]][0], rows[order[start]][1]): chunk
+        for start, chunk in zip(starts, np.split(values, starts[1:]))
+    }
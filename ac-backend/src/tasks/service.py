@@ -3,25 +3,238 @@ import importlib.util
 import inspect
 import logging
 import sys
+from datetime import timedelta
 from pathlib import Path
-from typing import Optional, Any
+from typing import Optional, Any, cast as typing_cast
 from uuid import UUID
 
-from sqlalchemy import insert, update
-from sqlalchemy.orm import Session
+from psycopg import AsyncConnection, Connection, sql
+from sqlalchemy import (
+    Insert,
+    ScalarSelect,
+    Select,
+    Update,
+    case,
+    cast,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased
 
 from src.core.config.config import settings
-from src.plugin.interface.catalog_plugin import CatalogPlugin, DefaultCatalogPlugin
-from src.plugin.interface.schemas import StellarObjectIdentificatorDto
+from src.core.rate_limit.limiter import RateLimiter, plugin_limit_name
+from src.core.cone_search_cache.cache import ConeSearchCache
+from src.core.raw_data_cache.cache import RawDataCache
+from src.plugin.interface.async_catalog_plugin import AsyncCatalogPlugin
+from src.plugin.interface.catalog_plugin import (
+    BaseCatalogPlugin,
+    CatalogPlugin,
+    DefaultCatalogPlugin,
+)
+from src.plugin.interface.photometric_batch import PhotometricBatch
+from src.plugin.interface.schemas import (
+    PhotometricDataJobDto,
+    StellarObjectIdentificatorDto,
+)
 from src.core.repository.exception import RepositoryException
 
+from src.plugin.cache import plugin_cache
 from src.plugin.exceptions import NoPluginClassException
 from src.plugin.model import Plugin
-from src.tasks.model import Task
-from src.tasks.types import TaskStatus
+from src.tasks.binary_copy import encode_photometric_batch, PHOTOMETRIC_DATA_COLUMNS
+from src.tasks.model import (
+    Task,
+    PeriodogramPeak,
+    PhotometricData,
+    StellarObjectIdentifier,
+)
+from src.tasks.types import TaskStatus, TaskType
 
 logger = logging.getLogger(__name__)
 
+# models of the results, which reference their task by task_id
+TaskResultModel = (
+    type[PhotometricData] | type[StellarObjectIdentifier] | type[PeriodogramPeak]
+)
+
+_PLUGIN_BASE_CLASSES = (
+    BaseCatalogPlugin,
+    CatalogPlugin,
+    DefaultCatalogPlugin,
+    AsyncCatalogPlugin,
+)
+
+_COPY_PHOTOMETRIC_DATA = sql.SQL("COPY {} ({}) FROM STDIN (FORMAT BINARY)").format(
+    sql.Identifier(PhotometricData.__tablename__),
+    sql.SQL(", ").join(map(sql.Identifier, PHOTOMETRIC_DATA_COLUMNS)),
+)
+_COPY_IDENTIFIERS = sql.SQL(
+    "COPY {} (task_id, identifier) FROM STDIN (FORMAT BINARY)"
+).format(sql.Identifier(StellarObjectIdentifier.__tablename__))
+
+
+def _get_cached_plugin(
+    db_plugin: Plugin,
+) -> (
+    CatalogPlugin[StellarObjectIdentificatorDto]
+    | AsyncCatalogPlugin[StellarObjectIdentificatorDto]
+):
+    plugin_file_path = Path.joinpath(settings.PLUGIN_DIR, db_plugin.file_name).resolve()
+
+    plugin = plugin_cache.get(
+        db_plugin.id,
+        db_plugin.file_name,
+        lambda: SyncTaskService._load_plugin(db_plugin.file_name, plugin_file_path),
+    )
+    if plugin is None:
+        raise NoPluginClassException()
+
+    return plugin
+
+
+def _get_rate_limiter(plugin_id: UUID, db_plugin: Plugin | None) -> RateLimiter:
+    if db_plugin is None:
+        return RateLimiter(plugin_limit_name(plugin_id))
+    return RateLimiter(
+        plugin_limit_name(plugin_id),
+        rate=db_plugin.rate_limit,
+        burst=db_plugin.rate_limit_burst,
+        max_concurrency=db_plugin.max_concurrency,
+    )
+
+
+def catalog_task_queue(db_plugin: Plugin | None) -> str:
+    """
+    Returns the Celery queue of the catalog tasks (cone search, object search and photometric data) of the plugin.
+
+    :param db_plugin: the plugin record, None if the plugin does not exist.
+    :return: the queue assigned to the plugin, the default catalog queue if none is assigned.
+    """
+    if db_plugin is None or db_plugin.task_queue is None:
+        return settings.DEFAULT_CATALOG_TASK_QUEUE
+    return db_plugin.task_queue
+
+
+def _get_raw_data_cache(plugin_id: UUID, db_plugin: Plugin | None) -> RawDataCache:
+    if db_plugin is None or db_plugin.raw_data_cache_ttl is None:
+        return RawDataCache(plugin_id, settings.RAW_DATA_CACHE_TTL)
+    return RawDataCache(plugin_id, db_plugin.raw_data_cache_ttl)
+
+
+def _get_cone_search_cache(
+    plugin_id: UUID, db_plugin: Plugin | None
+) -> ConeSearchCache:
+    if db_plugin is not None and not db_plugin.directly_identifies_objects:
+        # the identificator of the search center is not a stellar object, which could be filtered by its position
+        return ConeSearchCache(plugin_id, 0)
+    if db_plugin is None or db_plugin.cone_search_cache_ttl is None:
+        return ConeSearchCache(plugin_id, settings.CONE_SEARCH_CACHE_TTL)
+    return ConeSearchCache(plugin_id, db_plugin.cone_search_cache_ttl)
+
+
+def _task_status_statement(task_id: str, status: TaskStatus) -> Update:
+    return update(Task).where(Task.id == UUID(task_id)).values(status=status)
+
+
+def _complete_task_statement(model: TaskResultModel, task_id: str) -> Update:
+    uuid = UUID(task_id)
+    result_count = (
+        select(func.count())
+        .select_from(model)
+        .where(model.task_id == uuid)
+        .scalar_subquery()
+    )
+    return (
+        update(Task)
+        .where(Task.id == uuid)
+        .values(status=TaskStatus.completed, result_count=result_count)
+    )
+
+
+def _reusable_task_statement(
+    task_id: UUID, plugin_id: UUID, identificator_hash: str
+) -> Select[tuple[UUID]]:
+    # the latest completed task of the same stellar object and plugin within the reuse window
+    return (
+        select(Task.id)
+        .where(
+            Task.task_type == TaskType.photometric_data,
+            Task.status == TaskStatus.completed,
+            Task.plugin_id == plugin_id,
+            Task.identificator_hash == identificator_hash,
+            Task.created_at
+            > func.localtimestamp()
+            - timedelta(seconds=settings.PHOTOMETRIC_DATA_REUSE_WINDOW),
+            Task.id != task_id,
+        )
+        .order_by(Task.created_at.desc())
+        .limit(1)
+    )
+
+
+def _copy_photometric_data_statement(source_task_id: UUID, task_id: UUID) -> Insert:
+    # the copied rows are inserted now, so they are kept as long as the task, which they belong to
+    return insert(PhotometricData).from_select(
+        PHOTOMETRIC_DATA_COLUMNS,
+        select(
+            literal(task_id, PhotometricData.task_id.type),
+            *(
+                getattr(PhotometricData, column)
+                for column in PHOTOMETRIC_DATA_COLUMNS[1:]
+            ),
+        ).where(PhotometricData.task_id == source_task_id),
+    )
+
+
+def _parent_id_subquery(task_id: str) -> ScalarSelect[UUID | None]:
+    task = aliased(Task)
+    return select(task.parent_id).where(task.id == UUID(task_id)).scalar_subquery()
+
+
+def _lock_parent_statement(task_id: str) -> Select[tuple[UUID]]:
+    # the parent is locked by every finishing child, so the last one sees the final statuses of its siblings
+    return (
+        select(Task.id).where(Task.id == _parent_id_subquery(task_id)).with_for_update()
+    )
+
+
+def _aggregate_parent_statement(task_id: str) -> Update:
+    """
+    Finishes the parent of the task, when none of its children is in progress. The parent is completed
+    if any child completed, otherwise it failed. Its result count is the sum of the counts of the children.
+    """
+    child = aliased(Task)
+    in_progress = exists().where(
+        child.parent_id == Task.id, child.status == TaskStatus.in_progress
+    )
+    completed = exists().where(
+        child.parent_id == Task.id, child.status == TaskStatus.completed
+    )
+    result_count = (
+        select(func.coalesce(func.sum(child.result_count), 0))
+        .where(child.parent_id == Task.id)
+        .scalar_subquery()
+    )
+    return (
+        update(Task)
+        .where(Task.id == _parent_id_subquery(task_id), ~in_progress)
+        .values(
+            status=cast(
+                case(
+                    (completed, literal(TaskStatus.completed, Task.status.type)),
+                    else_=literal(TaskStatus.failed, Task.status.type),
+                ),
+                Task.status.type,
+            ),
+            result_count=result_count,
+        )
+    )
+
 
 class SyncTaskService:
     """
@@ -40,20 +253,24 @@ class SyncTaskService:
             raise RepositoryException("Plugin with ID " + str(entity_id) + " not found")
         return result
 
+    @staticmethod
     def _load_plugin(
-        self, module_name: str, file_path: Path
-    ) -> Optional[CatalogPlugin[StellarObjectIdentificatorDto]]:
+        module_name: str, file_path: Path
+    ) -> Optional[
+        CatalogPlugin[StellarObjectIdentificatorDto]
+        | AsyncCatalogPlugin[StellarObjectIdentificatorDto]
+    ]:
         """
         Loads a plugin dynamically by its module name and file path, and returns an instance
-        of a class that subclasses `CatalogPlugin`, if available.
+        of a class that subclasses `CatalogPlugin` or `AsyncCatalogPlugin`, if available.
 
         :param module_name: Name of the module to be loaded.
         :type module_name: str
         :param file_path: Path to the module file to be loaded.
         :type file_path: Path
-        :return: An instance of a class that subclasses `CatalogPlugin`, or None if no
+        :return: An instance of a class that subclasses `CatalogPlugin` or `AsyncCatalogPlugin`, or None if no
             valid plugin class is found.
-        :rtype: Optional[CatalogPlugin[StellarObjectIdentificatorDto]]
+        :rtype: Optional[CatalogPlugin[StellarObjectIdentificatorDto] | AsyncCatalogPlugin[StellarObjectIdentificatorDto]]
         :raises ImportError: If the module spec or loader cannot be loaded from `file_path`.
         """
         spec = importlib.util.spec_from_file_location(module_name, file_path)
@@ -70,9 +287,9 @@ class SyncTaskService:
             # Only add classes that are a sub class of PhotometricCataloguePlugin,
             # but NOT PhotometricCataloguePlugin itself
             if (
-                issubclass(cls, CatalogPlugin)
-                and cls is not CatalogPlugin
-                and cls is not DefaultCatalogPlugin
+                issubclass(cls, (CatalogPlugin, AsyncCatalogPlugin))
+                and cls not in _PLUGIN_BASE_CLASSES
+                and not inspect.isabstract(cls)
             ):
                 logger.info(f"Found plugin class: {cls.__module__}.{cls.__name__}")
                 return cls()
@@ -81,27 +298,63 @@ class SyncTaskService:
 
     def get_plugin_instance(
         self, plugin_id: UUID
-    ) -> CatalogPlugin[StellarObjectIdentificatorDto]:
+    ) -> (
+        CatalogPlugin[StellarObjectIdentificatorDto]
+        | AsyncCatalogPlugin[StellarObjectIdentificatorDto]
+    ):
         """
         Retrieves an instance of the catalog plugin identified by the plugin UUID.
+        The instance is cached by the worker process, so the plugin file is loaded only by the first task
+        of the process, or after the file was replaced.
         If no corresponding plugin class is found, an exception is raised.
 
         :param plugin_id: Unique identifier of the plugin to retrieve.
         :type plugin_id: UUID
         :return: An instance of the catalog plugin corresponding to the provided ID.
-        :rtype: CatalogPlugin[StellarObjectIdentificatorDto]
+        :rtype: CatalogPlugin[StellarObjectIdentificatorDto] | AsyncCatalogPlugin[StellarObjectIdentificatorDto]
         :raises NoPluginClassException: If no plugin class is found for the given plugin ID.
         """
-        db_plugin = self._get_plugin_entity(plugin_id)
-        plugin_file_path = Path.joinpath(
-            settings.PLUGIN_DIR, db_plugin.file_name
-        ).resolve()
+        return _get_cached_plugin(self._get_plugin_entity(plugin_id))
+
+    def get_rate_limiter(self, plugin_id: UUID) -> RateLimiter:
+        """
+        Returns the rate limiter of the catalog of the plugin, configured by the limits of the plugin record.
+        The tasks hold a slot of the limiter while they use the plugin.
+
+        :param plugin_id: Unique identifier of the plugin.
+        :return: the rate limiter, without limits if the plugin does not exist.
+        """
+        return _get_rate_limiter(plugin_id, self._session.get(Plugin, plugin_id))
+
+    def get_raw_data_cache(self, plugin_id: UUID) -> RawDataCache:
+        """
+        Returns the cache of the raw responses of the catalog of the plugin, configured by the TTL of the plugin record.
+        The tasks set the cache for the plugin by its scope while they use the plugin.
+
+        :param plugin_id: Unique identifier of the plugin.
+        :return: the raw data cache, with the default TTL if the plugin does not exist.
+        """
+        return _get_raw_data_cache(plugin_id, self._session.get(Plugin, plugin_id))
+
+    def get_cone_search_cache(self, plugin_id: UUID) -> ConeSearchCache:
+        """
+        Returns the cache of the stellar objects found by the cone searches of the plugin,
+        configured by the TTL of the plugin record. The cache is disabled for the plugins, which do not identify
+        the stellar objects directly, as they return the searched position itself.
+
+        :param plugin_id: Unique identifier of the plugin.
+        :return: the cone search cache, with the default TTL if the plugin does not exist.
+        """
+        return _get_cone_search_cache(plugin_id, self._session.get(Plugin, plugin_id))
 
-        plugin = self._load_plugin(db_plugin.file_name, plugin_file_path)
-        if plugin is None:
-            raise NoPluginClassException()
+    def get_task_queue(self, plugin_id: UUID) -> str:
+        """
+        Returns the Celery queue of the catalog tasks of the plugin.
 
-        return plugin
+        :param plugin_id: Unique identifier of the plugin.
+        :return: the queue of the plugin, the default catalog queue if the plugin does not exist.
+        """
+        return catalog_task_queue(self._session.get(Plugin, plugin_id))
 
     def bulk_insert(self, data: list[dict[Any, Any]]):
         if data == []:
@@ -109,8 +362,246 @@ class SyncTaskService:
         self._session.execute(insert(self._model), data)
         self._session.commit()
 
+    def _driver_connection(self) -> Connection:
+        # psycopg connection of the current session transaction, the engines use the psycopg driver
+        return typing_cast(
+            Connection, self._session.connection().connection.driver_connection
+        )
+
+    def insert_photometric_batch(self, task_id: UUID, batch: PhotometricBatch) -> None:
+        """
+        Streams a photometric batch into the database with COPY FROM STDIN in binary format.
+        The batch is encoded from its columns, so no object is created per measurement.
+
+        :param task_id: ID of the task the data belongs to.
+        :param batch: the photometric data to insert.
+        """
+        if len(batch) == 0:
+            return
+
+        with (
+            self._driver_connection().cursor() as cursor,
+            cursor.copy(_COPY_PHOTOMETRIC_DATA) as copy,
+        ):
+            copy.write(encode_photometric_batch(task_id, batch))
+        self._session.commit()
+
+    def insert_identifiers(
+        self, task_id: UUID, identifiers: list[StellarObjectIdentificatorDto]
+    ) -> None:
+        """
+        Streams stellar object identifiers into the database with COPY FROM STDIN in binary format.
+
+        :param task_id: ID of the task the identifiers belong to.
+        :param identifiers: the identifiers to insert.
+        """
+        if identifiers == []:
+            return
+
+        with (
+            self._driver_connection().cursor() as cursor,
+            cursor.copy(_COPY_IDENTIFIERS) as copy,
+        ):
+            copy.set_types(["uuid", "jsonb"])
+            for dto in identifiers:
+                copy.write_row((task_id, dto.model_dump()))
+        self._session.commit()
+
+    def _finish_parent(self, task_id: str) -> None:
+        if self._session.execute(_lock_parent_statement(task_id)).first() is not None:
+            self._session.execute(_aggregate_parent_statement(task_id))
+
     def set_task_status(self, task_id: str, status: TaskStatus):
+        self._session.execute(_task_status_statement(task_id, status))
+        self._finish_parent(task_id)
+        self._session.commit()
+
+    def get_task_job(self, task_id: str) -> tuple[PhotometricDataJobDto | None, float]:
+        """
+        Returns the job stored on the task, which prepares the photometric data on the catalog server.
+
+        :param task_id: ID of the task.
+        :return: the stored job (None if no job was stored yet) and the age of the task in seconds.
+        """
+        job, age = self._session.execute(
+            select(
+                Task.job,
+                func.extract("epoch", func.localtimestamp() - Task.created_at),
+            ).where(Task.id == UUID(task_id))
+        ).one()
+        self._session.commit()
+        if job is None:
+            return None, float(age)
+        return PhotometricDataJobDto.model_validate(job), float(age)
+
+    def set_task_job(self, task_id: str, job: PhotometricDataJobDto | None) -> None:
+        self._session.execute(
+            update(Task)
+            .where(Task.id == UUID(task_id))
+            .values(job=None if job is None else job.model_dump(mode="json"))
+        )
+        self._session.commit()
+
+    def complete_task(self, task_id: str) -> None:
+        """
+        Marks the task as completed and stores the number of its results, so the results of completed tasks
+        can be paginated without counting them. The parent of the task is finished, if it was the last child
+        in progress.
+
+        :param task_id: ID of the task, whose results are stored in the model of the service.
+        """
+        self._session.execute(_complete_task_statement(self._model, task_id))
+        self._finish_parent(task_id)
+        self._session.commit()
+
+    def reuse_photometric_data(
+        self, task_id: str, identificator: StellarObjectIdentificatorDto
+    ) -> UUID | None:
+        """
+        Records the plugin and the content hash of the identificator on the photometric data task. If a completed task
+        retrieved the data of the same stellar object from the same plugin within PHOTOMETRIC_DATA_REUSE_WINDOW,
+        its data are copied to the task by a single INSERT ... SELECT, and the task is completed with the source task
+        recorded, so the plugin does not have to be called.
+
+        :param task_id: ID of the photometric data task.
+        :param identificator: the stellar object identificator of the task.
+        :return: ID of the task, whose data were copied, None if there is no such task.
+        """
         uuid = UUID(task_id)
-        stmt = update(Task).where(Task.id == uuid).values(status=status)
-        self._session.execute(stmt)
+        identificator_hash = identificator.content_hash()
+        self._session.execute(
+            update(Task)
+            .where(Task.id == uuid)
+            .values(
+                plugin_id=identificator.plugin_id,
+                identificator_hash=identificator_hash,
+            )
+        )
+
+        source_task_id = None
+        if settings.PHOTOMETRIC_DATA_REUSE_WINDOW > 0:
+            source_task_id = self._session.execute(
+                _reusable_task_statement(
+                    uuid, identificator.plugin_id, identificator_hash
+                )
+            ).scalar_one_or_none()
+        if source_task_id is None:
+            self._session.commit()
+            return None
+
+        self._session.execute(_copy_photometric_data_statement(source_task_id, uuid))
+        self._session.execute(
+            update(Task).where(Task.id == uuid).values(source_task_id=source_task_id)
+        )
+        self._session.execute(_complete_task_statement(PhotometricData, task_id))
+        self._finish_parent(task_id)
         self._session.commit()
+        return source_task_id
+
+
+class AsyncTaskService:
+    """
+    Async counterpart of SyncTaskService, used by the tasks running on the event loop of a worker
+    in the asyncio execution mode.
+    """
+
+    def __init__(self, session: AsyncSession, model: TaskResultModel) -> None:
+        self._session = session
+        self._model = model
+
+    async def get_plugin_instance(
+        self, plugin_id: UUID
+    ) -> (
+        CatalogPlugin[StellarObjectIdentificatorDto]
+        | AsyncCatalogPlugin[StellarObjectIdentificatorDto]
+    ):
+        """
+        Retrieves the cached instance of the catalog plugin, see SyncTaskService.get_plugin_instance.
+
+        :param plugin_id: Unique identifier of the plugin to retrieve.
+        :return: An instance of the catalog plugin corresponding to the provided ID.
+        :raises NoPluginClassException: If no plugin class is found for the given plugin ID.
+        """
+        db_plugin = await self._session.get(Plugin, plugin_id)
+        await self._session.commit()
+        if db_plugin is None:
+            raise RepositoryException("Plugin with ID " + str(plugin_id) + " not found")
+
+        return _get_cached_plugin(db_plugin)
+
+    async def get_rate_limiter(self, plugin_id: UUID) -> RateLimiter:
+        """
+        Returns the rate limiter of the catalog of the plugin, see SyncTaskService.get_rate_limiter.
+
+        :param plugin_id: Unique identifier of the plugin.
+        :return: the rate limiter, without limits if the plugin does not exist.
+        """
+        return _get_rate_limiter(plugin_id, await self._session.get(Plugin, plugin_id))
+
+    async def _driver_connection(self) -> AsyncConnection:
+        # psycopg connection of the current session transaction, the engines use the psycopg driver
+        connection = await self._session.connection()
+        raw_connection = await connection.get_raw_connection()
+        return typing_cast(AsyncConnection, raw_connection.driver_connection)
+
+    async def insert_photometric_batch(
+        self, task_id: UUID, batch: PhotometricBatch
+    ) -> None:
+        """
+        Streams a photometric batch into the database, see SyncTaskService.insert_photometric_batch.
+
+        :param task_id: ID of the task the data belongs to.
+        :param batch: the photometric data to insert.
+        """
+        if len(batch) == 0:
+            return
+
+        connection = await self._driver_connection()
+        async with (
+            connection.cursor() as cursor,
+            cursor.copy(_COPY_PHOTOMETRIC_DATA) as copy,
+        ):
+            await copy.write(encode_photometric_batch(task_id, batch))
+        await self._session.commit()
+
+    async def insert_identifiers(
+        self, task_id: UUID, identifiers: list[StellarObjectIdentificatorDto]
+    ) -> None:
+        """
+        Streams stellar object identifiers into the database, see SyncTaskService.insert_identifiers.
+
+        :param task_id: ID of the task the identifiers belong to.
+        :param identifiers: the identifiers to insert.
+        """
+        if identifiers == []:
+            return
+
+        connection = await self._driver_connection()
+        async with (
+            connection.cursor() as cursor,
+            cursor.copy(_COPY_IDENTIFIERS) as copy,
+        ):
+            copy.set_types(["uuid", "jsonb"])
+            for dto in identifiers:
+                await copy.write_row((task_id, dto.model_dump()))
+        await self._session.commit()
+
+    async def _finish_parent(self, task_id: str) -> None:
+        parent = await self._session.execute(_lock_parent_statement(task_id))
+        if parent.first() is not None:
+            await self._session.execute(_aggregate_parent_statement(task_id))
+
+    async def set_task_status(self, task_id: str, status: TaskStatus) -> None:
+        await self._session.execute(_task_status_statement(task_id, status))
+        await self._finish_parent(task_id)
+        await self._session.commit()
+
+    async def complete_task(self, task_id: str) -> None:
+        """
+        Marks the task as completed, see SyncTaskService.complete_task.
+
+        :param task_id: ID of the task, whose results are stored in the model of the service.
+        """
+        await self._session.execute(_complete_task_statement(self._model, task_id))
+        await self._finish_parent(task_id)
+        await self._session.commit()
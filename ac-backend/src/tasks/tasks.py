@@ -7,24 +7,56 @@ from uuid import UUID
 from astropy import units
 from astropy.coordinates import SkyCoord
 from astropy.coordinates.name_resolve import NameResolveError
+from celery import group
 from celery.utils.log import get_task_logger
 from httpx import Client
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, select
 from sqlalchemy.orm import Session
 
 from src.export.model import ExportFile
 from src.tasks.service import SyncTaskService
-from src.core.celery.worker import celery_app, TaskWithSession
+from src.core.celery.event_loop import worker_event_loop
+from src.core.celery.worker import celery_app, TaskWithSession, engine
 from src.core.config.config import settings
-from src.plugin.interface.schemas import StellarObjectIdentificatorDto
-from src.tasks.model import StellarObjectIdentifier, PhotometricData, Task
-from src.tasks.schemas import ConeSearchRequestDto, FindObjectRequestDto
+from src.core.http_client.registry import http_clients
+from src.core.rate_limit.exceptions import ConcurrencySlotUnavailableException
+from src.core.rate_limit.limiter import RateLimiter
+from src.core.raw_data_cache.cache import evict_raw_data_cache, link_or_copy
+from src.plugin.interface.photometric_batch import as_photometric_batch
+from src.plugin.interface.catalog_plugin import BaseCatalogPlugin
+from src.plugin.interface.light_travel_time_cache import get_light_travel_time_cache
+from src.plugin.interface.schemas import (
+    PhotometricDataJobDto,
+    StellarObjectIdentificatorDto,
+)
+from src.tasks.async_execution import (
+    cone_search_async,
+    fetch_photometric_data_async,
+    iterate,
+)
+from src.tasks.model import (
+    PeriodogramPeak,
+    StellarObjectIdentifier,
+    PhotometricData,
+    Task,
+)
+from src.tasks.partitions import create_partitions, drop_expired_partitions
+from src.tasks.period_search import load_light_curves, search_periods
+from src.tasks.pipeline import PhotometricDataWriter
+from src.tasks.schemas import (
+    ConeSearchRequestDto,
+    FindObjectRequestDto,
+    MultiCatalogSearchRequestDto,
+    PeriodSearchRequestDto,
+)
 
 from src.tasks.types import TaskStatus
 
 
 logger = get_task_logger("celery_app")
 
+VSX_URL = "https://vsx.aavso.org/index.php"
+
 
 def resolve_name_to_coordinates(name: str, http_client: Client) -> SkyCoord:
     """
@@ -42,9 +74,7 @@ def resolve_name_to_coordinates(name: str, http_client: Client) -> SkyCoord:
         # try searching in VSX AAVSO
         if name is not None:
             params = {"format": "json", "view": "api.object", "ident": name}
-            query_resp = http_client.get(
-                "https://vsx.aavso.org/index.php", params=params
-            )
+            query_resp = http_client.get(VSX_URL, params=params)
             query_data = query_resp.json()
 
             if query_data["VSXObject"] != []:
@@ -66,7 +96,11 @@ def cone_search(
 ) -> None:
     """
     Performs a cone search operation by querying a plug-in instance based on the provided
-    coordinates and radius. Stores the found stellar objects in the DB.
+    coordinates and radius. Stores the found stellar objects in the DB. In the asyncio execution mode,
+    the cone search runs on the worker event loop.
+
+    The cone search cache of the plugin is checked first, if the cone is contained in a recently searched one,
+    the plugin is not called (see ConeSearchCache). Otherwise, the found stellar objects are cached.
 
     :param plugin_id: Unique identifier for the plugin instance.
     :param task_service: service used to store the results of the cone search operation.
@@ -75,12 +109,51 @@ def cone_search(
     :param task_id: Unique identifier for the task associated with the cone search.
     :return: None
     """
+    cone_search_cache = task_service.get_cone_search_cache(plugin_id)
+    cached = cone_search_cache.load(coords, radius_arcsec)
+    if cached is not None:
+        task_service.insert_identifiers(task_id, cached)
+        return
+    # the objects of the searches, which are not cached, are not kept in memory
+    collect = cone_search_cache.accepts(radius_arcsec)
+
+    if settings.WORKER_EXECUTION_MODE == "asyncio":
+        found = worker_event_loop.run(
+            cone_search_async(plugin_id, coords, radius_arcsec, task_id, collect)
+        )
+        cone_search_cache.store(coords, radius_arcsec, found)
+        return
+
     plugin = task_service.get_plugin_instance(plugin_id)
     resources_dir = settings.RESOURCES_DIR / str(plugin_id)
 
-    for data in plugin.list_objects(coords, radius_arcsec, plugin_id, resources_dir):
-        values = [{"identifier": dto.model_dump(), "task_id": task_id} for dto in data]
-        task_service.bulk_insert(values)
+    found = []
+    with task_service.get_rate_limiter(plugin_id).slot():
+        results = plugin.list_objects(coords, radius_arcsec, plugin_id, resources_dir)
+        for data in iterate(results, worker_event_loop):
+            task_service.insert_identifiers(task_id, data)
+            if collect:
+                found.extend(data)
+    cone_search_cache.store(coords, radius_arcsec, found)
+
+
+def reschedule_without_slot(
+    task: Any,
+    args: tuple[Any, ...],
+    queue: str,
+    error: ConcurrencySlotUnavailableException,
+) -> None:
+    """
+    Re-schedules the task, which did not get a concurrency slot of its catalog, so it does not hold the worker
+    while the catalog is saturated. The task stays in progress.
+
+    :param task: the Celery task instance.
+    :param args: arguments of the task.
+    :param queue: queue of the task.
+    :param error: the exception of the rate limiter.
+    """
+    task.apply_async(args=args, countdown=error.countdown, queue=queue)
+    logger.info(f"{error}, the task is re-scheduled (PID {os.getpid()})")
 
 
 @celery_app.task(bind=True, base=TaskWithSession)
@@ -111,6 +184,14 @@ def catalog_cone_search(self, task_id: str, query_dict: dict[Any, Any]):
             coords=coords,
             radius_arcsec=query.radius_arcsec,
         )
+    except ConcurrencySlotUnavailableException as e:
+        reschedule_without_slot(
+            self,
+            (task_id, query_dict),
+            task_service.get_task_queue(query.plugin_id),
+            e,
+        )
+        return
     except Exception:
         logger.error(
             f"Find stellar object task with has failed (PID {os.getpid()})\nTask ID: {task_id}\nQuery: {query_dict}",
@@ -120,7 +201,7 @@ def catalog_cone_search(self, task_id: str, query_dict: dict[Any, Any]):
         raise
     else:
         logger.info(f"Cone search task {task_id} completed (PID {os.getpid()})")
-        task_service.set_task_status(task_id, TaskStatus.completed)
+        task_service.complete_task(task_id)
 
 
 @celery_app.task(bind=True, base=TaskWithSession)
@@ -140,9 +221,7 @@ def find_stellar_object(self, task_id: str, query_dict: dict[Any, Any]):
     try:
         uuid = UUID(task_id)
         query = FindObjectRequestDto.model_validate(query_dict)
-        http_client = Client()
-        coords = resolve_name_to_coordinates(query.name, http_client)
-        http_client.close()
+        coords = resolve_name_to_coordinates(query.name, http_clients.client(VSX_URL))
         cone_search(
             plugin_id=query.plugin_id,
             task_service=task_service,
@@ -150,6 +229,14 @@ def find_stellar_object(self, task_id: str, query_dict: dict[Any, Any]):
             coords=coords,
             radius_arcsec=settings.OBJECT_SEARCH_RADIUS,
         )
+    except ConcurrencySlotUnavailableException as e:
+        reschedule_without_slot(
+            self,
+            (task_id, query_dict),
+            task_service.get_task_queue(query.plugin_id),
+            e,
+        )
+        return
     except Exception:
         logger.error(
             f"Find stellar object task with has failed (PID {os.getpid()})\nTask ID: {task_id}\nQuery: {query_dict}",
@@ -159,7 +246,170 @@ def find_stellar_object(self, task_id: str, query_dict: dict[Any, Any]):
         raise
     else:
         logger.info(f"Find stellar object task {task_id} completed (PID {os.getpid()})")
-        task_service.set_task_status(task_id, TaskStatus.completed)
+        task_service.complete_task(task_id)
+
+
+@celery_app.task(bind=True, base=TaskWithSession)
+def multi_catalog_search(
+    self, task_id: str, query_dict: dict[Any, Any], plugin_task_ids: dict[str, str]
+):
+    """
+    Celery task fanning out a search to multiple catalogs. The name of the stellar object, if given, is resolved
+    to the coordinates once, and a group of cone search tasks is sent to the queues of the plugins.
+    The task (the parent) is finished by its last finishing child, see SyncTaskService.complete_task.
+
+    :param self: Current task instance (bound task).
+    :param task_id: Unique identifier of the parent task.
+    :param query_dict: Query parameters
+    :param plugin_task_ids: IDs of the child tasks by the IDs of their plugins.
+    :return: None
+    """
+    task_service = SyncTaskService(self.session, StellarObjectIdentifier)
+    try:
+        query = MultiCatalogSearchRequestDto.model_validate(query_dict)
+        if query.name is not None:
+            coords = resolve_name_to_coordinates(
+                query.name, http_clients.client(VSX_URL)
+            )
+        else:
+            coords = SkyCoord(
+                ra=query.right_ascension_deg * units.degree,
+                dec=query.declination_deg * units.degree,
+                frame="icrs",
+            )
+
+        children = [
+            catalog_cone_search.signature(
+                (
+                    child_task_id,
+                    ConeSearchRequestDto(
+                        plugin_id=UUID(plugin_id),
+                        right_ascension_deg=coords.icrs.ra.degree,
+                        declination_deg=coords.icrs.dec.degree,
+                        radius_arcsec=query.radius_arcsec,
+                    ).model_dump(),
+                ),
+                queue=task_service.get_task_queue(UUID(plugin_id)),
+            )
+            for plugin_id, child_task_id in plugin_task_ids.items()
+        ]
+        group(children).apply_async()
+    except Exception:
+        logger.error(
+            f"Multi-catalog search task has failed (PID {os.getpid()})\nTask ID: {task_id}\nQuery: {query_dict}",
+            exc_info=True,
+        )
+        # the parent fails with its last child
+        for child_task_id in plugin_task_ids.values():
+            task_service.set_task_status(child_task_id, TaskStatus.failed)
+        raise
+
+    logger.info(
+        f"Multi-catalog search task {task_id} sent {len(children)} cone searches (PID {os.getpid()})"
+    )
+
+
+def poll_photometric_data_job(
+    plugin: BaseCatalogPlugin[StellarObjectIdentificatorDto],
+    rate_limiter: RateLimiter,
+    task_service: SyncTaskService,
+    task_id: str,
+    identificator: StellarObjectIdentificatorDto,
+) -> PhotometricDataJobDto | None:
+    """
+    Submits or polls the job of the plugin, which prepares the photometric data on the catalog server,
+    and stores the job on the task, so the next run of the task continues with it.
+
+    :param plugin: the plugin of the identificator.
+    :param rate_limiter: rate limiter of the catalog of the plugin.
+    :param task_service: service used to store the job.
+    :param task_id: The unique identifier of the task being processed.
+    :param identificator: The stellar object identificator corresponding to the plugin.
+    :return: the job, None if the plugin does not prepare the data by a job.
+    :raises TimeoutError: if the job is not ready within PHOTOMETRIC_DATA_JOB_TIMEOUT.
+    """
+    # the method is optional for the plugins, which do not derive from the plugin base classes
+    poll = getattr(plugin, "poll_photometric_data", None)
+    if poll is None:
+        return None
+
+    stored_job, task_age = task_service.get_task_job(task_id)
+    with rate_limiter.slot():
+        job: PhotometricDataJobDto | None = poll(identificator, stored_job)
+    if job is None:
+        return None
+
+    if not job.ready and task_age > settings.PHOTOMETRIC_DATA_JOB_TIMEOUT:
+        raise TimeoutError(
+            f"The photometric data were not prepared by the catalog server within {task_age:.0f} s"
+        )
+
+    task_service.set_task_job(task_id, job)
+    return job
+
+
+def poll_photometric_data_jobs(
+    plugin: BaseCatalogPlugin[StellarObjectIdentificatorDto],
+    rate_limiter: RateLimiter,
+    task_service: SyncTaskService,
+    task_ids: list[str],
+    identificators: list[StellarObjectIdentificatorDto],
+) -> list[PhotometricDataJobDto | None]:
+    """
+    Submits or polls the jobs of the plugin for multiple stellar objects at once, see poll_photometric_data_job.
+    The job of each stellar object is stored on its task.
+
+    :param plugin: the plugin of the identificators.
+    :param rate_limiter: rate limiter of the catalog of the plugin.
+    :param task_service: service used to store the jobs.
+    :param task_ids: The unique identifiers of the tasks, one per identificator.
+    :param identificators: The stellar object identificators corresponding to the plugin.
+    :return: the jobs, one per identificator, None for the identificators without a job.
+    :raises TimeoutError: if a job is not ready within PHOTOMETRIC_DATA_JOB_TIMEOUT.
+    :raises ValueError: if the plugin does not return a job per identificator.
+    """
+    # the method is optional for the plugins, which do not derive from the plugin base classes
+    poll = getattr(plugin, "poll_photometric_data_batch", None)
+    if poll is None:
+        return [None] * len(identificators)
+
+    stored = [task_service.get_task_job(task_id) for task_id in task_ids]
+    with rate_limiter.slot():
+        jobs: list[PhotometricDataJobDto | None] = poll(
+            identificators, [stored_job for stored_job, _ in stored]
+        )
+    if len(jobs) != len(identificators):
+        raise ValueError(
+            f"The plugin returned {len(jobs)} jobs for {len(identificators)} identificators"
+        )
+
+    task_age = max(age for _, age in stored)
+    if (
+        any(job is not None and not job.ready for job in jobs)
+        and task_age > settings.PHOTOMETRIC_DATA_JOB_TIMEOUT
+    ):
+        raise TimeoutError(
+            f"The photometric data were not prepared by the catalog server within {task_age:.0f} s"
+        )
+
+    for task_id, job in zip(task_ids, jobs):
+        task_service.set_task_job(task_id, job)
+    return jobs
+
+
+def link_source_raw_data(source_task_id: UUID, csv_path: Path) -> None:
+    """
+    Provides the raw data of the task, whose photometric data were reused, as the raw data of the reusing task.
+
+    :param source_task_id: ID of the task, whose photometric data were copied.
+    :param csv_path: path of the CSV file of the reusing task.
+    """
+    try:
+        link_or_copy(
+            Path.joinpath(settings.TEMP_DIR, f"{source_task_id}.csv"), csv_path
+        )
+    except OSError as e:
+        logger.warning(f"Raw data of task {source_task_id} were not reused: {e}")
 
 
 @celery_app.task(bind=True, base=TaskWithSession)
@@ -170,6 +420,13 @@ def get_photometric_data(
     Celery task to retrieve photometric data from a plugin based on a provided stellar object
     identificator. The resulting data is stored into a database.
 
+    If the plugin prepares the data by a job on the catalog server (see CatalogPlugin.poll_photometric_data),
+    the task does not wait for the job. It stores the job and re-schedules itself, until the job is ready.
+    The task re-schedules itself as well, if no concurrency slot of the catalog is free (see RateLimiter).
+
+    If the data of the same stellar object were retrieved from the same plugin recently, they are copied
+    from the completed task instead of calling the plugin, see SyncTaskService.reuse_photometric_data.
+
     :param self: The Celery task instance, automatically passed when executed.
     :param task_id: The unique identifier of the task being processed.
     :param identificator_dict: A dictionary representing the stellar object identificator corresponding to the plugin.
@@ -183,12 +440,76 @@ def get_photometric_data(
 
     try:
         identificator = StellarObjectIdentificatorDto.model_validate(identificator_dict)
+        source_task_id = task_service.reuse_photometric_data(task_id, identificator)
+        if source_task_id is not None:
+            link_source_raw_data(source_task_id, csv_path)
+            logger.info(
+                f"Get photometric data task {task_id} reused the data of task {source_task_id} (PID {os.getpid()})"
+            )
+            return
+
         plugin = task_service.get_plugin_instance(identificator.plugin_id)
-        resources_dir = settings.RESOURCES_DIR / str(identificator.plugin_id)
+        rate_limiter = task_service.get_rate_limiter(identificator.plugin_id)
+        raw_data_cache = task_service.get_raw_data_cache(identificator.plugin_id)
 
-        for data in plugin.get_photometric_data(identificator, csv_path, resources_dir):
-            values = [{**dto.model_dump(), "task_id": task_id} for dto in data]
-            task_service.bulk_insert(values)
+        # the plugin does not queue a job for the cached raw data
+        with raw_data_cache.scope():
+            job = poll_photometric_data_job(
+                plugin, rate_limiter, task_service, task_id, identificator
+            )
+        if job is not None and not job.ready:
+            self.apply_async(
+                args=(task_id, identificator_dict, csv_path_str),
+                countdown=job.countdown,
+                queue=task_service.get_task_queue(identificator.plugin_id),
+            )
+            logger.info(
+                f"Get photometric data task {task_id} waits {job.countdown} s for the catalog server (PID {os.getpid()})"
+            )
+            return
+
+        if settings.WORKER_EXECUTION_MODE == "asyncio":
+            worker_event_loop.run(
+                fetch_photometric_data_async(
+                    UUID(task_id),
+                    plugin,
+                    rate_limiter,
+                    raw_data_cache,
+                    identificator,
+                    csv_path,
+                    job,
+                )
+            )
+        else:
+            resources_dir = settings.RESOURCES_DIR / str(identificator.plugin_id)
+
+            # the plugin produces the batches while the writer thread inserts them
+            with (
+                rate_limiter.slot(),
+                raw_data_cache.scope(),
+                PhotometricDataWriter(
+                    task_id=UUID(task_id),
+                    session_factory=lambda: Session(
+                        bind=engine, expire_on_commit=False
+                    ),
+                    max_pending=settings.PHOTOMETRIC_DATA_MAX_PENDING_BATCHES,
+                ) as writer,
+            ):
+                # the ready job is passed only to the plugins, which prepare the data by a job
+                job_kwargs = {} if job is None else {"job": job}
+                results = plugin.get_photometric_data(
+                    identificator, csv_path, resources_dir, **job_kwargs
+                )
+                for data in iterate(results, worker_event_loop):
+                    writer.put(as_photometric_batch(data))
+    except ConcurrencySlotUnavailableException as e:
+        reschedule_without_slot(
+            self,
+            (task_id, identificator_dict, csv_path_str),
+            task_service.get_task_queue(identificator.plugin_id),
+            e,
+        )
+        return
     except Exception:
         logger.error(
             f"Get photometric data task with has failed (PID {os.getpid()})\nTask ID: {task_id}\nIdentificator: {identificator_dict}",
@@ -199,7 +520,165 @@ def get_photometric_data(
 
     else:
         logger.info(f"Find stellar object task {task_id} completed (PID {os.getpid()})")
-        task_service.set_task_status(task_id, TaskStatus.completed)
+        task_service.complete_task(task_id)
+
+
+@celery_app.task(bind=True, base=TaskWithSession)
+def get_photometric_data_batch(
+    self,
+    task_ids: list[str],
+    identificator_dicts: list[dict[str, Any]],
+    csv_path_strs: list[str],
+):
+    """
+    Celery task to retrieve photometric data of multiple stellar objects of a single plugin at once,
+    see CatalogPlugin.get_photometric_data_batch. Each stellar object has its own task, the batches
+    yielded by the plugin are stored under the task of their identificator. The tasks are completed together,
+    or all of them fail. The tasks, whose data are reused from recent tasks (see get_photometric_data),
+    are completed first and the plugin retrieves only the remaining ones.
+
+    If the plugin prepares the data by jobs (see CatalogPlugin.poll_photometric_data_batch), the jobs are stored
+    on the tasks and the task re-schedules itself, until all jobs are ready.
+
+    :param self: The Celery task instance, automatically passed when executed.
+    :param task_ids: The unique identifiers of the tasks, one per identificator.
+    :param identificator_dicts: Dictionaries representing the stellar object identificators of the plugin.
+    :param csv_path_strs: The string paths of the CSV files to which the data are saved, one per identificator.
+    :return: None
+    """
+    task_service = SyncTaskService(self.session, PhotometricData)
+    # the tasks completed by reusing the data of recent tasks do not fail with the others
+    reused_task_ids: set[str] = set()
+
+    try:
+        identificators = [
+            StellarObjectIdentificatorDto.model_validate(identificator_dict)
+            for identificator_dict in identificator_dicts
+        ]
+        remaining = []
+        for task_id, identificator, identificator_dict, csv_path_str in zip(
+            task_ids, identificators, identificator_dicts, csv_path_strs
+        ):
+            source_task_id = task_service.reuse_photometric_data(task_id, identificator)
+            if source_task_id is None:
+                remaining.append(
+                    (task_id, identificator, identificator_dict, csv_path_str)
+                )
+            else:
+                reused_task_ids.add(task_id)
+                link_source_raw_data(source_task_id, Path(csv_path_str))
+        if not remaining:
+            logger.info(
+                f"Get photometric data batch of {len(task_ids)} tasks reused the data of other tasks (PID {os.getpid()})"
+            )
+            return
+        task_ids = [task_id for task_id, _, _, _ in remaining]
+        identificators = [identificator for _, identificator, _, _ in remaining]
+        identificator_dicts = [
+            identificator_dict for _, _, identificator_dict, _ in remaining
+        ]
+        csv_path_strs = [csv_path_str for _, _, _, csv_path_str in remaining]
+
+        task_uuids = [UUID(task_id) for task_id in task_ids]
+        plugin_id = identificators[0].plugin_id
+        plugin = task_service.get_plugin_instance(plugin_id)
+        rate_limiter = task_service.get_rate_limiter(plugin_id)
+        raw_data_cache = task_service.get_raw_data_cache(plugin_id)
+        resources_dir = settings.RESOURCES_DIR / str(plugin_id)
+
+        # the plugin does not queue the jobs of the cached raw data
+        with raw_data_cache.scope():
+            jobs = poll_photometric_data_jobs(
+                plugin, rate_limiter, task_service, task_ids, identificators
+            )
+        countdowns = [
+            job.countdown for job in jobs if job is not None and not job.ready
+        ]
+        if countdowns:
+            self.apply_async(
+                args=(task_ids, identificator_dicts, csv_path_strs),
+                countdown=min(countdowns),
+                queue=task_service.get_task_queue(plugin_id),
+            )
+            logger.info(
+                f"Get photometric data batch of {len(task_ids)} tasks waits {min(countdowns)} s for the catalog server (PID {os.getpid()})"
+            )
+            return
+        # the ready jobs are passed only to the plugins, which prepare the data by jobs
+        jobs_kwargs = {} if all(job is None for job in jobs) else {"jobs": jobs}
+
+        with (
+            rate_limiter.slot(),
+            raw_data_cache.scope(),
+            PhotometricDataWriter(
+                task_id=task_uuids[0],
+                session_factory=lambda: Session(bind=engine, expire_on_commit=False),
+                max_pending=settings.PHOTOMETRIC_DATA_MAX_PENDING_BATCHES,
+            ) as writer,
+        ):
+            results = plugin.get_photometric_data_batch(
+                identificators,
+                [Path(path) for path in csv_path_strs],
+                resources_dir,
+                **jobs_kwargs,
+            )
+            for index, data in iterate(results, worker_event_loop):
+                writer.put(as_photometric_batch(data), task_id=task_uuids[index])
+    except ConcurrencySlotUnavailableException as e:
+        reschedule_without_slot(
+            self,
+            (task_ids, identificator_dicts, csv_path_strs),
+            task_service.get_task_queue(plugin_id),
+            e,
+        )
+        return
+    except Exception:
+        logger.error(
+            f"Get photometric data batch task has failed (PID {os.getpid()})\nTask IDs: {task_ids}\nIdentificators: {identificator_dicts}",
+            exc_info=True,
+        )
+        for task_id in task_ids:
+            if task_id not in reused_task_ids:
+                task_service.set_task_status(task_id, TaskStatus.failed)
+        raise
+    else:
+        logger.info(
+            f"Get photometric data batch of {len(task_ids)} tasks completed (PID {os.getpid()})"
+        )
+        for task_id in task_ids:
+            task_service.complete_task(task_id)
+
+
+@celery_app.task(bind=True, base=TaskWithSession)
+def period_search(self, task_id: str, query_dict: dict[str, Any]):
+    """
+    Celery task to search the periods of the photometric data of other tasks by the Lomb-Scargle,
+    and optionally the Box Least Squares periodogram. The highest peaks of the periodograms
+    are stored into the database.
+
+    :param self: The Celery task instance, automatically passed when executed.
+    :param task_id: The unique identifier of the task being processed.
+    :param query_dict: Query parameters
+    :return: None
+    """
+    task_service = SyncTaskService(self.session, PeriodogramPeak)
+
+    try:
+        uuid = UUID(task_id)
+        query = PeriodSearchRequestDto.model_validate(query_dict)
+        light_curves = load_light_curves(self.session, query.task_ids)
+        peaks = search_periods(light_curves, query)
+        task_service.bulk_insert([{"task_id": uuid, **peak} for peak in peaks])
+    except Exception:
+        logger.error(
+            f"Period search task has failed (PID {os.getpid()})\nTask ID: {task_id}\nQuery: {query_dict}",
+            exc_info=True,
+        )
+        task_service.set_task_status(task_id, TaskStatus.failed)
+        raise
+    else:
+        logger.info(f"Period search task {task_id} completed (PID {os.getpid()})")
+        task_service.complete_task(task_id)
 
 
 @celery_app.task(bind=True, base=TaskWithSession)
@@ -207,7 +686,8 @@ def clear_task_data(self):
     """
     Clear old task data, including associated export files stored on the disk and database entries for
     photometric data and identifiers that are older than a specified interval. The interval
-    is defined by the TASK_DATA_DELETE_INTERVAL setting.
+    is defined by the TASK_DATA_DELETE_INTERVAL setting. The light travel time cache and the raw data cache
+    are evicted down to LIGHT_TRAVEL_TIME_CACHE_MAX_BYTES and RAW_DATA_CACHE_MAX_BYTES.
 
     :return: None
     """
@@ -241,14 +721,29 @@ def clear_task_data(self):
         )
         raise
 
-    # remove task data
-    stmt = delete(Task).where(
-        Task.created_at
-        < (datetime.now() - timedelta(hours=settings.TASK_DATA_DELETE_INTERVAL))
-    )
+    # remove task data, whole partitions are dropped first, so the cascading delete of the tasks
+    # only removes the few rows in the default partition or inserted after the cutoff.
+    # The time of the DB is used, as it sets created_at of the tasks and their results
+    now: datetime = session.execute(select(func.localtimestamp())).scalar_one()
+    cutoff = now - timedelta(hours=settings.TASK_DATA_DELETE_INTERVAL)
+    stmt = delete(Task).where(Task.created_at < cutoff)
     try:
+        dropped = drop_expired_partitions(session, cutoff)
+        logger.info(f"Dropped expired task data partitions: {dropped}")
+
         session.execute(stmt)
         logger.info("Deleted expired Tasks")
+
+        # the task runs every TASK_DATA_DELETE_INTERVAL hours, the partitions are created ahead
+        # until the run after the next one
+        created = create_partitions(
+            session,
+            now,
+            now + timedelta(hours=2 * settings.TASK_DATA_DELETE_INTERVAL),
+            settings.TASK_DATA_PARTITION_INTERVAL,
+        )
+        logger.info(f"Created task data partitions: {created}")
+        session.commit()
     except Exception:
         logger.error(
             f"Clear task data task has failed (PID {os.getpid()})",
@@ -284,3 +779,12 @@ def clear_task_data(self):
             exc_info=True,
         )
         raise
+
+    # the correction tables of the time conversions are kept within their disk budget
+    light_travel_time_cache = get_light_travel_time_cache()
+    if light_travel_time_cache is not None:
+        evicted = light_travel_time_cache.evict()
+        logger.info(f"Evicted {evicted} light travel time cache tables")
+
+    evicted = evict_raw_data_cache()
+    logger.info(f"Evicted {evicted} raw data cache entries")
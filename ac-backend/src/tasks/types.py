@@ -10,3 +10,9 @@ class TaskStatus(Enum):
 class TaskType(Enum):
     object_search = "OBJECT_SEARCH"
     photometric_data = "PHOTOMETRIC_DATA"
+    period_search = "PERIOD_SEARCH"
+
+
+class PeriodSearchMethod(Enum):
+    lomb_scargle = "LOMB_SCARGLE"
+    box_least_squares = "BOX_LEAST_SQUARES"
@@ -0,0 +1,77 @@
+import logging
+import time
+
+from astropy.time import Time
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.plugin.interface.catalog_plugin import BaseCatalogPlugin
+from src.plugin.interface.schemas import StellarObjectIdentificatorDto
+from src.plugin.model import Plugin
+from src.tasks.service import SyncTaskService
+
+logger = logging.getLogger("celery_app")
+
+
+def preload_plugins(session: Session) -> int:
+    """
+    Loads all uploaded plugins into the plugin cache of the process, so their modules, including
+    the libraries imported by them, are executed before the first task. Plugins, which fail to load,
+    are skipped, the tasks using them report the error.
+
+    :param session: DB session.
+    :return: number of loaded plugins.
+    """
+    plugin_ids = session.scalars(
+        select(Plugin.id).where(Plugin.file_name.is_not(None))
+    ).all()
+    task_service = SyncTaskService(session, None)
+
+    loaded = 0
+    for plugin_id in plugin_ids:
+        try:
+            task_service.get_plugin_instance(plugin_id)
+            loaded += 1
+        except Exception:
+            logger.warning(f"Could not preload plugin {plugin_id}", exc_info=True)
+    return loaded
+
+
+def convert_dummy_time() -> None:
+    """
+    Converts the current time to BJD_TDB from the heliocentric and geocentric frames, which loads
+    the IERS tables, the solar system ephemeris and the light travel time cache of the process.
+    """
+    # the helpers of the base class do not need a catalog
+    plugin = BaseCatalogPlugin[StellarObjectIdentificatorDto]()
+    now = Time.now().jd
+    for reference_frame in ("heliocentric", "geocentric"):
+        plugin._to_bjd_tdb(now, "jd", "utc", reference_frame, 0.0, 0.0)
+
+
+def warm_up_worker(session: Session) -> None:
+    """
+    Pays the one-time costs of a worker process before it accepts the first task. A failure of the warm-up
+    is only logged, the costs are then paid by the first task.
+
+    :param session: DB session.
+    """
+    start = time.perf_counter()
+    try:
+        loaded = preload_plugins(session)
+    except Exception:
+        logger.warning("Could not preload the plugins", exc_info=True)
+        loaded = 0
+    plugins_loaded = time.perf_counter()
+
+    try:
+        convert_dummy_time()
+    except Exception:
+        logger.warning("Could not warm up the time conversion", exc_info=True)
+    finished = time.perf_counter()
+
+    logger.info(
+        f"Worker warm-up finished in {finished - start:.2f} s: "
+        f"{loaded} plugins loaded in {plugins_loaded - start:.2f} s, "
+        f"time conversion in {finished - plugins_loaded:.2f} s"
+    )
@@ -0,0 +1,274 @@
+import asyncio
+import threading
+import uuid
+
+import pytest
+from sqlalchemy import select
+
+from src.core.celery.event_loop import WorkerEventLoop
+from src.core.config.config import settings
+from src.plugin.interface.async_catalog_plugin import AsyncCatalogPlugin
+from src.plugin.interface.schemas import (
+    PhotometricDataDto,
+    StellarObjectIdentificatorDto,
+)
+from src.tasks import async_execution
+from src.tasks import tasks as tasks_module
+from src.tasks.async_execution import (
+    ThreadedPluginAdapter,
+    as_async_plugin,
+    iterate,
+    iterate_in_loop,
+    iterate_in_thread,
+)
+from src.tasks.model import PhotometricData, StellarObjectIdentifier, Task
+from src.tasks.types import TaskStatus
+
+# reuses the eager Celery configuration and the HTTP client of the task integration tests
+from tests.test_task_integration import (  # noqa: F401
+    client,
+    configure_celery_for_tests,
+    fastapi_app,
+)
+
+
+@pytest.fixture
+def event_loop_thread():
+    worker_loop = WorkerEventLoop(2)
+    yield worker_loop
+    worker_loop.loop.call_soon_threadsafe(worker_loop.loop.stop)
+
+
+@pytest.fixture
+def asyncio_mode(monkeypatch):
+    monkeypatch.setattr(settings, "WORKER_EXECUTION_MODE", "asyncio")
+
+
+def test_iterate_in_thread_runs_blocking_generator_outside_loop(event_loop_thread):
+    threads = []
+
+    def numbers():
+        for i in range(3):
+            threads.append(threading.current_thread())
+            yield i
+
+    async def collect():
+        return [item async for item in iterate_in_thread(numbers)]
+
+    assert event_loop_thread.run(collect()) == [0, 1, 2]
+
+    async def current_thread():
+        return threading.current_thread()
+
+    loop_thread = event_loop_thread.run(current_thread())
+    assert loop_thread.name == "worker-event-loop"
+    assert all(thread is not loop_thread for thread in threads)
+
+
+def test_iterate_in_loop_and_iterate(event_loop_thread):
+    async def numbers():
+        for i in range(3):
+            await asyncio.sleep(0)
+            yield i
+
+    assert list(iterate_in_loop(numbers(), event_loop_thread)) == [0, 1, 2]
+    assert list(iterate(numbers(), event_loop_thread)) == [0, 1, 2]
+
+    sync_results = [[1], [2]]
+    assert iterate(sync_results, event_loop_thread) is sync_results
+
+
+def test_iterate_in_loop_propagates_errors(event_loop_thread):
+    async def failing():
+        yield 1
+        raise ValueError("catalog unavailable")
+
+    iterator = iterate_in_loop(failing(), event_loop_thread)
+    assert next(iterator) == 1
+    with pytest.raises(ValueError, match="catalog unavailable"):
+        next(iterator)
+
+
+def test_threaded_plugin_adapter(event_loop_thread):
+    plugin_id = uuid.uuid4()
+
+    class FakePlugin:
+        def list_objects(self, coords, radius_arcsec, plugin_id_arg, resources_dir):
+            assert radius_arcsec == 30
+            yield [
+                StellarObjectIdentificatorDto(
+                    plugin_id=plugin_id_arg,
+                    ra_deg=10.0,
+                    dec_deg=-20.0,
+                    name="Star A",
+                    dist_arcsec=1.0,
+                )
+            ]
+
+    adapter = as_async_plugin(FakePlugin())
+    assert isinstance(adapter, ThreadedPluginAdapter)
+
+    async def collect():
+        return [
+            batch async for batch in adapter.list_objects(None, 30, plugin_id, None)
+        ]
+
+    batches = event_loop_thread.run(collect())
+    assert [dto.name for dto in batches[0]] == ["Star A"]
+
+
+def test_async_plugin_is_not_adapted():
+    class FakeAsyncPlugin(AsyncCatalogPlugin[StellarObjectIdentificatorDto]):
+        async def list_objects(self, coords, radius_arcsec, plugin_id, resources_dir):
+            yield []
+
+        async def get_photometric_data(self, identificator, csv_path, resources_dir):
+            yield []
+
+    plugin = FakeAsyncPlugin()
+    assert as_async_plugin(plugin) is plugin
+
+
+@pytest.mark.asyncio
+async def test_cone_search_in_asyncio_mode(
+    client,  # noqa: F811
+    db_session,
+    override_directories,
+    monkeypatch,
+    asyncio_mode,
+):
+    """
+    HTTP -> router -> Celery (eager) -> worker event loop -> async plugin -> AsyncTaskService -> DB
+    """
+    plugin_id = uuid.uuid4()
+
+    class FakeAsyncPlugin(AsyncCatalogPlugin[StellarObjectIdentificatorDto]):
+        async def list_objects(
+            self, coords, radius_arcsec, plugin_id_arg, resources_dir
+        ):
+            for name, dist in (("Star A", 1.0), ("Star B", 2.0)):
+                await asyncio.sleep(0)
+                yield [
+                    StellarObjectIdentificatorDto(
+                        plugin_id=plugin_id_arg,
+                        ra_deg=10.0,
+                        dec_deg=-20.0,
+                        name=name,
+                        dist_arcsec=dist,
+                    )
+                ]
+
+        async def get_photometric_data(self, identificator, csv_path, resources_dir):
+            yield []
+
+    async def fake_get_plugin_instance(self, plugin_id_param):
+        assert plugin_id_param == plugin_id
+        return FakeAsyncPlugin()
+
+    monkeypatch.setattr(
+        async_execution.AsyncTaskService,
+        "get_plugin_instance",
+        fake_get_plugin_instance,
+        raising=True,
+    )
+
+    resp = await client.post(
+        f"/tasks/submit-task/{plugin_id}/cone-search",
+        json={
+            "right_ascension_deg": 10.0,
+            "declination_deg": -20.0,
+            "radius_arcsec": 30.0,
+            "plugin_id": str(plugin_id),
+        },
+    )
+
+    assert resp.status_code == 200
+    task_id = uuid.UUID(resp.json()["task_id"])
+
+    task_obj = (
+        await db_session.execute(select(Task).where(Task.id == task_id))
+    ).scalar_one()
+    assert task_obj.status == TaskStatus.completed
+    assert task_obj.result_count == 2
+
+    identifiers = (
+        (
+            await db_session.execute(
+                select(StellarObjectIdentifier).where(
+                    StellarObjectIdentifier.task_id == task_id
+                )
+            )
+        )
+        .scalars()
+        .all()
+    )
+    assert {i.identifier["name"] for i in identifiers} == {"Star A", "Star B"}
+
+
+@pytest.mark.asyncio
+async def test_sync_plugin_photometric_data_in_asyncio_mode(
+    client,  # noqa: F811
+    db_session,
+    override_directories,
+    monkeypatch,
+    asyncio_mode,
+):
+    """
+    Sync plugins are run in threads by the asyncio execution mode.
+    """
+    plugin_id = uuid.uuid4()
+
+    class FakePlugin:
+        def get_photometric_data(self, identificator, csv_path, resources_dir):
+            assert identificator.name == "TestStar"
+            yield [
+                PhotometricDataDto(
+                    plugin_id=plugin_id,
+                    julian_date=2450000.5 + i,
+                    magnitude=12.3,
+                    magnitude_error=0.01,
+                    light_filter="V",
+                )
+                for i in range(3)
+            ]
+
+    def fake_get_plugin_instance(self, plugin_id_param):
+        return FakePlugin()
+
+    monkeypatch.setattr(
+        tasks_module.SyncTaskService,
+        "get_plugin_instance",
+        fake_get_plugin_instance,
+        raising=True,
+    )
+
+    resp = await client.post(
+        f"/tasks/submit-task/{plugin_id}/photometric-data",
+        json={
+            "plugin_id": str(plugin_id),
+            "ra_deg": 12.3,
+            "dec_deg": -45.6,
+            "name": "TestStar",
+            "dist_arcsec": 1.23,
+        },
+    )
+
+    assert resp.status_code == 200
+    task_id = uuid.UUID(resp.json()["task_id"])
+
+    task_obj = (
+        await db_session.execute(select(Task).where(Task.id == task_id))
+    ).scalar_one()
+    assert task_obj.status == TaskStatus.completed
+    assert task_obj.result_count == 3
+
+    records = (
+        (
+            await db_session.execute(
+                select(PhotometricData).where(PhotometricData.task_id == task_id)
+            )
+        )
+        .scalars()
+        .all()
+    )
+    assert sorted(r.julian_date for r in records) == [2450000.5, 2450001.5, 2450002.5]
@@ -0,0 +1,206 @@
+import uuid
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+
+from src.core.raw_data_cache.cache import RawDataCache
+from src.plugin.default_plugins.atlas.atlas_plugin import (
+    AtlasIdentificatorDto,
+    AtlasPlugin,
+)
+from src.plugin.interface.schemas import PhotometricDataJobDto
+
+TASK_URL = "https://fallingstar-data.com/forcedphot/queue/1/"
+RESULT_URL = "https://fallingstar-data.com/forcedphot/static/results/job1.txt"
+RESULT = (
+    "###MJD m dm uJy duJy F err chi/N RA Dec x y maj min phi apfit mag5sig Sky Obs\n"
+    "57000.5 15.2 0.05 300 20 o 0 1.1 10.0 -20.0 5000 5000 2.5 2.4 10 -0.4 19.1 20.5 02a57000o0001c\n"
+)
+
+
+@pytest.fixture
+def identificator():
+    return AtlasIdentificatorDto(
+        plugin_id=uuid.uuid4(), ra_deg=10.0, dec_deg=-20.0, name=None, dist_arcsec=0
+    )
+
+
+def atlas_plugin(handler) -> AtlasPlugin:
+    plugin = AtlasPlugin()
+    plugin._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+    return plugin
+
+
+def test_poll_queues_job(identificator):
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.method == "POST"
+        return httpx.Response(201, json=[{"url": TASK_URL}])
+
+    job = atlas_plugin(handler).poll_photometric_data(identificator, None)
+
+    assert job.state == {"task_url": TASK_URL}
+    assert not job.ready
+    assert job.countdown == AtlasPlugin._POLL_INTERVAL_SECONDS
+
+
+@pytest.mark.parametrize(
+    "detail, countdown",
+    [
+        ("Request was throttled. Expected available in 42 seconds.", 42),
+        ("Request was throttled. Expected available in 2 minutes.", 120),
+        ("Request was throttled.", 10),
+    ],
+)
+def test_poll_throttled_queue(identificator, detail, countdown):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(429, json=[{"detail": detail}])
+
+    job = atlas_plugin(handler).poll_photometric_data(identificator, None)
+
+    # the job is queued again by the next poll
+    assert job.state == {}
+    assert not job.ready
+    assert job.countdown == countdown
+
+
+def test_poll_queued_job(identificator):
+    finished = False
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.method == "GET" and str(request.url) == TASK_URL
+        return httpx.Response(
+            200,
+            json={
+                "finishtimestamp": "2026-10-17T12:00:00Z" if finished else None,
+                "result_url": RESULT_URL if finished else None,
+            },
+        )
+
+    plugin = atlas_plugin(handler)
+    queued = PhotometricDataJobDto(state={"task_url": TASK_URL}, countdown=5)
+
+    job = plugin.poll_photometric_data(identificator, queued)
+    assert not job.ready
+    assert job.state == {"task_url": TASK_URL}
+
+    finished = True
+    job = plugin.poll_photometric_data(identificator, queued)
+    assert job.ready
+    assert job.state == {"task_url": TASK_URL, "result_url": RESULT_URL}
+
+
+def test_poll_queue_error(identificator):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(401, json=[{"detail": "Invalid token."}])
+
+    with pytest.raises(httpx.HTTPStatusError):
+        atlas_plugin(handler).poll_photometric_data(identificator, None)
+
+
+def test_photometric_data_batch(identificator, tmp_path, monkeypatch):
+    monkeypatch.setattr(AtlasPlugin, "_POLL_INTERVAL_SECONDS", 0)
+    task_urls = [f"https://fallingstar-data.com/forcedphot/queue/{i}/" for i in (1, 2)]
+    polls = {task_url: 0 for task_url in task_urls}
+    deleted = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        if request.method == "POST":
+            # both targets are queued by a single request
+            form = parse_qs(request.content.decode())
+            assert form["radeclist"] == ["10.0 -20.0\n11.0 -20.0"]
+            return httpx.Response(201, json=[{"url": url} for url in task_urls])
+        if request.method == "DELETE":
+            deleted.append(url)
+            return httpx.Response(204)
+        if url in polls:
+            polls[url] += 1
+            # the second job finishes later
+            finished = url == task_urls[0] or polls[url] > 1
+            return httpx.Response(
+                200,
+                json={
+                    "finishtimestamp": "2026-10-17T12:00:00Z" if finished else None,
+                    "result_url": f"{url}result.txt" if finished else None,
+                },
+            )
+        return httpx.Response(200, text=RESULT)
+
+    identificators = [
+        identificator,
+        identificator.model_copy(update={"ra_deg": 11.0}),
+    ]
+    csv_paths = [tmp_path / "first.txt", tmp_path / "second.txt"]
+
+    results = list(
+        atlas_plugin(handler).get_photometric_data_batch(
+            identificators, csv_paths, tmp_path
+        )
+    )
+
+    assert [index for index, _ in results] == [0, 1]
+    assert all(len(batch) == 1 for _, batch in results)
+    assert polls == {task_urls[0]: 1, task_urls[1]: 2}
+    assert deleted == task_urls
+    assert all(csv_path.read_text() == RESULT for csv_path in csv_paths)
+
+
+def test_cached_targets_are_not_queued(identificator, tmp_path, monkeypatch):
+    monkeypatch.setattr(AtlasPlugin, "_POLL_INTERVAL_SECONDS", 0)
+    raw_cache = RawDataCache(identificator.plugin_id, ttl=60, directory=tmp_path)
+    # the statistics are not recorded without Redis
+    monkeypatch.setattr(RawDataCache, "_record", lambda *args, **kwargs: None)
+    cached_path = tmp_path / "cached.txt"
+    cached_path.write_text(RESULT)
+    raw_cache.store(identificator, cached_path)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            # only the target, which is not cached
+            form = parse_qs(request.content.decode())
+            assert form["radeclist"] == ["11.0 -20.0"]
+            return httpx.Response(201, json=[{"url": TASK_URL}])
+        if request.method == "DELETE":
+            return httpx.Response(204)
+        if str(request.url) == TASK_URL:
+            return httpx.Response(
+                200,
+                json={
+                    "finishtimestamp": "2026-10-17T12:00:00Z",
+                    "result_url": RESULT_URL,
+                },
+            )
+        return httpx.Response(200, text=RESULT)
+
+    plugin = atlas_plugin(handler)
+    identificators = [
+        identificator,
+        identificator.model_copy(update={"ra_deg": 11.0}),
+    ]
+    csv_paths = [tmp_path / "first.txt", tmp_path / "second.txt"]
+
+    with raw_cache.scope():
+        # no job is queued, the task retrieves the cached data directly
+        assert plugin.poll_photometric_data(identificator, None) is None
+        results = list(
+            plugin.get_photometric_data_batch(identificators, csv_paths, tmp_path)
+        )
+
+    assert [index for index, _ in results] == [0, 1]
+    assert all(csv_path.read_text() == RESULT for csv_path in csv_paths)
+    assert raw_cache.contains(identificators[1])
+
+
+def test_poll_batch_job_count_mismatch(identificator):
+    def handler(request: httpx.Request) -> httpx.Response:
+        # a single job for two targets
+        return httpx.Response(201, json=[{"url": TASK_URL}])
+
+    identificators = [
+        identificator,
+        identificator.model_copy(update={"ra_deg": 11.0}),
+    ]
+
+    with pytest.raises(ValueError, match="1 jobs for 2 coordinates"):
+        atlas_plugin(handler).poll_photometric_data_batch(identificators, [None, None])
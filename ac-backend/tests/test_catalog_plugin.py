@@ -0,0 +1,179 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from astropy import units
+from astropy.coordinates import SkyCoord, EarthLocation
+from astropy.time import Time
+from astropy.utils import iers
+from astropy.utils.data import conf as data_conf
+
+from src.core.config.config import settings
+from src.plugin.interface import light_travel_time_cache
+from src.plugin.interface.light_travel_time_cache import (
+    LightTravelTimeCache,
+    get_light_travel_time_cache,
+    light_travel_time_correction,
+)
+from tests.default_test_plugins.plugin_test.plugin import PluginTest
+
+
+@pytest.fixture(autouse=True)
+def offline_astropy():
+    # use the bundled IERS tables, so that the tests do not hit the network
+    with (
+        iers.conf.set_temp("auto_download", False),
+        iers.conf.set_temp("auto_max_age", None),
+        data_conf.set_temp("allow_internet", False),
+    ):
+        yield
+
+
+class TestCatalogPlugin:
+    @pytest.fixture
+    def catalog_plugin(self, override_directories) -> PluginTest:
+        return PluginTest()
+
+    @pytest.mark.parametrize(
+        "time_format,offset", [("jd", 2450000.0), ("mjd", 50000.0)]
+    )
+    @pytest.mark.parametrize("time_scale", ["utc", "tcb"])
+    @pytest.mark.parametrize(
+        "reference_frame", ["geocentric", "heliocentric", "barycentric"]
+    )
+    def test_to_bjd_tdb_batch_matches_scalar(
+        self, catalog_plugin, time_format, offset, time_scale, reference_frame
+    ):
+        time_values = offset + np.random.default_rng(42).uniform(0, 9000, 25)
+
+        batch = catalog_plugin._to_bjd_tdb_batch(
+            time_values, time_format, time_scale, reference_frame, 123.4, -22.5
+        )
+        scalar = np.array(
+            [
+                catalog_plugin._to_bjd_tdb(
+                    time_value, time_format, time_scale, reference_frame, 123.4, -22.5
+                )
+                for time_value in time_values
+            ]
+        )
+
+        assert batch.dtype == np.float64
+        assert np.array_equal(batch, scalar)
+
+    def test_to_bjd_tdb_batch_accepts_lists(self, catalog_plugin):
+        batch = catalog_plugin._to_bjd_tdb_batch(
+            [2455197.5, 2455198.5], "jd", "utc", "heliocentric", 10.0, 20.0
+        )
+
+        assert batch.shape == (2,)
+        assert batch[0] == catalog_plugin._to_bjd_tdb(
+            2455197.5, "jd", "utc", "heliocentric", 10.0, 20.0
+        )
+
+    def test_to_bjd_tdb_batch_empty(self, catalog_plugin):
+        batch = catalog_plugin._to_bjd_tdb_batch(
+            [], "jd", "utc", "heliocentric", 10.0, 20.0
+        )
+
+        assert batch.shape == (0,)
+
+    def test_to_bjd_tdb_batch_invalid_frame(self, catalog_plugin):
+        with pytest.raises(ValueError):
+            catalog_plugin._to_bjd_tdb_batch(
+                [2455197.5], "jd", "utc", "topocentric", 10.0, 20.0
+            )
+
+
+class TestLightTravelTimeCache:
+    @pytest.fixture
+    def cache(self, tmp_path) -> LightTravelTimeCache:
+        return LightTravelTimeCache(tmp_path, accuracy=1e-6)
+
+    @pytest.fixture
+    def geocenter(self) -> EarthLocation:
+        return EarthLocation.from_geocentric(0 * units.m, 0 * units.m, 0 * units.m)
+
+    @pytest.mark.parametrize("kind", ["geocentric", "heliocentric"])
+    @pytest.mark.parametrize("time_scale", ["utc", "tcb"])
+    def test_corrections_within_accuracy(self, cache, geocenter, kind, time_scale):
+        target = SkyCoord(270.0, -66.5, unit="deg")
+        # spans the 1997 and 1999 UTC leap seconds
+        time = Time(
+            2450500 + np.random.default_rng(7).uniform(0, 700, 200),
+            format="jd",
+            scale=time_scale,
+        )
+
+        cached = cache.corrections(time, target, kind)
+        exact = light_travel_time_correction(time, target, kind, geocenter)
+
+        assert cached.shape == time.shape
+        assert np.max(np.abs(cached - exact)) <= cache.accuracy
+
+    def test_corrections_scalar(self, cache):
+        target = SkyCoord(10.0, 20.0, unit="deg")
+
+        scalar = cache.corrections(
+            Time(2455197.5, format="jd", scale="utc"), target, "geocentric"
+        )
+        values = cache.corrections(
+            Time([2455197.5], format="jd", scale="utc"), target, "geocentric"
+        )
+
+        assert scalar.shape == ()
+        assert values[0] == scalar
+
+    def test_tables_are_shared(self, cache, tmp_path, monkeypatch):
+        target = SkyCoord(10.0, 20.0, unit="deg")
+        time = Time(2455197.5 + np.arange(100.0), format="jd", scale="utc")
+
+        expected = cache.corrections(time, target, "heliocentric")
+        assert list(tmp_path.rglob("*.npy")) != []
+
+        # a new process only maps the persisted tables, without evaluating the ephemeris
+        def fail(*args, **kwargs):
+            raise AssertionError("ephemeris evaluated")
+
+        monkeypatch.setattr(
+            light_travel_time_cache, "light_travel_time_correction", fail
+        )
+        other_cache = LightTravelTimeCache(tmp_path, accuracy=1e-6)
+
+        assert np.array_equal(
+            other_cache.corrections(time, target, "heliocentric"), expected
+        )
+
+    def test_least_recently_used_tables_are_evicted(self, tmp_path):
+        time = Time(2455197.5, format="jd", scale="utc")
+        targets = [SkyCoord(ra, 20.0, unit="deg") for ra in (10.0, 20.0, 30.0)]
+        writer = LightTravelTimeCache(tmp_path, accuracy=1e-6)
+        for target in targets:
+            writer.corrections(time, target, "geocentric")
+        tables = sorted(tmp_path.rglob("*.npy"), key=lambda path: path.stat().st_atime)
+        assert len(tables) == 3
+
+        # room for two tables, the table of the first target is opened again by another process
+        cache = LightTravelTimeCache(
+            tmp_path, accuracy=1e-6, max_bytes=2 * tables[0].stat().st_size
+        )
+        expected = cache.corrections(time, targets[0], "geocentric")
+
+        assert cache.evict() == 1
+        assert sorted(tmp_path.rglob("*.npy")) == sorted([tables[0], tables[2]])
+        # the evicted table is evaluated again
+        assert cache.corrections(time, targets[1], "geocentric") != expected
+        assert len(list(tmp_path.rglob("*.npy"))) == 3
+        assert cache.evict() == 1
+
+    def test_step_respects_accuracy(self):
+        coarse = LightTravelTimeCache(Path("unused"), accuracy=1e-3)
+        fine = LightTravelTimeCache(Path("unused"), accuracy=1e-6)
+
+        assert fine.step("geocentric") < coarse.step("geocentric")
+        assert fine.step("geocentric") < fine.step("heliocentric")
+
+    def test_cache_can_be_disabled(self, monkeypatch):
+        monkeypatch.setattr(settings, "LIGHT_TRAVEL_TIME_CACHE_ACCURACY", 0)
+
+        assert get_light_travel_time_cache() is None
@@ -0,0 +1,191 @@
+import uuid
+from collections import Counter
+
+import numpy as np
+import pytest
+import redis
+from astropy import units as u
+from astropy.coordinates import SkyCoord
+
+from src.core.cone_search_cache.cache import ConeSearchCache, separation_arcsec
+from src.core.cone_search_cache.healpix import (
+    ang2pix_nest,
+    order_for_size,
+    pixel_size_arcsec,
+)
+from src.core.config.config import settings
+from src.plugin.interface.schemas import StellarObjectIdentificatorDto
+
+
+class InMemoryRedis:
+    """Redis client keeping the entries and the statistics in memory."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.expirations: dict[str, int] = {}
+        self.stats: dict[str, Counter[str]] = {}
+
+    def mget(self, keys: list[str]) -> list[str | None]:
+        return [self.values.get(key) for key in keys]
+
+    def set(self, key: str, value: str, px: int) -> None:
+        self.values[key] = value
+        self.expirations[key] = px
+
+    def pipeline(self, transaction: bool = True) -> "InMemoryRedis":
+        return self
+
+    def __enter__(self) -> "InMemoryRedis":
+        return self
+
+    def __exit__(self, *args) -> None:
+        pass
+
+    def hincrby(self, key: str, field: str, amount: int) -> None:
+        self.stats.setdefault(key, Counter())[field] += amount
+
+    def execute(self) -> None:
+        pass
+
+
+class UnavailableRedis:
+    def __getattr__(self, name):
+        def fail(*args, **kwargs):
+            raise redis.ConnectionError("Connection refused")
+
+        return fail
+
+
+@pytest.fixture
+def plugin_id():
+    return uuid.uuid4()
+
+
+def make_identificators(plugin_id, center, offsets_arcsec):
+    return [
+        StellarObjectIdentificatorDto(
+            plugin_id=plugin_id,
+            ra_deg=center.ra.deg,
+            dec_deg=center.dec.deg + offset / 3600,
+            name=f"Star {index}",
+            dist_arcsec=offset,
+            catalog_id=index,
+        )
+        for index, offset in enumerate(offsets_arcsec)
+    ]
+
+
+def test_ang2pix_nest():
+    # the base pixels of the poles and the equator
+    assert ang2pix_nest(0, [0, 0, 0, 100], [89.9, 0, -89.9, 0]).tolist() == [
+        0,
+        4,
+        8,
+        5,
+    ]
+
+    rng = np.random.default_rng(42)
+    ra = rng.uniform(0, 360, 100_000)
+    dec = np.degrees(np.arcsin(rng.uniform(-1, 1, 100_000)))
+
+    # the pixels have equal areas
+    counts = np.bincount(ang2pix_nest(2, ra, dec), minlength=192)
+    assert len(counts) == 192
+    assert counts.min() > 0.8 * 100_000 / 192
+    assert counts.max() < 1.2 * 100_000 / 192
+    # the pixels of the nested scheme are divided into four pixels of the next order
+    assert np.array_equal(ang2pix_nest(16, ra, dec) >> 2, ang2pix_nest(15, ra, dec))
+
+
+def test_order_for_size():
+    assert order_for_size(1e9) == 0
+    assert order_for_size(0.5 * pixel_size_arcsec(10)) == 11
+    assert order_for_size(1e-9) == 29
+
+
+def test_separation_arcsec():
+    center = SkyCoord(ra=359.99 * u.deg, dec=45.0 * u.deg)
+    ra = np.array([0.01, 359.99, 10.0])
+    dec = np.array([45.0, 44.9, -30.0])
+
+    expected = center.separation(SkyCoord(ra=ra * u.deg, dec=dec * u.deg)).arcsec
+    assert np.allclose(
+        separation_arcsec(ra, dec, center.ra.deg, center.dec.deg), expected
+    )
+
+
+def test_contained_cone_is_filtered(plugin_id):
+    redis_client = InMemoryRedis()
+    cone_cache = ConeSearchCache(plugin_id, ttl=60, redis_client=redis_client)
+    center = SkyCoord(ra=120.0 * u.deg, dec=-30.0 * u.deg)
+
+    assert cone_cache.load(center, 100) is None
+    cone_cache.store(center, 100, make_identificators(plugin_id, center, [5, 30, 90]))
+    assert list(redis_client.expirations.values()) == [60_000]
+
+    # the same search
+    assert [identificator.name for identificator in cone_cache.load(center, 100)] == [
+        "Star 0",
+        "Star 1",
+        "Star 2",
+    ]
+
+    # a smaller search around other center
+    other_center = SkyCoord(ra=120.0 * u.deg, dec=(-30.0 + 10 / 3600) * u.deg)
+    found = cone_cache.load(other_center, 25)
+    assert [identificator.name for identificator in found] == ["Star 0", "Star 1"]
+    assert [identificator.dist_arcsec for identificator in found] == pytest.approx(
+        [5, 20]
+    )
+    # the attributes of the plugin are kept
+    assert [identificator.model_dump()["catalog_id"] for identificator in found] == [
+        0,
+        1,
+    ]
+
+    assert redis_client.stats[f"cone-search-cache:{plugin_id}:stats"] == {
+        "misses": 1,
+        "stores": 1,
+        "stored_identifiers": 3,
+        "hits": 2,
+        "served_identifiers": 5,
+    }
+
+
+def test_cone_exceeding_cached_cone_is_not_loaded(plugin_id):
+    cone_cache = ConeSearchCache(plugin_id, ttl=60, redis_client=InMemoryRedis())
+    center = SkyCoord(ra=120.0 * u.deg, dec=-30.0 * u.deg)
+    cone_cache.store(center, 20, make_identificators(plugin_id, center, [5]))
+
+    # in the same bucket, but not contained in the cached cone
+    assert cone_cache.load(center, 25) is None
+    shifted = SkyCoord(ra=120.0 * u.deg, dec=(-30.0 + 5 / 3600) * u.deg)
+    assert cone_cache.load(shifted, 20) is None
+
+
+def test_cache_is_not_used(plugin_id):
+    center = SkyCoord(ra=120.0 * u.deg, dec=-30.0 * u.deg)
+    identificators = make_identificators(plugin_id, center, [5])
+
+    disabled = ConeSearchCache(plugin_id, ttl=0, redis_client=UnavailableRedis())
+    disabled.store(center, 10, identificators)
+    assert disabled.load(center, 10) is None
+
+    # the catalog is searched instead
+    unavailable = ConeSearchCache(plugin_id, ttl=60, redis_client=UnavailableRedis())
+    unavailable.store(center, 10, identificators)
+    assert unavailable.load(center, 10) is None
+
+
+def test_too_large_searches_are_not_stored(plugin_id, monkeypatch):
+    monkeypatch.setattr(settings, "CONE_SEARCH_CACHE_MAX_IDENTIFIERS", 2)
+    redis_client = InMemoryRedis()
+    cone_cache = ConeSearchCache(plugin_id, ttl=60, redis_client=redis_client)
+    center = SkyCoord(ra=120.0 * u.deg, dec=-30.0 * u.deg)
+
+    cone_cache.store(center, 10, make_identificators(plugin_id, center, [1, 2, 3]))
+    # above the largest bucket
+    cone_cache.store(center, 10**6, make_identificators(plugin_id, center, [1]))
+
+    assert redis_client.values == {}
+    assert redis_client.stats[f"cone-search-cache:{plugin_id}:stats"] == {"skips": 1}
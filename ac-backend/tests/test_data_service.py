@@ -0,0 +1,118 @@
+import pytest
+import pytest_asyncio
+
+from src.core.repository.repository import Distinct, Filters, Repository
+from src.data_retrieval.service import DataService
+from src.tasks.model import (
+    PeriodogramPeak,
+    PhotometricData,
+    StellarObjectIdentifier,
+    Task,
+)
+from src.tasks.types import TaskStatus, TaskType
+
+
+class TestDataService:
+    @pytest_asyncio.fixture
+    async def data_service(self, db_session):
+        return DataService(
+            Repository(StellarObjectIdentifier, db_session),
+            Repository(PhotometricData, db_session),
+            Repository(Task, db_session),
+            Repository(PeriodogramPeak, db_session),
+        )
+
+    async def make_task(self, db_session, rows: int, **task_kwargs) -> Task:
+        task = Task(task_type=TaskType.photometric_data, **task_kwargs)
+        db_session.add(task)
+        await db_session.flush()
+        db_session.add_all(
+            [
+                PhotometricData(
+                    task_id=task.id,
+                    plugin_id=task.id,
+                    julian_date=2450000.0 + i,
+                    magnitude=12.0,
+                    magnitude_error=0.1,
+                )
+                for i in range(rows)
+            ]
+        )
+        await db_session.commit()
+        return task
+
+    @pytest.mark.asyncio
+    async def test_total_of_completed_tasks_is_stored_count(
+        self, db_session, data_service
+    ):
+        # the stored counts differ from the rows to show they are not counted
+        t1 = await self.make_task(
+            db_session, 3, status=TaskStatus.completed, result_count=30
+        )
+        t2 = await self.make_task(
+            db_session, 2, status=TaskStatus.completed, result_count=20
+        )
+
+        page = await data_service.list_photometric_data(
+            count=2, filters=Filters(filters={"task_id__in": [str(t1.id), t2.id]})
+        )
+
+        assert page.count == 2
+        assert page.total_items == 50
+
+    @pytest.mark.asyncio
+    async def test_total_of_in_progress_task_is_counted(self, db_session, data_service):
+        completed = await self.make_task(
+            db_session, 3, status=TaskStatus.completed, result_count=30
+        )
+        in_progress = await self.make_task(db_session, 2)
+
+        page = await data_service.list_photometric_data(
+            filters=Filters(
+                filters={"task_id__in": [str(completed.id), str(in_progress.id)]}
+            )
+        )
+
+        assert page.total_items == 5
+
+    @pytest.mark.asyncio
+    async def test_total_with_other_filters_is_counted(self, db_session, data_service):
+        task = await self.make_task(
+            db_session, 3, status=TaskStatus.completed, result_count=3
+        )
+
+        page = await data_service.list_photometric_data(
+            filters=Filters(
+                filters={"task_id__eq": str(task.id), "julian_date__ge": 2450001.0}
+            )
+        )
+
+        assert page.total_items == 2
+
+    @pytest.mark.asyncio
+    async def test_total_can_be_skipped(self, db_session, data_service):
+        task = await self.make_task(db_session, 3)
+
+        page = await data_service.list_photometric_data(
+            filters=Filters(filters={"task_id__eq": str(task.id)}), with_total=False
+        )
+
+        assert page.count == 3
+        assert page.total_items is None
+
+    @pytest.mark.asyncio
+    async def test_distinct_is_paginated_by_offset(self, db_session, data_service):
+        t1 = await self.make_task(db_session, 3)
+        t2 = await self.make_task(db_session, 2)
+
+        page = await data_service.list_photometric_data(
+            filters=Filters(
+                filters={"task_id__in": [str(t1.id), str(t2.id)]},
+                distinct=Distinct(fields=["task_id"]),
+            )
+        )
+
+        assert page.count == 2
+        assert page.total_items == 2
+        assert page.next_cursor is None
+        assert {data.plugin_id for data in page.data} == {t1.id, t2.id}
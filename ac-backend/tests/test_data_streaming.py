@@ -0,0 +1,154 @@
+import contextlib
+import json
+
+import pyarrow as pa
+import pytest
+
+from src.core.exception.exceptions import APIException
+from src.core.repository.repository import Filters
+from src.data_retrieval.exceptions import NotAcceptableException
+from src.data_retrieval.router import stream_data
+from src.data_retrieval.streaming import (
+    ARROW_STREAM_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    PHOTOMETRIC_DATA_SCHEMA,
+    negotiate_media_type,
+)
+from src.tasks.model import PhotometricData, Task
+from src.tasks.types import TaskType
+
+
+@pytest.mark.parametrize(
+    "accept, expected",
+    [
+        (None, ARROW_STREAM_MEDIA_TYPE),
+        ("*/*", ARROW_STREAM_MEDIA_TYPE),
+        ("application/x-ndjson", NDJSON_MEDIA_TYPE),
+        (
+            "application/vnd.apache.arrow.stream;q=0.5, application/x-ndjson",
+            NDJSON_MEDIA_TYPE,
+        ),
+        ("text/html, application/*;q=0.1", ARROW_STREAM_MEDIA_TYPE),
+    ],
+)
+def test_negotiate_media_type(accept, expected):
+    assert negotiate_media_type(accept) == expected
+
+
+@pytest.mark.parametrize("accept", ["text/html", "application/x-ndjson;q=0"])
+def test_negotiate_media_type_not_acceptable(accept):
+    with pytest.raises(NotAcceptableException):
+        negotiate_media_type(accept)
+
+
+class TestDataStreaming:
+    @pytest.fixture
+    def session_factory(self, db_session):
+        # the stream shares the transaction of the test, which is rolled back afterwards
+        @contextlib.asynccontextmanager
+        async def factory():
+            yield db_session
+
+        return factory
+
+    async def make_task(self, db_session, julian_dates: list[float]) -> Task:
+        task = Task(task_type=TaskType.photometric_data)
+        db_session.add(task)
+        await db_session.flush()
+        db_session.add_all(
+            [
+                PhotometricData(
+                    task_id=task.id,
+                    plugin_id=task.id,
+                    julian_date=julian_date,
+                    magnitude=12.0,
+                    magnitude_error=0.1,
+                    light_filter="V",
+                )
+                for julian_date in julian_dates
+            ]
+        )
+        await db_session.commit()
+        return task
+
+    async def read_body(self, response) -> bytes:
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    @pytest.mark.asyncio
+    async def test_stream_arrow(self, db_session, session_factory, monkeypatch):
+        monkeypatch.setattr(
+            "src.data_retrieval.router.settings.PHOTOMETRIC_DATA_STREAM_BATCH_SIZE", 2
+        )
+        t1 = await self.make_task(db_session, [2450003.0, 2450001.0, 2450002.0])
+        t2 = await self.make_task(db_session, [2450000.0, 2450004.0])
+
+        response = await stream_data(
+            session_factory,
+            Filters(filters={"task_id__in": [str(t1.id), str(t2.id)]}),
+            accept=None,
+        )
+        assert response.media_type == ARROW_STREAM_MEDIA_TYPE
+
+        table = pa.ipc.open_stream(await self.read_body(response)).read_all()
+
+        assert table.schema == PHOTOMETRIC_DATA_SCHEMA
+        rows = list(zip(table["task_id"].to_pylist(), table["julian_date"].to_pylist()))
+        assert rows == sorted(
+            [(t1.id, jd) for jd in (2450001.0, 2450002.0, 2450003.0)]
+            + [(t2.id, jd) for jd in (2450000.0, 2450004.0)]
+        )
+
+    @pytest.mark.asyncio
+    async def test_stream_ndjson(self, db_session, session_factory):
+        task = await self.make_task(db_session, [2450001.0, 2450000.0])
+
+        response = await stream_data(
+            session_factory,
+            Filters(filters={"task_id__eq": str(task.id)}),
+            accept=NDJSON_MEDIA_TYPE,
+        )
+        assert response.media_type == NDJSON_MEDIA_TYPE
+
+        lines = (await self.read_body(response)).decode().splitlines()
+
+        assert [json.loads(line) for line in lines] == [
+            {
+                "task_id": str(task.id),
+                "plugin_id": str(task.id),
+                "julian_date": julian_date,
+                "magnitude": 12.0,
+                "magnitude_error": 0.1,
+                "light_filter": "V",
+            }
+            for julian_date in (2450000.0, 2450001.0)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_empty_arrow_stream_has_schema(self, db_session, session_factory):
+        task = await self.make_task(db_session, [])
+
+        response = await stream_data(
+            session_factory,
+            Filters(filters={"task_id__eq": str(task.id)}),
+            accept=ARROW_STREAM_MEDIA_TYPE,
+        )
+        table = pa.ipc.open_stream(await self.read_body(response)).read_all()
+
+        assert table.schema == PHOTOMETRIC_DATA_SCHEMA
+        assert table.num_rows == 0
+
+    @pytest.mark.asyncio
+    async def test_stream_requires_task_id(self, session_factory):
+        with pytest.raises(APIException):
+            await stream_data(session_factory, Filters(filters={}), accept=None)
+
+    @pytest.mark.asyncio
+    async def test_stream_not_acceptable(self, session_factory):
+        with pytest.raises(NotAcceptableException):
+            await stream_data(
+                session_factory,
+                Filters(
+                    filters={"task_id__eq": "00000000-0000-0000-0000-000000000000"}
+                ),
+                accept="text/csv",
+            )
@@ -54,7 +54,9 @@ def fake_data_service_single_page(fake_plugin_service):
     plugin_id = fake_plugin_service.plugins[0].id
 
     class FakeDataService:
-        async def list_photometric_data(self, offset=0, count=100, filters=None):
+        async def list_photometric_data(
+            self, offset=0, count=100, filters=None, cursor=None, with_total=True
+        ):
             data = [
                 PhotometricDataDto(
                     plugin_id=plugin_id,
@@ -0,0 +1,65 @@
+import httpx
+import pytest
+
+from src.core.config.config import settings
+from src.core.http_client.registry import HttpClientRegistry
+
+
+class TestHttpClientRegistry:
+    @pytest.fixture
+    def registry(self):
+        registry = HttpClientRegistry()
+        yield registry
+        registry.close()
+
+    def test_client_is_shared_per_origin(self, registry):
+        client = registry.client("https://vsx.aavso.org/index.php", timeout=10.0)
+
+        assert registry.client("https://vsx.aavso.org/other", timeout=10.0) is client
+        assert registry.client("https://vsx.aavso.org:443", timeout=10.0) is client
+        assert registry.client("http://vsx.aavso.org", timeout=10.0) is not client
+        assert registry.client("https://vsx.aavso.org", timeout=30.0) is not client
+        assert registry.client() is not client
+
+    def test_connection_limits(self, registry, monkeypatch):
+        monkeypatch.setattr(
+            settings, "HTTP_CLIENT_HOST_MAX_CONNECTIONS", {"asas-sn.osu.edu": 2}
+        )
+
+        registry.client("https://asas-sn.osu.edu")
+        registry.client("https://vsx.aavso.org")
+        registry.client()
+
+        limits = {stats.origin: stats.max_connections for stats in registry.stats()}
+        assert limits == {
+            "https://asas-sn.osu.edu:443": 2,
+            "https://vsx.aavso.org:443": settings.HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST,
+            None: settings.HTTP_CLIENT_MAX_CONNECTIONS,
+        }
+
+    def test_forked_process_drops_clients_of_parent(self, registry):
+        client = registry.client("https://vsx.aavso.org")
+        registry._pid = -1
+
+        assert registry.client("https://vsx.aavso.org") is not client
+
+    def test_stats_count_requests(self, registry):
+        # nothing listens on the port, the request is counted before it fails
+        client = registry.client("http://127.0.0.1:9", timeout=1.0)
+        with pytest.raises(httpx.ConnectError):
+            client.get("http://127.0.0.1:9/")
+
+        [stats] = registry.stats()
+        assert stats.requests == 1
+        assert stats.open_connections == 0
+        assert stats.queued_requests == 0
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_all_clients(self, registry):
+        client = registry.client("https://vsx.aavso.org")
+        async_client = registry.async_client()
+
+        await registry.aclose()
+
+        assert client.is_closed and async_client.is_closed
+        assert registry.stats() == []
@@ -0,0 +1,87 @@
+import uuid
+
+import pytest
+
+from src.data_retrieval.downsampling import downsample_light_curves
+from src.data_retrieval.schemas import LightCurveRequestDto
+from src.tasks.model import PhotometricData, Task
+from src.tasks.types import TaskType
+
+PLUGIN_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+
+
+class TestLightCurveDownsampling:
+    async def make_task(
+        self, db_session, points: list[tuple[float, float]], light_filter="V"
+    ) -> Task:
+        task = Task(task_type=TaskType.photometric_data)
+        db_session.add(task)
+        await db_session.flush()
+        db_session.add_all(
+            [
+                PhotometricData(
+                    task_id=task.id,
+                    plugin_id=PLUGIN_ID,
+                    julian_date=julian_date,
+                    magnitude=magnitude,
+                    magnitude_error=0.1,
+                    light_filter=light_filter,
+                )
+                for julian_date, magnitude in points
+            ]
+        )
+        await db_session.commit()
+        return task
+
+    @pytest.mark.asyncio
+    async def test_keeps_extremes_of_buckets(self, db_session):
+        # 2 buckets of 5 days, the extremes are in the middle of the buckets
+        magnitudes = [12.0, 11.0, 14.0, 12.0, 12.5, 12.0, 13.0, 10.0, 12.0, 12.1]
+        task = await self.make_task(
+            db_session, [(2450000.0 + i, m) for i, m in enumerate(magnitudes)]
+        )
+
+        series = await downsample_light_curves(
+            db_session, LightCurveRequestDto(task_ids=[task.id], points=4)
+        )
+
+        assert len(series) == 1
+        assert series[0].total_points == 10
+        assert series[0].julian_date == [2450001.0, 2450002.0, 2450006.0, 2450007.0]
+        assert series[0].magnitude == [11.0, 14.0, 13.0, 10.0]
+
+    @pytest.mark.asyncio
+    async def test_small_series_are_not_downsampled(self, db_session):
+        task = await self.make_task(db_session, [(2450001.0, 12.0), (2450000.0, 13.0)])
+        await self.make_task(db_session, [(2450000.0, 12.0)], light_filter=None)
+
+        series = await downsample_light_curves(
+            db_session, LightCurveRequestDto(task_ids=[task.id], points=2)
+        )
+
+        assert [s.julian_date for s in series] == [[2450000.0, 2450001.0]]
+
+    @pytest.mark.asyncio
+    async def test_series_per_light_filter_in_window(self, db_session):
+        v = await self.make_task(
+            db_session, [(2450000.0 + i, 12.0) for i in range(10)], light_filter="V"
+        )
+        b = await self.make_task(
+            db_session, [(2450000.0 + i, 13.0) for i in range(10)], light_filter="B"
+        )
+
+        series = await downsample_light_curves(
+            db_session,
+            LightCurveRequestDto(
+                task_ids=[v.id, b.id],
+                julian_date_from=2450002.0,
+                julian_date_to=2450004.0,
+                points=10,
+            ),
+        )
+
+        assert [(s.light_filter, s.total_points) for s in series] == [
+            ("B", 3),
+            ("V", 3),
+        ]
+        assert all(s.julian_date == [2450002.0, 2450003.0, 2450004.0] for s in series)
@@ -0,0 +1,119 @@
+import uuid
+
+import numpy as np
+import pytest
+
+from src.tasks.period_search import (
+    box_least_squares_peaks,
+    find_peaks,
+    frequency_grid,
+    lomb_scargle_peaks,
+    search_periods,
+)
+from src.tasks.schemas import PeriodSearchRequestDto
+from src.tasks.series import split_series
+from src.tasks.types import PeriodSearchMethod
+
+
+def light_curve(julian_date, magnitude):
+    return julian_date, magnitude, np.full(len(julian_date), 0.01)
+
+
+class TestFrequencyGrid:
+    def test_limits_by_baseline_and_cadence(self):
+        # baseline of 100 days sampled every 0.5 days
+        julian_date = 2450000.0 + np.arange(201) * 0.5
+
+        frequency = frequency_grid(julian_date, None, None, 1_000_000)
+
+        assert frequency[0] == pytest.approx(1 / 100)
+        assert frequency[-1] == pytest.approx(1.0)
+        # oversampled by 5 over the peak width 1 / baseline
+        assert frequency[1] - frequency[0] == pytest.approx(1 / 500, rel=1e-2)
+
+    def test_limits_by_request_and_cap(self):
+        julian_date = 2450000.0 + np.arange(201) * 0.5
+
+        frequency = frequency_grid(julian_date, 0.1, 10.0, 50)
+
+        assert len(frequency) == 50
+        assert frequency[0] == pytest.approx(1 / 10)
+        assert frequency[-1] == pytest.approx(10.0)
+
+    def test_empty_for_single_date(self):
+        assert len(frequency_grid(np.array([2450000.0] * 3), None, None, 100)) == 0
+
+
+def test_find_peaks():
+    power = np.array([0.5, 0.1, 0.3, 0.2, 0.9, 0.9, 0.1, 0.4])
+
+    assert find_peaks(power, 3).tolist() == [4, 0, 7]
+    assert find_peaks(power, 10).tolist() == [4, 0, 7, 2]
+
+
+def test_lomb_scargle_finds_period():
+    rng = np.random.default_rng(1)
+    julian_date = 2450000.0 + np.sort(rng.uniform(0, 200, 500))
+    magnitude = 0.2 * np.sin(2 * np.pi * julian_date / 3.7) + rng.normal(0, 0.02, 500)
+    curve = light_curve(julian_date, magnitude)
+
+    peaks = lomb_scargle_peaks(curve, frequency_grid(julian_date, None, None, 10**5), 3)
+
+    assert [peak["rank"] for peak in peaks] == [1, 2, 3]
+    # limited by the grid step
+    assert peaks[0]["period"] == pytest.approx(3.7, rel=5e-3)
+    assert peaks[0]["power"] > peaks[1]["power"]
+    assert peaks[0]["false_alarm_probability"] < 1e-10
+
+
+def test_box_least_squares_finds_transit():
+    julian_date = 2450000.0 + np.arange(0, 60, 0.02)
+    # dimming by 0.1 mag for 0.15 days every 4.2 days
+    magnitude = np.where(np.mod(julian_date - 2450001.0, 4.2) < 0.15, 0.1, 0.0)
+    curve = light_curve(julian_date, magnitude)
+
+    peaks = box_least_squares_peaks(
+        curve, frequency_grid(julian_date, 1.0, 10.0, 10**5), 1
+    )
+
+    assert peaks[0]["method"] == PeriodSearchMethod.box_least_squares
+    assert peaks[0]["period"] == pytest.approx(4.2, rel=1e-2)
+    assert peaks[0]["depth"] == pytest.approx(0.1, rel=0.2)
+
+
+def test_search_periods_skips_short_light_curves():
+    julian_date = 2450000.0 + np.arange(100.0)
+    query = PeriodSearchRequestDto(task_ids=["00000000-0000-0000-0000-000000000000"])
+
+    peaks = search_periods(
+        {
+            "V": light_curve(julian_date, np.sin(julian_date)),
+            "B": light_curve(julian_date[:5], np.sin(julian_date[:5])),
+        },
+        query,
+    )
+
+    assert {peak["light_filter"] for peak in peaks} == {"V"}
+    assert len(peaks) == query.peaks
+
+
+def test_split_series():
+    first, second = uuid.uuid4(), uuid.uuid4()
+    rows = [
+        (first, "V", 1.0, 10.0, 0.1),
+        (second, None, 2.0, 20.0, 0.2),
+        (first, None, 3.0, 30.0, 0.3),
+        (first, "V", 4.0, 40.0, 0.4),
+        # the filter is not confused with the missing one
+        (first, "", 5.0, 50.0, 0.5),
+    ]
+
+    series = split_series(rows)
+
+    assert set(series) == {(first, "V"), (first, None), (first, ""), (second, None)}
+    # the rows keep their order within the series
+    assert series[(first, "V")].tolist() == [[1.0, 10.0, 0.1], [4.0, 40.0, 0.4]]
+    assert series[(first, None)].tolist() == [[3.0, 30.0, 0.3]]
+    assert series[(first, "")].tolist() == [[5.0, 50.0, 0.5]]
+    assert series[(second, None)].tolist() == [[2.0, 20.0, 0.2]]
+    assert split_series([]) == {}
@@ -0,0 +1,110 @@
+import uuid
+
+import numpy as np
+import pytest
+
+from src.phase_curve.folding import (
+    MAD_TO_SIGMA,
+    bin_phases,
+    fold,
+    fold_photometric_data,
+)
+from src.phase_curve.schemas import PhaseFoldRequestDto
+from src.tasks.model import PhotometricData, Task
+from src.tasks.types import TaskType
+
+PLUGIN_IDS = [
+    uuid.UUID("00000000-0000-0000-0000-000000000001"),
+    uuid.UUID("00000000-0000-0000-0000-000000000002"),
+]
+
+
+def test_fold():
+    julian_date = np.array([2450000.0, 2450000.5, 2450002.25, 2449999.75])
+
+    assert fold(julian_date, 2.0, 2450000.0).tolist() == [0.0, 0.25, 0.125, 0.875]
+
+
+def test_bin_phases():
+    phase = np.array([0.05, 0.1, 0.15, 0.2, 0.6, 0.7])
+    magnitude = np.array([12.0, 10.0, 11.0, 14.0, 13.0, 13.5])
+
+    centers, median, scatter, counts = bin_phases(phase, magnitude, 2)
+
+    assert centers.tolist() == [0.25, 0.75]
+    assert median.tolist() == [11.5, 13.25]
+    # deviations are 0.5, 1.5, 0.5, 2.5 and 0.25, 0.25
+    assert scatter.tolist() == pytest.approx([MAD_TO_SIGMA, MAD_TO_SIGMA * 0.25])
+    assert counts.tolist() == [4, 2]
+
+
+class TestFoldPhotometricData:
+    async def make_task(
+        self, db_session, plugin_id, light_filter, points: list[tuple[float, float]]
+    ) -> Task:
+        task = Task(task_type=TaskType.photometric_data)
+        db_session.add(task)
+        await db_session.flush()
+        db_session.add_all(
+            [
+                PhotometricData(
+                    task_id=task.id,
+                    plugin_id=plugin_id,
+                    julian_date=julian_date,
+                    magnitude=magnitude,
+                    magnitude_error=0.1,
+                    light_filter=light_filter,
+                )
+                for julian_date, magnitude in points
+            ]
+        )
+        await db_session.commit()
+        return task
+
+    @pytest.mark.asyncio
+    async def test_fold_and_bin(self, db_session):
+        t1 = await self.make_task(
+            db_session, PLUGIN_IDS[0], "V", [(2450003.5, 12.0), (2450000.25, 11.0)]
+        )
+        t2 = await self.make_task(
+            db_session, PLUGIN_IDS[1], "V", [(2450010.0, 13.0), (2450010.75, 14.0)]
+        )
+        t3 = await self.make_task(db_session, PLUGIN_IDS[1], None, [(2450001.0, 9.0)])
+
+        curve = await fold_photometric_data(
+            db_session,
+            PhaseFoldRequestDto(
+                task_ids=[t1.id, t2.id, t3.id], period=1.0, epoch=2450000.0, bins=2
+            ),
+        )
+
+        assert [(s.plugin_id, s.light_filter, s.phase) for s in curve.series] == [
+            (PLUGIN_IDS[0], "V", [0.25, 0.5]),
+            (PLUGIN_IDS[1], None, [0.0]),
+            (PLUGIN_IDS[1], "V", [0.0, 0.75]),
+        ]
+        assert curve.series[0].magnitude == [11.0, 12.0]
+
+        bins = {b.light_filter: b for b in curve.bins}
+        assert bins["V"].phase == [0.25, 0.75]
+        assert bins["V"].median_magnitude == [12.0, 13.0]
+        assert bins["V"].count == [2, 2]
+        assert bins[None].count == [1]
+
+    @pytest.mark.asyncio
+    async def test_only_bins(self, db_session):
+        task = await self.make_task(db_session, PLUGIN_IDS[0], "V", [(2450000.0, 12.0)])
+
+        curve = await fold_photometric_data(
+            db_session,
+            PhaseFoldRequestDto(
+                task_ids=[task.id],
+                period=1.0,
+                epoch=2450000.0,
+                bins=10,
+                include_points=False,
+            ),
+        )
+
+        assert curve.series is None
+        assert curve.bins[0].phase == [0.05]
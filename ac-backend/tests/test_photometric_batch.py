@@ -0,0 +1,89 @@
+import uuid
+
+import numpy as np
+import pytest
+
+from src.plugin.interface.photometric_batch import (
+    PhotometricBatch,
+    as_photometric_batch,
+)
+from src.plugin.interface.schemas import PhotometricDataDto
+
+
+class TestPhotometricBatch:
+    @pytest.fixture
+    def plugin_id(self) -> uuid.UUID:
+        return uuid.uuid4()
+
+    def test_from_columns_encodes_light_filters(self, plugin_id):
+        batch = PhotometricBatch.from_columns(
+            plugin_id,
+            [1.0, 2.0, 3.0, 4.0],
+            [10.0, 11.0, 12.0, 13.0],
+            [0.1, 0.2, 0.3, 0.4],
+            light_filter=np.array(["V", "B", None, "V"], dtype=object),
+        )
+
+        assert len(batch) == 4
+        assert batch.light_filters == ["B", "V"]
+        assert batch.light_filter_codes.tolist() == [1, 0, -1, 1]
+        assert batch.light_filter().tolist() == ["V", "B", None, "V"]
+
+    def test_from_columns_treats_nan_as_missing_filter(self, plugin_id):
+        batch = PhotometricBatch.from_columns(
+            plugin_id, [1.0, 2.0], [10.0, 11.0], [0.1, 0.2], [np.nan, "g"]
+        )
+
+        assert batch.light_filter().tolist() == [None, "g"]
+
+    @pytest.mark.parametrize("light_filter", ["V", None])
+    def test_from_columns_single_light_filter(self, plugin_id, light_filter):
+        batch = PhotometricBatch.from_columns(
+            plugin_id, [1.0, 2.0], [10.0, 11.0], [0.1, 0.2], light_filter
+        )
+
+        assert batch.light_filter().tolist() == [light_filter, light_filter]
+
+    def test_columns_must_have_equal_length(self, plugin_id):
+        with pytest.raises(ValueError):
+            PhotometricBatch.from_columns(
+                plugin_id, [1.0, 2.0], [10.0], [0.1, 0.2], "V"
+            )
+
+    def test_light_filter_codes_must_be_valid(self, plugin_id):
+        with pytest.raises(ValueError):
+            PhotometricBatch(plugin_id, [1.0], [10.0], [0.1], [1], ["V"])
+
+    def test_adapter_round_trip(self, plugin_id):
+        dtos = [
+            PhotometricDataDto(
+                plugin_id=plugin_id,
+                julian_date=2450000.5 + i,
+                magnitude=12.0 + i,
+                magnitude_error=0.01,
+                light_filter=light_filter,
+            )
+            for i, light_filter in enumerate(["V", None, "B", "V"])
+        ]
+
+        batch = as_photometric_batch(dtos)
+
+        assert batch.plugin_id == plugin_id
+        assert batch.light_filters == ["V", "B"]
+        assert batch.to_dtos() == dtos
+        assert as_photometric_batch(batch) is batch
+
+    def test_adapter_rejects_multiple_plugins(self):
+        dtos = [
+            PhotometricDataDto(
+                plugin_id=uuid.uuid4(),
+                julian_date=2450000.5,
+                magnitude=12.0,
+                magnitude_error=0.01,
+                light_filter=None,
+            )
+            for _ in range(2)
+        ]
+
+        with pytest.raises(ValueError):
+            as_photometric_batch(dtos)
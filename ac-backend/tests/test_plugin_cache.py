@@ -0,0 +1,85 @@
+import sys
+import types
+import uuid
+
+from src.plugin.cache import PluginCache
+
+PLUGIN_IDS = [
+    uuid.UUID("00000000-0000-0000-0000-000000000001"),
+    uuid.UUID("00000000-0000-0000-0000-000000000002"),
+    uuid.UUID("00000000-0000-0000-0000-000000000003"),
+]
+
+
+class TestPluginCache:
+    def loader(self, file_name: str, loads: list[str]):
+        # registers the module like SyncTaskService._load_plugin
+        def load():
+            loads.append(file_name)
+            sys.modules[file_name] = types.ModuleType(file_name)
+            return object()
+
+        return load
+
+    def test_plugin_is_loaded_once(self):
+        cache = PluginCache(2)
+        loads = []
+
+        first = cache.get(PLUGIN_IDS[0], "a.py", self.loader("a.py", loads))
+        second = cache.get(PLUGIN_IDS[0], "a.py", self.loader("a.py", loads))
+
+        assert first is second
+        assert loads == ["a.py"]
+        cache.clear()
+
+    def test_least_recently_used_is_evicted(self):
+        cache = PluginCache(2)
+        loads = []
+
+        cache.get(PLUGIN_IDS[0], "a.py", self.loader("a.py", loads))
+        cache.get(PLUGIN_IDS[1], "b.py", self.loader("b.py", loads))
+        cache.get(PLUGIN_IDS[0], "a.py", self.loader("a.py", loads))
+        cache.get(PLUGIN_IDS[2], "c.py", self.loader("c.py", loads))
+
+        assert len(cache) == 2
+        assert "b.py" not in sys.modules
+        cache.get(PLUGIN_IDS[0], "a.py", self.loader("a.py", loads))
+        assert loads == ["a.py", "b.py", "c.py"]
+        cache.clear()
+
+    def test_replaced_file_evicts_old_version(self):
+        cache = PluginCache(2)
+        loads = []
+
+        old = cache.get(PLUGIN_IDS[0], "a.py", self.loader("a.py", loads))
+        new = cache.get(PLUGIN_IDS[0], "b.py", self.loader("b.py", loads))
+
+        assert old is not new
+        assert len(cache) == 1
+        assert "a.py" not in sys.modules
+        cache.clear()
+
+    def test_invalidate(self):
+        cache = PluginCache(2)
+        loads = []
+
+        cache.get(PLUGIN_IDS[0], "a.py", self.loader("a.py", loads))
+        cache.get(PLUGIN_IDS[1], "b.py", self.loader("b.py", loads))
+        cache.invalidate(PLUGIN_IDS[0])
+
+        assert len(cache) == 1
+        assert "a.py" not in sys.modules
+        assert "b.py" in sys.modules
+        cache.clear()
+        assert "b.py" not in sys.modules
+
+    def test_missing_plugin_class_is_not_cached(self):
+        cache = PluginCache(2)
+
+        def load():
+            sys.modules["a.py"] = types.ModuleType("a.py")
+            return None
+
+        assert cache.get(PLUGIN_IDS[0], "a.py", load) is None
+        assert len(cache) == 0
+        assert "a.py" not in sys.modules
@@ -3,15 +3,17 @@ import os
 import uuid
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock, AsyncMock, call
 
 import pytest
 from fastapi import UploadFile
+from pydantic import ValidationError
 
 from src.core.config.config import settings
+from src.core.rate_limit.exceptions import RateLimitStatsUnavailableException
 from src.plugin import service
 from src.plugin.model import Plugin
-from src.plugin.schemas import CreatePluginDto, PluginDto
+from src.plugin.schemas import CreatePluginDto, PluginDto, UpdatePluginDto
 from src.plugin.service import PluginService
 from tests import conftest, default_test_plugins
 from tests.default_test_plugins.plugin_test import plugin
@@ -119,6 +121,68 @@ class TestPluginService:
         await plugin_service.delete_plugin(plugin_entity.id)
         assert not Path.joinpath(settings.PLUGIN_DIR, plugin_entity.file_name).exists()
 
+    @pytest.mark.asyncio
+    async def test_upload_and_delete_invalidate_plugin(
+        self, override_directories, mock_repository, plugin_entity, create_plugin_file
+    ):
+        redis_client = Mock()
+        redis_client.publish = AsyncMock(return_value=1)
+        plugin_service = PluginService(mock_repository, redis_client)
+        os.mkdir(settings.RESOURCES_DIR / str(plugin_entity.id))
+
+        await plugin_service.upload_plugin(
+            plugin_entity.id,
+            UploadFile(filename="plugin.py", file=io.BytesIO(b"print('hello')\n")),
+        )
+        await plugin_service.delete_plugin(plugin_entity.id)
+
+        redis_client.publish.assert_has_awaits(
+            [
+                call(settings.PLUGIN_CACHE_INVALIDATION_CHANNEL, str(plugin_entity.id)),
+                call(settings.PLUGIN_CACHE_INVALIDATION_CHANNEL, str(plugin_entity.id)),
+            ]
+        )
+
+    @pytest.mark.asyncio
+    async def test_update_plugin_limits(self, mock_repository, plugin_entity):
+        mock_repository.update = AsyncMock(return_value=plugin_entity)
+        plugin_service = PluginService(mock_repository)
+
+        await plugin_service.update_plugin(
+            UpdatePluginDto(id=plugin_entity.id, rate_limit=2.5, max_concurrency=None)
+        )
+
+        # the unset limits are kept, the explicit null removes the limit
+        mock_repository.update.assert_awaited_once_with(
+            plugin_entity.id,
+            {"id": plugin_entity.id, "rate_limit": 2.5, "max_concurrency": None},
+        )
+
+    @pytest.mark.asyncio
+    async def test_update_plugin_task_queue(self, mock_repository, plugin_entity):
+        mock_repository.update = AsyncMock(return_value=plugin_entity)
+        plugin_service = PluginService(mock_repository)
+
+        await plugin_service.update_plugin(
+            UpdatePluginDto(
+                id=plugin_entity.id, task_queue=settings.SLOW_CATALOG_TASK_QUEUE
+            )
+        )
+
+        mock_repository.update.assert_awaited_once_with(
+            plugin_entity.id,
+            {"id": plugin_entity.id, "task_queue": settings.SLOW_CATALOG_TASK_QUEUE},
+        )
+
+    def test_update_plugin_unknown_task_queue(self, plugin_entity):
+        with pytest.raises(ValidationError):
+            UpdatePluginDto(id=plugin_entity.id, task_queue="unknown")
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_stats_without_redis(self, plugin_service, plugin_entity):
+        with pytest.raises(RateLimitStatsUnavailableException):
+            await plugin_service.get_rate_limit_stats(plugin_entity.id)
+
     @pytest.mark.asyncio
     async def test_register_plugins(self, override_directories, plugin_service):
         dto: PluginDto = await plugin_service._PluginService__register_plugin(plugin)
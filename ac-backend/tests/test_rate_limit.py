@@ -0,0 +1,209 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import fakeredis
+import httpx
+import pytest
+import redis
+
+from src.core.config.config import settings
+from src.core.http_client.registry import HttpClientRegistry
+from src.core.rate_limit.exceptions import ConcurrencySlotUnavailableException
+from src.core.rate_limit import limiter as limiter_module
+from src.core.rate_limit.limiter import (
+    RateLimiter,
+    acquire_current_token,
+    async_acquire_current_token,
+)
+
+
+class RecordingRateLimiter(RateLimiter):
+    """Limiter counting the tokens instead of taking them from Redis."""
+
+    def __init__(self) -> None:
+        super().__init__("test", rate=1.0)
+        self.tokens = 0
+
+    def acquire_token(self) -> float:
+        self.tokens += 1
+        return 0.0
+
+
+class FailingRedis:
+    def __getattr__(self, name):
+        raise AssertionError(f"Redis must not be called, {name} was accessed")
+
+
+@pytest.fixture
+def lua_redis():
+    # runs the Lua scripts of the limiter
+    client = fakeredis.FakeRedis()
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def recorded_sleeps(monkeypatch):
+    # the waits are recorded instead of slept, so no tokens are refilled between the calls
+    sleeps = []
+    monkeypatch.setattr(
+        limiter_module,
+        "time",
+        SimpleNamespace(sleep=sleeps.append, monotonic=time.monotonic),
+    )
+    return sleeps
+
+
+@pytest.fixture
+def unavailable_redis():
+    # nothing listens on the port
+    client = redis.Redis(port=9, socket_connect_timeout=0.5, socket_timeout=0.5)
+    yield client
+    client.close()
+
+
+def test_limiter_without_limits_does_not_use_redis():
+    limiter = RateLimiter("test", redis_client=FailingRedis())
+
+    assert limiter.acquire_token() == 0.0
+    with limiter.slot():
+        pass
+
+
+def test_limits_are_not_applied_without_redis(unavailable_redis):
+    limiter = RateLimiter(
+        "test", rate=1.0, burst=2, max_concurrency=1, redis_client=unavailable_redis
+    )
+
+    assert limiter.acquire_token() == 0.0
+    with limiter.slot():
+        with limiter.slot():
+            pass
+
+
+@pytest.mark.asyncio
+async def test_async_slot_without_redis(unavailable_redis):
+    limiter = RateLimiter("test", max_concurrency=1, redis_client=unavailable_redis)
+
+    async with limiter.async_slot():
+        async with limiter.async_slot():
+            pass
+
+
+def test_tokens_are_acquired_within_slot():
+    limiter = RecordingRateLimiter()
+
+    acquire_current_token()
+    assert limiter.tokens == 0
+
+    with limiter.slot():
+        acquire_current_token()
+        acquire_current_token()
+    acquire_current_token()
+
+    assert limiter.tokens == 2
+
+
+@pytest.mark.asyncio
+async def test_async_tokens_are_acquired_within_slot():
+    limiter = RecordingRateLimiter()
+
+    async with limiter.async_slot():
+        await async_acquire_current_token()
+    await async_acquire_current_token()
+
+    assert limiter.tokens == 1
+
+
+def test_pooled_client_requests_acquire_tokens():
+    registry = HttpClientRegistry()
+    limiter = RecordingRateLimiter()
+    try:
+        # nothing listens on the port, the token is acquired before the request fails
+        client = registry.client("http://127.0.0.1:9", timeout=1.0)
+        with pytest.raises(httpx.ConnectError):
+            client.get("http://127.0.0.1:9/")
+        assert limiter.tokens == 0
+
+        with limiter.slot(), pytest.raises(httpx.ConnectError):
+            client.get("http://127.0.0.1:9/")
+        assert limiter.tokens == 1
+    finally:
+        registry.close()
+
+
+def test_token_bucket_burst_and_wait_order(lua_redis, recorded_sleeps):
+    limiter = RateLimiter("test", rate=10.0, burst=3, redis_client=lua_redis)
+
+    waits = [limiter.acquire_token() for _ in range(6)]
+
+    # the burst is served at once, the bucket goes into debt for the later calls in their order
+    assert waits == pytest.approx([0, 0, 0, 0.1, 0.2, 0.3], abs=0.02)
+    assert recorded_sleeps == waits
+    assert lua_redis.hget("rate-limit:test:stats", "requests") == b"6"
+
+
+def test_token_bucket_refills(lua_redis, recorded_sleeps):
+    limiter = RateLimiter("test", rate=20.0, redis_client=lua_redis)
+
+    assert limiter.acquire_token() == pytest.approx(0, abs=0.01)
+    assert limiter.acquire_token() == pytest.approx(0.05, abs=0.01)
+    # the debt and the next token are refilled
+    time.sleep(0.15)
+    assert limiter.acquire_token() == pytest.approx(0, abs=0.01)
+
+
+def test_slots_are_capped(lua_redis, monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_SLOT_POLL_INTERVAL", 0.01)
+    limiter = RateLimiter("test", max_concurrency=2, redis_client=lua_redis)
+    acquired = threading.Event()
+
+    def third_slot():
+        with limiter.slot():
+            acquired.set()
+
+    with limiter.slot():
+        with limiter.slot():
+            thread = threading.Thread(target=third_slot)
+            thread.start()
+            assert not acquired.wait(0.2)
+            assert lua_redis.zcard("rate-limit:test:slots") == 2
+        # a released slot is taken by the waiting caller
+        assert acquired.wait(5)
+        thread.join()
+
+    assert lua_redis.zcard("rate-limit:test:slots") == 0
+
+
+def test_slot_lease_expires(lua_redis, monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_SLOT_LEASE", 0.2)
+    monkeypatch.setattr(settings, "RATE_LIMIT_SLOT_POLL_INTERVAL", 0.01)
+    limiter = RateLimiter("test", max_concurrency=1, redis_client=lua_redis)
+    # the slot of a crashed worker is never released
+    crashed_slot = RateLimiter("test", max_concurrency=1, redis_client=lua_redis).slot()
+    crashed_slot.__enter__()
+
+    start = time.monotonic()
+    with limiter.slot():
+        waited = time.monotonic() - start
+
+    # released by the lease, before the key of the slots expires after a second
+    assert 0.15 < waited < 0.9
+
+
+def test_slot_wait_is_bounded(lua_redis, monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_SLOT_MAX_WAIT", 0.1)
+    monkeypatch.setattr(settings, "RATE_LIMIT_SLOT_POLL_INTERVAL", 0.01)
+    limiter = RateLimiter("test", max_concurrency=1, redis_client=lua_redis)
+
+    start = time.monotonic()
+    with limiter.slot():
+        with pytest.raises(ConcurrencySlotUnavailableException) as e:
+            with limiter.slot():
+                pass
+        waited = time.monotonic() - start
+        assert lua_redis.zcard("rate-limit:test:slots") == 1
+
+    assert 0.1 <= waited < 1
+    assert e.value.countdown == 0.1
@@ -0,0 +1,210 @@
+import os
+import time
+import uuid
+from collections import Counter
+
+import pytest
+
+from src.core.raw_data_cache.cache import (
+    RawDataCache,
+    current_raw_data_cache,
+    evict_raw_data_cache,
+)
+from src.plugin.interface.catalog_plugin import CatalogPlugin
+from src.plugin.interface.schemas import StellarObjectIdentificatorDto
+
+
+class RecordingRedis:
+    """Redis client counting the statistics in memory."""
+
+    def __init__(self) -> None:
+        self.stats: dict[str, Counter[str]] = {}
+
+    def pipeline(self, transaction: bool = True) -> "RecordingRedis":
+        return self
+
+    def __enter__(self) -> "RecordingRedis":
+        return self
+
+    def __exit__(self, *args) -> None:
+        pass
+
+    def hincrby(self, key: str, field: str, amount: int) -> None:
+        self.stats.setdefault(key, Counter())[field] += amount
+
+    def execute(self) -> None:
+        pass
+
+
+class FailingRedis:
+    def __getattr__(self, name):
+        raise AssertionError(f"Redis must not be called, {name} was accessed")
+
+
+class DownloadingPlugin(CatalogPlugin[StellarObjectIdentificatorDto]):
+    def __init__(self) -> None:
+        super().__init__()
+        self.downloads = 0
+
+    def list_objects(self, coords, radius_arcsec, plugin_id, resources_dir):
+        yield []
+
+    def get_photometric_data(self, identificator, csv_path, resources_dir):
+        self._cached_download(identificator, csv_path, self._download)
+        yield []
+
+    def _download(self, path):
+        self.downloads += 1
+        path.write_text(f"download {self.downloads}")
+
+
+@pytest.fixture
+def plugin_id():
+    return uuid.uuid4()
+
+
+def make_identificator(plugin_id, name="Star A", **extra):
+    return StellarObjectIdentificatorDto(
+        plugin_id=plugin_id,
+        ra_deg=10.0,
+        dec_deg=-20.0,
+        name=name,
+        dist_arcsec=1.0,
+        **extra,
+    )
+
+
+def test_content_hash_ignores_search_and_attribute_order(plugin_id):
+    identificator = make_identificator(plugin_id, auid="000-AAA", field="x")
+
+    same = StellarObjectIdentificatorDto(
+        field="x",
+        auid="000-AAA",
+        name="Star A",
+        dec_deg=-20.0,
+        ra_deg=10.0,
+        dist_arcsec=25.0,
+        plugin_id=plugin_id,
+    )
+    assert identificator.content_hash() == same.content_hash()
+    assert (
+        identificator.content_hash()
+        != make_identificator(plugin_id, auid="000-AAB", field="x").content_hash()
+    )
+
+
+def test_load_and_store(tmp_path, plugin_id):
+    redis_client = RecordingRedis()
+    raw_cache = RawDataCache(
+        plugin_id, ttl=60, directory=tmp_path / "cache", redis_client=redis_client
+    )
+    identificator = make_identificator(plugin_id)
+    source = tmp_path / "first.csv"
+    target = tmp_path / "second.csv"
+
+    assert not raw_cache.load(identificator, target)
+    assert not target.exists()
+
+    source.write_text("raw data")
+    raw_cache.store(identificator, source)
+    assert raw_cache.contains(identificator)
+    # found by other search of the same object
+    assert raw_cache.load(identificator.model_copy(update={"dist_arcsec": 9.0}), target)
+    assert target.read_text() == "raw data"
+
+    assert redis_client.stats[f"raw-data-cache:{plugin_id}:stats"] == {
+        "misses": 1,
+        "stores": 1,
+        "stored_bytes": 8,
+        "hits": 1,
+        "hit_bytes": 8,
+    }
+
+
+def test_expired_entry_is_not_loaded(tmp_path, plugin_id):
+    raw_cache = RawDataCache(
+        plugin_id, ttl=60, directory=tmp_path / "cache", redis_client=RecordingRedis()
+    )
+    identificator = make_identificator(plugin_id)
+    source = tmp_path / "raw.csv"
+    source.write_text("raw data")
+    raw_cache.store(identificator, source)
+
+    entry = tmp_path / "cache" / str(plugin_id) / identificator.content_hash()
+    stored = time.time() - 120
+    os.utime(entry, (stored, stored))
+
+    assert not raw_cache.contains(identificator)
+    assert not raw_cache.load(identificator, tmp_path / "target.csv")
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, plugin_id):
+    redis_client = RecordingRedis()
+    # fits two entries of 10 bytes
+    raw_cache = RawDataCache(
+        plugin_id,
+        ttl=60,
+        max_bytes=25,
+        directory=tmp_path / "cache",
+        redis_client=redis_client,
+    )
+    identificators = [make_identificator(plugin_id, name) for name in "ABC"]
+    source = tmp_path / "raw.csv"
+
+    for index, identificator in enumerate(identificators[:2]):
+        source.write_text("0123456789")
+        raw_cache.store(identificator, source)
+        source.unlink()
+        # the first entry was used later than the second one
+        entry = tmp_path / "cache" / str(plugin_id) / identificator.content_hash()
+        os.utime(entry, (time.time() - 10 * (index + 1), time.time()))
+
+    source.write_text("0123456789")
+    raw_cache.store(identificators[2], source)
+    # the entries are evicted by the cleanup, not by the store
+    assert all(raw_cache.contains(identificator) for identificator in identificators)
+
+    assert (
+        evict_raw_data_cache(
+            max_bytes=25, directory=tmp_path / "cache", redis_client=redis_client
+        )
+        == 1
+    )
+    assert [raw_cache.contains(identificator) for identificator in identificators] == [
+        True,
+        False,
+        True,
+    ]
+    assert redis_client.stats[f"raw-data-cache:{plugin_id}:stats"]["evictions"] == 1
+
+
+def test_disabled_cache_is_not_used(tmp_path, plugin_id):
+    raw_cache = RawDataCache(
+        plugin_id, ttl=0, directory=tmp_path / "cache", redis_client=FailingRedis()
+    )
+    identificator = make_identificator(plugin_id)
+    source = tmp_path / "raw.csv"
+    source.write_text("raw data")
+
+    raw_cache.store(identificator, source)
+    assert not raw_cache.load(identificator, tmp_path / "target.csv")
+    with raw_cache.scope():
+        assert current_raw_data_cache() is None
+
+
+def test_plugin_downloads_once_within_scope(tmp_path, plugin_id):
+    plugin = DownloadingPlugin()
+    raw_cache = RawDataCache(
+        plugin_id, ttl=60, directory=tmp_path / "cache", redis_client=RecordingRedis()
+    )
+    identificator = make_identificator(plugin_id)
+
+    # the cache is used only within the scope set by the task
+    list(plugin.get_photometric_data(identificator, tmp_path / "1.csv", tmp_path))
+    with raw_cache.scope():
+        list(plugin.get_photometric_data(identificator, tmp_path / "2.csv", tmp_path))
+        list(plugin.get_photometric_data(identificator, tmp_path / "3.csv", tmp_path))
+    assert current_raw_data_cache() is None
+
+    assert plugin.downloads == 2
+    assert (tmp_path / "3.csv").read_text() == "download 2"
@@ -318,3 +318,123 @@ class TestRepository:
         rows = result.scalars().all()
 
         assert len(rows) == 3
+
+    @pytest.mark.asyncio
+    async def test_insert_returning_keeps_order(self, plugin_repo, db_session):
+        names = [f"Bulk{i}" for i in range(20)]
+
+        plugins = await plugin_repo.insert_returning(
+            [
+                {
+                    "name": name,
+                    "catalog_url": "http://example.com",
+                    "description": "desc",
+                    "created_by": "tester",
+                    "directly_identifies_objects": False,
+                }
+                for name in names
+            ]
+        )
+
+        assert [p.name for p in plugins] == names
+        assert len({p.id for p in plugins}) == len(names)
+
+        stmt = select(Plugin.id, Plugin.name).where(Plugin.name.in_(names))
+        rows = dict((await db_session.execute(stmt)).tuples().all())
+        assert rows == {p.id: p.name for p in plugins}
+
+    @pytest.mark.asyncio
+    async def test_insert_returning_empty(self, plugin_repo):
+        assert await plugin_repo.insert_returning([]) == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("order", ["asc", "desc"])
+    async def test_find_by_cursor_pages_through_all(
+        self, db_session, plugin_repo, order
+    ):
+        # duplicate names are ordered by ID
+        names = ["Alpha", "Beta", "Beta", "Beta", "Gamma"]
+        db_session.add_all([self.make_plugin(n, created_by="pager") for n in names])
+        await db_session.commit()
+
+        filters = Filters(
+            filters={"created_by__eq": "pager"},
+            order_by=OrderBy(field="name", value=order),
+        )
+        pages = []
+        cursor = None
+        while True:
+            total_count, results, cursor = await plugin_repo.find_by_cursor(
+                cursor=cursor, count=2, filters=filters
+            )
+            assert total_count == 5
+            pages.append(results)
+            if cursor is None:
+                break
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+        plugins = [p for page in pages for p in page]
+        assert len({p.id for p in plugins}) == 5
+        assert [(p.name, p.id) for p in plugins] == sorted(
+            ((p.name, p.id) for p in plugins), reverse=order == "desc"
+        )
+
+    @pytest.mark.asyncio
+    async def test_find_by_cursor_default_key_and_offset(self, db_session, plugin_repo):
+        db_session.add_all(
+            [self.make_plugin(f"P{i}", created_by="pager") for i in range(3)]
+        )
+        await db_session.commit()
+        filters = Filters(filters={"created_by__eq": "pager"})
+
+        _, first, cursor = await plugin_repo.find_by_cursor(count=1, filters=filters)
+        _, rest, last_cursor = await plugin_repo.find_by_cursor(
+            cursor=cursor, filters=filters
+        )
+        _, skipped, _ = await plugin_repo.find_by_cursor(offset=2, filters=filters)
+
+        ids = sorted([first[0].id, *(p.id for p in rest)])
+        assert [first[0].id, *(p.id for p in rest)] == ids
+        assert [p.id for p in skipped] == ids[2:]
+        assert last_cursor is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("cursor", ["not a cursor", "e30=", "W10="])
+    async def test_find_by_cursor_invalid_cursor_raises(self, plugin_repo, cursor):
+        with pytest.raises(RepositoryException) as excinfo:
+            await plugin_repo.find_by_cursor(cursor=cursor)
+
+        assert "Invalid cursor" in str(excinfo.value)
+
+    @pytest.mark.asyncio
+    async def test_find_by_cursor_other_order_raises(self, db_session, plugin_repo):
+        db_session.add_all([self.make_plugin(f"P{i}") for i in range(2)])
+        await db_session.commit()
+
+        _, _, cursor = await plugin_repo.find_by_cursor(count=1)
+
+        with pytest.raises(RepositoryException) as excinfo:
+            await plugin_repo.find_by_cursor(
+                cursor=cursor, filters=Filters(order_by=OrderBy(field="name"))
+            )
+
+        assert "Invalid cursor" in str(excinfo.value)
+
+    @pytest.mark.asyncio
+    async def test_find_by_cursor_distinct_raises(self, plugin_repo):
+        filters = Filters(distinct=Distinct(fields=["name"]))
+
+        with pytest.raises(RepositoryException):
+            await plugin_repo.find_by_cursor(filters=filters)
+
+    @pytest.mark.asyncio
+    async def test_find_without_total(self, db_session, plugin_repo):
+        db_session.add_all([self.make_plugin("Alpha", created_by="counter")])
+        await db_session.commit()
+        filters = Filters(filters={"created_by__eq": "counter"})
+
+        total_count, results = await plugin_repo.find(filters=filters, with_total=False)
+
+        assert total_count is None
+        assert len(results) == 1
+        assert await plugin_repo.count(filters.filters) == 1
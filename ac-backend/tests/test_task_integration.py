@@ -1,26 +1,41 @@
 import uuid
+from contextlib import contextmanager
 
+import numpy as np
 import pytest
 import pytest_asyncio
 from astropy import units as u
 from astropy.coordinates import SkyCoord
+from astropy.coordinates.name_resolve import NameResolveError
 from fastapi import FastAPI
 from httpx import AsyncClient, ASGITransport
 from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
 )
 
 from src.core.celery.worker import celery_app
+from src.core.cone_search_cache import cache as cone_search_cache_module
+from src.core.cone_search_cache.cache import ConeSearchCache
+from src.core.config.config import settings
+from src.core.rate_limit.exceptions import ConcurrencySlotUnavailableException
+from src.core.rate_limit.limiter import RateLimiter
 from src.core.database.database import get_async_db_session
+from src.core.repository.repository import Repository
 from src.main import app
+from src.plugin.interface.catalog_plugin import CatalogPlugin
+from src.plugin.interface.photometric_batch import PhotometricBatch
+from src.plugin.model import Plugin
 from src.plugin.interface.schemas import (
     StellarObjectIdentificatorDto,
     PhotometricDataDto,
+    PhotometricDataJobDto,
 )
 from src.tasks.model import Task, StellarObjectIdentifier, PhotometricData
 from src.tasks.types import TaskType, TaskStatus
 from src.tasks import tasks as tasks_module
+from tests.test_cone_search_cache import InMemoryRedis
 
 
 @pytest.fixture(autouse=True)
@@ -154,6 +169,7 @@ async def test_cone_search_with_celery(
     task_obj = result.scalar_one()
     assert task_obj.task_type == TaskType.object_search
     assert task_obj.status == TaskStatus.completed
+    assert task_obj.result_count == 2
 
     # check that SyncTaskService.bulk_insert inserted the StellarObjectIdentifier rows
     result = await db_session.execute(
@@ -168,6 +184,157 @@ async def test_cone_search_with_celery(
     assert identifiers_by_name == {"Star A", "Star B"}
 
 
+@pytest.mark.asyncio
+async def test_cone_search_answered_from_cache(
+    client,
+    db_session,
+    override_directories,
+    monkeypatch,
+):
+    """
+    The cone contained in a recently searched cone is filtered from the cached objects, the plugin is called once.
+    """
+    plugin_id = uuid.uuid4()
+    cone_search_cache = ConeSearchCache(plugin_id, 60, redis_client=InMemoryRedis())
+    searches = []
+
+    class FakePlugin:
+        def list_objects(self, coords, radius_arcsec, plugin_id_arg, resources_dir):
+            searches.append(radius_arcsec)
+            yield [
+                StellarObjectIdentificatorDto(
+                    plugin_id=plugin_id,
+                    ra_deg=123.4,
+                    dec_deg=-22.5 + offset / 3600,
+                    name=f"Star {offset}",
+                    dist_arcsec=offset,
+                )
+                for offset in (2.0, 8.0)
+            ]
+
+    monkeypatch.setattr(
+        tasks_module.SyncTaskService,
+        "get_plugin_instance",
+        lambda self, plugin_id_param: FakePlugin(),
+        raising=True,
+    )
+    monkeypatch.setattr(
+        tasks_module.SyncTaskService,
+        "get_cone_search_cache",
+        lambda self, plugin_id_param: cone_search_cache,
+        raising=True,
+    )
+
+    task_ids = []
+    for radius_arcsec in (10.0, 5.0):
+        resp = await client.post(
+            f"/tasks/submit-task/{plugin_id}/cone-search",
+            json={
+                "right_ascension_deg": 123.4,
+                "declination_deg": -22.5,
+                "radius_arcsec": radius_arcsec,
+                "plugin_id": str(plugin_id),
+            },
+        )
+        assert resp.status_code == 200
+        task_ids.append(uuid.UUID(resp.json()["task_id"]))
+
+    assert searches == [10.0]
+
+    task_obj = await db_session.get(Task, task_ids[1])
+    assert task_obj.status == TaskStatus.completed
+    assert task_obj.result_count == 1
+    result = await db_session.execute(
+        select(StellarObjectIdentifier).where(
+            StellarObjectIdentifier.task_id == task_ids[1]
+        )
+    )
+    identifier = result.scalar_one()
+    assert identifier.identifier["name"] == "Star 2.0"
+    assert identifier.dist_arcsec == pytest.approx(2.0)
+
+
+@pytest.mark.asyncio
+async def test_cone_search_cache_skips_positional_plugins(
+    client,
+    db_session,
+    async_session_maker,
+    override_directories,
+    monkeypatch,
+):
+    """
+    The plugins, which do not identify the objects directly, return the searched position, so an off-center search
+    within a cached cone must call the plugin again.
+    """
+    plugin_id = uuid.uuid4()
+    searches = []
+
+    class FakePlugin:
+        def list_objects(self, coords, radius_arcsec, plugin_id_arg, resources_dir):
+            searches.append(radius_arcsec)
+            yield [
+                StellarObjectIdentificatorDto(
+                    plugin_id=plugin_id,
+                    ra_deg=coords.ra.deg,
+                    dec_deg=coords.dec.deg,
+                    name=None,
+                    dist_arcsec=0,
+                )
+            ]
+
+    monkeypatch.setattr(
+        tasks_module.SyncTaskService,
+        "get_plugin_instance",
+        lambda self, plugin_id_param: FakePlugin(),
+        raising=True,
+    )
+    redis_client = InMemoryRedis()
+    monkeypatch.setattr(cone_search_cache_module, "_redis_client", lambda: redis_client)
+
+    async with async_session_maker() as session:
+        session.add(
+            Plugin(
+                id=plugin_id,
+                name="Forced photometry",
+                catalog_url="https://example.com",
+                description="Forced photometry at the searched position",
+                created_by="test",
+                directly_identifies_objects=False,
+            )
+        )
+        await session.commit()
+
+    try:
+        task_ids = []
+        # the second cone is contained in the first one
+        for declination_deg, radius_arcsec in ((-22.5, 30.0), (-22.5 - 5 / 3600, 10.0)):
+            resp = await client.post(
+                f"/tasks/submit-task/{plugin_id}/cone-search",
+                json={
+                    "right_ascension_deg": 123.4,
+                    "declination_deg": declination_deg,
+                    "radius_arcsec": radius_arcsec,
+                    "plugin_id": str(plugin_id),
+                },
+            )
+            assert resp.status_code == 200
+            task_ids.append(uuid.UUID(resp.json()["task_id"]))
+    finally:
+        async with async_session_maker() as session:
+            await session.delete(await session.get(Plugin, plugin_id))
+            await session.commit()
+
+    assert searches == [30.0, 10.0]
+    result = await db_session.execute(
+        select(StellarObjectIdentifier).where(
+            StellarObjectIdentifier.task_id == task_ids[1]
+        )
+    )
+    identifier = result.scalar_one()
+    assert identifier.identifier["dec_deg"] == pytest.approx(-22.5 - 5 / 3600)
+    assert identifier.dist_arcsec == 0
+
+
 @pytest.mark.asyncio
 async def test_find_object_with_celery(
     client,
@@ -330,6 +497,7 @@ async def test_photometric_data_with_celery(
     task_obj = result.scalar_one()
     assert task_obj.task_type == TaskType.photometric_data
     assert task_obj.status == TaskStatus.completed
+    assert task_obj.result_count == 2
 
     # PhotometricData rows inserted by SyncTaskService.bulk_insert
     result = await db_session.execute(
@@ -345,3 +513,1025 @@ async def test_photometric_data_with_celery(
     assert jd_values == {2450000.5, 2450001.5}
     assert mags == {12.3, 12.4}
     assert filters == {"V", "B"}
+
+
+@pytest.mark.asyncio
+async def test_photometric_data_reused_from_recent_task(
+    client,
+    db_session,
+    override_directories,
+    monkeypatch,
+):
+    """
+    The second task of the same stellar object copies the data of the first one, the plugin is called once.
+    """
+    plugin_id = uuid.uuid4()
+    calls = []
+
+    class FakePlugin:
+        def get_photometric_data(self, identificator, csv_path, resources_dir):
+            calls.append(identificator.dist_arcsec)
+            csv_path.write_text("raw data")
+            yield [
+                PhotometricDataDto(
+                    plugin_id=plugin_id,
+                    julian_date=2450000.5 + i,
+                    magnitude=12.3,
+                    magnitude_error=0.01,
+                    light_filter="V",
+                )
+                for i in range(3)
+            ]
+
+    monkeypatch.setattr(
+        tasks_module.SyncTaskService,
+        "get_plugin_instance",
+        lambda self, plugin_id_param: FakePlugin(),
+        raising=True,
+    )
+
+    task_ids = []
+    # found by different searches of the same object
+    for dist_arcsec in (1.23, 4.56):
+        resp = await client.post(
+            f"/tasks/submit-task/{plugin_id}/photometric-data",
+            json={
+                "plugin_id": str(plugin_id),
+                "ra_deg": 12.3,
+                "dec_deg": -45.6,
+                "name": "TestStar",
+                "dist_arcsec": dist_arcsec,
+            },
+        )
+        assert resp.status_code == 200
+        task_ids.append(uuid.UUID(resp.json()["task_id"]))
+
+    assert calls == [1.23]
+
+    resp = await client.get(f"/tasks/task_status/{task_ids[1]}")
+    assert resp.status_code == 200
+    assert resp.json()["status"] == TaskStatus.completed.value
+    assert resp.json()["source_task_id"] == str(task_ids[0])
+
+    result = await db_session.execute(select(Task).where(Task.id.in_(task_ids)))
+    assert [task.result_count for task in result.scalars()] == [3, 3]
+    result = await db_session.execute(
+        select(PhotometricData.julian_date).where(
+            PhotometricData.task_id == task_ids[1]
+        )
+    )
+    assert sorted(result.scalars()) == [2450000.5, 2450001.5, 2450002.5]
+    assert (settings.TEMP_DIR / f"{task_ids[1]}.csv").read_text() == "raw data"
+
+
+@pytest.mark.asyncio
+async def test_reused_tasks_of_failed_batch_stay_completed(
+    client,
+    db_session,
+    override_directories,
+    monkeypatch,
+):
+    """
+    The tasks of a batch, which were completed by reusing the data of a recent task,
+    are not failed together with the rest of the batch.
+    """
+    plugin_id = uuid.uuid4()
+
+    class FakePlugin:
+        def get_photometric_data(self, identificator, csv_path, resources_dir):
+            yield PhotometricBatch.from_columns(
+                plugin_id, [2450000.5], [12.3], [0.01], "V"
+            )
+
+    monkeypatch.setattr(
+        tasks_module.SyncTaskService,
+        "get_plugin_instance",
+        lambda self, plugin_id_param: FakePlugin(),
+        raising=True,
+    )
+
+    identificator = {
+        "plugin_id": str(plugin_id),
+        "ra_deg": 12.3,
+        "dec_deg": -45.6,
+        "name": "TestStar",
+        "dist_arcsec": 1.23,
+    }
+    resp = await client.post(
+        f"/tasks/submit-task/{plugin_id}/photometric-data", json=identificator
+    )
+    assert resp.status_code == 200
+
+    reuse_photometric_data = tasks_module.SyncTaskService.reuse_photometric_data
+    reused = []
+
+    def failing_second_reuse(self, task_id, identificator_dto):
+        reused.append(task_id)
+        if len(reused) > 1:
+            raise OperationalError("SELECT", {}, Exception("Connection lost"))
+        return reuse_photometric_data(self, task_id, identificator_dto)
+
+    monkeypatch.setattr(
+        tasks_module.SyncTaskService, "reuse_photometric_data", failing_second_reuse
+    )
+
+    with pytest.raises(OperationalError):
+        await client.post(
+            f"/tasks/submit-task/{plugin_id}/photometric-data-batch",
+            json={"identificators": [identificator, identificator]},
+        )
+
+    result = await db_session.execute(
+        select(Task.id, Task.status).where(Task.id.in_(map(uuid.UUID, reused)))
+    )
+    statuses = dict(result.all())
+    assert [statuses[uuid.UUID(task_id)] for task_id in reused] == [
+        TaskStatus.completed,
+        TaskStatus.failed,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_photometric_batch_with_celery(
+    client,
+    db_session,
+    override_directories,
+    monkeypatch,
+):
+    """
+    Plugins yielding columnar photometric batches are inserted without per-row objects.
+    """
+    plugin_id = uuid.uuid4()
+
+    class FakePlugin:
+        def get_photometric_data(self, identificator, csv_path, resources_dir):
+            yield PhotometricBatch.from_columns(
+                plugin_id,
+                np.array([2450000.5, 2450001.5, 2450002.5]),
+                np.array([12.3, 12.4, 12.5]),
+                np.array([0.01, 0.02, 0.03]),
+                light_filter=np.array(["V", None, "B"], dtype=object),
+            )
+            yield PhotometricBatch.from_columns(plugin_id, [], [], [], "V")
+
+    def fake_get_plugin_instance(self, plugin_id_param):
+        return FakePlugin()
+
+    monkeypatch.setattr(
+        tasks_module.SyncTaskService,
+        "get_plugin_instance",
+        fake_get_plugin_instance,
+        raising=True,
+    )
+
+    body = {
+        "plugin_id": str(plugin_id),
+        "ra_deg": 12.3,
+        "dec_deg": -45.6,
+        "name": "TestStar",
+        "dist_arcsec": 1.23,
+    }
+
+    resp = await client.post(
+        f"/tasks/submit-task/{plugin_id}/photometric-data",
+        json=body,
+    )
+
+    assert resp.status_code == 200
+    task_id = uuid.UUID(resp.json()["task_id"])
+
+    result = await db_session.execute(select(Task).where(Task.id == task_id))
+    assert result.scalar_one().status == TaskStatus.completed
+
+    result = await db_session.execute(
+        select(PhotometricData)
+        .where(PhotometricData.task_id == task_id)
+        .order_by(PhotometricData.julian_date)
+    )
+    records = result.scalars().all()
+
+    assert [r.julian_date for r in records] == [2450000.5, 2450001.5, 2450002.5]
+    assert [r.magnitude for r in records] == [12.3, 12.4, 12.5]
+    assert [r.magnitude_error for r in records] == [0.01, 0.02, 0.03]
+    assert [r.light_filter for r in records] == ["V", None, "B"]
+    assert all(r.plugin_id == plugin_id for r in records)
+
+
+@pytest.mark.asyncio
+async def test_photometric_data_writer_failure_marks_task_failed(
+    client,
+    db_session,
+    override_directories,
+    monkeypatch,
+):
+    """
+    An error in the writer thread of the photometric data task fails the whole task.
+    """
+    plugin_id = uuid.uuid4()
+
+    class FakePlugin:
+        def get_photometric_data(self, identificator, csv_path, resources_dir):
+            for i in range(10):
+                yield PhotometricBatch.from_columns(
+                    plugin_id, [2450000.5 + i], [12.3], [0.01], "V"
+                )
+
+    def fake_get_plugin_instance(self, plugin_id_param):
+        return FakePlugin()
+
+    failed_task_ids = []
+
+    def failing_insert(self, task_id, batch):
+        failed_task_ids.append(task_id)
+        raise RuntimeError("insert failed")
+
+    monkeypatch.setattr(
+        tasks_module.SyncTaskService,
+        "get_plugin_instance",
+        fake_get_plugin_instance,
+        raising=True,
+    )
+    monkeypatch.setattr(
+        tasks_module.SyncTaskService,
+        "insert_photometric_batch",
+        failing_insert,
+        raising=True,
+    )
+
+    body = {
+        "plugin_id": str(plugin_id),
+        "ra_deg": 12.3,
+        "dec_deg": -45.6,
+        "name": "TestStar",
+        "dist_arcsec": 1.23,
+    }
+
+    with pytest.raises(RuntimeError, match="insert failed"):
+        await client.post(
+            f"/tasks/submit-task/{plugin_id}/photometric-data",
+            json=body,
+        )
+
+    assert len(failed_task_ids) == 1
+    result = await db_session.execute(select(Task).where(Task.id == failed_task_ids[0]))
+    assert result.scalar_one().status == TaskStatus.failed
+
+
+@pytest.mark.asyncio
+async def test_period_search_with_celery(
+    client,
+    db_session,
+    override_directories,
+    monkeypatch,
+):
+    """
+    Photometric data task followed by a period search task over its data, both run eagerly by Celery.
+    """
+    plugin_id = uuid.uuid4()
+    rng = np.random.default_rng(42)
+    julian_date = 2450000.0 + np.sort(rng.uniform(0, 100, 300))
+    magnitude = 12.0 + 0.3 * np.sin(2 * np.pi * julian_date / 2.5)
+
+    class FakePlugin:
+        def get_photometric_data(self, identificator, csv_path, resources_dir):
+            yield PhotometricBatch.from_columns(
+                plugin_id, julian_date, magnitude, np.full(300, 0.01), "V"
+            )
+
+    monkeypatch.setattr(
+        tasks_module.SyncTaskService,
+        "get_plugin_instance",
+        lambda self, plugin_id_param: FakePlugin(),
+        raising=True,
+    )
+
+    resp = await client.post(
+        f"/tasks/submit-task/{plugin_id}/photometric-data",
+        json={
+            "plugin_id": str(plugin_id),
+            "ra_deg": 12.3,
+            "dec_deg": -45.6,
+            "name": "TestStar",
+            "dist_arcsec": 1.23,
+        },
+    )
+    data_task_id = resp.json()["task_id"]
+
+    resp = await client.post(
+        "/tasks/submit-task/period-search",
+        json={"task_ids": [data_task_id], "peaks": 3, "box_least_squares": True},
+    )
+
+    assert resp.status_code == 200
+    task_id = uuid.UUID(resp.json()["task_id"])
+
+    result = await db_session.execute(select(Task).where(Task.id == task_id))
+    task_obj = result.scalar_one()
+    assert task_obj.task_type == TaskType.period_search
+    assert task_obj.status == TaskStatus.completed
+    assert task_obj.result_count == 6
+
+    resp = await client.post(
+        "/retrieve/periodogram-peaks",
+        json={"filters": {"task_id__eq": str(task_id)}},
+    )
+    page = resp.json()
+    assert page["total_items"] == 6
+
+    lomb_scargle = [p for p in page["data"] if p["method"] == "LOMB_SCARGLE"]
+    best = min(lomb_scargle, key=lambda p: p["rank"])
+    assert best["light_filter"] == "V"
+    assert best["period"] == pytest.approx(2.5, rel=1e-2)
+    assert best["false_alarm_probability"] < 1e-6
+
+
+@pytest.mark.asyncio
+async def test_photometric_data_job_reschedules_task(
+    client,
+    db_session,
+    override_directories,
+    monkeypatch,
+):
+    """
+    The task re-schedules itself, while the job of the plugin is not ready, and retrieves the data
+    with the ready job afterwards.
+    """
+    plugin_id = uuid.uuid4()
+    polled_jobs = []
+
+    class FakePlugin:
+        def poll_photometric_data(self, identificator, job):
+            polled_jobs.append(job)
+            if job is None:
+                return PhotometricDataJobDto(state={"url": "job/1"}, countdown=30)
+            return PhotometricDataJobDto(
+                state={**job.state, "result": "result/1"}, ready=True
+            )
+
+        def get_photometric_data(self, identificator, csv_path, resources_dir, job):
+            assert job.state == {"url": "job/1", "result": "result/1"}
+            yield PhotometricBatch.from_columns(
+                plugin_id, [2450000.5], [12.3], [0.01], "V"
+            )
+
+    monkeypatch.setattr(
+        tasks_module.SyncTaskService,
+        "get_plugin_instance",
+        lambda self, plugin_id_param: FakePlugin(),
+        raising=True,
+    )
+
+    countdowns = []
+    apply_async = tasks_module.get_photometric_data.apply_async
+
+    def recording_apply_async(*args, countdown=None, **kwargs):
+        countdowns.append(countdown)
+        return apply_async(*args, **kwargs)
+
+    monkeypatch.setattr(
+        tasks_module.get_photometric_data, "apply_async", recording_apply_async
+    )
+
+    resp = await client.post(
+        f"/tasks/submit-task/{plugin_id}/photometric-data",
+        json={
+            "plugin_id": str(plugin_id),
+            "ra_deg": 12.3,
+            "dec_deg": -45.6,
+            "name": "TestStar",
+            "dist_arcsec": 1.23,
+        },
+    )
+
+    assert resp.status_code == 200
+    task_id = uuid.UUID(resp.json()["task_id"])
+
+    # the first call is made by the router, the second one by the task waiting for the job
+    assert countdowns == [None, 30]
+    assert polled_jobs[0] is None
+    assert polled_jobs[1].state == {"url": "job/1"}
+
+    result = await db_session.execute(select(Task).where(Task.id == task_id))
+    task_obj = result.scalar_one()
+    assert task_obj.status == TaskStatus.completed
+    assert task_obj.result_count == 1
+    assert task_obj.job["ready"] is True
+
+
+@pytest.mark.asyncio
+async def test_photometric_data_job_timeout_fails_task(
+    client,
+    db_session,
+    override_directories,
+    monkeypatch,
+):
+    plugin_id = uuid.uuid4()
+
+    class FakePlugin:
+        def poll_photometric_data(self, identificator, job):
+            return PhotometricDataJobDto(countdown=30)
+
+        def get_photometric_data(self, identificator, csv_path, resources_dir, job):
+            raise AssertionError("the job is never ready")
+
+    monkeypatch.setattr(
+        tasks_module.SyncTaskService,
+        "get_plugin_instance",
+        lambda self, plugin_id_param: FakePlugin(),
+        raising=True,
+    )
+    monkeypatch.setattr(settings, "PHOTOMETRIC_DATA_JOB_TIMEOUT", -1.0)
+
+    with pytest.raises(TimeoutError):
+        await client.post(
+            f"/tasks/submit-task/{plugin_id}/photometric-data",
+            json={
+                "plugin_id": str(plugin_id),
+                "ra_deg": 12.3,
+                "dec_deg": -45.6,
+                "name": "TestStar",
+                "dist_arcsec": 1.23,
+            },
+        )
+
+    result = await db_session.execute(
+        select(Task).where(Task.task_type == TaskType.photometric_data)
+    )
+    assert TaskStatus.failed in {task.status for task in result.scalars().all()}
+
+
+@pytest.mark.asyncio
+async def test_cone_search_holds_rate_limit_slot(
+    client,
+    db_session,
+    override_directories,
+    monkeypatch,
+):
+    """
+    The plugin runs within the slot of the rate limiter of its catalog.
+    """
+    plugin_id = uuid.uuid4()
+    entered = []
+
+    class RecordingRateLimiter(RateLimiter):
+        @contextmanager
+        def slot(self):
+            entered.append("enter")
+            with super().slot():
+                yield
+            entered.append("exit")
+
+    class FakePlugin:
+        def list_objects(self, coords, radius_arcsec, plugin_id_arg, resources_dir):
+            assert entered == ["enter"]
+            yield []
+
+    monkeypatch.setattr(
+        tasks_module.SyncTaskService,
+        "get_plugin_instance",
+        lambda self, plugin_id_param: FakePlugin(),
+        raising=True,
+    )
+    monkeypatch.setattr(
+        tasks_module.SyncTaskService,
+        "get_rate_limiter",
+        lambda self, plugin_id_param: RecordingRateLimiter(str(plugin_id_param)),
+        raising=True,
+    )
+
+    resp = await client.post(
+        f"/tasks/submit-task/{plugin_id}/cone-search",
+        json={
+            "right_ascension_deg": 10.0,
+            "declination_deg": -20.0,
+            "radius_arcsec": 30.0,
+            "plugin_id": str(plugin_id),
+        },
+    )
+
+    assert resp.status_code == 200
+    assert entered == ["enter", "exit"]
+
+
+@pytest.mark.asyncio
+async def test_task_without_slot_is_rescheduled(client, db_session, monkeypatch):
+    """
+    The task, which does not get a concurrency slot of its catalog, re-schedules itself instead of waiting
+    in the worker, and runs the plugin once it gets the slot.
+    """
+    plugin_id = uuid.uuid4()
+    attempts = []
+
+    class SaturatedRateLimiter(RateLimiter):
+        @contextmanager
+        def slot(self):
+            attempts.append(self._name)
+            if len(attempts) == 1:
+                raise ConcurrencySlotUnavailableException(self._name, 10.0)
+            yield
+
+    class FakePlugin:
+        def list_objects(self, coords, radius_arcsec, plugin_id_arg, resources_dir):
+            yield []
+
+    monkeypatch.setattr(
+        tasks_module.SyncTaskService,
+        "get_plugin_instance",
+        lambda self, plugin_id_param: FakePlugin(),
+        raising=True,
+    )
+    monkeypatch.setattr(
+        tasks_module.SyncTaskService,
+        "get_rate_limiter",
+        lambda self, plugin_id_param: SaturatedRateLimiter(str(plugin_id_param)),
+        raising=True,
+    )
+
+    countdowns = []
+    apply_async = tasks_module.catalog_cone_search.apply_async
+
+    def recording_apply_async(*args, countdown=None, **kwargs):
+        countdowns.append(countdown)
+        return apply_async(*args, **kwargs)
+
+    monkeypatch.setattr(
+        tasks_module.catalog_cone_search, "apply_async", recording_apply_async
+    )
+
+    resp = await client.post(
+        f"/tasks/submit-task/{plugin_id}/cone-search",
+        json={
+            "right_ascension_deg": 10.0,
+            "declination_deg": -20.0,
+            "radius_arcsec": 30.0,
+            "plugin_id": str(plugin_id),
+        },
+    )
+
+    assert resp.status_code == 200
+    task_id = uuid.UUID(resp.json()["task_id"])
+
+    # the first call is made by the router, the second one by the task without the slot
+    assert countdowns == [None, 10.0]
+    assert len(attempts) == 2
+
+    result = await db_session.execute(select(Task).where(Task.id == task_id))
+    assert result.scalar_one().status == TaskStatus.completed
+
+
+@pytest.mark.asyncio
+async def test_catalog_tasks_routed_to_plugin_queue(client, monkeypatch):
+    """
+    The catalog tasks are sent to the queue of their plugin, the plugins without a queue use the default one.
+    """
+    slow_plugin = Plugin(id=uuid.uuid4(), task_queue=settings.SLOW_CATALOG_TASK_QUEUE)
+    get_optional = Repository.get_optional
+
+    async def fake_get_optional(self, entity_id):
+        if entity_id == slow_plugin.id:
+            return slow_plugin
+        return await get_optional(self, entity_id)
+
+    monkeypatch.setattr(Repository, "get_optional", fake_get_optional)
+
+    queues = []
+    for task in (tasks_module.catalog_cone_search, tasks_module.get_photometric_data):
+        monkeypatch.setattr(
+            task, "apply_async", lambda args, queue: queues.append(queue)
+        )
+
+    for plugin_id in (slow_plugin.id, uuid.uuid4()):
+        resp = await client.post(
+            f"/tasks/submit-task/{plugin_id}/cone-search",
+            json={
+                "right_ascension_deg": 10.0,
+                "declination_deg": -20.0,
+                "radius_arcsec": 30.0,
+                "plugin_id": str(plugin_id),
+            },
+        )
+        assert resp.status_code == 200
+
+        resp = await client.post(
+            f"/tasks/submit-task/{plugin_id}/photometric-data",
+            json={
+                "plugin_id": str(plugin_id),
+                "ra_deg": 12.3,
+                "dec_deg": -45.6,
+                "name": "TestStar",
+                "dist_arcsec": 1.23,
+            },
+        )
+        assert resp.status_code == 200
+
+    assert queues == [
+        settings.SLOW_CATALOG_TASK_QUEUE,
+        settings.SLOW_CATALOG_TASK_QUEUE,
+        settings.DEFAULT_CATALOG_TASK_QUEUE,
+        settings.DEFAULT_CATALOG_TASK_QUEUE,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_multi_catalog_search_with_celery(
+    client,
+    db_session,
+    override_directories,
+    monkeypatch,
+):
+    """
+    The name is resolved once, the children search their catalogs and the parent aggregates them.
+    The identifiers of all catalogs are retrieved by the parent sorted by distance.
+    """
+    # the failing child is not propagated, so the remaining children run
+    monkeypatch.setattr(celery_app.conf, "task_eager_propagates", False)
+
+    distances = {uuid.uuid4(): [3.0, 1.0], uuid.uuid4(): [2.0], uuid.uuid4(): None}
+
+    class FakePlugin:
+        def __init__(self, plugin_id):
+            self._plugin_id = plugin_id
+
+        def list_objects(self, coords, radius_arcsec, plugin_id_arg, resources_dir):
+            assert radius_arcsec == settings.OBJECT_SEARCH_RADIUS
+            assert coords.ra.degree == pytest.approx(10.0)
+            if distances[self._plugin_id] is None:
+                raise RuntimeError("catalog unavailable")
+            yield [
+                StellarObjectIdentificatorDto(
+                    plugin_id=plugin_id_arg,
+                    ra_deg=10.0,
+                    dec_deg=-20.0,
+                    name=f"Star {dist}",
+                    dist_arcsec=dist,
+                )
+                for dist in distances[self._plugin_id]
+            ]
+
+    resolved_names = []
+
+    def fake_resolve_name(name, http_client):
+        resolved_names.append(name)
+        return SkyCoord(ra=10.0 * u.degree, dec=-20.0 * u.degree, frame="icrs")
+
+    monkeypatch.setattr(
+        tasks_module.SyncTaskService,
+        "get_plugin_instance",
+        lambda self, plugin_id_param: FakePlugin(plugin_id_param),
+        raising=True,
+    )
+    monkeypatch.setattr(
+        tasks_module, "resolve_name_to_coordinates", fake_resolve_name, raising=True
+    )
+
+    resp = await client.post(
+        "/tasks/submit-task/multi-catalog-search",
+        json={
+            "plugin_ids": [str(plugin_id) for plugin_id in distances],
+            "name": "Vega",
+        },
+    )
+
+    assert resp.status_code == 200
+    data = resp.json()
+    parent_id = uuid.UUID(data["task_id"])
+    child_ids = {
+        uuid.UUID(plugin_id): uuid.UUID(task_id)
+        for plugin_id, task_id in data["plugin_task_ids"].items()
+    }
+    assert child_ids.keys() == distances.keys()
+    assert resolved_names == ["Vega"]
+
+    tasks = {
+        task.id: task
+        for task in (
+            await db_session.execute(
+                select(Task).where(Task.id.in_([parent_id, *child_ids.values()]))
+            )
+        ).scalars()
+    }
+    assert [tasks[child_ids[plugin_id]].status for plugin_id in distances] == [
+        TaskStatus.completed,
+        TaskStatus.completed,
+        TaskStatus.failed,
+    ]
+    # completed with the results of the catalogs, which did not fail
+    assert tasks[parent_id].status == TaskStatus.completed
+    assert tasks[parent_id].result_count == 3
+
+    resp = await client.get(
+        f"/retrieve/multi-catalog-search/{parent_id}/object-identifiers",
+        params={"count": 2},
+    )
+    assert resp.status_code == 200
+    page = resp.json()
+    assert page["total_items"] == 3
+    assert [soi["identifier"]["dist_arcsec"] for soi in page["data"]] == [1.0, 2.0]
+
+    resp = await client.get(
+        f"/retrieve/multi-catalog-search/{parent_id}/object-identifiers",
+        params={"count": 2, "cursor": page["next_cursor"]},
+    )
+    assert [soi["identifier"]["dist_arcsec"] for soi in resp.json()["data"]] == [3.0]
+
+
+@pytest.mark.asyncio
+async def test_multi_catalog_search_unresolved_name_fails_all_tasks(
+    client,
+    db_session,
+    override_directories,
+    monkeypatch,
+):
+    monkeypatch.setattr(celery_app.conf, "task_eager_propagates", False)
+
+    def fake_resolve_name(name, http_client):
+        raise NameResolveError(f'Object "{name}" was not found in CDS or VSX.')
+
+    monkeypatch.setattr(
+        tasks_module, "resolve_name_to_coordinates", fake_resolve_name, raising=True
+    )
+
+    resp = await client.post(
+        "/tasks/submit-task/multi-catalog-search",
+        json={"plugin_ids": [str(uuid.uuid4()), str(uuid.uuid4())], "name": "Nowhere"},
+    )
+
+    assert resp.status_code == 200
+    data = resp.json()
+    task_ids = [uuid.UUID(data["task_id"])] + [
+        uuid.UUID(task_id) for task_id in data["plugin_task_ids"].values()
+    ]
+    result = await db_session.execute(select(Task.status).where(Task.id.in_(task_ids)))
+    assert list(result.scalars()) == [TaskStatus.failed] * 3
+
+
+@pytest.mark.asyncio
+async def test_multi_catalog_search_unpublished_children_fail_all_tasks(
+    client,
+    db_session,
+    override_directories,
+    monkeypatch,
+):
+    monkeypatch.setattr(celery_app.conf, "task_eager_propagates", False)
+
+    class UnavailableBrokerGroup:
+        def __init__(self, children):
+            pass
+
+        def apply_async(self):
+            raise ConnectionError("The broker is not available")
+
+    monkeypatch.setattr(tasks_module, "group", UnavailableBrokerGroup, raising=True)
+
+    resp = await client.post(
+        "/tasks/submit-task/multi-catalog-search",
+        json={
+            "plugin_ids": [str(uuid.uuid4()), str(uuid.uuid4())],
+            "right_ascension_deg": 10.0,
+            "declination_deg": -20.0,
+        },
+    )
+
+    assert resp.status_code == 200
+    data = resp.json()
+    task_ids = [uuid.UUID(data["task_id"])] + [
+        uuid.UUID(task_id) for task_id in data["plugin_task_ids"].values()
+    ]
+    result = await db_session.execute(select(Task.status).where(Task.id.in_(task_ids)))
+    assert list(result.scalars()) == [TaskStatus.failed] * 3
+
+
+@pytest.mark.asyncio
+async def test_multi_catalog_search_requires_name_or_coordinates(client):
+    resp = await client.post(
+        "/tasks/submit-task/multi-catalog-search",
+        json={"plugin_ids": [str(uuid.uuid4())], "right_ascension_deg": 10.0},
+    )
+    assert resp.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_photometric_data_batch_with_celery(
+    client,
+    db_session,
+    override_directories,
+    monkeypatch,
+):
+    """
+    A single Celery task retrieves the data of all identificators, each batch is stored under its own task.
+    """
+    plugin_id = uuid.uuid4()
+    calls = []
+
+    class FakePlugin(CatalogPlugin[StellarObjectIdentificatorDto]):
+        def list_objects(self, coords, radius_arcsec, plugin_id_arg, resources_dir):
+            yield []
+
+        # the default get_photometric_data_batch calls this for each identificator
+        def get_photometric_data(self, identificator, csv_path, resources_dir):
+            calls.append((identificator.name, csv_path.name))
+            yield PhotometricBatch.from_columns(
+                plugin_id,
+                [2450000.5 + i for i in range(len(identificator.name))],
+                [12.3] * len(identificator.name),
+                [0.01] * len(identificator.name),
+                "V",
+            )
+
+    monkeypatch.setattr(
+        tasks_module.SyncTaskService,
+        "get_plugin_instance",
+        lambda self, plugin_id_param: FakePlugin(),
+        raising=True,
+    )
+
+    names = ["A", "BB", "CCC"]
+    resp = await client.post(
+        f"/tasks/submit-task/{plugin_id}/photometric-data-batch",
+        json={
+            "identificators": [
+                {
+                    "plugin_id": str(plugin_id),
+                    "ra_deg": 12.3,
+                    "dec_deg": -45.6,
+                    "name": name,
+                    "dist_arcsec": 1.23,
+                }
+                for name in names
+            ]
+        },
+    )
+
+    assert resp.status_code == 200
+    task_ids = [uuid.UUID(task["task_id"]) for task in resp.json()]
+    assert calls == [(name, f"{task_id}.csv") for name, task_id in zip(names, task_ids)]
+
+    tasks = {
+        task.id: task
+        for task in (
+            await db_session.execute(select(Task).where(Task.id.in_(task_ids)))
+        ).scalars()
+    }
+    assert [tasks[task_id].status for task_id in task_ids] == [TaskStatus.completed] * 3
+    assert [tasks[task_id].result_count for task_id in task_ids] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_photometric_data_batch_job_reschedules_task(
+    client,
+    db_session,
+    override_directories,
+    monkeypatch,
+):
+    """
+    The batch task re-schedules itself, while any job of the plugin is not ready, and retrieves the data
+    with the ready jobs afterwards.
+    """
+    plugin_id = uuid.uuid4()
+    polled_jobs = []
+
+    class FakePlugin:
+        def poll_photometric_data_batch(self, identificators, jobs):
+            polled_jobs.append(jobs)
+            if jobs[0] is None:
+                return [
+                    PhotometricDataJobDto(state={"url": f"job/{index}"}, countdown=30)
+                    for index in range(len(identificators))
+                ]
+            return [PhotometricDataJobDto(state=job.state, ready=True) for job in jobs]
+
+        def get_photometric_data_batch(
+            self, identificators, csv_paths, resources_dir, jobs
+        ):
+            assert [job.state for job in jobs] == [{"url": "job/0"}, {"url": "job/1"}]
+            for index in range(len(identificators)):
+                yield (
+                    index,
+                    PhotometricBatch.from_columns(
+                        plugin_id, [2450000.5], [12.3], [0.01], "V"
+                    ),
+                )
+
+    monkeypatch.setattr(
+        tasks_module.SyncTaskService,
+        "get_plugin_instance",
+        lambda self, plugin_id_param: FakePlugin(),
+        raising=True,
+    )
+
+    countdowns = []
+    apply_async = tasks_module.get_photometric_data_batch.apply_async
+
+    def recording_apply_async(*args, countdown=None, **kwargs):
+        countdowns.append(countdown)
+        return apply_async(*args, **kwargs)
+
+    monkeypatch.setattr(
+        tasks_module.get_photometric_data_batch, "apply_async", recording_apply_async
+    )
+
+    resp = await client.post(
+        f"/tasks/submit-task/{plugin_id}/photometric-data-batch",
+        json={
+            "identificators": [
+                {
+                    "plugin_id": str(plugin_id),
+                    "ra_deg": 12.3,
+                    "dec_deg": -45.6 + index,
+                    "name": f"Star {index}",
+                    "dist_arcsec": 1.23,
+                }
+                for index in range(2)
+            ]
+        },
+    )
+
+    assert resp.status_code == 200
+    task_ids = [uuid.UUID(task["task_id"]) for task in resp.json()]
+
+    # the first call is made by the router, the second one by the task waiting for the jobs
+    assert countdowns == [None, 30]
+    assert polled_jobs[0] == [None, None]
+    assert [job.state for job in polled_jobs[1]] == [{"url": "job/0"}, {"url": "job/1"}]
+
+    tasks = (
+        await db_session.execute(select(Task).where(Task.id.in_(task_ids)))
+    ).scalars()
+    for task_obj in tasks:
+        assert task_obj.status == TaskStatus.completed
+        assert task_obj.result_count == 1
+        assert task_obj.job["ready"] is True
+
+
+@pytest.mark.asyncio
+async def test_bulk_photometric_data_with_celery(
+    client,
+    db_session,
+    override_directories,
+    monkeypatch,
+):
+    """
+    The tasks of stellar objects of different plugins are submitted by a single request,
+    each of them retrieves the data of its own stellar object by its plugin.
+    """
+    plugin_ids = [uuid.uuid4(), uuid.uuid4()]
+    calls = []
+
+    class FakePlugin(CatalogPlugin[StellarObjectIdentificatorDto]):
+        def list_objects(self, coords, radius_arcsec, plugin_id_arg, resources_dir):
+            yield []
+
+        def get_photometric_data(self, identificator, csv_path, resources_dir):
+            calls.append((identificator.plugin_id, identificator.name, csv_path.name))
+            yield PhotometricBatch.from_columns(
+                identificator.plugin_id,
+                [2450000.5 + i for i in range(len(identificator.name))],
+                [12.3] * len(identificator.name),
+                [0.01] * len(identificator.name),
+                "V",
+            )
+
+    monkeypatch.setattr(
+        tasks_module.SyncTaskService,
+        "get_plugin_instance",
+        lambda self, plugin_id_param: FakePlugin(),
+        raising=True,
+    )
+
+    items = [(plugin_ids[i % 2], "S" * (i + 1)) for i in range(4)]
+    resp = await client.post(
+        "/tasks/submit-task/photometric-data/bulk",
+        json={
+            "items": [
+                {
+                    "plugin_id": str(plugin_id),
+                    "identificator": {
+                        # the plugin of the item is used
+                        "plugin_id": str(uuid.uuid4()),
+                        "ra_deg": 12.3,
+                        "dec_deg": -45.6,
+                        "name": name,
+                        "dist_arcsec": 1.23,
+                    },
+                }
+                for plugin_id, name in items
+            ]
+        },
+    )
+
+    assert resp.status_code == 200
+    task_ids = [uuid.UUID(task["task_id"]) for task in resp.json()]
+    assert len(set(task_ids)) == len(items)
+    assert calls == [
+        (plugin_id, name, f"{task_id}.csv")
+        for (plugin_id, name), task_id in zip(items, task_ids)
+    ]
+
+    tasks = {
+        task.id: task
+        for task in (
+            await db_session.execute(select(Task).where(Task.id.in_(task_ids)))
+        ).scalars()
+    }
+    assert [tasks[task_id].status for task_id in task_ids] == [TaskStatus.completed] * 4
+    assert [tasks[task_id].result_count for task_id in task_ids] == [1, 2, 3, 4]
@@ -0,0 +1,90 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from src.core.celery.worker import engine
+from src.tasks.model import PhotometricData, Task
+from src.tasks.partitions import (
+    create_partitions,
+    drop_expired_partitions,
+    partition_name,
+    window_start,
+)
+from src.tasks.types import TaskType
+
+# far in the future, so the default partition contains no rows of the windows
+NOW = datetime(2090, 1, 1, 10, 30)
+
+
+@pytest.fixture
+def session():
+    # DDL is transactional in PostgreSQL, everything is rolled back after the test
+    with Session(bind=engine, expire_on_commit=False) as session:
+        yield session
+        session.rollback()
+
+
+def partition_of(session: Session, row_id) -> str:
+    return session.execute(
+        text("SELECT tableoid::regclass::text FROM ac_photometric_data WHERE id = :id"),
+        {"id": row_id},
+    ).scalar_one()
+
+
+class TestTaskPartitions:
+    @pytest.mark.parametrize(
+        "interval_hours, expected",
+        [(1, datetime(2090, 1, 1, 10)), (4, datetime(2090, 1, 1, 8))],
+    )
+    def test_window_start(self, interval_hours, expected):
+        assert window_start(NOW, interval_hours) == expected
+
+    def test_create_partitions_after_current_window(self, session):
+        created = create_partitions(session, NOW, datetime(2090, 1, 1, 15), 2)
+
+        assert created == [
+            partition_name(table, datetime(2090, 1, 1, hour))
+            for table in ("ac_photometric_data", "ac_stellar_object_identifier")
+            for hour in (12, 14)
+        ]
+        # already existing partitions are skipped
+        assert create_partitions(session, NOW, datetime(2090, 1, 1, 15), 2) == []
+
+    def test_rows_are_routed_and_dropped_with_partition(self, session):
+        create_partitions(session, NOW, datetime(2090, 1, 1, 14), 1)
+        task = Task(task_type=TaskType.photometric_data)
+        session.add(task)
+        session.flush()
+
+        rows = [
+            PhotometricData(
+                task_id=task.id,
+                plugin_id=task.id,
+                julian_date=2450000.0,
+                magnitude=12.0,
+                magnitude_error=0.1,
+                created_at=created_at,
+            )
+            for created_at in (
+                datetime(2090, 1, 1, 11, 15),
+                datetime(2090, 1, 1, 12, 45),
+            )
+        ]
+        session.add_all(rows)
+        session.flush()
+
+        assert partition_of(session, rows[0].id) == "ac_photometric_data_p2090010111"
+        assert partition_of(session, rows[1].id) == "ac_photometric_data_p2090010112"
+
+        dropped = drop_expired_partitions(session, datetime(2090, 1, 1, 12, 30))
+
+        assert dropped == [
+            "ac_photometric_data_p2090010111",
+            "ac_stellar_object_identifier_p2090010111",
+        ]
+        remaining = session.scalars(
+            select(PhotometricData.id).where(PhotometricData.task_id == task.id)
+        ).all()
+        assert remaining == [rows[1].id]
@@ -0,0 +1,89 @@
+import threading
+import uuid
+from contextlib import nullcontext
+from unittest.mock import Mock
+
+import pytest
+
+from src.plugin.interface.photometric_batch import PhotometricBatch
+from src.tasks.pipeline import PhotometricDataWriter
+from src.tasks.service import SyncTaskService
+
+
+class TestPhotometricDataWriter:
+    @pytest.fixture
+    def task_id(self) -> uuid.UUID:
+        return uuid.uuid4()
+
+    @pytest.fixture
+    def batches(self) -> list[PhotometricBatch]:
+        plugin_id = uuid.uuid4()
+        return [
+            PhotometricBatch.from_columns(plugin_id, [float(i)], [10.0], [0.1], "V")
+            for i in range(5)
+        ]
+
+    @pytest.fixture
+    def inserted(self, monkeypatch) -> list[tuple[uuid.UUID, PhotometricBatch]]:
+        inserted = []
+
+        def fake_insert(service, task_id, batch):
+            inserted.append((task_id, batch))
+
+        monkeypatch.setattr(SyncTaskService, "insert_photometric_batch", fake_insert)
+        return inserted
+
+    def writer(self, task_id, max_pending=2) -> PhotometricDataWriter:
+        return PhotometricDataWriter(
+            task_id, lambda: nullcontext(Mock()), max_pending=max_pending
+        )
+
+    def test_inserts_all_batches_in_order(self, task_id, batches, inserted):
+        with self.writer(task_id) as writer:
+            for batch in batches:
+                writer.put(batch)
+
+        assert inserted == [(task_id, batch) for batch in batches]
+
+    def test_backpressure(self, task_id, batches, monkeypatch):
+        release = threading.Event()
+        monkeypatch.setattr(
+            SyncTaskService,
+            "insert_photometric_batch",
+            lambda service, task_id, batch: release.wait(),
+        )
+
+        writer = self.writer(task_id, max_pending=1)
+        producer = threading.Thread(
+            target=lambda: [writer.put(batch) for batch in batches]
+        )
+
+        with writer:
+            producer.start()
+            # one batch is being inserted, one waits in the queue, the producer is blocked
+            producer.join(timeout=0.5)
+            assert producer.is_alive()
+
+            release.set()
+            producer.join(timeout=5)
+            assert not producer.is_alive()
+
+    def test_writer_error_is_raised_in_producer(self, task_id, batches, monkeypatch):
+        def failing_insert(service, task_id, batch):
+            raise RuntimeError("insert failed")
+
+        monkeypatch.setattr(SyncTaskService, "insert_photometric_batch", failing_insert)
+
+        with pytest.raises(RuntimeError, match="insert failed"):
+            with self.writer(task_id, max_pending=1) as writer:
+                for batch in batches:
+                    writer.put(batch)
+
+    def test_producer_error_aborts_writer(self, task_id, batches, inserted):
+        with pytest.raises(ValueError):
+            with self.writer(task_id) as writer:
+                writer.put(batches[0])
+                raise ValueError("plugin failed")
+
+        assert not writer._thread.is_alive()
+        assert len(inserted) <= 1
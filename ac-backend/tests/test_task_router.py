@@ -48,6 +48,13 @@ class FakeTaskRepository:
         return self.tasks_by_id[task_id]
 
 
+class FakePluginRepository:
+    """Repo that behaves like Repository[Plugin] for the router, without any plugins."""
+
+    async def get_optional(self, plugin_id: uuid.UUID) -> None:
+        return None
+
+
 # ---------------------------------------------------------------------------
 # /submit-task/{plugin_id}/cone-search
 # ---------------------------------------------------------------------------
@@ -65,15 +72,16 @@ async def test_cone_search_submits_task_and_calls_celery(monkeypatch):
         plugin_id=plugin_id,
     )
 
-    # patch the Celery task's .delay
-    fake_delay = MagicMock()
+    # patch the Celery task's .apply_async
+    fake_apply_async = MagicMock()
     monkeypatch.setattr(
-        "src.tasks.router.catalog_cone_search.delay",
-        fake_delay,
+        "src.tasks.router.catalog_cone_search.apply_async",
+        fake_apply_async,
     )
 
     response: TaskIdDto = await cone_search(
         task_repository=repo,
+        plugin_repository=FakePluginRepository(),
         search_query_dto=body,
         plugin_id=plugin_id,
     )
@@ -87,9 +95,11 @@ async def test_cone_search_submits_task_and_calls_celery(monkeypatch):
     assert response.task_id == saved_task.id
 
     # Celery task was called with correct args
-    fake_delay.assert_called_once()
-    args, kwargs = fake_delay.call_args
-    # catalog_cone_search.delay(str(task.id), search_query_dto.model_dump())
+    fake_apply_async.assert_called_once()
+    (args,), kwargs = fake_apply_async.call_args
+    # the plugin without a queue uses the default catalog queue
+    assert kwargs == {"queue": settings.DEFAULT_CATALOG_TASK_QUEUE}
+    # catalog_cone_search.apply_async((str(task.id), search_query_dto.model_dump()), queue=...)
     assert args[0] == str(saved_task.id)
     payload = args[1]
     assert payload["right_ascension_deg"] == 123.4
@@ -114,14 +124,15 @@ async def test_find_object_submits_task_and_calls_celery(monkeypatch):
         plugin_id=plugin_id,
     )
 
-    fake_delay = MagicMock()
+    fake_apply_async = MagicMock()
     monkeypatch.setattr(
-        "src.tasks.router.find_stellar_object.delay",
-        fake_delay,
+        "src.tasks.router.find_stellar_object.apply_async",
+        fake_apply_async,
     )
 
     response: TaskIdDto = await find_object(
         task_repository=repo,
+        plugin_repository=FakePluginRepository(),
         query_dto=body,
         plugin_id=plugin_id,
     )
@@ -131,8 +142,10 @@ async def test_find_object_submits_task_and_calls_celery(monkeypatch):
     assert saved_task.task_type == TaskType.object_search
     assert response.task_id == saved_task.id
 
-    fake_delay.assert_called_once()
-    args, kwargs = fake_delay.call_args
+    fake_apply_async.assert_called_once()
+    (args,), kwargs = fake_apply_async.call_args
+    # the plugin without a queue uses the default catalog queue
+    assert kwargs == {"queue": settings.DEFAULT_CATALOG_TASK_QUEUE}
 
     assert args[0] == str(saved_task.id)
     payload = args[1]
@@ -161,14 +174,15 @@ async def test_submit_retrieve_data_submits_task_and_calls_celery(
         dist_arcsec=1.23,
     )
 
-    fake_delay = MagicMock()
+    fake_apply_async = MagicMock()
     monkeypatch.setattr(
-        "src.tasks.router.get_photometric_data.delay",
-        fake_delay,
+        "src.tasks.router.get_photometric_data.apply_async",
+        fake_apply_async,
     )
 
     response: TaskIdDto = await submit_retrieve_data(
         task_repository=repo,
+        plugin_repository=FakePluginRepository(),
         plugin_id=plugin_id,
         identificator_model=identificator,
     )
@@ -178,8 +192,10 @@ async def test_submit_retrieve_data_submits_task_and_calls_celery(
     assert task.task_type == TaskType.photometric_data
     assert response.task_id == task.id
 
-    fake_delay.assert_called_once()
-    args, kwargs = fake_delay.call_args
+    fake_apply_async.assert_called_once()
+    (args,), kwargs = fake_apply_async.call_args
+    # the plugin without a queue uses the default catalog queue
+    assert kwargs == {"queue": settings.DEFAULT_CATALOG_TASK_QUEUE}
 
     assert args[0] == str(task.id)
     payload = args[1]
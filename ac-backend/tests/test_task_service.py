@@ -1,3 +1,4 @@
+import sys
 import uuid
 from datetime import datetime
 from unittest.mock import Mock
@@ -5,8 +6,10 @@ from unittest.mock import Mock
 import pytest
 
 from src.core.config.config import settings
+from src.plugin.cache import PluginCache
 from src.plugin.interface.catalog_plugin import CatalogPlugin
 from src.plugin.model import Plugin
+from src.tasks import service
 from src.tasks.service import SyncTaskService
 from tests.default_test_plugins.plugin_test import plugin
 
@@ -53,3 +56,21 @@ class TestTaskService:
         )
         assert isinstance(instance, CatalogPlugin)
         assert type(instance).__name__ == "PluginTest"
+
+    def test_plugin_instance_is_cached(
+        self,
+        monkeypatch,
+        override_directories,
+        plugin_entity,
+        create_plugin_script,
+        sync_task_service,
+    ):
+        monkeypatch.setattr(service, "plugin_cache", PluginCache(1))
+        sync_task_service._session.get.return_value = plugin_entity
+
+        instance = sync_task_service.get_plugin_instance(plugin_entity.id)
+
+        assert sync_task_service.get_plugin_instance(plugin_entity.id) is instance
+        assert plugin_entity.file_name in sys.modules
+        service.plugin_cache.invalidate(plugin_entity.id)
+        assert plugin_entity.file_name not in sys.modules
@@ -0,0 +1,51 @@
+import logging
+import uuid
+from unittest.mock import Mock
+
+from src.tasks import warm_up
+from src.tasks.service import SyncTaskService
+
+PLUGIN_IDS = [
+    uuid.UUID("00000000-0000-0000-0000-000000000001"),
+    uuid.UUID("00000000-0000-0000-0000-000000000002"),
+]
+
+
+class TestWorkerWarmUp:
+    def session(self) -> Mock:
+        session = Mock()
+        session.scalars.return_value.all.return_value = PLUGIN_IDS
+        return session
+
+    def test_preload_plugins_skips_broken_plugin(self, monkeypatch):
+        loaded = []
+
+        def fake_get_plugin_instance(self, plugin_id):
+            if plugin_id == PLUGIN_IDS[0]:
+                raise ImportError("broken plugin")
+            loaded.append(plugin_id)
+
+        monkeypatch.setattr(
+            SyncTaskService, "get_plugin_instance", fake_get_plugin_instance
+        )
+
+        assert warm_up.preload_plugins(self.session()) == 1
+        assert loaded == [PLUGIN_IDS[1]]
+
+    def test_warm_up_reports_timing_after_failure(self, monkeypatch, caplog):
+        monkeypatch.setattr(
+            SyncTaskService, "get_plugin_instance", lambda self, plugin_id: None
+        )
+
+        def failing_conversion():
+            raise ValueError("IERS table not available")
+
+        monkeypatch.setattr(warm_up, "convert_dummy_time", failing_conversion)
+        logger = logging.getLogger("celery_app")
+        monkeypatch.setattr(logger, "propagate", True)
+
+        with caplog.at_level(logging.INFO, logger="celery_app"):
+            warm_up.warm_up_worker(self.session())
+
+        assert "Could not warm up the time conversion" in caplog.text
+        assert "2 plugins loaded" in caplog.text
@@ -1,7 +1,8 @@
 export type PaginationResponse<T> = {
   data: Array<T>;
   count: number;
-  total_items: number;
+  total_items: number | null;
+  next_cursor?: string | null;
 };
 
 export type SubmitTaskDto = {
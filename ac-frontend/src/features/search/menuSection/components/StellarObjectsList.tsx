@@ -117,9 +117,12 @@ const StellarObjectsList = ({
                            description={stellarObjectsResultsQuery.error.message}/>
     }
 
+    // the total is null if not counted, then the loaded identifiers are counted
+    const totalItems = stellarObjectsResultsQuery.data.total_items ?? stellarObjectsResultsQuery.data.count;
+
     return (
         <>
-            <span className={"font-bold"}>{stellarObjectsResultsQuery.data.total_items}</span> stellar object{stellarObjectsResultsQuery.data.total_items !== 1 ? "s" : ""} found
+            <span className={"font-bold"}>{totalItems}</span> stellar object{totalItems !== 1 ? "s" : ""} found
             <ClientPaginatedDataTable data={stellarObjectsResultsQuery.data.data} columns={identifierColumns} defaultSorting={[{id: "distance", desc: false}]}/>
         </>
     );
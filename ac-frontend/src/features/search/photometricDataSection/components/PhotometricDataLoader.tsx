@@ -19,16 +19,15 @@ const COUNT = 5000;
 const PhotometricDataLoader = ({ taskId, onData }: PhotometryDataLoader) => {
     const q = useInfiniteQuery({
         queryKey: ['pd', taskId],
-        initialPageParam: 0,
+        initialPageParam: null as string | null,
         queryFn: ({ pageParam }) =>
             BaseApi.post<PaginationResponse<PhotometricDataDto>>(
-                `/retrieve/photometric-data?offset=${pageParam}&count=${COUNT}`,
-                { filters: {task_id__eq: taskId} }
+                `/retrieve/photometric-data`,
+                { filters: {task_id__eq: taskId} },
+                { params: { count: COUNT, cursor: pageParam ?? undefined } }
             ),
-        getNextPageParam: (lastPage, pages) => {
-            const offset = pages.reduce((n, p) => n + p.count, 0);
-            return offset < lastPage.total_items ? offset : undefined;
-        },
+        // keyset pagination, each page starts after the last measurement of the previous one
+        getNextPageParam: (lastPage) => lastPage.next_cursor ?? undefined,
         staleTime: Infinity,
     });
 
@@ -116,7 +116,8 @@ function PhotometricDataTable({taskIds, pluginNames}: PhotometricDataTableProps)
         columns: getPhotometricColumns(pluginNames),
         getCoreRowModel: getCoreRowModel(),
         manualPagination: true,
-        rowCount: photometricResultsQuery.data?.total_items,
+        // the total is null if not counted, the page count is unknown then
+        rowCount: photometricResultsQuery.data?.total_items ?? undefined,
 
         state: { pagination },
         onPaginationChange: setPagination,